@@ -17,6 +17,14 @@ DATA_FIELD = "data"
 STREAM_ID_START = "0"
 CONSUMER_GROUP_SEPARATOR = ":"
 NEW_MESSAGES_MARK = ">"
+# Consumer that holds messages released while no peer was active
+HANDOFF_CONSUMER_SUFFIX = ":handoff"
+# Peers idle for longer than this are not handed messages on drain
+HANDOFF_PEER_MAX_IDLE_MS = 30_000
+HANDOFF_BATCH_SIZE = 100
+# Consumers scheduled to stop, per group; never handed messages on drain
+DRAINING_KEY_SUFFIX = ":draining"
+DRAINING_MARK_TTL_MS = 120_000
 
 
 class RedisBroker(BaseBroker):
@@ -541,6 +549,149 @@ class RedisBroker(BaseBroker):
         except redis.ResponseError:
             return 0
 
+    # ------------------------------------------------------------------
+    # Drain handoff
+    # ------------------------------------------------------------------
+
+    def mark_draining(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> None:
+        """Record *consumer_name* as scheduled to stop.
+
+        Marks live in a sorted set per group, scored by their expiry, so a
+        consumer that dies without releasing its entries stops being skipped
+        after ``DRAINING_MARK_TTL_MS``.
+        """
+        key = self._draining_key(stream, consumer_group)
+        expires_at = int(time.time() * 1000) + DRAINING_MARK_TTL_MS
+        try:
+            pipe = self.redis_instance.pipeline()
+            pipe.zadd(key, {consumer_name: expires_at})
+            pipe.pexpire(key, DRAINING_MARK_TTL_MS)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Failed to mark {consumer_name} as draining: {e}")
+
+    def release_pending(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> int:
+        """Hand *consumer_name*'s pending entries to another consumer.
+
+        Entries are claimed with ``XCLAIM`` by the most recently active peer
+        in the group, which reads its own pending entries before new ones.
+        Without an active peer they are parked on the group's handoff
+        consumer until the next consumer to start claims them. Once its
+        pending list is empty, the draining consumer is removed from the
+        group.
+
+        Returns the number of entries released.
+        """
+        try:
+            target = self._handoff_target(stream, consumer_group, consumer_name)
+            released = self._move_pending(stream, consumer_group, consumer_name, target)
+        except Exception as e:
+            logger.warning(
+                f"Failed to release pending messages of {consumer_name} "
+                f"on {stream}: {e}"
+            )
+            return 0
+
+        if released:
+            logger.info(
+                "broker.redis.pending_released",
+                extra={
+                    "stream": stream,
+                    "consumer": consumer_name,
+                    "target": target,
+                    "released": released,
+                },
+            )
+        return released
+
+    def claim_released(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> int:
+        """Claim the entries parked on the group's handoff consumer.
+
+        Returns the number of entries claimed.
+        """
+        parked = f"{consumer_group}{HANDOFF_CONSUMER_SUFFIX}"
+        try:
+            return self._move_pending(stream, consumer_group, parked, consumer_name)
+        except Exception as e:
+            logger.debug(f"Failed to claim released messages on {stream}: {e}")
+            return 0
+
+    def _handoff_target(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> str:
+        """Pick the consumer that takes over a draining consumer's entries.
+
+        Peers that are themselves scheduled to stop are skipped.
+        """
+        parked = f"{consumer_group}{HANDOFF_CONSUMER_SUFFIX}"
+        draining = {
+            self._decode_if_bytes(name)
+            for name in self.redis_instance.zrangebyscore(
+                self._draining_key(stream, consumer_group),
+                int(time.time() * 1000),
+                "+inf",
+            )
+        }
+        target, target_idle = parked, None
+        for c in self.redis_instance.xinfo_consumers(stream, consumer_group):
+            if not isinstance(c, dict):
+                continue
+            name = self._get_field_value(c, "name")
+            if name is None or name in (consumer_name, parked) or name in draining:
+                continue
+            idle = self._get_field_value(c, "idle", convert_to_int=True)
+            if idle is None or idle > HANDOFF_PEER_MAX_IDLE_MS:
+                continue
+            if target_idle is None or idle < target_idle:
+                target, target_idle = name, idle
+        return target
+
+    @staticmethod
+    def _draining_key(stream: str, consumer_group: str) -> str:
+        return (
+            f"{stream}{CONSUMER_GROUP_SEPARATOR}{consumer_group}{DRAINING_KEY_SUFFIX}"
+        )
+
+    def _move_pending(
+        self, stream: str, consumer_group: str, source: str, target: str
+    ) -> int:
+        """Move every pending entry of *source* to *target*.
+
+        *source* is deleted from the group once nothing is left pending on
+        it. Returns the number of entries moved.
+        """
+        moved = 0
+        previous: list[str] = []
+        while True:
+            pending = self.redis_instance.xpending_range(
+                stream,
+                consumer_group,
+                min="-",
+                max="+",
+                count=HANDOFF_BATCH_SIZE,
+                consumername=source,
+            )
+            ids = [self._decode_if_bytes(p["message_id"]) for p in pending]
+            if not ids:
+                break
+            if ids == previous:
+                # Nothing could be moved; leave the rest pending on source
+                return moved
+            claimed = self.redis_instance.xclaim(
+                stream, consumer_group, target, 0, ids, justid=True
+            )
+            moved += len(claimed)
+            previous = ids
+
+        self.redis_instance.xgroup_delconsumer(stream, consumer_group, source)
+        return moved
+
     def _ensure_group(self, group_name: str, stream: str) -> None:
         """Create consumer group if it doesn't exist"""
         group_key = f"{stream}{CONSUMER_GROUP_SEPARATOR}{group_name}"
@@ -1,7 +1,16 @@
 import importlib
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, DefaultDict, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from protean.core.command_handler import BaseCommandHandler
 from protean.core.event_handler import BaseEventHandler
@@ -35,6 +44,14 @@ class EventStore:
         )
         self._projectors: DefaultDict[str, Set[BaseProjector]] = defaultdict(set)
 
+        # Dispatch tables keyed by (message type, stream category). Filled for
+        #   every registered event and command at `Domain.init`, on first use
+        #   for anything else, and cleared whenever an element is registered.
+        self._event_dispatch: Dict[Tuple[Optional[str], Optional[str]], FrozenSet] = {}
+        self._command_dispatch: Dict[
+            Tuple[Optional[str], str], Optional[BaseCommandHandler]
+        ] = {}
+
     @property
     def store(self):
         return self._event_store
@@ -84,6 +101,7 @@ class EventStore:
 
         self._initialize_event_streams()
         self._initialize_command_streams()
+        self._build_dispatch_tables()
 
     def _initialize_event_streams(self):
         for _, record in self.domain.registry.event_handlers.items():
@@ -108,6 +126,42 @@ class EventStore:
                 record.cls
             )
 
+    def _build_dispatch_tables(self) -> None:
+        """Precompute handler lookups for all registered events and commands."""
+        self._invalidate_dispatch_tables()
+
+        for _, record in self.domain.registry.events.items():
+            key = self._event_dispatch_key(record.cls)
+            self._event_dispatch[key] = self._resolve_event_handlers(*key)
+
+        for _, record in self.domain.registry.commands.items():
+            if record.cls.meta_.part_of is None:
+                continue
+            key = (
+                getattr(record.cls, "__type__", None),
+                record.cls.meta_.part_of.meta_.stream_category,
+            )
+            self._command_dispatch[key] = self._resolve_command_handler(*key)
+
+    def _invalidate_dispatch_tables(self) -> None:
+        """Forget cached handler lookups, e.g. after a new element is registered."""
+        self._event_dispatch.clear()
+        self._command_dispatch.clear()
+
+    @staticmethod
+    def _event_dispatch_key(event_cls) -> Tuple[Optional[str], Optional[str]]:
+        part_of = (
+            getattr(event_cls.meta_, "part_of", None)
+            if hasattr(event_cls, "meta_")
+            else None
+        )
+        stream_category = (
+            getattr(part_of.meta_, "stream_category", None)
+            if part_of is not None
+            else None
+        )
+        return getattr(event_cls, "__type__", None), stream_category
+
     def repository_for(self, part_of):
         repository_cls = type(
             part_of.__name__ + "Repository", (BaseEventSourcedRepository,), {}
@@ -117,7 +171,7 @@ class EventStore:
         )
         return repository_cls(self.domain)
 
-    def handlers_for(self, event: Any) -> set:
+    def handlers_for(self, event: Any) -> FrozenSet:
         """Return all handlers configured to run on the given event.
 
         For internal events (events with a ``part_of`` aggregate), looks up
@@ -125,19 +179,24 @@ class EventStore:
         registered via ``register_external_event``) have no ``part_of``
         aggregate, so the lookup falls back to scanning all registered stream
         categories for handlers that match the event's ``__type__``.
+
+        Results are cached per (event type, stream category) and returned as
+        frozensets, so callers must not modify them.
         """
+        key = self._event_dispatch_key(event.__class__)
+        try:
+            return self._event_dispatch[key]
+        except KeyError:
+            handlers = self._resolve_event_handlers(*key)
+            self._event_dispatch[key] = handlers
+            return handlers
+
+    def _resolve_event_handlers(
+        self, event_type: Optional[str], stream_category: Optional[str]
+    ) -> FrozenSet:
         # Gather handlers configured to run on all events
         all_stream_handlers = self._event_streams.get("$all", set())
 
-        # Determine stream category from the event's aggregate
-        part_of = (
-            getattr(event.meta_, "part_of", None) if hasattr(event, "meta_") else None
-        )
-        if part_of is not None:
-            stream_category = getattr(part_of.meta_, "stream_category", None)
-        else:
-            stream_category = None
-
         if stream_category is not None:
             # Fast path: internal event — look up by aggregate stream category
             stream_handlers = self._event_streams.get(stream_category, set())
@@ -145,7 +204,6 @@ class EventStore:
             # Slow path: external event (no part_of) — scan all registered
             # stream categories for handlers that match the event's __type__.
             stream_handlers = set()
-            event_type = getattr(event.__class__, "__type__", None)
             if event_type:
                 # External events match handlers by their concrete __type__.
                 # `$any` is deliberately NOT honoured here: a `$any` handler
@@ -157,17 +215,17 @@ class EventStore:
                     for handler in handlers_set:
                         if event_type in handler._handlers:
                             stream_handlers.add(handler)
-                return set.union(stream_handlers, all_stream_handlers)
+                return frozenset(stream_handlers | all_stream_handlers)
 
         configured_stream_handlers = set()
         for stream_handler in stream_handlers:
             if (
-                event.__class__.__type__ in stream_handler._handlers
+                event_type in stream_handler._handlers
                 or "$any" in stream_handler._handlers
             ):
                 configured_stream_handlers.add(stream_handler)
 
-        return set.union(configured_stream_handlers, all_stream_handlers)
+        return frozenset(configured_stream_handlers | all_stream_handlers)
 
     def projectors_for(self, projection_cls) -> set:
         """Return Projectors listening to a specific projection
@@ -186,10 +244,21 @@ class EventStore:
                 f"Command `{command.__name__}` needs to be associated with an aggregate"
             )
 
-        stream_category = command.meta_.part_of.meta_.stream_category
-
+        key = (
+            command.__class__.__type__,
+            command.meta_.part_of.meta_.stream_category,
+        )
+        try:
+            return self._command_dispatch[key]
+        except KeyError:
+            handler_cls = self._resolve_command_handler(*key)
+            self._command_dispatch[key] = handler_cls
+            return handler_cls
+
+    def _resolve_command_handler(
+        self, command_type: Optional[str], stream_category: str
+    ) -> Optional[BaseCommandHandler]:
         handler_classes = self._command_streams.get(stream_category, set())
-        command_type = command.__class__.__type__
         for handler_cls in handler_classes:
             if handler_cls._handlers.get(command_type):
                 return handler_cls
@@ -1,4 +1,5 @@
 import threading
+from contextlib import nullcontext
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -7,9 +8,11 @@ from pydantic import Field
 
 from protean.core.aggregate import BaseAggregate
 from protean.core.repository import BaseRepository
+from protean.core.unit_of_work import UnitOfWork
 from protean.port.event_store import BaseEventStore
-from protean.utils.globals import current_domain
+from protean.utils.globals import current_domain, current_uow
 from protean.utils.eventing import Metadata
+from protean.utils.query import Q
 
 
 class MemoryMessage(BaseAggregate):
@@ -43,6 +46,16 @@ class MemoryMessage(BaseAggregate):
     metadata: Metadata | None = None
 
 
+def _version_conflict(stream_name: str, expected: int, actual: int) -> ValueError:
+    """Build the error raised when ``stream_name`` is not at ``expected``."""
+    error = ValueError(
+        f"Wrong expected version: {expected} "
+        f"(Stream: {stream_name}, Stream Version: {actual})"
+    )
+    error.stream = stream_name  # type: ignore[attr-defined]
+    return error
+
+
 class MemoryMessageRepository(BaseRepository):
     # Class-level lock: repositories are instantiated per repository_for()
     # call, so an instance-level lock would not be shared across callers.
@@ -78,10 +91,7 @@ class MemoryMessageRepository(BaseRepository):
             _stream_version = self.stream_version(stream_name)
 
             if expected_version is not None and expected_version != _stream_version:
-                raise ValueError(
-                    f"Wrong expected version: {expected_version} "
-                    f"(Stream: {stream_name}, Stream Version: {_stream_version})"
-                )
+                raise _version_conflict(stream_name, expected_version, _stream_version)
 
             next_position = _stream_version + 1
 
@@ -98,6 +108,46 @@ class MemoryMessageRepository(BaseRepository):
 
             return next_position
 
+    def write_many(self, messages: List[tuple]) -> List[int]:
+        """Write several messages all-or-nothing.
+
+        Every expected version is checked before anything is written, and
+        the messages are added in one Unit of Work (or the caller's, when one
+        is active), so the store is copied and committed once per batch.
+        """
+        with self._write_lock:
+            versions: Dict[str, int] = {}
+            positions = []
+            for stream_name, _, _, _, expected_version in messages:
+                if stream_name not in versions:
+                    versions[stream_name] = self.stream_version(stream_name)
+                if (
+                    expected_version is not None
+                    and expected_version != versions[stream_name]
+                ):
+                    raise _version_conflict(
+                        stream_name, expected_version, versions[stream_name]
+                    )
+                versions[stream_name] += 1
+                positions.append(versions[stream_name])
+
+            with nullcontext() if current_uow else UnitOfWork():
+                for (stream_name, message_type, data, metadata, _), position in zip(
+                    messages, positions
+                ):
+                    self.add(
+                        MemoryMessage(
+                            stream_name=stream_name,
+                            position=position,
+                            type=message_type,
+                            data=data,
+                            metadata=metadata,
+                            time=datetime.now(UTC),
+                        )
+                    )
+
+            return positions
+
     def read(
         self,
         stream_name: str,
@@ -106,28 +156,50 @@ class MemoryMessageRepository(BaseRepository):
         no_of_messages: int = 1000,
     ):
         repo = current_domain.repository_for(MemoryMessage)
-        q = (
-            repo._dao.query.filter(position__gte=position)
-            .order_by("position")
-            .limit(no_of_messages)
-        )
+        q = repo._dao.query.limit(no_of_messages)
 
+        # Like Message DB, stream reads are positioned by the stream's own
+        # position, while category and `$all` reads span many streams and
+        # are positioned by global position.
         if stream_name == "$all":
-            pass  # Don't filter on stream name or category
+            q = q.filter(global_position__gte=position).order_by("global_position")
         elif self.is_category(stream_name):
             # If filtering on category, ensure the supplied stream name
             #   is the only thing in the category.
             # Eg. If stream is 'user', then only 'user' should be in the category,
             #   and not even `user:command`
-            q = q.filter(stream_name__contains=f"{stream_name}-")
+            q = q.filter(
+                stream_name__contains=f"{stream_name}-",
+                global_position__gte=position,
+            ).order_by("global_position")
         else:
-            q = q.filter(stream_name=stream_name)
+            q = q.filter(stream_name=stream_name, position__gte=position).order_by(
+                "position"
+            )
 
         items = q.all().items
         return [item.to_dict() for item in items]
 
+    def head_position(self, stream_name: str) -> int:
+        """Global position of the newest message in a stream, category or
+        ``$all``, or ``-1`` when there is none."""
+        repo = current_domain.repository_for(MemoryMessage)
+        q = repo._dao.query.order_by("-global_position").limit(1)
+
+        if stream_name == "$all":
+            pass
+        elif self.is_category(stream_name):
+            q = q.filter(stream_name__contains=f"{stream_name}-")
+        else:
+            q = q.filter(stream_name=stream_name)
+
+        results = q.all()
+        return results.first.global_position if results.items else -1
+
 
 class MemoryEventStore(BaseEventStore):
+    atomic_batches = True
+
     def __init__(self, domain, conn_info) -> None:
         super().__init__("Memory", domain, conn_info)
 
@@ -151,7 +223,18 @@ class MemoryEventStore(BaseEventStore):
         expected_version: int = None,
     ) -> int:
         repo = self.domain.repository_for(MemoryMessage)
-        return repo.write(stream_name, message_type, data, metadata, expected_version)
+        position = repo.write(
+            stream_name, message_type, data, metadata, expected_version
+        )
+        self._stream_heads.discard(stream_name)
+        return position
+
+    def _write_many(self, messages: List[tuple]) -> List[int]:
+        repo = self.domain.repository_for(MemoryMessage)
+        positions = repo.write_many(messages)
+        for stream_name, *_ in messages:
+            self._stream_heads.discard(stream_name)
+        return positions
 
     def _read(
         self,
@@ -166,14 +249,23 @@ class MemoryEventStore(BaseEventStore):
     def _read_last_message(self, stream_name) -> Optional[Dict[str, Any]]:
         repo = self.domain.repository_for(MemoryMessage)
 
-        messages = repo.read(stream_name)
-        return messages[-1] if messages else None
+        results = (
+            repo._dao.query.filter(stream_name=stream_name)
+            .order_by("-position")
+            .limit(1)
+            .all()
+        )
+        return results.first.to_dict() if results.items else None
+
+    def _truncate_stream(self, stream_name: str, before_position: int) -> int:
+        repo = self.domain.repository_for(MemoryMessage)
+        return repo._dao._delete_all(
+            Q(stream_name=stream_name, position__lt=before_position)
+        )
 
     def _stream_head_position(self, stream_category: str) -> int:
-        messages = self._read(stream_category, no_of_messages=1_000_000)
-        if messages:
-            return messages[-1].get("global_position", -1)
-        return -1
+        repo = self.domain.repository_for(MemoryMessage)
+        return repo.head_position(stream_category)
 
     def _stream_identifiers(self, stream_category: str) -> List[str]:
         messages = self._read(stream_category, no_of_messages=1_000_000)
@@ -192,3 +284,4 @@ class MemoryEventStore(BaseEventStore):
         """
         repo = self.domain.repository_for(MemoryMessage)
         repo._dao._delete_all()
+        self._stream_heads.clear()
@@ -23,10 +23,14 @@ class MessageDBStore(BaseEventStore):
     # Keys from conn_info that are forwarded to MessageDB connection pool
     _POOL_KEYS = frozenset({"max_connections"})
 
+    atomic_batches = True
+
     def __init__(self, domain: Domain, conn_info: dict[str, Any]) -> None:
         super().__init__("MessageDB", domain, conn_info)
 
         self._client = None
+        # Whether the connected role may delete messages, checked on first use
+        self._can_delete: bool | None = None
         self._pool_kwargs: dict[str, Any] = {
             key: value for key, value in conn_info.items() if key in self._POOL_KEYS
         }
@@ -55,9 +59,39 @@ class MessageDBStore(BaseEventStore):
         expected_version: int | None = None,
     ) -> int:
         """Write a message to the event store."""
-        return self.client.write(
-            stream_name, message_type, data, metadata, expected_version
-        )
+        try:
+            position = self.client.write(
+                stream_name, message_type, data, metadata, expected_version
+            )
+        except ValueError as exc:
+            exc.stream = stream_name  # type: ignore[attr-defined]
+            raise
+        self._stream_heads.discard(stream_name)
+        return position
+
+    def _write_many(self, messages: List[tuple]) -> List[int]:
+        """Write several messages in one transaction on one connection.
+
+        Each message still goes through Message DB's ``write_message``, so
+        expected versions are checked per message; a failure rolls back the
+        whole batch.
+        """
+        conn = self.client.connection_pool.get_connection()
+        positions = []
+        try:
+            with conn:
+                for message in messages:
+                    try:
+                        positions.append(self.client._write(conn, *message))
+                    except ValueError as exc:
+                        exc.stream = message[0]  # type: ignore[attr-defined]
+                        raise
+        finally:
+            self.client.connection_pool.release(conn)
+
+        for stream_name, *_ in messages:
+            self._stream_heads.discard(stream_name)
+        return positions
 
     def _read(
         self,
@@ -75,14 +109,100 @@ class MessageDBStore(BaseEventStore):
         """Read the last message from the event store."""
         return self.client.read_last_message(stream_name)
 
+    def _stream_version(self, stream_name: str) -> int:
+        """Return the stream's version with Message DB's ``stream_version``
+        function, without fetching its last message."""
+        conn = self.client.connection_pool.get_connection()
+        try:
+            with conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT message_store.stream_version(%(stream_name)s)",
+                    {"stream_name": stream_name},
+                )
+                row = cursor.fetchone()
+        finally:
+            self.client.connection_pool.release(conn)
+
+        if row is None or row[0] is None:
+            return -1
+        return row[0]
+
+    def _check_truncate_support(self) -> None:
+        """Check that the connected role may delete from ``message_store.messages``.
+
+        Message DB deployments commonly grant application roles only what
+        ``write_message`` and the read functions need, so the privilege is
+        checked before anything is written or deleted.
+        """
+        if self._can_delete is None:
+            conn = self.client.connection_pool.get_connection()
+            try:
+                with conn, conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT has_table_privilege('message_store.messages', 'DELETE')"
+                    )
+                    self._can_delete = bool(cursor.fetchone()[0])
+            finally:
+                self.client.connection_pool.release(conn)
+
+        if not self._can_delete:
+            raise ConfigurationError(
+                "Truncating streams needs DELETE on message_store.messages, "
+                "which the event store's database role does not have. Grant "
+                "it to that role, or run compaction with a role that has it."
+            )
+
+    def _truncate_stream(self, stream_name: str, before_position: int) -> int:
+        """Delete a stream's messages positioned before ``before_position``.
+
+        Message DB derives a stream's version from its highest position, so
+        removing earlier messages leaves expected-version checks intact.
+        """
+        self._check_truncate_support()
+        conn = self.client.connection_pool.get_connection()
+        try:
+            with conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM message_store.messages "
+                    "WHERE stream_name = %(stream_name)s "
+                    "AND position < %(position)s",
+                    {"stream_name": stream_name, "position": before_position},
+                )
+                return cursor.rowcount
+        finally:
+            self.client.connection_pool.release(conn)
+
     def _stream_head_position(self, stream_category: str) -> int:
-        # _read_last_message uses get_last_stream_message() which only works
-        # for specific streams (with entity ID), not category streams.
-        # Use _read to get category messages and take the last one.
-        messages = self._read(stream_category, no_of_messages=1_000_000)
-        if messages:
-            return messages[-1].get("global_position", -1)
-        return -1
+        """Return the newest global position with a single indexed lookup.
+
+        Category lookups are served by Message DB's ``messages_category``
+        index on ``(category(stream_name), global_position)``, stream lookups
+        by ``messages_stream``, and ``$all`` by the primary key.
+        """
+        if stream_category == "$all":
+            sql = "SELECT MAX(global_position) FROM message_store.messages"
+        elif "-" in stream_category:
+            sql = (
+                "SELECT MAX(global_position) FROM message_store.messages "
+                "WHERE stream_name = %(stream_name)s"
+            )
+        else:
+            sql = (
+                "SELECT MAX(global_position) FROM message_store.messages "
+                "WHERE message_store.category(stream_name) = %(stream_name)s"
+            )
+
+        conn = self.client.connection_pool.get_connection()
+        try:
+            with conn, conn.cursor() as cursor:
+                cursor.execute(sql, {"stream_name": stream_category})
+                row = cursor.fetchone()
+        finally:
+            self.client.connection_pool.release(conn)
+
+        if row is None or row[0] is None:
+            return -1
+        return row[0]
 
     def _stream_identifiers(self, stream_category: str) -> List[str]:
         """Return unique aggregate identifiers for a stream category.
@@ -128,3 +248,4 @@ class MessageDBStore(BaseEventStore):
         cursor.close()
 
         conn.close()
+        self._stream_heads.clear()
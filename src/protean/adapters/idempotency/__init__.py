@@ -0,0 +1,9 @@
+"""Package for concrete implementations of idempotency record storage"""
+
+from protean.adapters.idempotency.memory import MemoryIdempotencyBackend
+from protean.adapters.idempotency.redis import RedisIdempotencyBackend
+
+__all__ = (
+    "MemoryIdempotencyBackend",
+    "RedisIdempotencyBackend",
+)
@@ -0,0 +1,139 @@
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.index import Index
+from protean.core.repository import BaseRepository
+from protean.fields import Identifier
+from protean.port.idempotency import BaseIdempotencyBackend
+from protean.utils import ensure_utc_aware
+from protean.utils.query import Q
+
+logger = logging.getLogger(__name__)
+
+# Rows removed per purge statement
+DEFAULT_PURGE_BATCH_SIZE = 1000
+# Minimum seconds between opportunistic purges triggered by writes
+DEFAULT_PURGE_INTERVAL = 60.0
+
+
+class IdempotencyRecord(BaseAggregate):
+    """A stored idempotency record.
+
+    Keyed directly by the idempotency key, so lookups and overwrites hit the
+    primary key. ``expires_at`` is indexed for the batched purge.
+    """
+
+    key = Identifier(identifier=True, max_length=255)
+    record: dict
+    expires_at: datetime
+
+
+IDEMPOTENCY_INDEXES = [Index("expires_at")]
+
+
+class IdempotencyRecordRepository(BaseRepository):
+    """Repository for idempotency records, cloned per provider."""
+
+
+class DatabaseIdempotencyBackend(BaseIdempotencyBackend):
+    """Idempotency records in a table on one of the domain's providers.
+
+    Reads and writes go through the provider's DAO, so records written
+    while a Unit of Work is active commit or roll back together with it.
+    Reads filter out expired rows; physical removal happens in batches of
+    ``purge_batch_size``, at most once every ``purge_interval`` seconds from
+    the write path, or on demand through :meth:`purge_expired`.
+    """
+
+    transactional = True
+
+    def __init__(
+        self,
+        repository: BaseRepository,
+        purge_batch_size: int = DEFAULT_PURGE_BATCH_SIZE,
+        purge_interval: float = DEFAULT_PURGE_INTERVAL,
+    ) -> None:
+        self._repository = repository
+        self._purge_batch_size = purge_batch_size
+        self._purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+
+    @property
+    def _dao(self):
+        return self._repository._dao
+
+    def _live(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch unexpired records for ``keys`` with one query."""
+        now = datetime.now(timezone.utc)
+        rows = (
+            self._dao.query.filter(Q(key__in=keys) & Q(expires_at__gt=now))
+            .only("key", "record", "expires_at")
+            .limit(len(keys))
+            .all(with_total=False)
+            .items
+        )
+        return {
+            row.key: row.record
+            for row in rows
+            if ensure_utc_aware(row.expires_at) > now
+        }
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        return self._live([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Optional[dict[str, Any]]]:
+        keys = list(keys)
+        results: dict[str, Optional[dict[str, Any]]] = dict.fromkeys(keys)
+        if keys:
+            results.update(self._live(keys))
+        return results
+
+    def set(self, key: str, record: dict[str, Any], ttl: int) -> None:
+        self.set_many({key: record}, ttl)
+
+    def set_many(self, records: dict[str, dict[str, Any]], ttl: int) -> None:
+        if not records:
+            return
+
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+        self._dao._upsert_many(
+            {
+                key: {"record": record, "expires_at": expires_at}
+                for key, record in records.items()
+            }
+        )
+
+        self._maybe_purge()
+
+    def delete(self, key: str) -> None:
+        self._dao._delete_all(Q(key=key))
+
+    def flush(self) -> None:
+        self._dao._delete_all()
+
+    def _maybe_purge(self) -> None:
+        if time.monotonic() - self._last_purge < self._purge_interval:
+            return
+        self._last_purge = time.monotonic()
+        try:
+            self._dao._delete_top(
+                Q(expires_at__lt=datetime.now(timezone.utc)),
+                limit=self._purge_batch_size,
+            )
+        except Exception:
+            logger.warning("Failed to purge expired idempotency records", exc_info=True)
+
+    def purge_expired(self) -> int:
+        """Delete every expired record in batches of ``purge_batch_size``."""
+        criteria = Q(expires_at__lt=datetime.now(timezone.utc))
+        total = 0
+        while True:
+            deleted = self._dao._delete_top(criteria, limit=self._purge_batch_size)
+            total += deleted
+            if deleted < self._purge_batch_size:
+                break
+        self._last_purge = time.monotonic()
+        return total
@@ -0,0 +1,124 @@
+import json
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Iterable, Optional
+
+from protean.port.idempotency import BaseIdempotencyBackend
+
+# Default upper bound on records held in memory
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class MemoryIdempotencyBackend(BaseIdempotencyBackend):
+    """In-process idempotency records for single-process deployments and tests.
+
+    Expiry is driven by a timing wheel: every record is filed in the slot
+    covering its expiry instant (``resolution`` seconds wide), and each
+    operation sweeps only the slots that have elapsed since the last call.
+    Purging is therefore proportional to what actually expired rather than
+    to the size of the store. The store is also bounded at ``max_entries``,
+    evicting least recently written records first.
+
+    Records are kept as JSON strings so callers never share mutable state
+    with the store, matching what a remote backend would return.
+    """
+
+    local_tier = False
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        resolution: float = 1.0,
+    ) -> None:
+        self._max_entries = max_entries
+        self._resolution = resolution
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._wheel: defaultdict[int, set[str]] = defaultdict(set)
+        self._cursor = self._slot(time.monotonic())
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _slot(self, instant: float) -> int:
+        return int(instant // self._resolution)
+
+    def _advance(self, now: float) -> int:
+        """Drop records whose wheel slots have fully elapsed. Lock must be held."""
+        current = self._slot(now)
+        if current <= self._cursor:
+            return 0
+
+        if current - self._cursor <= len(self._wheel):
+            elapsed = [s for s in range(self._cursor, current) if s in self._wheel]
+        else:
+            elapsed = [s for s in self._wheel if s < current]
+
+        removed = 0
+        for slot in elapsed:
+            for key in self._wheel.pop(slot):
+                item = self._entries.get(key)
+                # The key may have been rewritten with a later expiry and
+                # filed in another slot; only the live expiry counts.
+                if item is not None and item[0] <= now:
+                    del self._entries[key]
+                    removed += 1
+        self._cursor = current
+        return removed
+
+    def _read(self, key: str, now: float) -> Optional[dict[str, Any]]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, raw = item
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        return json.loads(raw)
+
+    def _write(self, key: str, record: dict[str, Any], ttl: int, now: float) -> None:
+        expires_at = now + ttl
+        self._entries[key] = (expires_at, json.dumps(record))
+        self._entries.move_to_end(key)
+        self._wheel[self._slot(expires_at)].add(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            return self._read(key, now)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Optional[dict[str, Any]]]:
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            return {key: self._read(key, now) for key in keys}
+
+    def set(self, key: str, record: dict[str, Any], ttl: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            self._write(key, record, ttl, now)
+
+    def set_many(self, records: dict[str, dict[str, Any]], ttl: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            for key, record in records.items():
+                self._write(key, record, ttl, now)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._wheel.clear()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._advance(time.monotonic())
@@ -0,0 +1,79 @@
+import json
+import logging
+from typing import Any, Iterable, Optional
+
+from protean.port.idempotency import BaseIdempotencyBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RedisIdempotencyBackend(BaseIdempotencyBackend):
+    """Redis-backed idempotency records.
+
+    Records are stored as JSON strings under ``idempotency:{key}`` and
+    expire through Redis' native TTL. Batches resolve with one ``MGET`` or
+    one non-transactional pipeline.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self._redis = client
+
+    @classmethod
+    def from_url(cls, redis_url: str) -> "RedisIdempotencyBackend":
+        """Connect to ``redis_url`` and verify the connection with ``PING``.
+
+        Raises whatever ``redis`` raises when the server is unreachable.
+        """
+        import redis  # noqa: PLC0415 — optional dependency
+
+        client = redis.Redis.from_url(redis_url)
+        client.ping()
+        return cls(client)
+
+    def _key(self, idempotency_key: str) -> str:
+        return f"idempotency:{idempotency_key}"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        raw = self._redis.get(self._key(key))
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Optional[dict[str, Any]]]:
+        keys = list(keys)
+        results: dict[str, Optional[dict[str, Any]]] = dict.fromkeys(keys)
+        if not keys:
+            return results
+
+        raws = self._redis.mget([self._key(key) for key in keys])
+        for key, raw in zip(keys, raws):
+            if raw is None:
+                continue
+            try:
+                results[key] = json.loads(raw)
+            except ValueError:
+                logger.warning("Malformed idempotency record for key %s", key)
+        return results
+
+    def set(self, key: str, record: dict[str, Any], ttl: int) -> None:
+        self._redis.setex(self._key(key), ttl, json.dumps(record))
+
+    def set_many(self, records: dict[str, dict[str, Any]], ttl: int) -> None:
+        if not records:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for key, record in records.items():
+            pipe.setex(self._key(key), ttl, json.dumps(record))
+        pipe.execute()
+
+    def delete(self, key: str) -> None:
+        self._redis.delete(self._key(key))
+
+    def flush(self) -> None:
+        self._redis.flushdb()
+
+    def close(self) -> None:
+        try:
+            self._redis.close()
+        except Exception:
+            logger.debug("Error closing idempotency Redis client", exc_info=True)
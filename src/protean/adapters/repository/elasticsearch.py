@@ -48,6 +48,10 @@ from protean.fields.resolved import ResolvedField
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on distinct values returned by a ``_count_by`` terms aggregation.
+# Grouped counts are meant for low-cardinality fields (statuses, kinds).
+_COUNT_BY_MAX_BUCKETS = 1000
+
 # Python type → elasticsearch_dsl field type mapping for auto-generated models.
 # These are sensible defaults; users override via custom @domain.model classes
 # for ES-specific tuning (analyzers, multi-fields, etc.).
@@ -267,9 +271,17 @@ class ESSession:
 
 
 class ElasticsearchDAO(BaseDAO):
+    # Set on DAOs that read and write a shadow index during rebuilds
+    shadow_index: str | None = None
+
     def __repr__(self) -> str:
         return f"ElasticsearchDAO <{self.entity_cls.__name__}>"
 
+    @property
+    def index_name(self) -> str:
+        """Name of the index this DAO reads and writes."""
+        return self.shadow_index or self.database_model_cls._index._name
+
     def _build_filters(self, criteria: Q):
         """Recursively Build the filters from the criteria object"""
         composed_query = query.Q()
@@ -339,11 +351,7 @@ class ElasticsearchDAO(BaseDAO):
         if criteria.children:
             q = self._build_filters(criteria)
 
-        s = (
-            Search(using=conn, index=self.database_model_cls._index._name)
-            .query(q)
-            .extra(version=True)
-        )
+        s = Search(using=conn, index=self.index_name).query(q).extra(version=True)
 
         if fields is not None:
             s = s.source(list(fields))
@@ -388,7 +396,7 @@ class ElasticsearchDAO(BaseDAO):
                 # Retry without sorting
                 try:
                     s_no_sort = (
-                        Search(using=conn, index=self.database_model_cls._index._name)
+                        Search(using=conn, index=self.index_name)
                         .query(q)
                         .extra(version=True)
                     )
@@ -440,7 +448,7 @@ class ElasticsearchDAO(BaseDAO):
         try:
             model_obj.save(
                 refresh=True,
-                index=self.database_model_cls._index._name,
+                index=self.index_name,
                 using=conn,
             )
         except Exception as exc:
@@ -464,7 +472,7 @@ class ElasticsearchDAO(BaseDAO):
         # Fetch the record to verify existence and capture seq_no/primary_term
         try:
             existing = self.database_model_cls.get(
-                id=identifier, using=conn, index=self.database_model_cls._index._name
+                id=identifier, using=conn, index=self.index_name
             )
         except NotFoundError:
             logger.exception("repository.elasticsearch.record_not_found")
@@ -484,13 +492,16 @@ class ElasticsearchDAO(BaseDAO):
                 raise ExpectedVersionError(
                     f"Wrong expected version: {expected_version} "
                     f"(Aggregate: {self.entity_cls.__name__}({identifier}), "
-                    f"Version: {stored_version})"
+                    f"Version: {stored_version})",
+                    aggregate=self.entity_cls.__name__,
+                    aggregate_id=identifier,
+                    stream=self._stream_for(identifier),
                 )
 
         try:
             save_kwargs: dict[str, Any] = {
                 "refresh": True,
-                "index": self.database_model_cls._index._name,
+                "index": self.index_name,
                 "using": conn,
             }
             # Use ES native OCC: if another write sneaked in between our
@@ -504,7 +515,10 @@ class ElasticsearchDAO(BaseDAO):
             # ES rejected the write because seq_no/primary_term changed
             raise ExpectedVersionError(
                 f"Wrong expected version: {expected_version} "
-                f"(Aggregate: {self.entity_cls.__name__}({identifier}))"
+                f"(Aggregate: {self.entity_cls.__name__}({identifier}))",
+                aggregate=self.entity_cls.__name__,
+                aggregate_id=identifier,
+                stream=self._stream_for(identifier),
             ) from exc
         except Exception as exc:
             logger.exception("repository.elasticsearch.update_failed")
@@ -545,7 +559,7 @@ class ElasticsearchDAO(BaseDAO):
         try:
             # Use update_by_query API
             response = conn.update_by_query(
-                index=self.database_model_cls._index._name,
+                index=self.index_name,
                 body={
                     "query": q.to_dict() if q else {"match_all": {}},
                     "script": {"source": script, "params": params},
@@ -566,7 +580,7 @@ class ElasticsearchDAO(BaseDAO):
 
         try:
             model_obj.delete(
-                index=self.database_model_cls._index._name,
+                index=self.index_name,
                 using=conn,
                 refresh=True,
             )
@@ -599,9 +613,34 @@ class ElasticsearchDAO(BaseDAO):
         if criteria.children:
             q = self._build_filters(criteria)
 
-        s = Search(using=conn, index=self.database_model_cls._index._name).query(q)
+        s = Search(using=conn, index=self.index_name).query(q)
         return s.count()
 
+    def _count_by(self, field_name: str, criteria: Q | None = None) -> dict[Any, int]:
+        """Count documents matching ``criteria`` per ``field_name`` value via a
+        ``terms`` aggregation, without fetching any hits.
+
+        Fields mapped as ``Text`` by a custom model are aggregated on their
+        ``.keyword`` sub-field, as exact-match lookups are.
+        """
+        conn = self.provider.get_connection()
+
+        q = elasticsearch_dsl.Q()
+        if criteria is not None and criteria.children:
+            q = self._build_filters(criteria)
+
+        s = Search(using=conn, index=self.index_name).query(q).extra(size=0)
+        agg_field = field_name
+        if field_name in getattr(self.database_model_cls, "_keyword_fields", ()):
+            agg_field = f"{field_name}.keyword"
+        s.aggs.bucket("counts", "terms", field=agg_field, size=_COUNT_BY_MAX_BUCKETS)
+
+        response = s.execute()
+        return {
+            bucket.key: bucket.doc_count
+            for bucket in response.aggregations.counts.buckets
+        }
+
     def _delete_top(
         self,
         criteria: Q,
@@ -618,7 +657,7 @@ class ElasticsearchDAO(BaseDAO):
         if criteria and criteria.children:
             q = self._build_filters(criteria)
 
-        s = Search(using=conn, index=self.database_model_cls._index._name).query(q)
+        s = Search(using=conn, index=self.index_name).query(q)
         if order_by:
             s = s.sort(order_by)
         # ``max_docs`` caps how many documents the delete-by-query removes.
@@ -629,7 +668,7 @@ class ElasticsearchDAO(BaseDAO):
 
             # ``Search.delete`` does not refresh the index; do it explicitly so
             # the deletion is visible to the next batch.
-            index = Index(name=self.entity_cls.meta_.schema_name, using=conn)
+            index = Index(name=self.index_name, using=conn)
             index.refresh()
         except Exception as exc:
             logger.exception("repository.elasticsearch.delete_top_failed")
@@ -648,14 +687,14 @@ class ElasticsearchDAO(BaseDAO):
         if criteria and criteria.children:
             q = self._build_filters(criteria)
 
-        s = Search(using=conn, index=self.database_model_cls._index._name).query(q)
+        s = Search(using=conn, index=self.index_name).query(q)
 
         # Return the results
         try:
             response = s.delete()
 
             # `Search.delete` does not refresh index, so we have to manually refresh
-            index = Index(name=self.entity_cls.meta_.schema_name, using=conn)
+            index = Index(name=self.index_name, using=conn)
             index.refresh()
         except Exception as exc:
             logger.exception("repository.elasticsearch.delete_all_failed")
@@ -685,7 +724,7 @@ class ElasticsearchDAO(BaseDAO):
         conn = self.provider.get_connection()
         # The v8 client returns a ``HeadApiResponse`` (truthy/falsy) rather than
         # a plain ``bool``, so coerce to ``bool`` to honor the return contract.
-        return bool(conn.indices.exists(index=self.database_model_cls._index._name))
+        return bool(conn.indices.exists(index=self.index_name))
 
 
 class ESProvider(BaseProvider):
@@ -805,6 +844,47 @@ class ESProvider(BaseProvider):
         """Return a DAO object configured with a live connection"""
         return ElasticsearchDAO(self.domain, self, entity_cls, database_model_cls)
 
+    def create_shadow(self, entity_cls, database_model_cls):
+        """Create an empty index with the live index's mappings and settings"""
+        shadow_name = self._new_shadow_name(database_model_cls._index._name)
+        database_model_cls._index.clone(name=shadow_name).create(
+            using=self.get_connection()
+        )
+        return shadow_name
+
+    def get_shadow_dao(self, entity_cls, database_model_cls, shadow_name):
+        """Return a DAO object reading and writing the shadow index"""
+        dao = ElasticsearchDAO(self.domain, self, entity_cls, database_model_cls)
+        dao.shadow_index = shadow_name
+        return dao
+
+    def swap_shadow(self, entity_cls, database_model_cls, shadow_name):
+        """Point the live name at the shadow index and drop the old index.
+
+        The live name becomes an alias of the shadow. When it was a concrete
+        index, that index is removed in the same atomic alias update;
+        otherwise the alias moves and its previous indices are deleted.
+        """
+        conn = self.get_connection()
+        live_name = database_model_cls._index._name
+
+        if conn.indices.exists_alias(name=live_name):
+            retired = list(conn.indices.get_alias(name=live_name).keys())
+            actions = [
+                {"remove": {"index": index, "alias": live_name}} for index in retired
+            ]
+        else:
+            retired = []
+            actions = [{"remove_index": {"index": live_name}}]
+        actions.append({"add": {"index": shadow_name, "alias": live_name}})
+
+        conn.indices.update_aliases(actions=actions)
+        for index in retired:
+            conn.indices.delete(index=index, ignore_unavailable=True)
+
+    def drop_shadow(self, entity_cls, database_model_cls, shadow_name):
+        self.get_connection().indices.delete(index=shadow_name, ignore_unavailable=True)
+
     def decorate_database_model_class(self, entity_cls, database_model_cls):
         schema_name = self.namespaced_schema_name(
             database_model_cls.derive_schema_name()
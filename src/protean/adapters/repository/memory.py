@@ -84,9 +84,14 @@ class MemorySession:
             current_uow and self._provider.name in current_uow._sessions
         ) and not new_connection:
             self._db = current_uow._sessions[self._provider.name]._db
+            self._base = current_uow._sessions[self._provider.name]._base
         else:
+            # The provider never mutates a published snapshot (see
+            # ``MemoryProvider._publish``), so it doubles as the baseline this
+            # session's changes are computed against at commit.
+            self._base = self._provider._databases
             self._db = {
-                "data": copy.deepcopy(self._provider._databases),
+                "data": copy.deepcopy(self._base),
                 "lock": self._provider._locks.setdefault(self._provider.name, Lock()),
                 "counters": self._provider._counters,
             }
@@ -95,7 +100,26 @@ class MemorySession:
         if current_uow and self._provider.name in current_uow._sessions:
             current_uow._sessions[self._provider.name]._db["data"] = self._db["data"]
         else:
-            self._provider._databases = self._db["data"]
+            self._provider._publish(self._changes(), self._base)
+
+    def _changes(self) -> dict[str, tuple[dict, set]]:
+        """Return ``{schema: (written records, removed keys)}`` relative to
+        the snapshot this session started from."""
+        changes = {}
+        for schema, records in self._db["data"].items():
+            base = self._base.get(schema, {})
+            written = {
+                key: record
+                for key, record in records.items()
+                if key not in base or base[key] != record
+            }
+            removed = base.keys() - records.keys()
+            if written or removed or schema not in self._base:
+                changes[schema] = (written, removed)
+        # Schemas dropped wholesale (``_delete_all`` without criteria)
+        for schema in self._base.keys() - self._db["data"].keys():
+            changes[schema] = ({}, set(self._base[schema]))
+        return changes
 
     def rollback(self):
         pass
@@ -120,8 +144,10 @@ class MemoryProvider(BaseProvider):
         # In case of `MemoryProvider`, the `database` value will always be `memory`.
         super().__init__(name, domain, conn_info)
 
-        # Global in-memory store of dict data.
+        # Global in-memory store of dict data. Published snapshots are
+        # replaced, never mutated, under ``_commit_lock``.
         self._databases = defaultdict(dict)
+        self._commit_lock = Lock()
         self._locks = defaultdict(Lock)
         self._counters = defaultdict(count)
 
@@ -145,6 +171,78 @@ class MemoryProvider(BaseProvider):
         """Check if the connection is alive"""
         return True
 
+    def _publish(
+        self,
+        changes: dict[str, tuple[dict, set]],
+        base: dict[str, dict] | None = None,
+    ) -> None:
+        """Merge a session's changes into the store.
+
+        Concurrent sessions each work on their own deep copy, so committing a
+        whole copy would drop whatever another session committed meanwhile.
+        Only the records a session wrote or removed are applied, onto a fresh
+        snapshot that replaces the current one, so sessions copying the old
+        snapshot never see it change.
+
+        When ``base`` (the snapshot the session started from) is given, every
+        versioned record written must still be at the version the session
+        read. Otherwise another session committed it in the meantime, and
+        ``ExpectedVersionError`` is raised before anything is applied.
+        """
+        if not changes:
+            return
+
+        with self._commit_lock:
+            if base is not None:
+                self._check_versions(changes, base)
+
+            databases = defaultdict(dict, self._databases)
+            for schema, (written, removed) in changes.items():
+                records = dict(databases.get(schema, {}))
+                records.update(written)
+                for key in removed:
+                    records.pop(key, None)
+                databases[schema] = records
+            self._databases = databases
+
+    def _check_versions(
+        self, changes: dict[str, tuple[dict, set]], base: dict[str, dict]
+    ) -> None:
+        """Raise ``ExpectedVersionError`` if a record about to be written was
+        committed by someone else since ``base`` was taken."""
+        for schema, (written, _) in changes.items():
+            read = base.get(schema, {})
+            stored = self._databases.get(schema, {})
+            for key, record in written.items():
+                if "_version" not in record or key not in stored:
+                    continue
+                read_version = read[key].get("_version") if key in read else None
+                stored_version = stored[key].get("_version")
+                if stored_version != read_version:
+                    entity_cls = self._entity_cls(schema)
+                    aggregate = entity_cls.__name__ if entity_cls else schema
+                    stream_category = (
+                        getattr(entity_cls.meta_, "stream_category", None)
+                        if entity_cls
+                        else None
+                    )
+                    raise ExpectedVersionError(
+                        f"Wrong expected version: {read_version} "
+                        f"(Aggregate: {aggregate}({key}), "
+                        f"Version: {stored_version})",
+                        aggregate=aggregate,
+                        aggregate_id=key,
+                        stream=f"{stream_category}-{key}" if stream_category else None,
+                    )
+
+    def _entity_cls(self, schema: str) -> Any:
+        """Return the entity class stored under ``schema``, if it is registered."""
+        for model_cls in self._database_model_classes.values():
+            entity_cls = model_cls.meta_.part_of
+            if entity_cls.meta_.schema_name == schema:
+                return entity_cls
+        return None
+
     def _data_reset(self):
         """Reset data"""
         self._databases = defaultdict(dict)
@@ -229,6 +327,31 @@ class MemoryProvider(BaseProvider):
         """Return a DAO object configured with a live connection"""
         return DictDAO(self.domain, self, entity_cls, database_model_cls)
 
+    def create_shadow(self, entity_cls, database_model_cls):
+        """Create an empty schema next to the entity's live schema"""
+        shadow_name = self._new_shadow_name(entity_cls.meta_.schema_name)
+        self._publish({shadow_name: ({}, set())})
+        return shadow_name
+
+    def get_shadow_dao(self, entity_cls, database_model_cls, shadow_name):
+        """Return a DAO object reading and writing the shadow schema"""
+        dao = DictDAO(self.domain, self, entity_cls, database_model_cls)
+        dao.schema_name = shadow_name
+        return dao
+
+    def swap_shadow(self, entity_cls, database_model_cls, shadow_name):
+        """Move the shadow schema's records under the live schema name"""
+        with self._commit_lock:
+            databases = defaultdict(dict, self._databases)
+            databases[entity_cls.meta_.schema_name] = databases.pop(shadow_name, {})
+            self._databases = databases
+
+    def drop_shadow(self, entity_cls, database_model_cls, shadow_name):
+        with self._commit_lock:
+            databases = defaultdict(dict, self._databases)
+            databases.pop(shadow_name, None)
+            self._databases = databases
+
     def _evaluate_lookup(self, key, value, negated, db):
         """Extract values from DB that match the given criteria.
 
@@ -491,7 +614,10 @@ class DictDAO(BaseDAO):
                     raise ExpectedVersionError(
                         f"Wrong expected version: {expected_version} "
                         f"(Aggregate: {self.entity_cls.__name__}({identifier}), "
-                        f"Version: {stored_version})"
+                        f"Version: {stored_version})",
+                        aggregate=self.entity_cls.__name__,
+                        aggregate_id=identifier,
+                        stream=self._stream_for(identifier),
                     )
 
             conn._db["data"][self.schema_name][identifier] = model_obj
@@ -576,6 +702,20 @@ class DictDAO(BaseDAO):
             return len(self._filter_items(criteria, records))
         return len(records)
 
+    def _count_by(self, field_name: str, criteria: Q | None = None) -> dict[Any, int]:
+        """Tally items matching ``criteria`` per ``field_name`` value, in place."""
+        conn = self._get_session()
+        assert conn is not None
+
+        records = conn._db["data"].get(self.schema_name, {})
+        if criteria is not None and criteria.children:
+            records = self._filter_items(criteria, records)
+
+        counts: dict[Any, int] = defaultdict(int)
+        for record in records.values():
+            counts[record.get(field_name)] += 1
+        return dict(counts)
+
     def _delete_top(
         self,
         criteria: Q,
@@ -618,6 +758,38 @@ class DictDAO(BaseDAO):
 
         return len(to_delete)
 
+    def _upsert(self, identifier: Any, values: dict[str, Any]) -> None:
+        """Atomic upsert for the in-memory adapter. See :meth:`_upsert_many`."""
+        self._upsert_many({identifier: values})
+
+    def _upsert_many(self, rows: dict[Any, dict[str, Any]]) -> None:
+        """Atomic upsert for the in-memory adapter.
+
+        Holds the provider lock across the existence checks and the writes,
+        so concurrent writers of the same identifier serialize instead of
+        both inserting.
+        """
+        conn = self._get_session()
+        assert conn is not None
+
+        id_fld = id_field(self.entity_cls)
+        assert id_fld is not None
+
+        with conn._db["lock"]:
+            records = conn._db["data"][self.schema_name]
+            for identifier, values in rows.items():
+                if identifier in records:
+                    records[identifier].update(values)
+                else:
+                    entity = self.entity_cls(
+                        **{id_fld.field_name: identifier}, **values
+                    )
+                    records[identifier] = self._set_auto_fields(
+                        self.database_model_cls.from_entity(entity)
+                    )
+
+        self._commit_if_standalone(conn)
+
     def _delete_all(self, criteria: Q = None):
         """Delete the dictionary object by its criteria"""
         conn = self._get_session()
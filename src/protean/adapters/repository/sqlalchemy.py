@@ -38,6 +38,7 @@ from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import DatabaseError
 from sqlalchemy import inspect
 from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql.elements import conv
 from sqlalchemy.types import CHAR, TypeDecorator
 
 from protean.core.database_model import BaseDatabaseModel
@@ -719,9 +720,11 @@ class SqlalchemyModel(orm.DeclarativeBase, BaseDatabaseModel):
 
         # Emit verbatim DDL for RawIndex escape-hatch declarations whose
         # dialect matches the configured engine, on table creation.
-        for raw in raw_indexes:
-            if raw.dialect == raw_dialect:
-                event.listen(cls.__table__, "after_create", DDL(raw.ddl))
+        cls._raw_index_ddl = tuple(
+            DDL(raw.ddl) for raw in raw_indexes if raw.dialect == raw_dialect
+        )
+        for ddl in cls._raw_index_ddl:
+            event.listen(cls.__table__, "after_create", ddl)
 
     @orm.declared_attr
     def __tablename__(cls):
@@ -936,7 +939,10 @@ class SADAO(BaseDAO):
                 raise ExpectedVersionError(
                     f"Wrong expected version: {expected_version} "
                     f"(Aggregate: {self.entity_cls.__name__}({identifier}), "
-                    f"Version: {stored_version})"
+                    f"Version: {stored_version})",
+                    aggregate=self.entity_cls.__name__,
+                    aggregate_id=identifier,
+                    stream=self._stream_for(identifier),
                 )
 
         # Sync DB Record with current changes
@@ -1126,6 +1132,24 @@ class SADAO(BaseDAO):
         finally:
             self._commit_if_standalone(conn)
 
+    def _count_by(self, field_name: str, criteria: Q | None = None) -> dict[Any, int]:
+        """Count rows matching ``criteria`` per ``field_name`` value in a single
+        ``SELECT field, COUNT(*) … GROUP BY field``.
+        """
+        column = self.database_model_cls.__table__.c[
+            fields(self.entity_cls)[field_name].attribute_name
+        ]
+
+        conn = self._get_session()
+        assert conn is not None
+        try:
+            qs = conn.query(column, func.count()).select_from(self.database_model_cls)
+            if criteria is not None and criteria.children:
+                qs = qs.filter(self._build_filters(criteria))
+            return {value: count for value, count in qs.group_by(column).all()}
+        finally:
+            self._commit_if_standalone(conn)
+
     def _delete_all(self, criteria: Q = None):
         """Delete a record from the sqlalchemy database"""
         conn = self._get_session()
@@ -1187,6 +1211,72 @@ class SADAO(BaseDAO):
         finally:
             self._commit_if_standalone(conn)
 
+    # Dialects with a native ``INSERT … ON CONFLICT (id) DO UPDATE``. Everything
+    # else falls back to the portable :meth:`BaseDAO._upsert` default.
+    _UPSERT_DIALECTS = {
+        "postgresql": psql.insert,
+        "sqlite": sqlite_dialect.insert,
+    }
+
+    def _upsert(self, identifier: Any, values: dict[str, Any]) -> None:
+        """Single-statement ``INSERT … ON CONFLICT DO UPDATE`` on supported
+        dialects; falls back to the portable :meth:`BaseDAO._upsert` default
+        elsewhere.
+        """
+        if self.provider._engine.dialect.name not in self._UPSERT_DIALECTS:
+            return super()._upsert(identifier, values)
+        self._upsert_many({identifier: values})
+
+    def _upsert_many(self, rows: dict[Any, dict[str, Any]]) -> None:
+        """Upsert the whole batch with one multi-row ``INSERT … ON CONFLICT
+        DO UPDATE`` on supported dialects; falls back to one upsert per row
+        elsewhere.
+        """
+        if not rows:
+            return
+
+        dialect_insert = self._UPSERT_DIALECTS.get(self.provider._engine.dialect.name)
+        if dialect_insert is None:
+            return super()._upsert_many(rows)
+
+        entity_id_field = id_field(self.entity_cls)
+        assert entity_id_field is not None
+        id_name = entity_id_field.attribute_name
+
+        # Build each row through the model so column names and field
+        # conversions match what ``_create`` would have written.
+        columns = {
+            prop.key: prop.columns[0].name
+            for prop in inspect(self.database_model_cls).column_attrs
+        }
+        data = []
+        for identifier, values in rows.items():
+            entity = self.entity_cls(
+                **{entity_id_field.field_name: identifier}, **values
+            )
+            model_obj = self.database_model_cls.from_entity(entity)
+            data.append(
+                {name: getattr(model_obj, key) for key, name in columns.items()}
+            )
+
+        table = self.database_model_cls.__table__
+        updated = next(iter(rows.values())).keys()
+        stmt = dialect_insert(table).values(data)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[columns[id_name]]],
+            set_={columns[key]: stmt.excluded[columns[key]] for key in updated},
+        )
+
+        conn = self._get_session()
+        assert conn is not None
+        try:
+            conn.execute(stmt)
+        except DatabaseError:
+            logger.exception("repository.sqlalchemy.upsert_failed")
+            raise
+        finally:
+            self._commit_if_standalone(conn)
+
     def _raw(self, query: Any, data: Any = None):
         """Run a raw query on the repository and return entity objects"""
         assert isinstance(query, str)
@@ -1299,6 +1389,9 @@ class SAProvider(BaseProvider):
         # A temporary cache of already constructed model classes
         self._database_model_classes = {}
 
+        # Model classes mapped to shadow tables, keyed by shadow table name
+        self._shadow_model_classes = {}
+
         # Cache the session factory and scoped session so they are created once
         # per provider, not on every get_session() call.
         kwargs = self._get_database_specific_session_args()
@@ -1591,6 +1684,158 @@ class SAProvider(BaseProvider):
         """Return a DAO object configured with a live connection"""
         return SADAO(self.domain, self, entity_cls, database_model_cls)
 
+    def create_shadow(self, entity_cls, database_model_cls):
+        """Create an empty table with the live table's columns and indexes"""
+        shadow_name = self._new_shadow_name(database_model_cls.derive_schema_name())
+        shadow_model_cls = self._shadow_model(
+            entity_cls, database_model_cls, shadow_name
+        )
+        shadow_model_cls.__table__.create(self._engine)
+        return shadow_name
+
+    def get_shadow_dao(self, entity_cls, database_model_cls, shadow_name):
+        """Return a DAO object reading and writing the shadow table"""
+        return SADAO(
+            self.domain,
+            self,
+            entity_cls,
+            self._shadow_model(entity_cls, database_model_cls, shadow_name),
+        )
+
+    def swap_shadow(self, entity_cls, database_model_cls, shadow_name):
+        """Rename the shadow table to the live name and drop the old table.
+
+        All three statements run in one transaction, so on databases with
+        transactional DDL readers see either the old table or the new one.
+        """
+        live_name = database_model_cls.__table__.name
+        retired_name = f"{shadow_name}__retired"
+        shadow_model_cls = self._shadow_model(
+            entity_cls, database_model_cls, shadow_name
+        )
+        live_indexes = {
+            index.name: index for index in database_model_cls.__table__.indexes
+        }
+
+        with self._engine.begin() as conn:
+            self._rename_table(conn, live_name, retired_name)
+            self._rename_table(conn, shadow_name, live_name)
+            conn.execute(text(f"DROP TABLE {self._qualified_table(retired_name)}"))
+
+            # Dropping the old table freed the declared index names; hand them
+            # to the shadow's indexes and create the verbatim ones it skipped.
+            for index_name, declared_name in shadow_model_cls._live_index_names.items():
+                self._rename_index(
+                    conn, live_name, index_name, live_indexes[declared_name]
+                )
+            for ddl in database_model_cls._raw_index_ddl:
+                conn.execute(ddl)
+
+        self._shadow_model_classes.pop(shadow_name, None)
+
+    def drop_shadow(self, entity_cls, database_model_cls, shadow_name):
+        shadow_model_cls = self._shadow_model(
+            entity_cls, database_model_cls, shadow_name
+        )
+        shadow_model_cls.__table__.drop(self._engine, checkfirst=True)
+        self._shadow_model_classes.pop(shadow_name, None)
+
+    def _shadow_model(self, entity_cls, database_model_cls, shadow_name):
+        """Return a model class mapped to the shadow table.
+
+        The live model's columns are copied as-is, so custom column
+        definitions carry over. The class gets its own ``MetaData`` to keep
+        the shadow out of ``create_all``/``drop_all``.
+
+        Index names are unique per database (or schema), so each shadow index
+        is suffixed with the rebuild token; ``_live_index_names`` maps them
+        back to the declared names for the swap. ``RawIndex`` DDL names the
+        live table verbatim, so it is not run against the shadow.
+        """
+        if shadow_name not in self._shadow_model_classes:
+            meta_ = Options(database_model_cls.meta_)
+            meta_.part_of = entity_cls
+            meta_.schema_name = shadow_name
+
+            attrs = {
+                "meta_": meta_,
+                "engine": self._engine,
+                "metadata": MetaData(schema=self._metadata.schema),
+            }
+            for column_attr in inspect(database_model_cls).column_attrs:
+                attrs[column_attr.key] = column_attr.columns[0]._copy()
+
+            token = shadow_name.rsplit("_", 1)[-1]
+            shadow_model_cls = type(
+                f"{database_model_cls.__name__}_{token}",
+                database_model_cls.__bases__,
+                attrs,
+            )
+
+            for ddl in shadow_model_cls._raw_index_ddl:
+                event.remove(shadow_model_cls.__table__, "after_create", ddl)
+
+            live_name = database_model_cls.__table__.name
+            max_length = self._engine.dialect.max_identifier_length
+            suffix = f"__{token}"
+            shadow_model_cls._live_index_names = {}
+            for index in shadow_model_cls.__table__.indexes:
+                # Derived names embed the table name; explicit ones do not
+                declared_name = index.name.replace(shadow_name, live_name)
+                index.name = conv(
+                    f"{declared_name[: max_length - len(suffix)]}{suffix}"
+                )
+                shadow_model_cls._live_index_names[index.name] = declared_name
+
+            self._shadow_model_classes[shadow_name] = shadow_model_cls
+
+        return self._shadow_model_classes[shadow_name]
+
+    def _qualified_table(self, table_name):
+        preparer = self._engine.dialect.identifier_preparer
+        if self._metadata.schema:
+            return (
+                f"{preparer.quote_schema(self._metadata.schema)}."
+                f"{preparer.quote(table_name)}"
+            )
+        return preparer.quote(table_name)
+
+    def _rename_table(self, conn, table_name, new_name):
+        preparer = self._engine.dialect.identifier_preparer
+        conn.execute(
+            text(
+                f"ALTER TABLE {self._qualified_table(table_name)} "
+                f"RENAME TO {preparer.quote(new_name)}"
+            )
+        )
+
+    def _rename_index(self, conn, table_name, index_name, declared_index):
+        """Give an index on ``table_name`` the name of ``declared_index``.
+
+        PostgreSQL and MySQL rename in place; elsewhere the index is dropped
+        and recreated from its declaration.
+        """
+        preparer = self._engine.dialect.identifier_preparer
+        dialect_name = self._engine.dialect.name
+        if dialect_name == "postgresql":
+            conn.execute(
+                text(
+                    f"ALTER INDEX {self._qualified_table(index_name)} "
+                    f"RENAME TO {preparer.quote(declared_index.name)}"
+                )
+            )
+        elif dialect_name in ("mysql", "mariadb"):
+            conn.execute(
+                text(
+                    f"ALTER TABLE {self._qualified_table(table_name)} "
+                    f"RENAME INDEX {preparer.quote(index_name)} "
+                    f"TO {preparer.quote(declared_index.name)}"
+                )
+            )
+        else:
+            conn.execute(text(f"DROP INDEX {self._qualified_table(index_name)}"))
+            conn.execute(CreateIndex(declared_index))
+
     def _raw(self, query: Any, data: Any = None):
         """Run raw query on Provider"""
         if data is None:
@@ -1736,6 +1981,18 @@ class MssqlProvider(SAProvider):
         # conn.execute(text("SET TRANSACTION ISOLATION LEVEL READ COMMITTED;"))
         return conn
 
+    def _rename_table(self, conn, table_name, new_name):
+        """SQL Server renames tables with ``sp_rename`` instead of ``ALTER TABLE``"""
+        old_name = (
+            f"{self._metadata.schema}.{table_name}"
+            if self._metadata.schema
+            else table_name
+        )
+        conn.execute(
+            text("EXEC sp_rename :old_name, :new_name"),
+            {"old_name": old_name, "new_name": new_name},
+        )
+
 
 operators = {
     "exact": "__eq__",
@@ -0,0 +1,9 @@
+"""Package for concrete implementations of scheduled message storage"""
+
+from protean.adapters.scheduler.memory import MemoryScheduleStore
+from protean.adapters.scheduler.redis import RedisScheduleStore
+
+__all__ = (
+    "MemoryScheduleStore",
+    "RedisScheduleStore",
+)
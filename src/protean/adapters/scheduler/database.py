@@ -0,0 +1,141 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.index import Index
+from protean.core.repository import BaseRepository
+from protean.fields import Identifier, String
+from protean.port.scheduler import BaseScheduleStore, ScheduledMessage
+from protean.utils import ensure_utc_aware
+from protean.utils.eventing import ensure_utc
+from protean.utils.query import Q
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledMessageRecord(BaseAggregate):
+    """A message stored for future delivery.
+
+    Keyed by the schedule id, so claims and cancellations hit the primary
+    key. ``deliver_at`` is indexed for the ordered ``due()`` scan.
+    ``locked_until`` is set while a worker holds the entry's lease.
+    """
+
+    schedule_id = Identifier(identifier=True, max_length=255)
+    stream = String(max_length=255, required=True)
+    payload: dict
+    deliver_at: datetime
+    locked_until: datetime | None = None
+
+
+SCHEDULED_MESSAGE_INDEXES = [Index("deliver_at")]
+
+
+class ScheduledMessageRecordRepository(BaseRepository):
+    """Repository for scheduled messages, cloned per provider."""
+
+
+class DatabaseScheduleStore(BaseScheduleStore):
+    """Scheduled messages in a table on one of the domain's providers.
+
+    Writes go through the provider's DAO, so a message scheduled while a
+    Unit of Work is active is stored only if that Unit of Work commits.
+    A claim sets ``locked_until`` through the DAO's ``_claim()``, which
+    never hands the same row to two workers. Removing and releasing are
+    one statement for the whole batch.
+    """
+
+    def __init__(self, repository: BaseRepository) -> None:
+        self._repository = repository
+
+    @property
+    def _dao(self):
+        return self._repository._dao
+
+    def add(self, message: ScheduledMessage) -> None:
+        self.add_many([message])
+
+    def add_many(self, messages: Iterable[ScheduledMessage]) -> None:
+        messages = list(messages)
+        if not messages:
+            return
+
+        dao = self._dao
+        existing = {
+            row.schedule_id
+            for row in dao.query.filter(
+                schedule_id__in=[message.id for message in messages]
+            )
+            .only("schedule_id")
+            .limit(len(messages))
+            .all(with_total=False)
+            .items
+        }
+        for message in messages:
+            values = {
+                "stream": message.stream,
+                "payload": message.payload,
+                "deliver_at": ensure_utc(message.deliver_at),
+            }
+            if message.id in existing:
+                dao._update_all(Q(schedule_id=message.id), **values)
+            else:
+                entity = dao.entity_cls(schedule_id=message.id, **values)
+                dao._create(dao.database_model_cls.from_entity(entity))
+
+    @staticmethod
+    def _unleased(now: datetime) -> Q:
+        return Q(locked_until__isnull=True) | Q(locked_until__lt=now)
+
+    def due(self, until: datetime, limit: int) -> list[ScheduledMessage]:
+        now = datetime.now(timezone.utc)
+        rows = (
+            self._dao.query.filter(
+                Q(deliver_at__lte=ensure_utc(until)) & self._unleased(now)
+            )
+            .order_by("deliver_at")
+            .limit(limit)
+            .all(with_total=False)
+            .items
+        )
+        return [
+            ScheduledMessage(
+                id=row.schedule_id,
+                stream=row.stream,
+                payload=row.payload,
+                deliver_at=ensure_utc_aware(row.deliver_at),
+            )
+            for row in rows
+        ]
+
+    def claim(self, ids: Iterable[str], lease: float) -> set[str]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        now = datetime.now(timezone.utc)
+        rows = self._dao._claim(
+            criteria=Q(schedule_id__in=ids) & self._unleased(now),
+            claim_fields={"locked_until": now + timedelta(seconds=lease)},
+            limit=len(ids),
+            order_by="deliver_at",
+        )
+        return {row.schedule_id for row in rows}
+
+    def release(self, ids: Iterable[str]) -> None:
+        ids = list(ids)
+        if ids:
+            self._dao._update_all(Q(schedule_id__in=ids), locked_until=None)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        ids = list(ids)
+        if not ids:
+            return 0
+        return self._dao._delete_all(Q(schedule_id__in=ids))
+
+    def count(self) -> int:
+        return self._dao._count(Q())
+
+    def flush(self) -> None:
+        self._dao._delete_all()
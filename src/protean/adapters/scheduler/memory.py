@@ -0,0 +1,106 @@
+import copy
+import heapq
+import threading
+import time
+from datetime import datetime
+from typing import Iterable
+
+from protean.port.scheduler import BaseScheduleStore, ScheduledMessage
+from protean.utils.eventing import ensure_utc
+
+
+class MemoryScheduleStore(BaseScheduleStore):
+    """In-process schedule store for single-process deployments and tests.
+
+    Entries live in a dict keyed by id, with a heap of ``(deliver_at, id)``
+    for ordered reads. Removed, cancelled and replaced entries are dropped
+    from the heap lazily, when they reach its top. Leases are monotonic
+    expiry times keyed by id.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, ScheduledMessage] = {}
+        self._heap: list[tuple[datetime, str]] = []
+        self._leases: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, message: ScheduledMessage) -> None:
+        self.add_many([message])
+
+    def add_many(self, messages: Iterable[ScheduledMessage]) -> None:
+        with self._lock:
+            for message in messages:
+                message = ScheduledMessage(
+                    id=message.id,
+                    stream=message.stream,
+                    payload=copy.deepcopy(message.payload),
+                    deliver_at=ensure_utc(message.deliver_at),
+                )
+                self._entries[message.id] = message
+                heapq.heappush(self._heap, (message.deliver_at, message.id))
+
+    def _is_live(self, deliver_at: datetime, id: str) -> bool:
+        entry = self._entries.get(id)
+        return entry is not None and entry.deliver_at == deliver_at
+
+    def _is_leased(self, id: str, now: float) -> bool:
+        expiry = self._leases.get(id)
+        return expiry is not None and expiry > now
+
+    def due(self, until: datetime, limit: int) -> list[ScheduledMessage]:
+        until = ensure_utc(until)
+        with self._lock:
+            while self._heap and not self._is_live(*self._heap[0]):
+                heapq.heappop(self._heap)
+
+            # Every stale heap item is matched by a missing entry, and leased
+            # entries are skipped, so looking this far past ``limit`` always
+            # reaches ``limit`` deliverable entries
+            stale = len(self._heap) - len(self._entries) + len(self._leases)
+            now = time.monotonic()
+            results = []
+            seen = set()
+            for deliver_at, id in heapq.nsmallest(limit + stale, self._heap):
+                if deliver_at > until or len(results) >= limit:
+                    break
+                if (
+                    id not in seen
+                    and self._is_live(deliver_at, id)
+                    and not self._is_leased(id, now)
+                ):
+                    seen.add(id)
+                    results.append(copy.deepcopy(self._entries[id]))
+            return results
+
+    def claim(self, ids: Iterable[str], lease: float) -> set[str]:
+        with self._lock:
+            now = time.monotonic()
+            claimed = set()
+            for id in ids:
+                if id in self._entries and not self._is_leased(id, now):
+                    self._leases[id] = now + lease
+                    claimed.add(id)
+            return claimed
+
+    def release(self, ids: Iterable[str]) -> None:
+        with self._lock:
+            for id in ids:
+                self._leases.pop(id, None)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        with self._lock:
+            removed = 0
+            for id in ids:
+                self._leases.pop(id, None)
+                if self._entries.pop(id, None) is not None:
+                    removed += 1
+            return removed
+
+    def count(self) -> int:
+        return len(self._entries)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._leases.clear()
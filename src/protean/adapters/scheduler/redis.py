@@ -0,0 +1,149 @@
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from protean.port.scheduler import BaseScheduleStore, ScheduledMessage
+from protean.utils.eventing import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+
+class RedisScheduleStore(BaseScheduleStore):
+    """Scheduled messages in a Redis sorted set.
+
+    Ids are members of the ``scheduled:due`` sorted set, scored by delivery
+    time in epoch seconds, and the serialized entries live in the
+    ``scheduled:messages`` hash. ``due()`` is one ``ZRANGEBYSCORE`` plus one
+    ``HMGET``. A claim sets a ``scheduled:lease:<id>`` key per id with
+    ``SET NX PX`` in one pipeline: only one worker creates each key, and
+    Redis expires it when the lease runs out.
+    """
+
+    DUE_KEY = "scheduled:due"
+    MESSAGES_KEY = "scheduled:messages"
+    LEASE_PREFIX = "scheduled:lease:"
+
+    def __init__(self, client: Any) -> None:
+        self._redis = client
+
+    @classmethod
+    def from_url(cls, redis_url: str) -> "RedisScheduleStore":
+        """Connect to ``redis_url`` and verify the connection with ``PING``."""
+        import redis  # noqa: PLC0415 — optional dependency
+
+        client = redis.Redis.from_url(redis_url)
+        client.ping()
+        return cls(client)
+
+    def add(self, message: ScheduledMessage) -> None:
+        self.add_many([message])
+
+    def add_many(self, messages: Iterable[ScheduledMessage]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for message in messages:
+            deliver_at = ensure_utc(message.deliver_at)
+            pipe.hset(
+                self.MESSAGES_KEY,
+                message.id,
+                json.dumps(
+                    {
+                        "stream": message.stream,
+                        "payload": message.payload,
+                        "deliver_at": deliver_at.isoformat(),
+                    }
+                ),
+            )
+            pipe.zadd(self.DUE_KEY, {message.id: deliver_at.timestamp()})
+        pipe.execute()
+
+    def due(self, until: datetime, limit: int) -> list[ScheduledMessage]:
+        ids = self._redis.zrangebyscore(
+            self.DUE_KEY, "-inf", ensure_utc(until).timestamp(), start=0, num=limit
+        )
+        if not ids:
+            return []
+
+        ids = [
+            raw_id.decode() if isinstance(raw_id, bytes) else raw_id for raw_id in ids
+        ]
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hmget(self.MESSAGES_KEY, ids)
+        pipe.mget([self._lease_key(id) for id in ids])
+        raws, leases = pipe.execute()
+
+        results = []
+        for id, raw, lease in zip(ids, raws, leases):
+            if raw is None or lease is not None:
+                continue  # Removed between the two reads, or being delivered
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                logger.warning("Malformed scheduled message %s", id)
+                continue
+            results.append(
+                ScheduledMessage(
+                    id=id,
+                    stream=entry["stream"],
+                    payload=entry["payload"],
+                    deliver_at=datetime.fromisoformat(entry["deliver_at"]).astimezone(
+                        timezone.utc
+                    ),
+                )
+            )
+        return results
+
+    def _lease_key(self, id: str) -> str:
+        return f"{self.LEASE_PREFIX}{id}"
+
+    def claim(self, ids: Iterable[str], lease: float) -> set[str]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        pipe = self._redis.pipeline(transaction=False)
+        for id in ids:
+            pipe.zscore(self.DUE_KEY, id)
+            pipe.set(self._lease_key(id), 1, nx=True, px=max(1, int(lease * 1000)))
+        replies = pipe.execute()
+
+        claimed, missing = set(), []
+        for id, score, leased in zip(ids, replies[::2], replies[1::2]):
+            if not leased:
+                continue
+            if score is None:
+                missing.append(id)  # Removed or cancelled; drop our lease
+            else:
+                claimed.add(id)
+        if missing:
+            self.release(missing)
+        return claimed
+
+    def release(self, ids: Iterable[str]) -> None:
+        keys = [self._lease_key(id) for id in ids]
+        if keys:
+            self._redis.delete(*keys)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        ids = list(ids)
+        if not ids:
+            return 0
+
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.zrem(self.DUE_KEY, *ids)
+        pipe.hdel(self.MESSAGES_KEY, *ids)
+        pipe.delete(*[self._lease_key(id) for id in ids])
+        removed, _, _ = pipe.execute()
+        return int(removed)
+
+    def count(self) -> int:
+        return int(self._redis.zcard(self.DUE_KEY))
+
+    def flush(self) -> None:
+        self._redis.delete(self.DUE_KEY, self.MESSAGES_KEY)
+
+    def close(self) -> None:
+        try:
+            self._redis.close()
+        except Exception:
+            logger.debug("Error closing schedule store Redis client", exc_info=True)
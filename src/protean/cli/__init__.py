@@ -28,6 +28,7 @@ from protean import __version__
 from protean.cli._helpers import CTX_LOG_CONFIGURED  # noqa: F401 — re-exported
 from protean.cli._helpers import cli_exception_handler  # noqa: F401 — re-exported
 from protean.cli._helpers import handle_cli_exceptions  # noqa: F401 — re-exported
+from protean.cli.bench import bench
 from protean.cli.check import check
 from protean.cli.database import app as db_app
 from protean.cli.dlq import app as dlq_app
@@ -38,6 +39,8 @@ from protean.cli.ir import app as ir_app
 from protean.cli.schema import app as schema_app
 from protean.cli.new import new
 from protean.cli.observatory import observatory
+from protean.cli.pm import app as pm_app
+from protean.cli.profile import profile
 from protean.cli.projection import app as projection_app
 from protean.cli.shell import shell
 from protean.cli.snapshot import app as snapshot_app
@@ -56,10 +59,12 @@ logger = get_logger(__name__)
 #   `no_args_is_help=True` will show the help message when no arguments are passed
 app = typer.Typer(no_args_is_help=True)
 
+app.command()(bench)
 app.command()(check)
 app.command()(upgrade_check)
 app.command()(new)
 app.command()(observatory)
+app.command()(profile)
 app.command()(shell)
 app.add_typer(db_app, name="db")
 app.add_typer(dlq_app, name="dlq")
@@ -68,6 +73,7 @@ app.add_typer(generate_app, name="generate")
 app.add_typer(ir_app, name="ir")
 app.add_typer(schema_app, name="schema")
 app.add_typer(docs_app, name="docs")
+app.add_typer(pm_app, name="pm")
 app.add_typer(projection_app, name="projection")
 app.add_typer(snapshot_app, name="snapshot")
 app.add_typer(subscriptions_app, name="subscriptions")
@@ -250,6 +256,7 @@ def server(
         else:
             # Multi-worker path: Supervisor spawns N independent Engine processes.
             # Each worker derives and initializes the domain independently.
+            from protean.server.drain import DrainPolicy  # noqa: PLC0415
             from protean.server.supervisor import Supervisor  # noqa: PLC0415
 
             supervisor = Supervisor(
@@ -257,6 +264,7 @@ def server(
                 num_workers=workers,
                 test_mode=test_mode,
                 debug=debug,
+                rolling_drain=DrainPolicy.from_config(derived_domain).rolling,
             )
             supervisor.run()
 
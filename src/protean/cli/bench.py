@@ -0,0 +1,180 @@
+"""CLI command for load-testing a domain and measuring its throughput.
+
+``protean bench`` drives a domain with deterministic synthetic commands and
+reports commands/sec, events/sec, handler latency percentiles, outbox lag
+and peak memory. Reports are JSON so that runs can be compared across
+Protean versions.
+
+Usage::
+
+    # 1,000 commands through the Engine against in-memory adapters
+    protean bench --domain=my_domain
+
+    # Synchronous processing on SQLite, report written to a file
+    protean bench --domain=my_domain --mode=sync --adapters=sqlite \\
+        --commands=5000 --output=bench.json
+
+    # Custom command mix
+    protean bench --domain=my_domain --scenario=benchmarks.orders:checkout
+"""
+
+import json as json_mod
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import print
+from rich.table import Table
+from typing_extensions import Annotated
+
+from protean.cli._helpers import handle_cli_exceptions
+from protean.exceptions import NoDomainException
+from protean.utils.domain_discovery import derive_domain
+from protean.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _load_scenario(path: str):
+    """Resolve a ``module:callable`` scenario path."""
+    import importlib  # noqa: PLC0415
+
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        print(f"Error: scenario must be given as 'module:callable', got '{path}'")
+        raise typer.Abort()
+    try:
+        return getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as exc:
+        print(f"Error loading scenario '{path}': {exc}")
+        raise typer.Abort()
+
+
+@handle_cli_exceptions("bench")
+def bench(
+    domain: Annotated[str, typer.Option(help="Domain module path")] = ".",
+    commands: Annotated[
+        int, typer.Option(help="Number of measured commands", min=1)
+    ] = 1000,
+    seed: Annotated[int, typer.Option(help="Seed for command generation")] = 42,
+    mode: Annotated[
+        str,
+        typer.Option(help="'async' (through the Engine) or 'sync' (inline)"),
+    ] = "async",
+    adapters: Annotated[
+        str,
+        typer.Option(help="'memory', 'sqlite', or 'configured' to keep the domain's"),
+    ] = "memory",
+    warmup: Annotated[
+        int, typer.Option(help="Unmeasured commands processed first", min=0)
+    ] = 0,
+    identities: Annotated[
+        int,
+        typer.Option(help="Size of the identifier pool for generated commands", min=1),
+    ] = 1000,
+    command: Annotated[
+        Optional[list[str]],
+        typer.Option(help="Only generate this command class (repeatable)"),
+    ] = None,
+    scenario: Annotated[
+        Optional[str],
+        typer.Option(help="'module:callable' yielding commands for (domain, rng)"),
+    ] = None,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(help="Write the report as JSON to this file"),
+    ] = None,
+    output_json: Annotated[
+        bool,
+        typer.Option("--json", help="Output raw JSON instead of a table"),
+    ] = False,
+) -> None:
+    """Load-test a domain and report throughput and latency."""
+    from protean.server.bench import (  # noqa: PLC0415
+        MODE_ASYNC,
+        MODE_SYNC,
+        configure_adapters,
+        run_benchmark,
+    )
+
+    if mode not in (MODE_ASYNC, MODE_SYNC):
+        print(f"Error: --mode must be '{MODE_ASYNC}' or '{MODE_SYNC}', got '{mode}'")
+        raise typer.Abort()
+
+    scenario_fn = _load_scenario(scenario) if scenario else None
+
+    try:
+        derived_domain = derive_domain(domain)
+    except NoDomainException as exc:
+        msg = f"Error loading Protean domain: {exc.args[0]}"
+        print(msg)
+        logger.error(msg)
+        raise typer.Abort()
+
+    assert derived_domain is not None
+    try:
+        configure_adapters(derived_domain, adapters)
+    except ValueError as exc:
+        print(f"Error: {exc}")
+        raise typer.Abort()
+    derived_domain.init()
+
+    try:
+        report = run_benchmark(
+            derived_domain,
+            commands=commands,
+            seed=seed,
+            mode=mode,
+            warmup=warmup,
+            identities=identities,
+            command_names=command or None,
+            scenario=scenario_fn,
+        )
+    except ValueError as exc:
+        print(f"Error: {exc}")
+        raise typer.Exit(code=1)
+    report["adapters"] = adapters
+
+    if output is not None:
+        output.write_text(json_mod.dumps(report, indent=2))
+
+    if output_json:
+        print(json_mod.dumps(report, indent=2))
+        return
+
+    summary = Table(title=f"Benchmark — {report['domain']} ({mode}, {adapters})")
+    summary.add_column("Metric", style="bold")
+    summary.add_column("Value", justify="right", style="cyan")
+    summary.add_row("Commands", str(report["commands"]))
+    summary.add_row("Rejected commands", str(sum(report["errors"].values())))
+    summary.add_row("Commands/sec (submit)", _fmt(report["submit"]["commands_per_sec"]))
+    if "processing" in report:
+        processing = report["processing"]
+        summary.add_row("Messages handled", str(processing["messages"]))
+        summary.add_row("Failed messages", str(processing["failed"]))
+        summary.add_row("Messages/sec", _fmt(processing["messages_per_sec"]))
+    summary.add_row("Events", str(report["events"]["count"]))
+    summary.add_row("Events/sec", _fmt(report["events"]["events_per_sec"]))
+    if report["outbox"]["pending_after_run"] is not None:
+        summary.add_row("Outbox pending", str(report["outbox"]["pending_after_run"]))
+    summary.add_row("Peak RSS (MiB)", _fmt(report["peak_rss_mb"]))
+    print(summary)
+
+    latency = Table(title="Latency (ms)")
+    latency.add_column("Handler" if mode == MODE_ASYNC else "Command", style="bold")
+    for column in ("count", "p50", "p90", "p99", "max"):
+        latency.add_column(column, justify="right")
+    for name, stats in report["latency_ms"].items():
+        latency.add_row(
+            name,
+            str(stats["count"]),
+            *(_fmt(stats[key]) for key in ("p50", "p90", "p99", "max")),
+        )
+    print(latency)
+
+    if output is not None:
+        print(f"Report written to {output}")
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:,.2f}"
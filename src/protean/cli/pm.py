@@ -0,0 +1,156 @@
+"""CLI commands for process manager maintenance.
+
+Provides the ``protean pm compact`` command for compacting the transition
+streams of completed and long-idle process manager instances.
+
+Usage::
+
+    # Compact every process manager with the configured retention policy
+    protean pm compact --domain=my_domain
+
+    # Compact one process manager, archiving removed transitions
+    protean pm compact --domain=my_domain --process-manager=OrderFulfillmentPM \\
+        --archive=transitions.jsonl
+
+    # Report what would be compacted
+    protean pm compact --domain=my_domain --dry-run
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+import typer
+from rich import print
+from typing_extensions import Annotated
+
+from protean.cli._helpers import handle_cli_exceptions
+from protean.exceptions import NoDomainException
+from protean.utils import DomainObjects
+from protean.utils.domain_discovery import derive_domain
+from protean.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+    from protean.utils.process_manager_compactor import CompactionResult
+
+logger = get_logger(__name__)
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.callback()
+def callback():
+    """Manage process managers."""
+
+
+@app.command()
+@handle_cli_exceptions("pm compact")
+def compact(
+    domain: Annotated[str, typer.Option(help="Domain module path")] = ".",
+    process_manager: Annotated[
+        str,
+        typer.Option(
+            help="Process manager class name (e.g. 'OrderFulfillmentPM'). "
+            "If omitted, compacts all process managers."
+        ),
+    ] = "",
+    idle_days: Annotated[
+        Optional[float],
+        typer.Option(
+            help="Also compact incomplete instances idle for this many days. "
+            "Defaults to process_manager.compaction.idle_days."
+        ),
+    ] = None,
+    min_transitions: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Leave streams with fewer transitions alone. "
+            "Defaults to process_manager.compaction.min_transitions."
+        ),
+    ] = None,
+    archive: Annotated[
+        str,
+        typer.Option(
+            help="JSON Lines file to append removed transitions to. "
+            "If omitted, removed transitions are deleted."
+        ),
+    ] = "",
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Report what would be compacted."),
+    ] = False,
+) -> None:
+    """Compact process manager transition streams.
+
+    Completed instances, and instances whose last transition is older than
+    --idle-days, get a terminal snapshot transition carrying their state.
+    The transitions before the snapshot are archived (with --archive) and
+    removed from the stream. Loading a compacted instance is unaffected.
+    """
+    try:
+        derived_domain = derive_domain(domain)
+    except NoDomainException as exc:
+        msg = f"Error loading Protean domain: {exc.args[0]}"
+        print(msg)
+        logger.error(msg)
+        raise typer.Abort()
+
+    assert derived_domain is not None
+
+    options = {
+        "idle_days": idle_days,
+        "min_transitions": min_transitions,
+        "archive": archive or None,
+        "dry_run": dry_run,
+    }
+
+    derived_domain.init()
+    with derived_domain.domain_context():
+        if process_manager:
+            pm_cls = _resolve_process_manager(derived_domain, process_manager)
+            if pm_cls is None:
+                raise typer.Abort()
+
+            result = derived_domain.compact_process_manager(pm_cls, **options)
+            if not result.success:
+                for error in result.errors:
+                    print(f"Error: {error}")
+                raise typer.Abort()
+            print(_summary(result, dry_run))
+        else:
+            results = derived_domain.compact_all_process_managers(**options)
+            if not results:
+                print("No process managers found in domain.")
+                return
+
+            for name, result in results.items():
+                if result.success:
+                    print(f"  {name}: {_summary(result, dry_run)}")
+                else:
+                    for error in result.errors:
+                        print(f"  {name}: ERROR - {error}")
+
+
+def _resolve_process_manager(domain: "Domain", name: str):
+    """Resolve a process manager class by name from the domain registry.
+
+    Returns the class or None (with error printed).
+    """
+    for _, record in domain.registry._elements[
+        DomainObjects.PROCESS_MANAGER.value
+    ].items():
+        if record.cls.__name__ == name:
+            return record.cls
+
+    print(f"Error: Process manager '{name}' not found in domain.")
+    return None
+
+
+def _summary(result: "CompactionResult", dry_run: bool) -> str:
+    verb = "Would compact" if dry_run else "Compacted"
+    summary = (
+        f"{verb} {result.streams_compacted} of {result.streams_examined} "
+        f"stream(s), removing {result.transitions_removed} transition(s)"
+    )
+    if result.transitions_archived:
+        summary += f" ({result.transitions_archived} archived)"
+    return summary + "."
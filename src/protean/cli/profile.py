@@ -0,0 +1,152 @@
+"""CLI command for capturing a handler profile from running engines.
+
+Engines started with ``[server.profiling] enabled = true`` publish
+cumulative profile snapshots to Redis. ``protean profile`` reads them at
+the start and end of a window and reports the difference: where handler
+time went while the command was running.
+
+Usage::
+
+    # Profile all workers for 30 seconds and print a table
+    protean profile --domain=my_domain
+
+    # Write a flame graph tree for one handler
+    protean profile --domain=my_domain --duration=60 \\
+        --handler=OrderProjector --output=profile.json
+"""
+
+import json as json_mod
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import print
+from rich.table import Table
+from typing_extensions import Annotated
+
+from protean.cli._helpers import handle_cli_exceptions
+from protean.exceptions import NoDomainException
+from protean.utils.domain_discovery import derive_domain
+from protean.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _load_domain(domain_path: str):
+    """Load and initialize a domain, handling errors consistently."""
+    try:
+        derived_domain = derive_domain(domain_path)
+    except NoDomainException as exc:
+        msg = f"Error loading Protean domain: {exc.args[0]}"
+        print(msg)
+        logger.error(msg)
+        raise typer.Abort()
+
+    assert derived_domain is not None
+    derived_domain.init()
+    return derived_domain
+
+
+@handle_cli_exceptions("profile")
+def profile(
+    domain: Annotated[str, typer.Option(help="Domain module path")] = ".",
+    duration: Annotated[
+        float, typer.Option(help="Length of the capture window in seconds")
+    ] = 30.0,
+    handler: Annotated[
+        Optional[str],
+        typer.Option(help="Restrict the flame graph to one handler class"),
+    ] = None,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(help="Write the flame graph tree as JSON to this file"),
+    ] = None,
+    output_json: Annotated[
+        bool,
+        typer.Option("--json", help="Output raw JSON instead of a table"),
+    ] = False,
+) -> None:
+    """Capture a handler profile from running engines."""
+    from protean.server.profiler import (  # noqa: PLC0415
+        diff_snapshots,
+        merge_snapshots,
+        read_snapshots,
+        summarize,
+        to_flamegraph,
+    )
+
+    derived_domain = _load_domain(domain)
+
+    with derived_domain.domain_context():
+        broker = derived_domain.brokers.get("default")
+        redis_conn = getattr(broker, "redis_instance", None) if broker else None
+        if redis_conn is None:
+            print("Error: profiling requires a Redis broker as the default broker.")
+            raise typer.Abort()
+
+        before = merge_snapshots(read_snapshots(redis_conn, derived_domain.name))
+        if not before["workers"]:
+            print(
+                "No profile snapshots found. Enable [server.profiling] on the "
+                "engine and retry."
+            )
+            raise typer.Exit(code=1)
+
+        if not output_json:
+            print(f"Profiling {len(before['workers'])} worker(s) for {duration:g}s...")
+        time.sleep(duration)
+        after = merge_snapshots(read_snapshots(redis_conn, derived_domain.name))
+
+    window = diff_snapshots(before, after)
+    handlers = summarize(window)
+    flamegraph = to_flamegraph(window, handler=handler)
+
+    if output is not None:
+        output.write_text(json_mod.dumps(flamegraph, indent=2))
+
+    if output_json:
+        print(
+            json_mod.dumps(
+                {
+                    "duration": duration,
+                    "samples": window["samples"],
+                    "handlers": handlers,
+                    "flamegraph": flamegraph,
+                },
+                indent=2,
+            )
+        )
+        return
+
+    if not handlers:
+        print("No handler activity recorded in the window.")
+        return
+
+    table = Table(title=f"Handler profile — {derived_domain.name} ({duration:g}s)")
+    table.add_column("Handler", style="bold")
+    table.add_column("Message type")
+    table.add_column("Calls", justify="right")
+    table.add_column("Wall ms", justify="right", style="cyan")
+    table.add_column("CPU ms", justify="right")
+    table.add_column("Avg ms", justify="right")
+
+    ranked = sorted(handlers.items(), key=lambda item: -item[1]["wall_ms"])
+    for handler_name, totals in ranked:
+        message_types = sorted(
+            totals["message_types"].items(), key=lambda item: -item[1]["wall_ms"]
+        )
+        for message_type, stats in message_types:
+            table.add_row(
+                handler_name,
+                message_type,
+                str(stats["count"]),
+                f"{stats['wall_ms']:.1f}",
+                f"{stats['cpu_ms']:.1f}",
+                f"{stats['wall_ms'] / stats['count']:.2f}",
+            )
+
+    print(table)
+    print(f"{window['samples']} stack samples")
+    if output is not None:
+        print(f"Flame graph written to {output}")
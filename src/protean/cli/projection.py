@@ -11,6 +11,12 @@ Usage::
 
     # Rebuild all projections
     protean projection rebuild --domain=my_domain
+
+    # Continue an interrupted rebuild, replaying on four threads
+    protean projection rebuild --domain=my_domain --resume --workers=4
+
+    # Rebuild into a shadow copy and swap it in, without downtime
+    protean projection rebuild --domain=my_domain --projection=Balances --shadow
 """
 
 import json as json_mod
@@ -53,8 +59,26 @@ def rebuild(
     ] = "",
     batch_size: Annotated[
         int,
-        typer.Option(help="Number of events to read per batch."),
+        typer.Option(help="Number of events to read and apply per page."),
     ] = 500,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help="Continue from the checkpoints of an interrupted rebuild.",
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(help="Number of partitions to replay in parallel.", min=1),
+    ] = 1,
+    shadow: Annotated[
+        bool,
+        typer.Option(
+            "--shadow",
+            help="Build into a shadow copy and swap it in when caught up.",
+        ),
+    ] = False,
 ) -> None:
     """Rebuild projections by replaying events from the event store.
 
@@ -63,9 +87,13 @@ def rebuild(
 
     Without options, rebuilds ALL projections.
     Use --projection to target a specific projection class.
+    Use --resume to continue an interrupted rebuild from its checkpoints,
+    and --workers to replay partitions of the events in parallel.
+    Use --shadow to keep the live projection readable: the rebuild writes
+    to a shadow copy and swaps it in atomically once it has caught up.
 
-    Warning: ensure the server is stopped before rebuilding projections
-    to avoid conflicts with concurrent event processing.
+    Warning: unless --shadow is used, ensure the server is stopped before
+    rebuilding projections to avoid conflicts with concurrent event processing.
     """
     try:
         derived_domain = derive_domain(domain)
@@ -80,9 +108,22 @@ def rebuild(
     derived_domain.init()
     with derived_domain.domain_context():
         if projection:
-            _rebuild_single(derived_domain, projection, batch_size)
+            _rebuild_single(
+                derived_domain,
+                projection,
+                batch_size,
+                resume=resume,
+                workers=workers,
+                shadow=shadow,
+            )
         else:
-            _rebuild_all(derived_domain, batch_size)
+            _rebuild_all(
+                derived_domain,
+                batch_size,
+                resume=resume,
+                workers=workers,
+                shadow=shadow,
+            )
 
 
 def _resolve_projection(domain: "Domain", projection_name: str):
@@ -102,16 +143,21 @@ def _rebuild_single(
     domain: "Domain",
     projection_name: str,
     batch_size: int,
+    resume: bool = False,
+    workers: int = 1,
+    shadow: bool = False,
 ) -> None:
     """Rebuild a single projection."""
     projection_cls = _resolve_projection(domain, projection_name)
     if projection_cls is None:
         raise typer.Abort()
 
-    result = domain.rebuild_projection(projection_cls, batch_size)
+    result = domain.rebuild_projection(
+        projection_cls, batch_size, resume=resume, workers=workers, shadow=shadow
+    )
     if result.success:
         print(
-            f"Rebuilt projection '{result.projection_name}': "
+            f"{'Resumed' if result.resumed else 'Rebuilt'} projection '{result.projection_name}': "
             f"{result.events_dispatched} events processed "
             f"through {result.projectors_processed} projector(s) "
             f"across {result.categories_processed} category/categories."
@@ -124,9 +170,17 @@ def _rebuild_single(
         raise typer.Abort()
 
 
-def _rebuild_all(domain: "Domain", batch_size: int) -> None:
+def _rebuild_all(
+    domain: "Domain",
+    batch_size: int,
+    resume: bool = False,
+    workers: int = 1,
+    shadow: bool = False,
+) -> None:
     """Rebuild all projections in the domain."""
-    results = domain.rebuild_all_projections(batch_size)
+    results = domain.rebuild_all_projections(
+        batch_size, resume=resume, workers=workers, shadow=shadow
+    )
     if not results:
         print("No projections found in domain.")
         return
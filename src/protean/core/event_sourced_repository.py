@@ -12,6 +12,7 @@ from protean.exceptions import (
 from protean.utils import DomainObjects, derive_element_class
 from protean.utils.container import Element, OptionsMixin
 from protean.utils.globals import current_uow
+from protean.utils.stages import STAGE_LOAD, stage
 from protean.utils.telemetry import set_span_error
 
 logger = logging.getLogger(__name__)
@@ -165,15 +166,24 @@ class BaseEventSourcedRepository(Element, OptionsMixin):
 
         # Temporal queries always bypass the identity map.
         if not is_temporal:
-            if current_uow and identifier in current_uow._identity_map:
-                return cast(BaseAggregate, current_uow._identity_map[identifier])
-
-        aggregate = self._domain.event_store.store.load_aggregate(
-            self.meta_.part_of,
-            identifier,
-            at_version=at_version,
-            as_of=as_of,
-        )
+            # The identity map is keyed by provider, then identifier. An
+            #   aggregate added earlier in this UnitOfWork carries changes not
+            #   yet in the event store, so it is returned instead of a fresh
+            #   load.
+            if current_uow:
+                tracked = current_uow._get_from_identity_map(
+                    self.meta_.part_of.meta_.provider, identifier
+                )
+                if tracked is not None:
+                    return cast(BaseAggregate, tracked)
+
+        with stage(STAGE_LOAD):
+            aggregate = self._domain.event_store.store.load_aggregate(
+                self.meta_.part_of,
+                identifier,
+                at_version=at_version,
+                as_of=as_of,
+            )
 
         if not aggregate:
             raise ObjectNotFoundError(
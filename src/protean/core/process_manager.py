@@ -25,8 +25,12 @@ Example::
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import date, datetime
 from typing import Any, ClassVar, Optional, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 from pydantic_core import PydanticUndefined
@@ -56,9 +60,73 @@ from protean.utils.eventing import (
 from protean.utils.globals import current_domain
 from protean.utils.mixins import HandlerMixin
 from protean.utils.reflection import _FIELDS, _ID_FIELD_NAME
+from protean.utils.stages import STAGE_DESERIALIZE, STAGE_HANDLER, STAGE_LOAD, stage
 
 logger = logging.getLogger(__name__)
 
+# Transitions read per page when replaying a whole PM stream
+TRANSITION_PAGE_SIZE = 1000
+
+
+class StreamStateCache:
+    """Thread-safe, size-bounded LRU of the latest state written to streams.
+
+    Each entry holds the stream version the state was read or written at.
+    Readers compare it with the stream's current version before trusting
+    the entry, and every write that depends on it carries that version as
+    its ``expected_version``, so a write racing another process still fails
+    and the caller discards the entry.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, stream: str) -> tuple[int, Any] | None:
+        with self._lock:
+            entry = self._entries.get(stream)
+            if entry is not None:
+                self._entries.move_to_end(stream)
+            return entry
+
+    def put(self, stream: str, version: int, state: Any) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[stream] = (version, state)
+            self._entries.move_to_end(stream)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, stream: str) -> None:
+        with self._lock:
+            self._entries.pop(stream, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Latest PM state per stream, one cache per event store instance
+_state_caches: WeakKeyDictionary[Any, StreamStateCache] = WeakKeyDictionary()
+_state_caches_lock = threading.Lock()
+
+
+def _state_cache(store: Any) -> StreamStateCache:
+    """Return the PM state cache for an event store, sized by the current
+    domain's ``process_manager.cache_size`` when first used."""
+    with _state_caches_lock:
+        cache = _state_caches.get(store)
+        if cache is None:
+            pm_config = current_domain.config.get("process_manager", {})
+            cache = StreamStateCache(pm_config.get("cache_size", 1000))
+            _state_caches[store] = cache
+        return cache
+
 
 def _resolve_correlation_value(
     event: BaseEvent, correlate_spec: Union[str, dict[str, str]]
@@ -306,7 +374,9 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
         state as a transition event in the PM's own event store stream.
         """
         # Deserialize
-        item = item.to_domain_object() if isinstance(item, Message) else item
+        if isinstance(item, Message):
+            with stage(STAGE_DESERIALIZE):
+                item = item.to_domain_object()
 
         # Find matching handler methods
         handlers = cls._handlers.get(item.__class__.__type__) or cls._handlers.get(
@@ -329,7 +399,8 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             correlation_value = _resolve_correlation_value(item, correlate_spec)
 
             # Load or create PM instance
-            pm_instance = cls._load_or_create(correlation_value, is_start)
+            with stage(STAGE_LOAD):
+                pm_instance = cls._load_or_create(correlation_value, is_start)
             if pm_instance is None:
                 logger.debug(
                     "Process Manager `%s` with correlation `%s` not found; "
@@ -353,7 +424,8 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             # Run handler within UoW, then persist transition
             with UnitOfWork():
                 # Call the ORIGINAL function, bypassing the @handle wrapper's UoW
-                handler_method.__wrapped__(pm_instance, item)
+                with stage(STAGE_HANDLER):
+                    handler_method.__wrapped__(pm_instance, item)
 
                 if is_end:
                     pm_instance._is_complete = True
@@ -372,6 +444,16 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
     ) -> Optional["BaseProcessManager"]:
         """Load an existing PM from its event store stream, or create a new one.
 
+        Every transition event carries the PM's full state, so only the last
+        one is read. The state is also kept in an in-process cache, keyed by
+        stream version, and later events for the same PM are served from
+        there once the stream's version confirms the entry is current. A
+        stale entry is dropped and the PM reloaded before any handler runs.
+
+        With ``process_manager.replay_transitions`` enabled, the PM is instead
+        rebuilt from every transition in its stream and compared with the last
+        one, to validate the stored state.
+
         Args:
             correlation_value: The value used to identify this PM instance.
             is_start: If True and no existing PM is found, create a new instance.
@@ -380,26 +462,37 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             The loaded or newly created PM instance, or None if not found and
             not a start event.
         """
+        store = current_domain.event_store.store
         stream_name = f"{cls.meta_.stream_category}-{correlation_value}"
-        messages = current_domain.event_store.store.read(stream_name)
 
-        if messages:
-            return cls._from_transitions(messages, correlation_value)
+        cache = _state_cache(store)
+
+        # Start events always check the store, so that a PM is never
+        # restarted from a stale cache entry
+        cached = None if is_start else cache.get(stream_name)
+        if cached is not None:
+            version, (state, is_complete) = cached
+            # Another process may have moved the stream on; its handlers
+            # must not run against the older state
+            if store._stream_version(stream_name) == version:
+                return cls._from_state(correlation_value, version, state, is_complete)
+            cache.discard(stream_name)
+
+        last_message = store.read_last_message(stream_name)
+        if last_message is not None:
+            if current_domain.config.get("process_manager", {}).get(
+                "replay_transitions", False
+            ):
+                pm = cls._from_transitions(
+                    cls._read_transitions(stream_name), correlation_value
+                )
+                cls._verify_replay(pm, last_message)
+            else:
+                pm = cls._from_last_transition(last_message, correlation_value)
+            cache.put(stream_name, pm._version, (pm._state(), pm._is_complete))
+            return pm
         elif is_start:
-            pm = cls.__new__(cls)
-            # Initialize Pydantic internals
-            object.__setattr__(pm, "__dict__", {})
-            object.__setattr__(pm, "__pydantic_extra__", None)
-            object.__setattr__(pm, "__pydantic_fields_set__", set())
-            object.__setattr__(
-                pm,
-                "__pydantic_private__",
-                {
-                    "_version": -1,
-                    "_is_complete": False,
-                    "_correlation_value": correlation_value,
-                },
-            )
+            pm = cls._blank(correlation_value)
 
             # Initialize all model fields to defaults
             for fname, finfo in cls.model_fields.items():
@@ -420,18 +513,8 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             return None
 
     @classmethod
-    def _from_transitions(
-        cls, messages: list, correlation_value: str
-    ) -> "BaseProcessManager":
-        """Reconstitute a PM from its transition events.
-
-        Args:
-            messages: List of Message objects from the PM's event store stream.
-            correlation_value: The correlation value for this PM instance.
-
-        Returns:
-            The fully reconstituted PM instance.
-        """
+    def _blank(cls, correlation_value: str) -> "BaseProcessManager":
+        """Create an uninitialized PM instance, bypassing validation."""
         pm = cls.__new__(cls)
         # Initialize Pydantic internals
         object.__setattr__(pm, "__dict__", {})
@@ -446,6 +529,89 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
                 "_correlation_value": correlation_value,
             },
         )
+        return pm
+
+    @classmethod
+    def _from_state(
+        cls,
+        correlation_value: str,
+        version: int,
+        state: dict[str, Any],
+        is_complete: bool,
+    ) -> "BaseProcessManager":
+        """Reconstitute a PM from a captured state at a stream version."""
+        pm = cls._blank(correlation_value)
+        state = deepcopy(state)
+        for fname in cls.model_fields:
+            pm.__dict__[fname] = state.get(fname)
+        pm._version = version
+        pm._is_complete = is_complete
+        return pm
+
+    @classmethod
+    def _from_last_transition(
+        cls, message: Message, correlation_value: str
+    ) -> "BaseProcessManager":
+        """Reconstitute a PM from the last transition event in its stream."""
+        domain_obj = message.to_domain_object()
+        return cls._from_state(
+            correlation_value,
+            message.metadata.event_store.position,
+            {
+                key: value
+                for key, value in domain_obj.state.items()
+                if key in cls.model_fields
+            },
+            bool(domain_obj.is_complete),
+        )
+
+    @classmethod
+    def _read_transitions(cls, stream_name: str) -> list[Message]:
+        """Read every transition event in a PM stream, page by page."""
+        store = current_domain.event_store.store
+        messages: list[Message] = []
+        position = 0
+        while True:
+            page = store.read(
+                stream_name, position=position, no_of_messages=TRANSITION_PAGE_SIZE
+            )
+            messages.extend(page)
+            if len(page) < TRANSITION_PAGE_SIZE:
+                return messages
+            # Compacted streams do not start at position 0
+            position = page[-1].metadata.event_store.position + 1
+
+    @classmethod
+    def _verify_replay(cls, pm: "BaseProcessManager", last_message: Message) -> None:
+        """Warn when replayed state differs from the last transition's state."""
+        expected = cls._from_last_transition(last_message, pm._correlation_value)
+        if (
+            pm._state() != expected._state()
+            or pm._version != expected._version
+            or pm._is_complete != expected._is_complete
+        ):
+            logger.warning(
+                "Process Manager `%s` with correlation `%s`: replaying %d "
+                "transitions does not reproduce the state of the last one",
+                cls.__name__,
+                pm._correlation_value,
+                pm._version + 1,
+            )
+
+    @classmethod
+    def _from_transitions(
+        cls, messages: list, correlation_value: str
+    ) -> "BaseProcessManager":
+        """Reconstitute a PM from its transition events.
+
+        Args:
+            messages: List of Message objects from the PM's event store stream.
+            correlation_value: The correlation value for this PM instance.
+
+        Returns:
+            The fully reconstituted PM instance.
+        """
+        pm = cls._blank(correlation_value)
 
         # Initialize all model fields to None
         for fname in cls.model_fields:
@@ -458,12 +624,27 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             for key, value in state.items():
                 if key in cls.model_fields:
                     pm.__dict__[key] = value
-            pm._version += 1
+            # Compacted streams start at their snapshot's position
+            event_store_meta = message.metadata.event_store
+            if event_store_meta and event_store_meta.position is not None:
+                pm._version = event_store_meta.position
+            else:
+                pm._version += 1
             if domain_obj.is_complete:
                 pm._is_complete = True
 
         return pm
 
+    def _state(self) -> dict[str, Any]:
+        """Capture the PM's field values, serializing non-JSON-safe types."""
+        state: dict[str, Any] = {}
+        for fname in self.__class__.model_fields:
+            value = getattr(self, fname, None)
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            state[fname] = value
+        return state
+
     @classmethod
     def _persist_transition(
         cls, pm_instance: "BaseProcessManager", handler_name: str
@@ -478,14 +659,7 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             handler_name: The name of the handler method that triggered this transition.
         """
         # Capture current state, serializing non-JSON-safe types
-        state: dict[str, Any] = {}
-        for fname in cls.model_fields:
-            value = getattr(pm_instance, fname, None)
-            if isinstance(value, datetime):
-                value = value.isoformat()
-            elif isinstance(value, date):
-                value = value.isoformat()
-            state[fname] = value
+        state = pm_instance._state()
 
         transition_cls = cls._transition_event_cls
         if transition_cls is None:
@@ -537,8 +711,19 @@ class BaseProcessManager(BaseModel, HandlerMixin, OptionsMixin):
             _expected_version=expected_version,
         )
 
-        # Write directly to event store
-        current_domain.event_store.store.append(transition_event)
+        # Write directly to event store, keeping the cached state in step
+        store = current_domain.event_store.store
+        cache = _state_cache(store)
+        try:
+            store.append(transition_event)
+        except Exception:
+            cache.discard(stream_name)
+            raise
+        cache.put(
+            stream_name,
+            pm_instance._version,
+            (deepcopy(state), pm_instance._is_complete),
+        )
 
 
 _T = TypeVar("_T")
@@ -8,7 +8,11 @@ from protean.exceptions import IncorrectUsageError, NotSupportedError
 from protean.fields import HasMany, HasOne
 from protean.fields.tempdata import HasManyChanges, HasOneChanges
 from protean.port.dao import BaseDAO
-from protean.port.provider import BaseProvider
+from protean.port.provider import (
+    BaseProvider,
+    shadow_storage_active,
+    shadow_storage_for,
+)
 from protean.utils import (
     Database,
     DomainObjects,
@@ -19,6 +23,7 @@ from protean.utils.container import Element, OptionsMixin
 from protean.utils.globals import current_uow, g
 from protean.utils.query import Q
 from protean.utils.reflection import association_fields, has_association_fields
+from protean.utils.stages import STAGE_LOAD, stage
 from protean.utils.telemetry import set_span_error
 
 if TYPE_CHECKING:
@@ -92,7 +97,6 @@ class BaseRepository(Element, OptionsMixin):
         return database_model_cls
 
     @property
-    @lru_cache()
     def _dao(self) -> BaseDAO:
         """Return the Data Access Object for this repository's aggregate.
 
@@ -116,6 +120,17 @@ class BaseRepository(Element, OptionsMixin):
             teardown, GDPR compliance) but should not be used for routine
             domain queries.
         """
+        if shadow_storage_active():
+            # Resolved per access: shadow routing is scoped to the current context
+            shadow_name = shadow_storage_for(self.meta_.part_of)
+            if shadow_name is not None:
+                return self._provider.get_shadow_dao(
+                    self.meta_.part_of, self._database_model, shadow_name
+                )
+        return self._live_dao()
+
+    @lru_cache()
+    def _live_dao(self) -> BaseDAO:
         # Fixate on Model class at the domain level because an explicit model may have been registered
         return self._provider.get_dao(self.meta_.part_of, self._database_model)  # type: ignore[return-value]
 
@@ -424,9 +439,19 @@ class BaseRepository(Element, OptionsMixin):
             span.set_attribute("protean.aggregate.type", self.meta_.part_of.__name__)
             span.set_attribute("protean.provider", self._provider.name)
 
+            # A batch UnitOfWork loads each aggregate once and hands the same
+            #   instance to every command that targets it.
+            if current_uow and current_uow.in_progress and current_uow.is_batch:
+                item = current_uow._get_from_identity_map(
+                    self._provider.name, identifier
+                )
+                if item is not None:
+                    return item
+
             try:
-                item = self._dao.get(identifier)
-                self._prewarm_associations(item)
+                with stage(STAGE_LOAD):
+                    item = self._dao.get(identifier)
+                    self._prewarm_associations(item)
                 return item
             except Exception as exc:
                 set_span_error(span, exc)
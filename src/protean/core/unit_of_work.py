@@ -1,6 +1,7 @@
 import logging
+import time
 from collections import defaultdict
-from typing import Any
+from typing import Any, Iterator
 
 from protean.exceptions import (
     ConfigurationError,
@@ -10,8 +11,16 @@ from protean.exceptions import (
 )
 from protean.port.provider import DatabaseCapabilities
 from protean.utils import Processing
+from protean.utils.contention import get_contention_tracker
 from protean.utils.globals import _uow_context_stack, current_domain, g
 from protean.utils.processing import current_priority
+from protean.utils.stages import (
+    STAGE_APPEND,
+    STAGE_FLUSH,
+    STAGE_OUTBOX,
+    STAGE_PUBLISH,
+    stage,
+)
 from protean.utils.reflection import id_field
 from protean.utils.telemetry import get_domain_metrics, set_span_error
 
@@ -38,20 +47,36 @@ class UnitOfWork:
     The UnitOfWork maintains an identity map to track loaded aggregates and
     collects domain events raised during the transaction. On commit, events
     are persisted to the outbox and dispatched to brokers/event store.
+
+    A *batch* UnitOfWork (``UnitOfWork(batch=True)``), used by
+    ``domain.process_many()``, is shared by several handler invocations:
+    handlers run inside it join it instead of opening their own, and
+    repositories return aggregates already loaded in it from the identity
+    map instead of loading them again.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, batch: bool = False) -> None:
         self.domain = current_domain
         self._in_progress = False
+        self._batch = batch
 
         self._sessions = {}
         self._messages_to_dispatch = []
         self._identity_map = defaultdict(dict)
+        self._started_at = 0.0
 
     @property
     def in_progress(self):
         return self._in_progress
 
+    @property
+    def is_batch(self) -> bool:
+        return self._batch
+
+    def _get_from_identity_map(self, provider_name: str, identifier: Any) -> Any:
+        """Return the aggregate tracked under ``identifier``, or None."""
+        return self._identity_map.get(provider_name, {}).get(identifier)
+
     def __enter__(self):
         # Initiate a new session as part of self
         self.start()
@@ -59,6 +84,8 @@ class UnitOfWork:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:  # something blew up inside the block
+            if isinstance(exc_val, ExpectedVersionError):
+                self._record_conflict(exc_val)
             self.rollback()
             return False  # re-raise the original exception
 
@@ -76,6 +103,31 @@ class UnitOfWork:
         identifier = getattr(aggregate, id_f.field_name)
         self._identity_map[aggregate.meta_.provider][identifier] = aggregate
 
+    def _aggregates(self) -> Iterator[tuple[str, Any]]:
+        """Yield ``(aggregate class name, identifier)`` for every tracked aggregate."""
+        for identity_map in self._identity_map.values():
+            for identifier, item in identity_map.items():
+                yield type(item).__name__, identifier
+
+    def _aggregate_for_stream(self, stream: str) -> tuple[str, Any] | None:
+        """Find the tracked aggregate that writes to ``stream``."""
+        for identity_map in self._identity_map.values():
+            for identifier, item in identity_map.items():
+                if f"{item.meta_.stream_category}-{identifier}" == stream:
+                    return type(item).__name__, identifier
+        return None
+
+    def _record_conflict(self, exc: ExpectedVersionError) -> None:
+        """Count a version conflict against the aggregate instance that caused it."""
+        if exc.aggregate is None:
+            return
+        try:
+            get_contention_tracker(self.domain).record_conflict(
+                exc.aggregate, exc.aggregate_id
+            )
+        except Exception:
+            logger.debug("uow.contention_record_failed", exc_info=True)
+
     def _gather_events(self):
         """Gather all events from items in the identity map"""
         all_events = defaultdict(list)
@@ -112,6 +164,7 @@ class UnitOfWork:
                     )
 
         self._in_progress = True
+        self._started_at = time.monotonic()
         _uow_context_stack.push(self)
 
     def commit(self) -> None:  # noqa: C901
@@ -147,7 +200,11 @@ class UnitOfWork:
                     if causation_id:
                         span.set_attribute("protean.causation_id", causation_id)
 
-            self._do_commit(span)
+            try:
+                self._do_commit(span)
+            except ExpectedVersionError as exc:
+                self._record_conflict(exc)
+                raise
 
     def _do_commit(self, span: Any) -> None:  # noqa: C901
         """Internal commit logic wrapped by the ``protean.uow.commit`` span."""
@@ -202,69 +259,70 @@ class UnitOfWork:
         # not in a relational table.  We still need a session for the outbox
         # INSERT, so one is lazily initialised here when missing.
         if self.domain.has_outbox:
-            outbox_config = self.domain.config.get("outbox", {})
-            internal_broker = outbox_config.get("broker", "default")
-            external_brokers: list[str] = outbox_config.get("external_brokers", [])
-            # Always tag the internal row with the configured internal broker.
-            # The composite (message_id, target_broker) unique index relies on
-            # target_broker never being NULL: PostgreSQL and SQLite treat NULLs
-            # as distinct in a UNIQUE index, so a NULL target_broker would
-            # defeat message_id idempotency. Published events additionally get
-            # one row per external broker below.
-
-            for provider_name, events in all_events.items():
-                if not events:
-                    continue
-
-                # Ensure a database session exists for this provider.
-                # For event-sourced aggregates no DAO call was made during
-                # persistence, so the session may not have been created yet.
-                if provider_name not in self._sessions:
-                    self._initialize_session(provider_name)
-
-                outbox_repo = self.domain._get_outbox_repo(provider_name)
-
-                for event in events:
-                    # Extract trace context for outbox denormalized fields
-                    correlation_id = None
-                    causation_id = None
-                    if event._metadata and event._metadata.domain:
-                        correlation_id = event._metadata.domain.correlation_id
-                        causation_id = event._metadata.domain.causation_id
-
-                    # Internal outbox row (always created)
-                    outbox_message = Outbox.create_message(
-                        message_id=event._metadata.headers.id,
-                        stream_name=event._metadata.headers.stream,
-                        message_type=event._metadata.headers.type,
-                        data=event.payload,
-                        metadata=event._metadata,
-                        priority=priority,
-                        correlation_id=correlation_id,
-                        causation_id=causation_id,
-                        target_broker=internal_broker,
-                    )
-                    outbox_repo._dao.save(outbox_message)
-
-                    # External outbox rows for published events — one per
-                    # external broker.  Each row is processed independently
-                    # by its own OutboxProcessor instance.
-                    if external_brokers and getattr(
-                        event.__class__.meta_, "published", False
-                    ):
-                        for ext_broker in external_brokers:
-                            ext_outbox = Outbox.create_message(
-                                message_id=event._metadata.headers.id,
-                                stream_name=event._metadata.headers.stream,
-                                message_type=event._metadata.headers.type,
-                                data=event.payload,
-                                metadata=event._metadata,
-                                priority=priority,
-                                correlation_id=correlation_id,
-                                causation_id=causation_id,
-                                target_broker=ext_broker,
-                            )
-                            outbox_repo._dao.save(ext_outbox)
+            with stage(STAGE_OUTBOX):
+                outbox_config = self.domain.config.get("outbox", {})
+                internal_broker = outbox_config.get("broker", "default")
+                external_brokers: list[str] = outbox_config.get("external_brokers", [])
+                # Always tag the internal row with the configured internal broker.
+                # The composite (message_id, target_broker) unique index relies on
+                # target_broker never being NULL: PostgreSQL and SQLite treat NULLs
+                # as distinct in a UNIQUE index, so a NULL target_broker would
+                # defeat message_id idempotency. Published events additionally get
+                # one row per external broker below.
+
+                for provider_name, events in all_events.items():
+                    if not events:
+                        continue
+
+                    # Ensure a database session exists for this provider.
+                    # For event-sourced aggregates no DAO call was made during
+                    # persistence, so the session may not have been created yet.
+                    if provider_name not in self._sessions:
+                        self._initialize_session(provider_name)
+
+                    outbox_repo = self.domain._get_outbox_repo(provider_name)
+
+                    for event in events:
+                        # Extract trace context for outbox denormalized fields
+                        correlation_id = None
+                        causation_id = None
+                        if event._metadata and event._metadata.domain:
+                            correlation_id = event._metadata.domain.correlation_id
+                            causation_id = event._metadata.domain.causation_id
+
+                        # Internal outbox row (always created)
+                        outbox_message = Outbox.create_message(
+                            message_id=event._metadata.headers.id,
+                            stream_name=event._metadata.headers.stream,
+                            message_type=event._metadata.headers.type,
+                            data=event.payload,
+                            metadata=event._metadata,
+                            priority=priority,
+                            correlation_id=correlation_id,
+                            causation_id=causation_id,
+                            target_broker=internal_broker,
+                        )
+                        outbox_repo._dao.save(outbox_message)
+
+                        # External outbox rows for published events — one per
+                        # external broker.  Each row is processed independently
+                        # by its own OutboxProcessor instance.
+                        if external_brokers and getattr(
+                            event.__class__.meta_, "published", False
+                        ):
+                            for ext_broker in external_brokers:
+                                ext_outbox = Outbox.create_message(
+                                    message_id=event._metadata.headers.id,
+                                    stream_name=event._metadata.headers.stream,
+                                    message_type=event._metadata.headers.type,
+                                    data=event.payload,
+                                    metadata=event._metadata,
+                                    priority=priority,
+                                    correlation_id=correlation_id,
+                                    causation_id=causation_id,
+                                    target_broker=ext_broker,
+                                )
+                                outbox_repo._dao.save(ext_outbox)
 
         # Record final session count after all lazy sessions have been initialised
         span.set_attribute("protean.uow.session_count", len(self._sessions))
@@ -276,22 +334,26 @@ class UnitOfWork:
 
         # Process each provider session separately
         try:
-            for provider_name, session in self._sessions.items():
-                # Commit the session (includes outbox records)
-                session.commit()
+            with stage(STAGE_FLUSH):
+                for provider_name, session in self._sessions.items():
+                    # Commit the session (includes outbox records)
+                    session.commit()
 
             # Store all events in the event store
-            for provider, events in all_events.items():
-                for event in events:
-                    current_domain.event_store.store.append(event)
+            with stage(STAGE_APPEND):
+                current_domain.event_store.store.append_many(
+                    [event for events in all_events.values() for event in events]
+                )
 
             # Dispatch messages to their designated broker
-            for stream, message, broker_name in self._messages_to_dispatch:
-                if broker_name and broker_name in self.domain.brokers:
-                    self.domain.brokers[broker_name].publish(stream, message)
-                else:
-                    # No specific broker designated; publish to default
-                    self.domain.brokers["default"].publish(stream, message)
+            if self._messages_to_dispatch:
+                with stage(STAGE_PUBLISH):
+                    for stream, message, broker_name in self._messages_to_dispatch:
+                        if broker_name and broker_name in self.domain.brokers:
+                            self.domain.brokers[broker_name].publish(stream, message)
+                        else:
+                            # No specific broker designated; publish to default
+                            self.domain.brokers["default"].publish(stream, message)
 
             # Iteratively consume all events produced in this session
             if current_domain.config["event_processing"] == Processing.SYNC.value:
@@ -325,7 +387,21 @@ class UnitOfWork:
                 msg = str(exc).split("P0001-ERROR:  ")[1]
             else:
                 msg = str(exc)
-            raise ExpectedVersionError(msg) from None
+
+            # Event stores name the conflicting stream on the error
+            stream = getattr(exc, "stream", None)
+            aggregate = self._aggregate_for_stream(stream) if stream else None
+            raise ExpectedVersionError(
+                msg,
+                aggregate=aggregate[0] if aggregate else None,
+                aggregate_id=aggregate[1] if aggregate else None,
+                stream=stream,
+            ) from None
+        except ExpectedVersionError as exc:
+            # Raised by providers that check versions when they commit
+            logger.exception("uow.commit_failed")
+            set_span_error(span, exc)
+            raise
         except ConfigurationError as exc:
             # Configuration errors can be raised if events are misconfigured
             #   We just re-raise it for the client to handle.
@@ -348,6 +424,15 @@ class UnitOfWork:
         self._reset()
 
     def _reset(self):
+        if self._in_progress:
+            # Attribute slow Units of Work to the aggregates they held
+            try:
+                get_contention_tracker(self.domain).record_uow(
+                    self._aggregates(), time.monotonic() - self._started_at
+                )
+            except Exception:
+                logger.debug("uow.contention_record_failed", exc_info=True)
+
         # Remove all scoped sessions — this calls close() on the underlying
         # session (releasing connections back to the pool) AND discards the
         # session from the scoped registry, preventing stale session reuse.
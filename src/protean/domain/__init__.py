@@ -56,7 +56,7 @@ import os
 import pathlib
 import sys
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from pathlib import Path
 from typing import (
@@ -64,8 +64,10 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -75,12 +77,18 @@ from typing import (
 )
 
 if TYPE_CHECKING:
+    from protean.utils.eventing import Message
+    from protean.utils.process_manager_compactor import CompactionResult
     from protean.utils.projection_rebuilder import RebuildResult
 
 from inflection import parameterize, titleize, transliterate, underscore
 
 from protean.adapters import Brokers, Caches, EmailProviders, Providers
 from protean.adapters.event_store import EventStore
+from protean.adapters.idempotency import MemoryIdempotencyBackend
+from protean.adapters.idempotency.database import DatabaseIdempotencyBackend
+from protean.adapters.scheduler import MemoryScheduleStore, RedisScheduleStore
+from protean.adapters.scheduler.database import DatabaseScheduleStore
 from protean.core.aggregate import aggregate_factory
 from protean.core.application_service import application_service_factory
 from protean.core.command import BaseCommand, command_factory
@@ -135,6 +143,8 @@ from protean.integrations.logging import (
 )
 from protean.ir.builder import IRBuilder
 from protean.port.event_store import CausationNode
+from protean.port.idempotency import BaseIdempotencyBackend
+from protean.port.scheduler import BaseScheduleStore
 from protean.server.tracing import TraceEmitter
 from protean.utils import (
     DomainObjects,
@@ -149,6 +159,10 @@ from protean.utils.logging import (
     access_logger,
     configure_logging,
 )
+from protean.utils.process_manager_compactor import (
+    compact_all_process_managers,
+    compact_process_manager,
+)
 from protean.utils.projection_rebuilder import (
     rebuild_all_projections,
     rebuild_projection,
@@ -162,7 +176,8 @@ from protean.utils.telemetry import (
 
 from .config import Config2, ConfigAttribute
 from .context import DomainContext, _DomainContextGlobals
-from .command_processor import CommandProcessor
+from .command_processor import CommandProcessor, CommandResult
+from .command_router import CommandRouter
 from .handler_setup import HandlerConfigurator
 from .infrastructure import InfrastructureManager
 from .query_processor import QueryProcessor
@@ -397,6 +412,13 @@ class Domain:
         # Lazy-initialized idempotency store
         self._idempotency_store = None
 
+        # Lazy-initialized store for scheduled messages
+        self._schedule_store = None
+        self._schedule_store_built = False
+
+        # Lazy-initialized per-aggregate command router
+        self._command_router = None
+
         # Lazy-initialized trace emitter for command processing observability
         self._trace_emitter = None
 
@@ -445,7 +467,7 @@ class Domain:
 
         The store is created on first access using the ``idempotency``
         section of the domain config. Returns an ``IdempotencyStore``
-        instance (which may be inactive if no Redis URL is configured).
+        instance (which may be inactive if no backend is configured).
         """
         if self._idempotency_store is None:
             idem_config = self.config.get("idempotency", {})
@@ -453,9 +475,88 @@ class Domain:
                 redis_url=idem_config.get("redis_url"),
                 ttl=idem_config.get("ttl", 86400),
                 error_ttl=idem_config.get("error_ttl", 60),
+                local_cache_size=idem_config.get("local_cache_size", 10_000),
+                backend=self._build_idempotency_backend(idem_config),
             )
         return self._idempotency_store
 
+    @property
+    def schedule_store(self) -> Optional[BaseScheduleStore]:
+        """Lazily initialize and return the store for scheduled messages.
+
+        Built on first access from the ``scheduler`` section of the domain
+        config. Returns None when no ``scheduler.backend`` is configured.
+        """
+        if not self._schedule_store_built:
+            self._schedule_store = self._build_schedule_store(
+                self.config.get("scheduler", {}) or {}
+            )
+            self._schedule_store_built = True
+        return self._schedule_store
+
+    def _build_schedule_store(self, config: dict) -> Optional[BaseScheduleStore]:
+        """Build the store named by ``scheduler.backend``."""
+        backend = config.get("backend")
+        if backend is None:
+            return None
+        if backend == "memory":
+            return MemoryScheduleStore()
+        if backend == "database":
+            return DatabaseScheduleStore(
+                self._infrastructure.get_schedule_repo(
+                    config.get("database_provider", "default")
+                )
+            )
+        if backend == "redis":
+            redis_url = config.get("redis_url")
+            if not redis_url:
+                raise ConfigurationError(
+                    "`scheduler.redis_url` is required for the redis schedule store"
+                )
+            return RedisScheduleStore.from_url(redis_url)
+        raise ConfigurationError(
+            f"Unknown scheduler backend '{backend}'. "
+            "Expected one of: memory, database, redis"
+        )
+
+    @property
+    def command_router(self):
+        """Lazily initialize and return the per-aggregate command router.
+
+        The router is created on first access using the ``command_router``
+        section of the domain config. See ``CommandRouter`` for details.
+        """
+        if self._command_router is None:
+            self._command_router = CommandRouter.from_config(self)
+        return self._command_router
+
+    def _build_idempotency_backend(
+        self, idem_config: dict
+    ) -> Optional[BaseIdempotencyBackend]:
+        """Build the backend named by ``idempotency.backend``.
+
+        Returns None for ``redis`` (or no backend), leaving the store to
+        connect to ``redis_url`` itself.
+        """
+        backend = idem_config.get("backend")
+        if backend in (None, "redis"):
+            return None
+        if backend == "memory":
+            return MemoryIdempotencyBackend(
+                max_entries=idem_config.get("max_entries", 100_000)
+            )
+        if backend == "database":
+            repo = self._infrastructure.get_idempotency_repo(
+                idem_config.get("database_provider", "default")
+            )
+            return DatabaseIdempotencyBackend(
+                repo, purge_batch_size=idem_config.get("purge_batch_size", 1000)
+            )
+        raise ConfigurationError(
+            f"Unknown idempotency backend '{backend}'. "
+            "Expected one of: redis, memory, database"
+        )
+
     @property
     def trace_emitter(self):
         """Lazily initialize and return a TraceEmitter for command tracing.
@@ -465,16 +566,7 @@ class Domain:
         in the Observatory dashboard.
         """
         if self._trace_emitter is None:
-            observatory_config = self.config.get("observatory", {})
-            try:
-                trace_retention_days = int(
-                    observatory_config.get("trace_retention_days", 7)
-                )
-            except (TypeError, ValueError):
-                trace_retention_days = 7
-            self._trace_emitter = TraceEmitter(
-                self, trace_retention_days=trace_retention_days
-            )
+            self._trace_emitter = TraceEmitter.from_config(self)
         return self._trace_emitter
 
     @property
@@ -626,6 +718,13 @@ class Domain:
         if self.has_outbox:
             self._initialize_outbox()
 
+        # Register the idempotency table so that setup_database() creates it
+        idem_config = self.config.get("idempotency", {})
+        if idem_config.get("backend") == "database":
+            self._infrastructure.get_idempotency_repo(
+                idem_config.get("database_provider", "default")
+            )
+
     def _auto_configure_logging(self) -> None:
         """Auto-configure logging during ``Domain.init()``.
 
@@ -843,6 +942,22 @@ class Domain:
         """
         logger.info("Closing domain infrastructure...")
 
+        # Flush queued trace events while the broker connection is still open
+        if self._trace_emitter is not None:
+            self._trace_emitter.close()
+
+        if self._idempotency_store is not None:
+            try:
+                self._idempotency_store.close()
+            except Exception:
+                logger.exception("Error closing idempotency store")
+
+        if self._schedule_store is not None:
+            try:
+                self._schedule_store.close()
+            except Exception:
+                logger.exception("Error closing schedule store")
+
         for name, closeable in [
             ("event store", self.event_store),
             ("brokers", self.brokers),
@@ -996,6 +1111,7 @@ class Domain:
 
         # Register element with domain
         self._domain_registry.register_element(new_cls, internal, auto_generated)
+        self.event_store._invalidate_dispatch_tables()
 
         # Resolve or record elements to be resolved
 
@@ -1247,6 +1363,7 @@ class Domain:
         adding it to the domain registry.
         """
         self._type_manager.register_external_event(event_cls, type_string)
+        self.event_store._invalidate_dispatch_tables()
 
     def _setup_command_handlers(self) -> None:
         self._handler_configurator.setup_command_handlers()
@@ -1746,6 +1863,94 @@ class Domain:
             timeout=timeout,
         )
 
+    def schedule(
+        self,
+        command: Any,
+        at: Optional[datetime] = None,
+        delay: Optional[timedelta] = None,
+        priority: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+    ) -> str:
+        """Schedule a command for asynchronous processing at a later time.
+
+        The command is kept in the schedule store until it falls due, then
+        the Engine appends it to its command stream, where it is handled like
+        any asynchronous command.
+
+        Args:
+            command: Command to schedule.
+            at (datetime, optional): Absolute delivery time. Mutually exclusive
+                with ``delay``.
+            delay (timedelta, optional): Delivery time relative to now.
+            priority (int, optional): Processing priority for events produced by
+                this command.
+            correlation_id (str, optional): Correlation ID for distributed tracing.
+            deadline (datetime, optional): Absolute time after which the command
+                must not be executed. Must fall after the delivery time.
+
+        Returns:
+            str: The schedule id, usable with ``cancel_scheduled()``.
+        """
+        if (at is None) == (delay is None):
+            raise IncorrectUsageError("Provide exactly one of `at` or `delay`")
+        deliver_at = at if at is not None else datetime.now(timezone.utc) + delay
+
+        return self._command_processor.schedule(
+            command,
+            deliver_at,
+            priority=priority,
+            correlation_id=correlation_id,
+            deadline=deadline,
+        )
+
+    def cancel_scheduled(self, schedule_id: str) -> bool:
+        """Cancel a scheduled command before it is delivered.
+
+        Returns:
+            bool: True if the command was still pending, False if it had
+            already been delivered or cancelled.
+        """
+        store = self.schedule_store
+        return store is not None and store.cancel(schedule_id)
+
+    def process_many(
+        self,
+        commands: Iterable[Any],
+        asynchronous: Optional[bool] = None,
+        idempotency_keys: Optional[Sequence[Optional[str]]] = None,
+        priority: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+        batch_size: int = 100,
+    ) -> list[CommandResult]:
+        """Process a batch of commands, grouping them into shared transactions.
+
+        Commands targeting the same aggregate type are handled together in
+        chunks of up to ``batch_size``, each in one Unit of Work. Commands
+        for the same aggregate are kept in the same chunk where they fit. A failing
+        command does not fail the others: the batch returns one
+        ``CommandResult`` per command, in submission order.
+
+        Args:
+            commands: Commands to process.
+            asynchronous (Boolean, optional): Same as for ``process``.
+            idempotency_keys (optional): One idempotency key (or None) per command.
+            priority (int, optional): Processing priority for all commands.
+            correlation_id (str, optional): Correlation ID shared by all commands.
+            batch_size (int): Maximum number of commands per Unit of Work.
+
+        Returns:
+            list[CommandResult]: One result per command.
+        """
+        return self._command_processor.process_many(
+            commands,
+            asynchronous=asynchronous,
+            idempotency_keys=idempotency_keys,
+            priority=priority,
+            correlation_id=correlation_id,
+            batch_size=batch_size,
+        )
+
     def command_handler_for(self, command: Any) -> Optional[BaseCommandHandler]:
         """Return Command Handler for a specific command."""
         return self._command_processor.handler_for(command)
@@ -1753,14 +1958,16 @@ class Domain:
     ###################
     # Handling Events #
     ###################
-    def handlers_for(self, event: Any) -> set:
+    def handlers_for(self, event: Any) -> frozenset:
         """Return Event Handlers listening to a specific event
 
         Args:
             event: Event to be consumed (instance of a ``@domain.event``-decorated class)
 
         Returns:
-            List[BaseEventHandler]: Event Handlers that have registered to consume the event
+            frozenset[BaseEventHandler]: Event Handlers that have registered to
+            consume the event. The set is cached and shared between callers, so
+            it must not be mutated; copy it with ``set(...)`` to build on it.
         """
         return self.event_store.handlers_for(event)
 
@@ -2021,7 +2228,14 @@ class Domain:
     ####################################
 
     def rebuild_projection(
-        self, projection_cls: type, batch_size: int = 500
+        self,
+        projection_cls: type,
+        batch_size: int = 500,
+        *,
+        resume: bool = False,
+        workers: int = 1,
+        partition_key: Callable[["Message"], Any] | None = None,
+        shadow: bool = False,
     ) -> "RebuildResult":
         """Rebuild a projection by replaying events through its projectors.
 
@@ -2034,15 +2248,35 @@ class Domain:
 
         Args:
             projection_cls: The projection class to rebuild.
-            batch_size: Number of events to read per batch from the event store.
+            batch_size: Number of events to read and apply per page.
+            resume: Continue from the checkpoints of an interrupted rebuild
+                instead of truncating.
+            workers: Number of partitions to replay in parallel.
+            partition_key: Callable returning the partition key of a message.
+                Defaults to the projection's identifier, read from the event.
+            shadow: Build into shadow storage and swap it in when caught up,
+                leaving the live projection readable throughout.
 
         Returns:
             RebuildResult with counts and any errors.
         """
-        return rebuild_projection(self, projection_cls, batch_size)
+        return rebuild_projection(
+            self,
+            projection_cls,
+            batch_size,
+            resume=resume,
+            workers=workers,
+            partition_key=partition_key,
+            shadow=shadow,
+        )
 
     def rebuild_all_projections(
-        self, batch_size: int = 500
+        self,
+        batch_size: int = 500,
+        *,
+        resume: bool = False,
+        workers: int = 1,
+        shadow: bool = False,
     ) -> dict[str, "RebuildResult"]:
         """Rebuild all projections registered in the domain.
 
@@ -2050,12 +2284,86 @@ class Domain:
         ``domain.domain_context()``.
 
         Args:
-            batch_size: Number of events to read per batch from the event store.
+            batch_size: Number of events to read and apply per page.
+            resume: Continue each projection from its rebuild checkpoints.
+            workers: Number of partitions to replay in parallel per projector.
+            shadow: Rebuild each projection into shadow storage and swap it in.
 
         Returns:
             Dictionary mapping projection class names to their RebuildResult.
         """
-        return rebuild_all_projections(self, batch_size)
+        return rebuild_all_projections(
+            self, batch_size, resume=resume, workers=workers, shadow=shadow
+        )
+
+    ############################################
+    # Process Manager Compaction Functionality #
+    ############################################
+
+    def compact_process_manager(
+        self,
+        pm_cls: type,
+        *,
+        idle_days: float | None = None,
+        min_transitions: int | None = None,
+        archive: str | Path | None = None,
+        dry_run: bool = False,
+    ) -> "CompactionResult":
+        """Compact the transition streams of a process manager.
+
+        Completed instances, and instances idle for ``idle_days``, get a
+        terminal snapshot transition; the transitions before it are archived
+        (when ``archive`` is given) and truncated from the stream.
+
+        Must be called after ``domain.init()`` and within
+        ``domain.domain_context()``.
+
+        Args:
+            pm_cls: The process manager class to compact.
+            idle_days: Age of the last transition after which an incomplete
+                instance is compacted. Defaults to
+                ``process_manager.compaction.idle_days``.
+            min_transitions: Leave streams with fewer transitions alone.
+                Defaults to ``process_manager.compaction.min_transitions``.
+            archive: JSON Lines file to append removed transitions to.
+            dry_run: Report what would be compacted without writing.
+
+        Returns:
+            CompactionResult with counts and any errors.
+        """
+        return compact_process_manager(
+            self,
+            pm_cls,
+            idle_days=idle_days,
+            min_transitions=min_transitions,
+            archive=archive,
+            dry_run=dry_run,
+        )
+
+    def compact_all_process_managers(
+        self,
+        *,
+        idle_days: float | None = None,
+        min_transitions: int | None = None,
+        archive: str | Path | None = None,
+        dry_run: bool = False,
+    ) -> dict[str, "CompactionResult"]:
+        """Compact the transition streams of every registered process manager.
+
+        Must be called after ``domain.init()`` and within
+        ``domain.domain_context()``.
+
+        Returns:
+            Dictionary mapping process manager class names to their
+            CompactionResult.
+        """
+        return compact_all_process_managers(
+            self,
+            idle_days=idle_days,
+            min_transitions=min_transitions,
+            archive=archive,
+            dry_run=dry_run,
+        )
 
     #######################
     # Email Functionality #
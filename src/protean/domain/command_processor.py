@@ -8,14 +8,19 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Optional
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
 from uuid import uuid4
 
 from protean.core.command import BaseCommand
 from protean.core.command_handler import BaseCommandHandler
+from protean.core.unit_of_work import UnitOfWork
 from protean.exceptions import (
     CommandExpiredError,
+    ConfigurationError,
     DuplicateCommandError,
     IncorrectUsageError,
     ValidationError,
@@ -24,6 +29,7 @@ from protean.integrations.logging import (
     SECURITY_EVENT_VALIDATION_FAILED,
     log_security_event,
 )
+from protean.port.scheduler import ScheduledMessage
 from protean.utils import DomainObjects, Processing, fqn
 from protean.utils.eventing import (
     DomainMeta,
@@ -106,6 +112,42 @@ def raise_if_expired(
         )
 
 
+class CommandStatus(Enum):
+    """Outcome of a command submitted through ``process_many``."""
+
+    PROCESSED = "processed"
+    """Handled synchronously; ``result`` holds the handler's return value."""
+
+    ENQUEUED = "enqueued"
+    """Stored for asynchronous handling; ``result`` holds its store position."""
+
+    DUPLICATE = "duplicate"
+    """Skipped because its idempotency key was already processed."""
+
+    FAILED = "failed"
+    """Rejected or raised while being handled; see ``error``."""
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    """Result of one command in a ``process_many`` batch."""
+
+    command: Any
+    """The command as submitted."""
+
+    status: CommandStatus
+
+    result: Any = None
+    """Handler return value, store position, or the cached duplicate result."""
+
+    error: Optional[Exception] = None
+    """The exception raised for a ``FAILED`` command."""
+
+    @property
+    def ok(self) -> bool:
+        return self.status != CommandStatus.FAILED
+
+
 class CommandProcessor:
     """Enrich, deduplicate, and dispatch commands.
 
@@ -523,8 +565,9 @@ class CommandProcessor:
                         worker_id="api",
                     )
 
-                    # Record success
-                    if idempotency_key and store.is_active:
+                    # Record success, unless the handler already recorded it
+                    # inside its Unit of Work
+                    if idempotency_key and store.is_active and not store.transactional:
                         store.record_success(idempotency_key, result)
                     return result
 
@@ -539,6 +582,436 @@ class CommandProcessor:
 
             return position
 
+    def process_many(
+        self,
+        commands: Iterable[Any],
+        asynchronous: Optional[bool] = None,
+        idempotency_keys: Optional[Sequence[Optional[str]]] = None,
+        priority: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+        batch_size: int = 100,
+    ) -> list[CommandResult]:
+        """Process a batch of commands and return one result per command.
+
+        Commands are grouped by the aggregate type they target (their stream
+        category), then by aggregate identifier, and handled in chunks of up
+        to ``batch_size``. Chunks are packed with whole aggregate groups, so
+        the commands for one aggregate share a chunk unless there are more
+        than ``batch_size`` of them. Each chunk runs in a single batch
+        ``UnitOfWork``: every aggregate is loaded once and shared by the
+        commands that target it, and the chunk commits once, appending the
+        events raised in it together. Idempotency keys are checked and
+        recorded in one round trip.
+
+        A failing command does not fail the batch. When a handler raises,
+        the chunk is rolled back and its commands are handled again one by
+        one, each in its own UnitOfWork with the usual retry policies, so
+        only the failing commands report ``FAILED``. Handlers must therefore
+        keep side effects inside the UnitOfWork. If a chunk fails while
+        committing, every command in it reports ``FAILED``.
+
+        Commands that target the same aggregate are handled in submission
+        order; results are returned in submission order.
+
+        Args:
+            commands: Commands to process.
+            asynchronous (Boolean, optional): Same as for ``process``.
+            idempotency_keys (optional): One key (or None) per command.
+            priority (int, optional): Processing priority for all commands.
+            correlation_id (str, optional): Correlation ID shared by all commands.
+            batch_size (int): Maximum number of commands per UnitOfWork.
+
+        Returns:
+            list[CommandResult]: One result per command, in submission order.
+        """
+        commands = list(commands)
+        if idempotency_keys is None:
+            keys: list[Optional[str]] = [None] * len(commands)
+        else:
+            keys = list(idempotency_keys)
+            if len(keys) != len(commands):
+                raise IncorrectUsageError(
+                    "`idempotency_keys` must have one entry per command."
+                )
+        if batch_size < 1:
+            raise IncorrectUsageError("`batch_size` must be at least 1.")
+
+        domain = self._domain
+        metrics = get_domain_metrics(domain)
+        if asynchronous is None:
+            asynchronous = domain.config["command_processing"] == Processing.ASYNC.value
+        will_handle_sync = (
+            not asynchronous
+            or domain.config["command_processing"] == Processing.SYNC.value
+        )
+        resolved_priority = priority if priority is not None else current_priority()
+
+        results: list[Optional[CommandResult]] = [None] * len(commands)
+
+        with domain.tracer.start_as_current_span(
+            "protean.command.process_many"
+        ) as span:
+            span.set_attribute("protean.command.count", len(commands))
+
+            store = domain.idempotency_store
+            records = (
+                store.check_many(key for key in keys if key)
+                if store.is_active and any(keys)
+                else {}
+            )
+
+            # Enrich and group what is left by target stream category
+            groups: dict[str, list[tuple[int, BaseCommand]]] = {}
+            first_with_key: dict[str, int] = {}
+            repeats: list[tuple[int, int]] = []
+            for index, (command, key) in enumerate(zip(commands, keys)):
+                if key:
+                    record = records.get(key)
+                    if record and record.get("status") == "success":
+                        results[index] = CommandResult(
+                            command, CommandStatus.DUPLICATE, record.get("result")
+                        )
+                        continue
+                    if key in first_with_key:
+                        repeats.append((index, first_with_key[key]))
+                        continue
+                    first_with_key[key] = index
+
+                try:
+                    self._ensure_registered(command)
+                    enriched = self.enrich(
+                        command,
+                        asynchronous,
+                        idempotency_key=key,
+                        priority=resolved_priority,
+                        correlation_id=correlation_id,
+                    )
+                    if will_handle_sync:
+                        raise_if_expired(
+                            enriched._metadata.headers,
+                            command.__class__.__type__,
+                            metrics,
+                        )
+                except Exception as exc:
+                    results[index] = CommandResult(
+                        command, CommandStatus.FAILED, error=exc
+                    )
+                    continue
+
+                category = command.meta_.part_of.meta_.stream_category
+                groups.setdefault(category, []).append((index, enriched))
+
+            for group in groups.values():
+                for chunk in self._chunks(group, batch_size):
+                    if will_handle_sync:
+                        outcomes = self._handle_chunk(chunk, resolved_priority)
+                    else:
+                        outcomes = self._enqueue_chunk(chunk)
+
+                    for index, status, result, error in outcomes:
+                        results[index] = CommandResult(
+                            commands[index], status, result, error
+                        )
+
+            # A key repeated within the batch shares its first command's outcome
+            for index, first in repeats:
+                first_result = results[first]
+                assert first_result is not None
+                if first_result.ok:
+                    results[index] = CommandResult(
+                        commands[index], CommandStatus.DUPLICATE, first_result.result
+                    )
+                else:
+                    results[index] = CommandResult(
+                        commands[index], CommandStatus.FAILED, error=first_result.error
+                    )
+
+            self._record_batch(results, keys)
+
+        return [result for result in results if result is not None]
+
+    def schedule(
+        self,
+        command: Any,
+        deliver_at: datetime,
+        priority: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+    ) -> str:
+        """Store a command for asynchronous handling at ``deliver_at``.
+
+        The command is enriched now, so it carries the correlation and
+        causation of the current context. Its deadline is measured from the
+        delivery time: the caller's ``deadline`` if given, otherwise the
+        handler's or domain's default timeout added to ``deliver_at``.
+
+        Returns:
+            The schedule id, which is also the command's message id.
+
+        Raises:
+            ConfigurationError: If no ``scheduler.backend`` is configured.
+            IncorrectUsageError: If ``deadline`` is not after ``deliver_at``.
+        """
+        self._ensure_registered(command)
+
+        store = self._domain.schedule_store
+        if store is None:
+            raise ConfigurationError(
+                "Scheduling messages needs a schedule store. "
+                "Set `scheduler.backend` in the domain configuration."
+            )
+
+        deliver_at = ensure_utc(deliver_at)
+        if deadline is not None:
+            deadline = ensure_utc(deadline)
+            if deadline <= deliver_at:
+                raise IncorrectUsageError(
+                    "A scheduled command's deadline must fall after its delivery time"
+                )
+        else:
+            deadline = self._default_deadline_for(command)
+            if deadline is not None:
+                # Default timeouts run from delivery, not from scheduling
+                deadline = deliver_at + (deadline - datetime.now(timezone.utc))
+
+        enriched = self.enrich(
+            command,
+            asynchronous=True,
+            priority=priority if priority is not None else current_priority(),
+            correlation_id=correlation_id,
+        )
+        message = Message.from_domain_object(enriched)
+        assert message.metadata is not None
+
+        payload = message.to_dict()
+        # Replace any deadline inherited from the current message: it was
+        # set for work happening now, not at delivery
+        payload["metadata"]["headers"]["deadline"] = (
+            deadline.isoformat() if deadline else None
+        )
+
+        schedule_id = message.metadata.headers.id
+        store.add(
+            ScheduledMessage(
+                id=schedule_id,
+                stream=message.metadata.headers.stream,
+                payload=payload,
+                deliver_at=deliver_at,
+            )
+        )
+        logger.debug(
+            "command.scheduled",
+            extra={
+                "command_type": command.__class__.__type__,
+                "schedule_id": schedule_id,
+                "deliver_at": deliver_at.isoformat(),
+            },
+        )
+        return schedule_id
+
+    def _ensure_registered(self, command: Any) -> None:
+        if (
+            fqn(command.__class__)
+            not in self._domain.registry._elements[DomainObjects.COMMAND.value]
+        ):
+            raise IncorrectUsageError(
+                f"Element {command.__class__.__name__} is not registered in domain "
+                f"{self._domain.name}"
+            )
+
+    @staticmethod
+    def _chunks(
+        group: list[tuple[int, BaseCommand]], batch_size: int
+    ) -> Iterator[list[tuple[int, BaseCommand]]]:
+        """Split one aggregate type's commands into chunks by aggregate.
+
+        Commands for the same aggregate stay together, in submission order,
+        and are only split across chunks when they outnumber ``batch_size``.
+        Commands without an identifier are grouped on their own.
+        """
+        by_aggregate: dict[Any, list[tuple[int, BaseCommand]]] = {}
+        for index, command in group:
+            identity_field = id_field(command)
+            identifier = (
+                getattr(command, identity_field.field_name, None)
+                if identity_field
+                else None
+            )
+            key = identifier if identifier is not None else (None, index)
+            by_aggregate.setdefault(key, []).append((index, command))
+
+        chunk: list[tuple[int, BaseCommand]] = []
+        for commands in by_aggregate.values():
+            if chunk and len(chunk) + len(commands) > batch_size:
+                yield chunk
+                chunk = []
+            while len(commands) > batch_size:
+                yield commands[:batch_size]
+                commands = commands[batch_size:]
+            chunk.extend(commands)
+        if chunk:
+            yield chunk
+
+    def _append_chunk(
+        self, chunk: list[tuple[int, BaseCommand]]
+    ) -> tuple[list[tuple[int, BaseCommand, int]], list[tuple]]:
+        """Append a chunk of commands to the event store in one batch write.
+
+        Returns the appended commands with their positions, and ``FAILED``
+        outcomes for the commands that could not be stored. When the batch
+        write fails and the store guarantees it wrote nothing, the commands
+        are appended one at a time so only the failing ones are reported.
+        """
+        store = self._domain.event_store.store
+        try:
+            positions = store.append_many([command for _, command in chunk])
+        except Exception as exc:
+            if not store.atomic_batches:
+                # Part of the batch may be stored; re-appending would
+                # duplicate it, so the whole chunk is reported as failed.
+                return [], [
+                    (index, CommandStatus.FAILED, None, exc) for index, _ in chunk
+                ]
+        else:
+            return [
+                (index, command, position)
+                for (index, command), position in zip(chunk, positions)
+            ], []
+
+        appended, failed = [], []
+        for index, command in chunk:
+            try:
+                appended.append((index, command, store.append(command)))
+            except Exception as exc:
+                failed.append((index, CommandStatus.FAILED, None, exc))
+        return appended, failed
+
+    def _enqueue_chunk(self, chunk: list[tuple[int, BaseCommand]]) -> list[tuple]:
+        """Store a chunk of commands for asynchronous handling."""
+        appended, failed = self._append_chunk(chunk)
+        return failed + [
+            (index, CommandStatus.ENQUEUED, position, None)
+            for index, _, position in appended
+        ]
+
+    def _handle_chunk(
+        self, chunk: list[tuple[int, BaseCommand]], priority: int
+    ) -> list[tuple]:
+        """Store a chunk of commands, then handle the stored ones."""
+        appended, failed = self._append_chunk(chunk)
+        chunk = [(index, command) for index, command, _ in appended]
+        if not chunk:
+            return failed
+        return failed + self._run_chunk(chunk, priority)
+
+    def _run_chunk(
+        self, chunk: list[tuple[int, BaseCommand]], priority: int
+    ) -> list[tuple]:
+        """Handle a chunk of commands in one batch UnitOfWork.
+
+        Falls back to handling the commands one by one when a handler fails.
+        """
+        if len(chunk) == 1:
+            return [self._handle_one(*chunk[0], priority)]
+
+        outcomes = []
+        handled = False
+        try:
+            with UnitOfWork(batch=True):
+                for index, command in chunk:
+                    handler_class = self.handler_for(command)
+                    result = None
+                    if handler_class:
+                        with (
+                            self._message_context(command),
+                            processing_priority(priority),
+                        ):
+                            result = handler_class._handle(command)
+                    outcomes.append((index, CommandStatus.PROCESSED, result, None))
+                handled = True
+        except Exception as exc:
+            if handled:
+                # The commit itself failed: nothing in the chunk is known to
+                # be persisted, and re-running could apply it twice.
+                logger.warning(
+                    "Batch of %d commands failed to commit", len(chunk), exc_info=True
+                )
+                return [(index, CommandStatus.FAILED, None, exc) for index, _ in chunk]
+
+            logger.debug(
+                "Command failed in a batch of %d; handling them one by one",
+                len(chunk),
+            )
+            return [
+                self._handle_one(index, command, priority) for index, command in chunk
+            ]
+
+        return outcomes
+
+    def _handle_one(self, index: int, command: BaseCommand, priority: int) -> tuple:
+        handler_class = self.handler_for(command)
+        if handler_class is None:
+            return (index, CommandStatus.PROCESSED, None, None)
+
+        try:
+            with self._message_context(command), processing_priority(priority):
+                result = handler_class._handle(command)
+        except Exception as exc:
+            if isinstance(exc, ValidationError):
+                self._emit_validation_failed(
+                    exc, command.__class__.__type__, handler_class.__name__
+                )
+            return (index, CommandStatus.FAILED, None, exc)
+        return (index, CommandStatus.PROCESSED, result, None)
+
+    @contextmanager
+    def _message_context(self, command: BaseCommand) -> Iterator[None]:
+        """Run with ``command`` as the message in context, as ``process`` does."""
+        previous = g.get("message_in_context")
+        g.message_in_context = Message.from_domain_object(command)
+        try:
+            yield
+        finally:
+            if previous is not None:
+                g.message_in_context = previous
+            else:
+                g.pop("message_in_context", None)
+
+    def _record_batch(
+        self, results: list[Optional[CommandResult]], keys: list[Optional[str]]
+    ) -> None:
+        """Record metrics and idempotency outcomes for a processed batch."""
+        metrics = get_domain_metrics(self._domain)
+        store = self._domain.idempotency_store
+
+        successes = {}
+        for result, key in zip(results, keys):
+            if result is None or result.status == CommandStatus.DUPLICATE:
+                continue
+
+            status = {
+                CommandStatus.PROCESSED: "ok",
+                CommandStatus.ENQUEUED: "enqueued",
+                CommandStatus.FAILED: "error",
+            }[result.status]
+            metrics.command_processed.add(
+                1,
+                {"command_type": result.command.__class__.__type__, "status": status},
+            )
+
+            if key and store.is_active:
+                if not result.ok:
+                    store.record_error(key, "handler_failed")
+                elif not (
+                    result.status == CommandStatus.PROCESSED and store.transactional
+                ):
+                    # Processed commands were recorded inside the handler's
+                    # Unit of Work when the backend is transactional
+                    successes[key] = result.result
+
+        if successes:
+            store.record_many(successes)
+
     def handler_for(self, command: Any) -> Optional[BaseCommandHandler]:
         """Return Command Handler for a specific command.
 
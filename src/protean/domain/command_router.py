@@ -0,0 +1,246 @@
+"""Per-aggregate serialization of concurrently submitted commands.
+
+Commands that target the same aggregate from many concurrent callers race
+each other: all but one fail ``UnitOfWork.commit`` with
+``ExpectedVersionError`` and the handler wrapper retries them with a sleep
+and a full reload. ``CommandRouter`` avoids the race instead of retrying
+it. Each aggregate gets a keyed ``asyncio`` queue drained by a single
+worker, which coalesces whatever has queued up into one
+``domain.process_many()`` call: one load, N applications, one commit.
+
+Across processes, a ``HashRing`` assigns every aggregate to one node. A
+router configured with the ring and its own node name only accepts
+commands for the aggregates it owns and raises ``CommandRoutingError`` for
+the rest. Forwarding is out of scope: the router has no transport to other
+nodes, so callers deliver those commands to ``router.owner_of(command)``
+themselves.
+
+Usage::
+
+    router = domain.command_router
+    result = await router.submit(ReserveStock(sku="A-1", quantity=1))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from protean.domain.command_processor import CommandResult
+from protean.exceptions import CommandRoutingError, IncorrectUsageError
+from protean.utils.reflection import id_field
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class HashRing:
+    """Consistent-hash ring mapping keys to nodes.
+
+    Each node is placed on the ring ``virtual_nodes`` times so that keys
+    spread evenly, and adding or removing a node only moves the keys that
+    node gains or loses.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = 128) -> None:
+        if virtual_nodes < 1:
+            raise IncorrectUsageError("`virtual_nodes` must be at least 1.")
+
+        self._virtual_nodes = virtual_nodes
+        self._points: list[int] = []
+        self._owners: dict[int, str] = {}
+        self._nodes: set[str] = set()
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> set[str]:
+        return set(self._nodes)
+
+    def add_node(self, node: str) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for replica in range(self._virtual_nodes):
+            point = _hash(f"{node}#{replica}")
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove_node(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        self._points = [p for p in self._points if self._owners[p] != node]
+        self._owners = {p: self._owners[p] for p in self._points}
+
+    def node_for(self, key: str) -> str:
+        """Return the node that owns ``key``."""
+        if not self._points:
+            raise IncorrectUsageError("Hash ring has no nodes.")
+
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[self._points[index]]
+
+
+class CommandRouter:
+    """Serialize and coalesce commands per target aggregate.
+
+    Commands are keyed by their aggregate's stream category and identifier.
+    Commands without an identifier field cannot conflict and are processed
+    on their own. Processing runs in a worker thread, so the event loop is
+    never blocked by handler or database work.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        max_batch: int = 100,
+        nodes: Iterable[str] = (),
+        node: Optional[str] = None,
+        virtual_nodes: int = 128,
+    ) -> None:
+        if max_batch < 1:
+            raise IncorrectUsageError("`max_batch` must be at least 1.")
+
+        nodes = list(nodes)
+        if nodes and node not in nodes:
+            raise IncorrectUsageError(
+                f"Command router node `{node}` is not one of the ring nodes {nodes}."
+            )
+
+        self.domain = domain
+        self.max_batch = max_batch
+        self.node = node
+        self.ring = HashRing(nodes, virtual_nodes) if nodes else None
+
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def from_config(cls, domain: Domain) -> CommandRouter:
+        """Build a router from the ``command_router`` section of the domain config."""
+        try:
+            config = domain.config.get("command_router", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+
+        return cls(
+            domain,
+            max_batch=config.get("max_batch", 100),
+            nodes=config.get("nodes") or (),
+            node=config.get("node"),
+            virtual_nodes=config.get("virtual_nodes", 128),
+        )
+
+    def key_for(self, command: Any) -> Optional[str]:
+        """Return the aggregate key ``command`` is serialized on, if any."""
+        identity_field = id_field(command)
+        if identity_field is None:
+            return None
+        identifier = getattr(command, identity_field.field_name, None)
+        if identifier is None:
+            return None
+        return f"{command.meta_.part_of.meta_.stream_category}-{identifier}"
+
+    def owner_of(self, command: Any) -> Optional[str]:
+        """Return the node owning ``command``'s aggregate, or None without a ring."""
+        key = self.key_for(command)
+        if self.ring is None or key is None:
+            return None
+        return self.ring.node_for(key)
+
+    @property
+    def pending(self) -> int:
+        """Commands queued and not yet picked up by a worker."""
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def submit(
+        self, command: Any, idempotency_key: Optional[str] = None
+    ) -> CommandResult:
+        """Queue ``command`` behind earlier commands for the same aggregate.
+
+        Returns the command's ``CommandResult`` once it has been processed.
+
+        Raises:
+            CommandRoutingError: If a hash ring is configured and another node
+                owns the command's aggregate.
+        """
+        key = self.key_for(command)
+
+        owner = self.owner_of(command)
+        if owner is not None and owner != self.node:
+            raise CommandRoutingError(
+                f"Aggregate `{key}` is owned by node `{owner}`", owner=owner
+            )
+
+        if key is None:
+            [result] = await self._process([(command, idempotency_key)])
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue()
+        queue.put_nowait((command, idempotency_key, future))
+
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._drain(key, queue))
+
+        return await future
+
+    async def _drain(self, key: str, queue: asyncio.Queue) -> None:
+        """Process queued commands for one aggregate until its queue is empty."""
+        try:
+            while not queue.empty():
+                batch = [queue.get_nowait()]
+                while len(batch) < self.max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                try:
+                    results = await self._process(
+                        [(command, idem_key) for command, idem_key, _ in batch]
+                    )
+                except Exception as exc:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            # No await since the last emptiness check: nothing can have been
+            # queued for this key in between.
+            self._queues.pop(key, None)
+            self._workers.pop(key, None)
+
+    async def _process(self, items: list[tuple[Any, Optional[str]]]) -> list:
+        commands = [command for command, _ in items]
+        keys = [key for _, key in items]
+        return await asyncio.to_thread(self._process_sync, commands, keys)
+
+    def _process_sync(self, commands: list, keys: list) -> list[CommandResult]:
+        with self.domain.domain_context():
+            return self.domain.process_many(
+                commands,
+                asynchronous=False,
+                idempotency_keys=keys if any(keys) else None,
+                batch_size=len(commands),
+            )
+
+    async def close(self) -> None:
+        """Wait until every queued command has been processed."""
+        while self._workers:
+            await asyncio.gather(*list(self._workers.values()), return_exceptions=True)
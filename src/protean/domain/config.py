@@ -57,6 +57,14 @@ def _default_config():
             },
         },
         "snapshot_threshold": 10,
+        "process_manager": {
+            "cache_size": 1000,  # In-process LRU of process manager states; 0 disables
+            "replay_transitions": False,  # Replay every transition to validate state
+            "compaction": {
+                "idle_days": 30,  # Compact incomplete instances idle this long; None disables
+                "min_transitions": 10,  # Leave shorter streams alone
+            },
+        },
         "enable_outbox": False,
         "outbox": {
             "broker": "default",
@@ -164,6 +172,53 @@ def _default_config():
                 "alert_callback": None,  # Optional dotted path to callable
                 "check_interval_seconds": 60,  # How often to run maintenance
             },
+            # Handle each fetched batch earliest deadline first. Commands whose
+            # deadline has passed are shed before deserialization either way.
+            "deadline_scheduling": True,
+            # Engine-wide admission control. Subscriptions pause fetching while
+            # a limit is reached. All limits are off by default.
+            # Example:
+            #   admission:
+            #     max_in_flight: 500
+            #     pool_saturation: 0.9
+            #     quotas: {ReportProjector: 100}
+            #     priorities: {OrderCommandHandler: 10}
+            "admission": {
+                "max_in_flight": None,  # Cap on fetched-but-unfinished messages
+                "pool_saturation": None,  # Pause at this checked_out/size ratio
+                "pool_check_interval": 0.5,  # Seconds between pool stats reads
+                "quotas": {},  # Per-subscription in-flight caps, by handler name
+                "priorities": {},  # Higher wins when capacity is scarce; default 0
+            },
+            # Sampling profiler attributing handler wall/CPU time per handler
+            # and message type. Snapshots are published to the default Redis
+            # broker for the Observatory and `protean profile`.
+            "profiling": {
+                "enabled": False,  # Off by default
+                "interval_ms": 10,  # Stack sampling interval
+                "publish_interval_seconds": 5,  # How often snapshots go to Redis
+                "max_stack_depth": 64,  # Frames kept per sampled stack
+                "max_stacks": 5000,  # Distinct stacks kept before truncating
+            },
+            # tracemalloc sampling of the memory each handler call leaves
+            # allocated. Slows allocation down while on; the report is served
+            # by the health server at GET /memory.
+            "memory_profiling": {
+                "enabled": False,  # Off by default
+                "sample_rate": 0.01,  # Fraction of handler calls snapshotted
+                "traceback_frames": 1,  # Frames stored per allocation
+                "top_sites": 10,  # Allocation sites kept per handler
+                "leak_window": 20,  # Recent samples checked for growth
+                "leak_threshold_bytes": 1048576,  # Growth flagged as a leak
+            },
+            # Graceful drain on shutdown: subscriptions stop fetching, finish
+            # their in-flight batch, flush checkpoints and hand off what they
+            # still hold.
+            "drain": {
+                "timeout_seconds": 10,  # Wait for the in-flight batch
+                "handoff": True,  # Release pending messages and outbox claims
+                "rolling": False,  # Supervisor drains workers one at a time
+            },
             # Health check HTTP server for Kubernetes liveness/readiness probes
             "health": {
                 "enabled": True,
@@ -171,10 +226,52 @@ def _default_config():
                 "port": 8080,
             },
         },
+        # Per-aggregate command serialization (domain.command_router).
+        # Commands for the same aggregate are queued and coalesced into one
+        # batch instead of racing on optimistic concurrency. With `nodes`
+        # set, a consistent-hash ring assigns each aggregate to one node and
+        # the router rejects commands owned by another node.
+        "command_router": {
+            "max_batch": 100,  # Commands coalesced into one load/commit
+            "nodes": [],  # Ring members, e.g. ["worker-1", "worker-2"]
+            "node": None,  # This process's name on the ring
+            "virtual_nodes": 128,  # Ring points per node
+        },
+        # Hot-aggregate contention tracking. Version conflicts, retry reloads
+        # and slow Units of Work are counted per aggregate id in top-K
+        # sketches, shown on the Observatory's Contention page.
+        "contention": {
+            "enabled": True,
+            "capacity": 100,  # Aggregate ids tracked per sketch
+            "report_top": 10,  # Ids exported per sketch as Prometheus gauges
+            "slow_uow_threshold_ms": 100,  # Faster Units of Work are not counted
+            "publish_interval_seconds": 10,  # Min seconds between Redis snapshots
+            "snapshot_ttl_seconds": 3600,  # Snapshot lifetime without updates
+        },
+        # Durable store for messages scheduled with domain.schedule(). The
+        # Engine loads entries due within `horizon_seconds` onto a timer wheel
+        # and appends them to their streams when they fall due.
+        "scheduler": {
+            "backend": None,  # memory | database | redis; None = scheduling disabled
+            "redis_url": None,  # e.g. "redis://localhost:6379/6" (backend = redis)
+            "database_provider": "default",  # Provider holding the table (backend = database)
+            "tick_ms": 100,  # Timer wheel resolution
+            "wheel_slots": 64,  # Slots per wheel level
+            "wheel_levels": 3,  # 64 slots x 3 levels at 100ms spans about 7 hours
+            "horizon_seconds": 60,  # How far ahead entries are loaded onto the wheel
+            "poll_interval_seconds": 1.0,  # How often the store is read
+            "batch_size": 500,  # Entries loaded, and promoted, per round
+            "lease_seconds": 60,  # How long a worker holds entries it is delivering
+        },
         "idempotency": {
+            "backend": None,  # redis | memory | database; None = redis if redis_url is set
             "redis_url": None,  # e.g. "redis://localhost:6379/5"
+            "database_provider": "default",  # Provider holding the table (backend = database)
+            "max_entries": 100000,  # Upper bound on records (backend = memory)
+            "purge_batch_size": 1000,  # Rows deleted per purge statement (backend = database)
             "ttl": 86400,  # Default TTL for success entries: 24 hours (in seconds)
             "error_ttl": 60,  # TTL for error entries: 60 seconds
+            "local_cache_size": 10000,  # In-process LRU of success entries; 0 disables
         },
         "logging": {
             "level": "",  # empty = use environment-based default (_ENV_LEVEL_MAP)
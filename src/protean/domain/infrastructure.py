@@ -1,7 +1,7 @@
 """Infrastructure lifecycle management extracted from the Domain class.
 
-The ``InfrastructureManager`` owns outbox initialization, database setup,
-truncation, and drop operations.
+The ``InfrastructureManager`` owns outbox, idempotency-table and
+scheduled-message-table initialization, database setup, truncation, and drop operations.
 """
 
 from __future__ import annotations
@@ -11,6 +11,16 @@ from typing import TYPE_CHECKING
 
 from inflection import camelize
 
+from protean.adapters.idempotency.database import (
+    IDEMPOTENCY_INDEXES,
+    IdempotencyRecord,
+    IdempotencyRecordRepository,
+)
+from protean.adapters.scheduler.database import (
+    SCHEDULED_MESSAGE_INDEXES,
+    ScheduledMessageRecord,
+    ScheduledMessageRecordRepository,
+)
 from protean.exceptions import ConfigurationError
 from protean.utils import clone_class
 from protean.utils.outbox import OUTBOX_INDEXES, Outbox, OutboxRepository
@@ -31,6 +41,8 @@ class InfrastructureManager:
     def __init__(self, domain: Domain) -> None:
         self._domain = domain
         self.outbox_repos: dict = {}
+        self.idempotency_repos: dict = {}
+        self.schedule_repos: dict = {}
 
     def initialize_outbox(self) -> None:
         """Initialize outbox repositories for all configured providers.
@@ -93,6 +105,97 @@ class InfrastructureManager:
 
         return self.outbox_repos[provider_name]
 
+    def get_idempotency_repo(self, provider_name: str = "default"):
+        """Get (registering on first use) the idempotency record repository
+        for a provider.
+
+        Mirrors :meth:`initialize_outbox`: the record aggregate is cloned per
+        provider so each provider gets its own ``idempotency`` table.
+        """
+        if provider_name in self.idempotency_repos:
+            return self.idempotency_repos[provider_name]
+
+        domain = self._domain
+        try:
+            new_cls = clone_class(
+                IdempotencyRecord, f"{camelize(provider_name)}IdempotencyRecord"
+            )
+            domain.register(
+                new_cls,
+                internal=True,
+                auto_generated=True,
+                schema_name="idempotency",
+                provider=provider_name,
+                indexes=IDEMPOTENCY_INDEXES,
+            )
+
+            new_repo_cls = clone_class(
+                IdempotencyRecordRepository,
+                f"{camelize(provider_name)}IdempotencyRecordRepository",
+            )
+            domain.register(
+                new_repo_cls,
+                internal=True,
+                auto_generated=True,
+                part_of=new_cls,
+            )
+            domain.providers._register_repository(new_cls, new_repo_cls)
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to initialize idempotency table for provider "
+                f"'{provider_name}': {str(e)}"
+            )
+
+        repo = domain.repository_for(new_cls)
+        self.idempotency_repos[provider_name] = repo
+        return repo
+
+    def get_schedule_repo(self, provider_name: str = "default"):
+        """Get (registering on first use) the scheduled message repository
+        for a provider.
+
+        Mirrors :meth:`get_idempotency_repo`, with a ``scheduled_message``
+        table per provider.
+        """
+        if provider_name in self.schedule_repos:
+            return self.schedule_repos[provider_name]
+
+        domain = self._domain
+        try:
+            new_cls = clone_class(
+                ScheduledMessageRecord,
+                f"{camelize(provider_name)}ScheduledMessageRecord",
+            )
+            domain.register(
+                new_cls,
+                internal=True,
+                auto_generated=True,
+                schema_name="scheduled_message",
+                provider=provider_name,
+                indexes=SCHEDULED_MESSAGE_INDEXES,
+            )
+
+            new_repo_cls = clone_class(
+                ScheduledMessageRecordRepository,
+                f"{camelize(provider_name)}ScheduledMessageRecordRepository",
+            )
+            domain.register(
+                new_repo_cls,
+                internal=True,
+                auto_generated=True,
+                part_of=new_cls,
+            )
+            domain.providers._register_repository(new_cls, new_repo_cls)
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to initialize scheduled message table for provider "
+                f"'{provider_name}': {str(e)}"
+            )
+
+        repo = domain.repository_for(new_cls)
+        self.schedule_repos[provider_name] = repo
+        return repo
+
     def setup_database(self) -> None:
         """Create all database tables (aggregates, entities, projections, outbox).
 
@@ -106,6 +209,10 @@ class InfrastructureManager:
         # Force DAO creation for outbox repos so their tables are included
         for _provider_name, outbox_repo in self.outbox_repos.items():
             outbox_repo._dao  # noqa: B018
+        for _provider_name, idempotency_repo in self.idempotency_repos.items():
+            idempotency_repo._dao  # noqa: B018
+        for _provider_name, schedule_repo in self.schedule_repos.items():
+            schedule_repo._dao  # noqa: B018
 
         for _, provider in self._domain.providers.items():
             if not provider.managed:
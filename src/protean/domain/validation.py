@@ -8,7 +8,7 @@ handlers before the domain is activated.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from protean.core.index import validate_indexes
 from protean.domain.helpers import get_env
@@ -130,6 +130,7 @@ class DomainValidator:
         self._validate_query_handler_associations()
         self._validate_outbox_subscription_consistency()
         self._validate_priority_lanes_config()
+        self._validate_admission_config()
         self._validate_indexes()
         self._warn_low_pool_size()
         self._warn_unhandled_commands()
@@ -164,6 +165,7 @@ class DomainValidator:
             self._validate_query_handler_associations,
             self._validate_outbox_subscription_consistency,
             self._validate_priority_lanes_config,
+            self._validate_admission_config,
             self._validate_indexes,
         ]
 
@@ -395,6 +397,80 @@ class DomainValidator:
                 f"got {type(suffix).__name__}: {suffix!r}"
             )
 
+        share = lanes_config.get("min_backfill_share", 0.0)
+        if (
+            not isinstance(share, (int, float))
+            or isinstance(share, bool)
+            or not 0 <= share < 1
+        ):
+            raise ConfigurationError(
+                f"server.priority_lanes.min_backfill_share must be a number in "
+                f"[0, 1), got {type(share).__name__}: {share!r}"
+            )
+
+        weights = lanes_config.get("weights") or {}
+        if not isinstance(weights, dict) or any(
+            lane not in ("primary", "backfill")
+            or not isinstance(weight, (int, float))
+            or isinstance(weight, bool)
+            or weight < 0
+            for lane, weight in weights.items()
+        ):
+            raise ConfigurationError(
+                f"server.priority_lanes.weights must map 'primary' and 'backfill' "
+                f"to non-negative numbers, got {weights!r}"
+            )
+        if weights and weights.get("primary", 1) == 0:
+            raise ConfigurationError(
+                "server.priority_lanes.weights.primary must be greater than 0"
+            )
+
+    def _validate_admission_config(self) -> None:
+        """Check that engine admission limits are well-typed."""
+        admission = self._domain.config.get("server", {}).get("admission", {})
+        if not admission:
+            return
+
+        def _is_count(value: Any) -> bool:
+            return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+        max_in_flight = admission.get("max_in_flight")
+        if max_in_flight is not None and not _is_count(max_in_flight):
+            raise ConfigurationError(
+                f"server.admission.max_in_flight must be a positive integer, "
+                f"got {type(max_in_flight).__name__}: {max_in_flight!r}"
+            )
+
+        saturation = admission.get("pool_saturation")
+        if saturation is not None and (
+            not isinstance(saturation, (int, float))
+            or isinstance(saturation, bool)
+            or saturation <= 0
+        ):
+            raise ConfigurationError(
+                f"server.admission.pool_saturation must be a positive number, "
+                f"got {type(saturation).__name__}: {saturation!r}"
+            )
+
+        quotas = admission.get("quotas") or {}
+        if not isinstance(quotas, dict) or not all(
+            _is_count(quota) for quota in quotas.values()
+        ):
+            raise ConfigurationError(
+                f"server.admission.quotas must map subscription names to "
+                f"positive integers, got {quotas!r}"
+            )
+
+        priorities = admission.get("priorities") or {}
+        if not isinstance(priorities, dict) or any(
+            not isinstance(priority, int) or isinstance(priority, bool)
+            for priority in priorities.values()
+        ):
+            raise ConfigurationError(
+                f"server.admission.priorities must map subscription names to "
+                f"integers, got {priorities!r}"
+            )
+
     def _validate_indexes(self) -> None:
         """Validate ``Index`` declarations on aggregates, entities, projections.
 
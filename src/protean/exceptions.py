@@ -146,7 +146,24 @@ class SendError(ProteanException):
 
 
 class ExpectedVersionError(ProteanException):
-    """Raised on expected version conflicts in EventSourcing"""
+    """Raised on expected version conflicts in EventSourcing
+
+    Carries the conflicting stream, and the aggregate's class name and
+    identifier, when the raising store knows them.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        aggregate: str | None = None,
+        aggregate_id: Any = None,
+        stream: str | None = None,
+        **kwargs,
+    ):
+        super().__init__(message, **kwargs)
+        self.aggregate = aggregate
+        self.aggregate_id = aggregate_id
+        self.stream = stream
 
 
 class TransactionError(ProteanException):
@@ -184,6 +201,18 @@ class CommandExpiredError(ProteanException):
         self.deadline = deadline
 
 
+class CommandRoutingError(ProteanException):
+    """Raised when a command is submitted to a router that does not own it.
+
+    Carries the name of the node that owns the command's aggregate so that
+    callers can forward the command there.
+    """
+
+    def __init__(self, message: str, owner: str | None = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.owner = owner
+
+
 class DeserializationError(ProteanException):
     """Exception raised when message deserialization fails.
 
@@ -735,6 +735,65 @@ class BaseBroker(metaclass=ABCMeta):
         """
         return 0
 
+    # ------------------------------------------------------------------
+    # Drain handoff
+    # ------------------------------------------------------------------
+
+    def mark_draining(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> None:
+        """Announce that a consumer is scheduled to stop.
+
+        Called by a subscription before it drains, so peers that release
+        their pending messages do not hand them to a consumer that is about
+        to release them again. Brokers without per-consumer pending lists
+        leave the default implementation, which does nothing.
+
+        Args:
+            stream: The stream the consumer reads.
+            consumer_group: The consumer's group.
+            consumer_name: The consumer that is about to drain.
+        """
+
+    def release_pending(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> int:
+        """Hand a draining consumer's unacknowledged messages to its group.
+
+        Called by a subscription once it has drained on shutdown, so its
+        pending messages are redelivered to another consumer right away
+        instead of waiting for the consumer to come back. Brokers without
+        per-consumer pending lists leave the default implementation, which
+        returns 0.
+
+        Args:
+            stream: The stream the consumer reads.
+            consumer_group: The consumer's group.
+            consumer_name: The draining consumer.
+
+        Returns:
+            Number of messages released.
+        """
+        return 0
+
+    def claim_released(
+        self, stream: str, consumer_group: str, consumer_name: str
+    ) -> int:
+        """Take over messages released while no other consumer was active.
+
+        Called by a subscription on startup. Brokers without per-consumer
+        pending lists leave the default implementation, which returns 0.
+
+        Args:
+            stream: The stream the consumer reads.
+            consumer_group: The consumer's group.
+            consumer_name: The starting consumer.
+
+        Returns:
+            Number of messages claimed.
+        """
+        return 0
+
     def close(self) -> None:
         """Close the broker and release all connections.
 
@@ -121,6 +121,12 @@ class BaseDAO(metaclass=ABCMeta):
             finally:
                 conn.close()
 
+    def _stream_for(self, identifier: Any) -> str | None:
+        """Event stream of the aggregate stored under ``identifier``, for
+        version conflict errors. ``None`` for non-aggregate entities."""
+        stream_category = getattr(self.entity_cls.meta_, "stream_category", None)
+        return f"{stream_category}-{identifier}" if stream_category else None
+
     def _sync_event_position(self, entity: BaseEntity) -> None:
         """Sync the aggregate's event position from the event store.
 
@@ -477,6 +483,88 @@ class BaseDAO(metaclass=ABCMeta):
             deleted += self._delete_all(Q(**{f"{id_name}__in": chunk}))
         return deleted
 
+    def _count_by(self, field_name: str, criteria: Q | None = None) -> dict[Any, int]:
+        """Count rows matching ``criteria`` grouped by the value of ``field_name``.
+
+        Returns a mapping of each distinct value to its row count; values with
+        no rows are absent. Used by infrastructure that reports a breakdown
+        (e.g. outbox messages per status) and would otherwise issue one
+        :meth:`_count` per value.
+
+        This is the **portable default**: a single read projecting only
+        ``field_name`` (via :meth:`QuerySet.only`), tallied in Python. One
+        round trip, but every matching row is transferred. Adapters with
+        native aggregation (``GROUP BY``, terms aggregations) override this
+        so only the per-value counts leave the data store.
+
+        :param field_name: The field to group rows by.
+        :param criteria: Optional ``Q`` object narrowing the counted rows.
+        :return: A ``{value: count}`` dictionary.
+        """
+        queryset = self.query
+        if criteria is not None and criteria.children:
+            queryset = queryset.filter(criteria)
+        records = queryset.only(field_name).limit(None).all(with_total=False).items
+
+        counts: dict[Any, int] = {}
+        for record in records:
+            value = getattr(record, field_name)
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def _upsert(self, identifier: Any, values: dict[str, Any]) -> None:
+        """Write ``values`` to the row identified by ``identifier``, inserting
+        the row when it does not exist yet.
+
+        Used by infrastructure that keys rows by a caller-supplied identifier
+        and overwrites them freely (e.g. idempotency records), where a
+        read-then-insert would let two concurrent writers both see the row
+        missing and collide on the primary key.
+
+        .. warning::
+
+            Like :meth:`_update_all`, this is an **internal framework method**.
+            It bypasses domain validation and invariants. Do not call it from
+            domain-level code.
+
+        The write goes through the DAO's session: inside an active Unit of
+        Work it commits or rolls back with that Unit of Work, and on its own
+        it commits immediately.
+
+        This is the **portable default**: an :meth:`_update_all` on the
+        identifier followed by a :meth:`_create` when no row matched. It
+        narrows the window but is not race-free — two writers can still both
+        miss the row and one insert fails on the primary key. Adapters with a
+        native upsert (``INSERT … ON CONFLICT DO UPDATE``) or in-process
+        locking override this with an atomic write.
+
+        :param identifier: Value of the entity's identity field.
+        :param values: Attribute data to write, excluding the identifier.
+        """
+        entity_id_field = id_field(self.entity_cls)
+        assert entity_id_field is not None, (
+            f"`{self.entity_cls.__name__}` does not have an identity field"
+        )
+        id_name = entity_id_field.field_name
+
+        if self._update_all(Q(**{id_name: identifier}), dict(values)) > 0:
+            return
+
+        entity = self.entity_cls(**{id_name: identifier}, **values)
+        self._create(self.database_model_cls.from_entity(entity))
+
+    def _upsert_many(self, rows: dict[Any, dict[str, Any]]) -> None:
+        """Upsert several rows, keyed by identifier.
+
+        Same contract as :meth:`_upsert`. Every row must set the same
+        attributes. The portable default upserts one row at a time; adapters
+        with a native upsert write the whole batch in one statement.
+
+        :param rows: Attribute data to write, keyed by identifier.
+        """
+        for identifier, values in rows.items():
+            self._upsert(identifier, values)
+
     ######################
     # Life-cycle methods #
     ######################
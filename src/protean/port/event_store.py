@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict, deque
 from dataclasses import dataclass, field as dc_field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union
 
 if TYPE_CHECKING:
     from protean.domain import Domain
@@ -12,7 +14,11 @@ if TYPE_CHECKING:
 from protean.core.aggregate import BaseAggregate
 from protean.core.command import BaseCommand
 from protean.core.event import BaseEvent
-from protean.exceptions import IncorrectUsageError, ObjectNotFoundError
+from protean.exceptions import (
+    IncorrectUsageError,
+    NotSupportedError,
+    ObjectNotFoundError,
+)
 from protean.utils.eventing import Message
 from protean.utils.telemetry import set_span_error
 
@@ -33,6 +39,66 @@ class CausationNode:
     delta_ms: float | None = None
 
 
+DEFAULT_STREAM_HEAD_TTL = 2.0
+
+
+class StreamHeadTracker:
+    """Thread-safe, short-lived cache of stream head positions for lag reporting.
+
+    A head is fetched with ``fetch`` and trusted for ``ttl`` seconds. An
+    expired entry is revalidated against the ``$all`` head, cached the same
+    way: while nothing new has been written anywhere, the entry still holds
+    and the stream is not queried again. Adapters discard the affected
+    entries as they write, so local writes show up immediately; writes made
+    by other processes show up within two ``ttl`` periods.
+
+    A ``ttl`` of ``0`` disables caching.
+    """
+
+    _ALL = "$all"
+
+    def __init__(self, fetch: Callable[[str], int], ttl: float) -> None:
+        self._fetch = fetch
+        self._ttl = ttl
+        # stream -> (head, ``$all`` head it was validated against, checked at)
+        self._entries: dict[str, tuple[int, int | None, float]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def head(self, stream: str) -> int:
+        if self._ttl <= 0:
+            return self._fetch(stream)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(stream)
+        if entry is not None and now - entry[2] < self._ttl:
+            return entry[0]
+
+        all_head = None if stream == self._ALL else self.head(self._ALL)
+        if entry is not None and all_head is not None and entry[1] == all_head:
+            head = entry[0]
+        else:
+            head = self._fetch(stream)
+
+        with self._lock:
+            self._entries[stream] = (head, all_head, now)
+        return head
+
+    def discard(self, stream: str) -> None:
+        """Forget ``stream``, its category and ``$all`` after writing to it."""
+        category, _, _ = stream.partition("-")
+        with self._lock:
+            for key in (stream, category, self._ALL):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class BaseEventStore(metaclass=ABCMeta):
     """This class outlines the base event store capabilities
     to be implemented in all supported event store adapters.
@@ -41,11 +107,25 @@ class BaseEventStore(metaclass=ABCMeta):
     classes with the domain.
     """
 
+    #: Whether ``append_many`` writes a batch all-or-nothing. Adapters that
+    #: override :meth:`_write_many` with a single transaction set this, so a
+    #: failed batch is known to have written nothing and can be retried.
+    atomic_batches: bool = False
+
     def __init__(self, name: str, domain: "Domain", conn_info: Dict[str, str]) -> None:
         self.name = name
         self.domain = domain
         self.conn_info = conn_info
 
+        # Stream heads served to lag reporting, refreshed every few seconds
+        try:
+            head_ttl = float(conn_info.get("stream_head_ttl", DEFAULT_STREAM_HEAD_TTL))
+        except (TypeError, ValueError):
+            head_ttl = DEFAULT_STREAM_HEAD_TTL
+        self._stream_heads = StreamHeadTracker(
+            lambda stream: self._stream_head_position(stream), head_ttl
+        )
+
     def close(self) -> None:
         """Close the event store and release all connections.
 
@@ -68,9 +148,21 @@ class BaseEventStore(metaclass=ABCMeta):
 
         Returns the position of the message in the stream.
 
-        Implemented by the concrete event store adapter.
+        Implemented by the concrete event store adapter. An expected version
+        conflict raises ``ValueError`` with a ``stream`` attribute naming the
+        conflicting stream.
         """
 
+    def _write_many(self, messages: List[tuple]) -> List[int]:
+        """Write several messages, in order, and return their positions.
+
+        Each entry holds the positional arguments of one :meth:`_write`
+        call. The default writes them one at a time, so a failure leaves the
+        messages before it written. Adapters that can write a batch in one
+        transaction override this and set :attr:`atomic_batches`.
+        """
+        return [self._write(*message) for message in messages]
+
     @abstractmethod
     def _read(
         self,
@@ -115,6 +207,58 @@ class BaseEventStore(metaclass=ABCMeta):
 
         return messages
 
+    def _stream_version(self, stream_name: str) -> int:
+        """Return the position of the last message in a stream, or ``-1`` when
+        the stream is empty.
+
+        This is the version ``expected_version`` writes are checked against.
+        The default reads the stream's last message; adapters that can look
+        the version up without fetching the message override it.
+        """
+        message = self._read_last_message(stream_name)
+        return message["position"] if message else -1
+
+    def _truncate_stream(self, stream_name: str, before_position: int) -> int:
+        """Delete the messages of a stream positioned before ``before_position``.
+
+        Optional capability, used to compact streams whose latest message
+        carries their full state. Adapters that cannot remove messages keep
+        this default.
+
+        Returns:
+            The number of messages removed.
+        """
+        raise NotSupportedError(
+            f"Event store '{self.name}' ({self.__class__.__name__}) "
+            "does not support truncating streams"
+        )
+
+    def _check_truncate_support(self) -> None:
+        """Raise when this store cannot truncate streams.
+
+        Called before work that ends in a truncation, so that it fails before
+        writing anything. The default only checks that the adapter
+        implements :meth:`_truncate_stream`.
+        """
+        if type(self)._truncate_stream is BaseEventStore._truncate_stream:
+            raise NotSupportedError(
+                f"Event store '{self.name}' ({self.__class__.__name__}) "
+                "does not support truncating streams"
+            )
+
+    def truncate_stream(self, stream_name: str, before_position: int) -> int:
+        """Remove the messages of a stream positioned before ``before_position``.
+
+        The stream's version is unchanged: later writes continue after its
+        last message, and reads from an earlier position start at the first
+        message kept.
+        """
+        if "-" not in stream_name:
+            raise IncorrectUsageError(
+                f"`{stream_name}` is a category; only single streams can be truncated"
+            )
+        return self._truncate_stream(stream_name, before_position)
+
     def read_last_message(self, stream) -> Optional[Message]:
         raw_message = self._read_last_message(stream)
         if raw_message:
@@ -122,6 +266,20 @@ class BaseEventStore(metaclass=ABCMeta):
 
         return None
 
+    @staticmethod
+    def _write_args(message: Message) -> tuple:
+        """Positional arguments for writing ``message`` with :meth:`_write`."""
+        assert message.metadata is not None, "Message metadata cannot be None"
+        return (
+            message.metadata.headers.stream,
+            message.metadata.headers.type,
+            message.data,
+            message.metadata.to_dict(),
+            message.metadata.domain.expected_version
+            if message.metadata.domain
+            else None,
+        )
+
     def append(self, object: Union[BaseEvent, BaseCommand]) -> int:
         tracer = self.domain.tracer
 
@@ -141,15 +299,7 @@ class BaseEventStore(metaclass=ABCMeta):
             )
 
             try:
-                position = self._write(
-                    message.metadata.headers.stream,
-                    message.metadata.headers.type,
-                    message.data,
-                    metadata=message.metadata.to_dict(),
-                    expected_version=message.metadata.domain.expected_version
-                    if message.metadata.domain
-                    else None,
-                )
+                position = self._write(*self._write_args(message))
 
                 span.set_attribute("protean.event_store.position", position)
                 return position
@@ -157,6 +307,33 @@ class BaseEventStore(metaclass=ABCMeta):
                 set_span_error(span, exc)
                 raise
 
+    def append_many(self, objects: List[Union[BaseEvent, BaseCommand]]) -> List[int]:
+        """Append several events or commands, in order, and return their positions.
+
+        Each message is still checked against its own expected version. The
+        batch goes to :meth:`_write_many` in one call; with
+        :attr:`atomic_batches`, a failure means none of it was written.
+        """
+        if not objects:
+            return []
+
+        with self.domain.tracer.start_as_current_span(
+            "protean.event_store.append_many",
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            span.set_attribute("protean.event_store.message_count", len(objects))
+            try:
+                return self._write_many(
+                    [
+                        self._write_args(Message.from_domain_object(object))
+                        for object in objects
+                    ]
+                )
+            except Exception as exc:
+                set_span_error(span, exc)
+                raise
+
     def load_aggregate(
         self,
         part_of: Type[BaseAggregate],
@@ -808,18 +985,27 @@ class BaseEventStore(metaclass=ABCMeta):
             stream has no messages.
         """
 
-    def stream_head_position(self, stream_category: str) -> int:
+    def stream_head_position(
+        self, stream_category: str, *, cached: bool = False
+    ) -> int:
         """Return the global_position of the newest message in a category stream.
 
         Public wrapper around :meth:`_stream_head_position`.
 
         Args:
             stream_category: The stream category to check.
+            cached: Serve the position from the store's
+                :class:`StreamHeadTracker`, which may be a few seconds
+                behind writes from other processes. Lag reporting uses this
+                so that status checks across many subscriptions do not query
+                each category every time.
 
         Returns:
             The ``global_position`` of the latest message, or ``-1`` if the
             stream has no messages.
         """
+        if cached:
+            return self._stream_heads.head(stream_category)
         return self._stream_head_position(stream_category)
 
     @abstractmethod
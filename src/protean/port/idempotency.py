@@ -0,0 +1,70 @@
+"""Port for idempotency record storage.
+
+An idempotency backend stores small JSON-serializable records (``status``
+plus ``result`` or ``error``) under caller-provided keys with a per-entry
+TTL. ``IdempotencyStore`` owns the dedup semantics; backends only persist
+and expire records.
+"""
+
+from abc import ABCMeta, abstractmethod
+from typing import Any, Iterable, Optional
+
+
+class BaseIdempotencyBackend(metaclass=ABCMeta):
+    """Key/value storage with TTL for idempotency records.
+
+    Concrete backends implement the single-key operations. ``get_many`` and
+    ``set_many`` default to looping over them; backends that can resolve a
+    batch in one round trip should override both.
+    """
+
+    #: Whether writes made inside an active Unit of Work commit (or roll
+    #: back) together with the business data.
+    transactional: bool = False
+
+    #: Whether ``IdempotencyStore`` should keep an in-process LRU of success
+    #: records in front of this backend. Backends that already live in
+    #: process memory gain nothing from a second copy.
+    local_tier: bool = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the live record stored under ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, record: dict[str, Any], ttl: int) -> None:
+        """Store ``record`` under ``key``, replacing any previous record.
+
+        Args:
+            key: The idempotency key.
+            record: A JSON-serializable dict.
+            ttl: Seconds until the record expires.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the record stored under ``key``, if any."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Remove every record. Useful for testing."""
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Optional[dict[str, Any]]]:
+        """Return a dict mapping each key to its live record, or None."""
+        return {key: self.get(key) for key in keys}
+
+    def set_many(self, records: dict[str, dict[str, Any]], ttl: int) -> None:
+        """Store several records that share one TTL."""
+        for key, record in records.items():
+            self.set(key, record, ttl)
+
+    def purge_expired(self) -> int:
+        """Remove expired records and return how many were removed.
+
+        Backends whose storage expires entries natively (Redis) keep the
+        default no-op.
+        """
+        return 0
+
+    def close(self) -> None:
+        """Release connections held by the backend. No-op by default."""
@@ -1,10 +1,14 @@
 """Base class for Providers"""
 
 import logging
+import threading
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Flag, auto
 from importlib import import_module, metadata
-from typing import Any, Protocol, Type, runtime_checkable
+from typing import Any, Iterator, Protocol, Type, runtime_checkable
+from uuid import uuid4
 
 from protean.exceptions import ConfigurationError, NotSupportedError
 from protean.utils.query import RegisterLookupMixin
@@ -61,6 +65,53 @@ class DatabaseCapabilities(Flag):
     )
 
 
+# Entities whose repositories currently read and write shadow storage, keyed
+# by entity class. Set by ``use_shadow_storage`` during blue/green rebuilds.
+_shadow_storage: ContextVar[dict[type, str] | None] = ContextVar(
+    "shadow_storage", default=None
+)
+
+# Number of ``use_shadow_storage`` blocks open in any context. Repositories
+# only consult the context variable while a rebuild holds one open.
+_open_shadow_routes = 0
+_open_shadow_routes_lock = threading.Lock()
+
+
+@contextmanager
+def use_shadow_storage(entity_cls: type, shadow_name: str) -> Iterator[None]:
+    """Route an entity's repository to shadow storage within the block.
+
+    Repositories resolve their DAO through
+    :meth:`BaseProvider.get_shadow_dao` while the block is active. The
+    routing is scoped to the current context, so other threads and tasks
+    keep reading and writing the live storage.
+    """
+    global _open_shadow_routes
+
+    with _open_shadow_routes_lock:
+        _open_shadow_routes += 1
+    token = _shadow_storage.set(
+        {**(_shadow_storage.get() or {}), entity_cls: shadow_name}
+    )
+    try:
+        yield
+    finally:
+        _shadow_storage.reset(token)
+        with _open_shadow_routes_lock:
+            _open_shadow_routes -= 1
+
+
+def shadow_storage_active() -> bool:
+    """Whether any context is currently routed to shadow storage."""
+    return _open_shadow_routes > 0
+
+
+def shadow_storage_for(entity_cls: type) -> str | None:
+    """Return the shadow storage an entity is routed to, if any."""
+    shadows = _shadow_storage.get()
+    return shadows.get(entity_cls) if shadows else None
+
+
 @runtime_checkable
 class SessionProtocol(Protocol):
     """Protocol that database session objects must satisfy.
@@ -363,6 +414,60 @@ class BaseProvider(RegisterLookupMixin, metaclass=ABCMeta):
         """
         return {}
 
+    @staticmethod
+    def _new_shadow_name(schema_name: str) -> str:
+        """Return a unique name for a shadow of ``schema_name``.
+
+        Unique per rebuild, so names derived from it (indexes, constraints)
+        never clash with those of a copy that was swapped in earlier.
+        """
+        return f"{schema_name}__rebuild_{uuid4().hex[:8]}"
+
+    def create_shadow(self, entity_cls: Type, database_model_cls: Type) -> str:
+        """Create empty storage alongside an entity's live storage.
+
+        Used by blue/green projection rebuilds, which build the new copy in
+        the shadow while reads keep hitting the live storage. Returns the
+        shadow's name.
+
+        Raises NotSupportedError if the provider cannot create shadows.
+        """
+        raise NotSupportedError(
+            f"Provider '{self.name}' ({self.__class__.__name__}) "
+            "does not support shadow storage"
+        )
+
+    def get_shadow_dao(
+        self, entity_cls: Type, database_model_cls: Type, shadow_name: str
+    ) -> Any:
+        """Return a DAO that reads and writes the named shadow storage."""
+        raise NotSupportedError(
+            f"Provider '{self.name}' ({self.__class__.__name__}) "
+            "does not support shadow storage"
+        )
+
+    def swap_shadow(
+        self, entity_cls: Type, database_model_cls: Type, shadow_name: str
+    ) -> None:
+        """Atomically replace the live storage with the shadow.
+
+        After the swap the shadow's data is reachable under the live name
+        and the previous live copy has been dropped.
+        """
+        raise NotSupportedError(
+            f"Provider '{self.name}' ({self.__class__.__name__}) "
+            "does not support shadow storage"
+        )
+
+    def drop_shadow(
+        self, entity_cls: Type, database_model_cls: Type, shadow_name: str
+    ) -> None:
+        """Discard a shadow that will not be swapped in."""
+        raise NotSupportedError(
+            f"Provider '{self.name}' ({self.__class__.__name__}) "
+            "does not support shadow storage"
+        )
+
     @abstractmethod
     def _data_reset(self) -> None:
         """Flush all data in the provider's persistence store.
@@ -0,0 +1,95 @@
+"""Port for durable storage of messages scheduled for future delivery.
+
+A schedule store holds serialized messages until their delivery time. The
+Engine's ``ScheduledDelivery`` task reads what falls due within its
+horizon, keeps it on an in-memory timer wheel, and on expiry claims the
+messages and appends them to their target streams in one batch.
+
+Several workers may load the same entries. ``claim()`` is what decides
+which of them delivers each message: a store must lease an entry to
+exactly one caller at a time. The entry stays in the store until the
+worker has appended it and calls ``remove()``. A worker that dies in
+between leaves a lease that runs out, and the entry is delivered again,
+so delivery is at least once.
+"""
+
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable
+
+
+@dataclass(frozen=True)
+class ScheduledMessage:
+    """A serialized message waiting for its delivery time."""
+
+    id: str
+    """Schedule identifier, returned by ``domain.schedule()``."""
+
+    stream: str
+    """Stream the message is appended to when it falls due."""
+
+    payload: dict[str, Any]
+    """The message, as produced by ``Message.to_dict()``."""
+
+    deliver_at: datetime
+    """UTC instant at which the message becomes due."""
+
+
+class BaseScheduleStore(metaclass=ABCMeta):
+    """Storage for scheduled messages, ordered by delivery time.
+
+    Concrete stores implement the single-entry operations and ``due()``.
+    ``add_many`` defaults to looping over ``add``; stores that can write a
+    batch in one round trip should override it.
+    """
+
+    @abstractmethod
+    def add(self, message: ScheduledMessage) -> None:
+        """Store ``message``, replacing any entry with the same id."""
+
+    @abstractmethod
+    def due(self, until: datetime, limit: int) -> list[ScheduledMessage]:
+        """Return up to ``limit`` entries due at or before ``until``, earliest first.
+
+        Entries are not removed, and leased entries are left out; see
+        ``claim()``.
+        """
+
+    @abstractmethod
+    def claim(self, ids: Iterable[str], lease: float) -> set[str]:
+        """Lease the entries with ``ids`` for ``lease`` seconds and return
+        those this call leased.
+
+        An id leased by another worker whose lease has not run out, or
+        cancelled, is left out of the result.
+        """
+
+    @abstractmethod
+    def release(self, ids: Iterable[str]) -> None:
+        """End the leases on ``ids`` so the entries can be claimed again."""
+
+    @abstractmethod
+    def remove(self, ids: Iterable[str]) -> int:
+        """Delete the entries with ``ids``, leased or not. Returns how many
+        there were."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of entries waiting for delivery."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Remove every entry. Useful for testing."""
+
+    def add_many(self, messages: Iterable[ScheduledMessage]) -> None:
+        """Store several entries."""
+        for message in messages:
+            self.add(message)
+
+    def cancel(self, id: str) -> bool:
+        """Remove an entry before delivery. Returns whether it was still pending."""
+        return self.remove([id]) > 0
+
+    def close(self) -> None:
+        """Release connections held by the store. No-op by default."""
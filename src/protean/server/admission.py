@@ -0,0 +1,299 @@
+"""Engine-wide admission control for message fetching.
+
+Every subscription and outbox processor in an ``Engine`` pulls work on its
+own schedule. Without a shared limit, a burst across many streams fetches
+far more messages than the shared database connection pool can serve, and
+handlers then fail in cascades of pool timeouts.
+
+``AdmissionController`` is a soft gate that sits in front of every fetch.
+Before reading a batch, a subscription enters a slot; the slot blocks while:
+
+- the number of fetched-but-unfinished messages across the engine is at
+  ``max_in_flight``,
+- the subscription's own quota is full,
+- any database provider's connection pool is at or above
+  ``pool_saturation`` (checked-out connections divided by pool size), or
+- a subscription with a higher priority is waiting for the same capacity.
+
+Once admitted, the slot is charged with the size of the fetched batch and
+released when the batch has been processed. The limit is soft: a batch is
+never split, so the total may overshoot ``max_in_flight`` by at most one
+batch per admitted subscription.
+
+The controller is disabled unless at least one limit is configured. While
+disabled, entering a slot costs a single attribute check.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often blocked waiters re-check pool saturation, in seconds
+DEFAULT_POOL_CHECK_INTERVAL = 0.5
+
+
+class _NullSlot:
+    """Slot handed out when admission control is disabled."""
+
+    __slots__ = ()
+
+    async def __aenter__(self) -> "_NullSlot":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def admit(self, count: int) -> None:
+        pass
+
+
+NULL_SLOT = _NullSlot()
+
+
+class AdmissionSlot:
+    """Capacity held by one subscription between fetch and processing.
+
+    Entering the slot waits for admission and reserves one unit of
+    capacity, so concurrent subscriptions cannot all pass the gate on the
+    same free unit. ``admit`` resizes the reservation to the number of
+    messages actually fetched. Leaving the slot releases everything held.
+    """
+
+    __slots__ = ("_controller", "_name", "_held")
+
+    def __init__(self, controller: "AdmissionController", name: str) -> None:
+        self._controller = controller
+        self._name = name
+        self._held = 0
+
+    async def __aenter__(self) -> "AdmissionSlot":
+        await self._controller._acquire(self._name)
+        self._held = 1
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._controller._release(self._name, self._held)
+        self._held = 0
+
+    def admit(self, count: int) -> None:
+        """Resize the reservation to ``count`` fetched messages."""
+        self._controller._adjust(self._name, count - self._held)
+        self._held = count
+
+
+class AdmissionController:
+    """Bound in-flight work across all subscriptions of an engine.
+
+    Args:
+        max_in_flight: Engine-wide cap on fetched-but-unfinished messages.
+            ``None`` disables the global cap.
+        quotas: Per-subscription caps on in-flight messages, keyed by
+            subscription name.
+        priorities: Per-subscription priorities, keyed by subscription name.
+            When capacity is scarce, a waiting subscription defers to any
+            waiter with a higher priority. Unlisted subscriptions have
+            priority ``0``.
+        pool_saturation: Pause fetching while any connection pool's
+            ``checked_out / size`` ratio is at or above this value. ``None``
+            disables the check.
+        pool_check_interval: Seconds between pool statistics reads, and
+            between re-checks by blocked waiters.
+        pool_stats: Callable returning an iterable of pool statistics dicts,
+            as produced by ``BaseProvider.pool_stats()``.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        quotas: Optional[dict[str, int]] = None,
+        priorities: Optional[dict[str, int]] = None,
+        pool_saturation: Optional[float] = None,
+        pool_check_interval: float = DEFAULT_POOL_CHECK_INTERVAL,
+        pool_stats: Optional[Callable[[], Iterable[dict[str, int]]]] = None,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.quotas = dict(quotas or {})
+        self.priorities = dict(priorities or {})
+        self.pool_saturation = pool_saturation
+        self.pool_check_interval = pool_check_interval
+        self._pool_stats = pool_stats
+
+        self._in_flight = 0
+        self._per_subscription: Counter[str] = Counter()
+        self._waiting: Counter[str] = Counter()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopped = False
+
+        self._saturation = 0.0
+        self._saturation_checked_at = float("-inf")
+
+        # Counters surfaced through ``stats()``
+        self._admitted = 0
+        self._throttled = 0
+
+    @classmethod
+    def from_config(cls, domain: Any) -> "AdmissionController":
+        """Build a controller from the ``server.admission`` config section."""
+        try:
+            config = domain.config.get("server", {}).get("admission", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+        return cls(
+            max_in_flight=config.get("max_in_flight"),
+            quotas=config.get("quotas"),
+            priorities=config.get("priorities"),
+            pool_saturation=config.get("pool_saturation"),
+            pool_check_interval=config.get(
+                "pool_check_interval", DEFAULT_POOL_CHECK_INTERVAL
+            ),
+            pool_stats=lambda: _domain_pool_stats(domain),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return bool(
+            self.max_in_flight or self.quotas or self.pool_saturation is not None
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Messages fetched but not yet processed, engine-wide."""
+        return self._in_flight
+
+    def slot(self, name: str) -> "AdmissionSlot | _NullSlot":
+        """Return an async context manager guarding one fetch-and-process cycle.
+
+        Args:
+            name: Subscription name, matched against ``quotas`` and
+                ``priorities``.
+        """
+        if not self.enabled or self._stopped:
+            return NULL_SLOT
+        return AdmissionSlot(self, name)
+
+    def stop(self) -> None:
+        """Stop gating and release every blocked waiter.
+
+        Called on engine shutdown so no subscription stays parked at the gate.
+        """
+        self._stopped = True
+        self._notify()
+
+    def stats(self) -> dict[str, Any]:
+        """Current admission state, for health endpoints and metrics."""
+        return {
+            "enabled": self.enabled,
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "per_subscription": dict(self._per_subscription),
+            "waiting": sum(self._waiting.values()),
+            "pool_saturation": self._saturation,
+            "admitted": self._admitted,
+            "throttled": self._throttled,
+        }
+
+    # ------------------------------------------------------------------
+    # Slot protocol
+    # ------------------------------------------------------------------
+
+    async def _acquire(self, name: str) -> None:
+        if not self._can_admit(name, check_waiters=True):
+            self._throttled += 1
+            self._waiting[name] += 1
+            try:
+                while not self._can_admit(name, check_waiters=True):
+                    if self._wakeup is None:
+                        self._wakeup = asyncio.Event()
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(), self.pool_check_interval
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiting[name] -= 1
+                if self._waiting[name] <= 0:
+                    del self._waiting[name]
+
+        self._admitted += 1
+        self._adjust(name, 1)
+
+    def _adjust(self, name: str, delta: int) -> None:
+        self._in_flight += delta
+        self._per_subscription[name] += delta
+        if self._per_subscription[name] <= 0:
+            del self._per_subscription[name]
+        if delta < 0:
+            self._notify()
+
+    def _release(self, name: str, count: int) -> None:
+        if count:
+            self._adjust(name, -count)
+
+    def _notify(self) -> None:
+        # Wake every waiter; each re-checks its own conditions
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._wakeup = None
+
+    def _can_admit(self, name: str, check_waiters: bool = False) -> bool:
+        if self._stopped:
+            return True
+        if self.max_in_flight and self._in_flight >= self.max_in_flight:
+            return False
+        quota = self.quotas.get(name)
+        if quota and self._per_subscription[name] >= quota:
+            return False
+        if self._pool_saturated():
+            return False
+        if check_waiters and self._outranked(name):
+            return False
+        return True
+
+    def _outranked(self, name: str) -> bool:
+        """Whether a higher-priority waiter could use the free capacity."""
+        if not self._waiting or not self.priorities:
+            return False
+        priority = self.priorities.get(name, 0)
+        for other in self._waiting:
+            if other == name or self.priorities.get(other, 0) <= priority:
+                continue
+            # A waiter blocked by its own quota cannot use the capacity
+            quota = self.quotas.get(other)
+            if quota and self._per_subscription[other] >= quota:
+                continue
+            return True
+        return False
+
+    def _pool_saturated(self) -> bool:
+        if self.pool_saturation is None or self._pool_stats is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._saturation_checked_at >= self.pool_check_interval:
+            self._saturation_checked_at = now
+            try:
+                self._saturation = max(
+                    (
+                        stats["checked_out"] / stats["size"]
+                        for stats in self._pool_stats()
+                        if stats and stats.get("size")
+                    ),
+                    default=0.0,
+                )
+            except Exception:
+                logger.debug("Failed to read connection pool stats", exc_info=True)
+                self._saturation = 0.0
+
+        return self._saturation >= self.pool_saturation
+
+
+def _domain_pool_stats(domain: Any) -> list[dict[str, int]]:
+    """Collect ``pool_stats()`` from every initialized provider of ``domain``."""
+    providers = getattr(domain.providers, "_providers", None) or {}
+    return [provider.pool_stats() for provider in providers.values()]
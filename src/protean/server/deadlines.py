@@ -0,0 +1,195 @@
+"""Earliest-deadline-first ordering of a subscription's message batch.
+
+Commands submitted with a deadline (``domain.process(..., timeout=...)``)
+carry it in ``metadata.headers.deadline``. Subscriptions used to handle a
+batch in arrival order and discover an expired command only once the
+engine was about to run it, after it had been deserialized. Under
+overload that spends capacity on commands whose callers have already
+given up, while fresher commands behind them expire in turn.
+
+``DeadlineScheduler`` runs over a fetched batch before any handler work:
+
+* Messages whose deadline has passed are shed. They are never deserialized
+  and never enter a Unit of Work. The engine counts sheds per handler.
+* The remaining messages are ordered earliest deadline first. Messages
+  without a deadline keep their arrival order after those that have one.
+
+Messages of the same stream are never reordered against each other:
+replaying an aggregate's commands out of order would change their
+outcome. A message inherits the earliest deadline of the messages behind
+it in its own stream, so an urgent command pulls its predecessors forward
+with it.
+
+Deadlines are read straight from the raw ``metadata.headers`` dictionary
+for broker payloads, or from ``Message`` headers for event store reads.
+"""
+
+import math
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional, Sequence, TypeVar
+
+from protean.utils.eventing import ensure_utc
+
+T = TypeVar("T")
+
+
+def payload_deadline(payload: Any) -> Optional[datetime]:
+    """Return the deadline of a serialized message payload, if it has one.
+
+    Only ``metadata.headers.deadline`` is read, so shedding an expired
+    message costs a dictionary lookup rather than a full deserialization.
+    Unreadable deadlines are treated as absent, leaving the decision to
+    the engine once the message has been deserialized.
+    """
+    try:
+        deadline = payload["metadata"]["headers"].get("deadline")
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+    if deadline is None or isinstance(deadline, datetime):
+        return deadline
+    try:
+        return datetime.fromisoformat(deadline)
+    except (TypeError, ValueError):
+        return None
+
+
+def payload_stream(payload: Any) -> Optional[str]:
+    """Return the stream name of a serialized message payload, if present."""
+    try:
+        return payload["metadata"]["headers"].get("stream")
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def message_deadline(message: Any) -> Optional[datetime]:
+    """Return the deadline of a deserialized ``Message``, if it has one."""
+    headers = message.metadata.headers if message.metadata else None
+    return headers.deadline if headers else None
+
+
+def message_stream(message: Any) -> Optional[str]:
+    """Return the stream name of a deserialized ``Message``, if present."""
+    headers = message.metadata.headers if message.metadata else None
+    return headers.stream if headers else None
+
+
+class DeadlineScheduler:
+    """Shed expired messages and order the rest earliest deadline first.
+
+    One scheduler is shared by all of an engine's subscriptions. It also
+    keeps the running count of shed messages per handler.
+
+    Args:
+        enabled: When ``False``, batches keep their arrival order. Expired
+            messages are still shed, because running them is never useful.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._shed: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, domain) -> "DeadlineScheduler":
+        """Build a scheduler from ``server.deadline_scheduling``."""
+        try:
+            enabled = domain.config["server"].get("deadline_scheduling", True)
+        except (KeyError, TypeError, AttributeError):
+            enabled = True
+        return cls(enabled=bool(enabled))
+
+    def schedule(
+        self,
+        items: Sequence[T],
+        deadline_of: Callable[[T], Optional[datetime]],
+        stream_of: Callable[[T], Optional[str]],
+        now: Optional[datetime] = None,
+    ) -> tuple[list[T], list[T]]:
+        """Split ``items`` into the order to process them and the expired ones.
+
+        Args:
+            items: The fetched batch, in arrival order.
+            deadline_of: Returns an item's deadline, or ``None``.
+            stream_of: Returns an item's stream. Items of one stream keep
+                their relative order.
+            now: Reference time. Defaults to the current UTC time.
+
+        Returns:
+            A ``(ready, expired)`` tuple. ``ready`` is in processing order;
+            ``expired`` is in arrival order.
+        """
+        now = ensure_utc(now) if now else datetime.now(timezone.utc)
+
+        ready: list[tuple[T, float]] = []
+        expired: list[T] = []
+        has_deadlines = False
+        for item in items:
+            deadline = deadline_of(item)
+            if deadline is None:
+                ready.append((item, math.inf))
+                continue
+            deadline = ensure_utc(deadline)
+            if now > deadline:
+                expired.append(item)
+            else:
+                has_deadlines = True
+                ready.append((item, deadline.timestamp()))
+
+        if not (self.enabled and has_deadlines):
+            return [item for item, _ in ready], expired
+
+        # Walk the batch backwards so each message inherits the earliest
+        # deadline of the messages behind it in the same stream.
+        effective = [0.0] * len(ready)
+        earliest_behind: dict[Optional[str], float] = {}
+        for index in range(len(ready) - 1, -1, -1):
+            item, deadline = ready[index]
+            stream = stream_of(item)
+            deadline = min(deadline, earliest_behind.get(stream, math.inf))
+            earliest_behind[stream] = deadline
+            effective[index] = deadline
+
+        order = sorted(range(len(ready)), key=lambda index: effective[index])
+        return [ready[index][0] for index in order], expired
+
+    def record_shed(self, handler: str, count: int = 1) -> None:
+        """Count ``count`` messages shed on behalf of ``handler``."""
+        with self._lock:
+            self._shed[handler] += count
+
+    def shed_counts(self) -> dict[str, int]:
+        """Return the number of messages shed so far, per handler."""
+        with self._lock:
+            return dict(self._shed)
+
+
+class PositionWatermark:
+    """Track the read position of a batch that is processed out of order.
+
+    A subscription may only persist a read position once every message up
+    to it has been handled. Otherwise a restart would skip messages that
+    were reordered behind it. ``complete()`` returns the highest position
+    that is safe to persist.
+
+    Args:
+        positions: Positions of the batch's messages.
+    """
+
+    def __init__(self, positions: Iterable[int]) -> None:
+        self._pending = sorted(positions)
+        self._done: set[int] = set()
+        self._next = 0
+
+    def complete(self, position: int) -> Optional[int]:
+        """Mark ``position`` handled; return the new safe position, if it moved."""
+        self._done.add(position)
+        moved = None
+        while (
+            self._next < len(self._pending) and self._pending[self._next] in self._done
+        ):
+            moved = self._pending[self._next]
+            self._next += 1
+        return moved
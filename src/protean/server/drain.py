@@ -0,0 +1,77 @@
+"""Graceful drain of an Engine's subscriptions on shutdown.
+
+Cancelling a subscription task mid-batch leaves the batch partly handled.
+Event store positions written since the last checkpoint are lost, so those
+messages are handled again. Redis pending entries stay assigned to a
+consumer that no longer exists until something claims them. Outbox rows
+stay locked until their lock expires.
+
+On shutdown each subscription drains instead:
+
+1. It stops fetching. The poll loop exits before its next read.
+2. It waits up to ``timeout_seconds`` for the batch it is handling to
+   finish, then cancels whatever is still running.
+3. It flushes its checkpoint. Event store subscriptions write their read
+   position.
+4. It releases what it still holds, when ``handoff`` is on. Stream
+   subscriptions hand their pending Redis entries to an active peer in the
+   consumer group that is not itself draining, or park them for the next
+   consumer to start. Outbox processors return claimed rows they did not
+   get to to ``PENDING``.
+
+With ``rolling`` on, the multi-worker supervisor drains its workers one at
+a time, within one overall timeout. It first tells every worker that it is
+scheduled to stop, so messages are only handed to consumers outside the
+shutdown.
+"""
+
+from typing import Any
+
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 10.0
+
+
+class DrainPolicy:
+    """How an Engine's subscriptions drain on shutdown.
+
+    Args:
+        timeout_seconds: How long a subscription waits for its in-flight
+            batch before cancelling it.
+        handoff: Whether subscriptions release pending broker messages and
+            outbox claims once drained.
+        rolling: Whether the supervisor drains workers one at a time.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = DEFAULT_DRAIN_TIMEOUT_SECONDS,
+        handoff: bool = True,
+        rolling: bool = False,
+    ) -> None:
+        self.timeout_seconds = max(0.0, timeout_seconds)
+        self.handoff = handoff
+        self.rolling = rolling
+
+    @classmethod
+    def from_config(cls, domain: Any) -> "DrainPolicy":
+        """Build a policy from the ``server.drain`` config section.
+
+        Invalid values fall back to the defaults rather than failing engine
+        startup.
+        """
+        try:
+            config = domain.config.get("server", {}).get("drain", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+
+        try:
+            timeout = float(
+                config.get("timeout_seconds", DEFAULT_DRAIN_TIMEOUT_SECONDS)
+            )
+        except (TypeError, ValueError):
+            timeout = DEFAULT_DRAIN_TIMEOUT_SECONDS
+
+        return cls(
+            timeout_seconds=timeout,
+            handoff=bool(config.get("handoff", True)),
+            rolling=bool(config.get("rolling", False)),
+        )
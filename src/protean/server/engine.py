@@ -4,7 +4,8 @@ import platform
 import signal
 import time
 from collections import defaultdict
-from typing import Type, Union
+from datetime import datetime
+from typing import Any, Type, Union
 
 from protean.core.command_handler import BaseCommandHandler
 from protean.core.event_handler import BaseEventHandler
@@ -21,6 +22,7 @@ from protean.utils.eventing import (
     new_correlation_id,
 )
 from protean.utils.processing import processing_priority
+from protean.utils.stages import StageTimer, message_stages
 from protean.utils.telemetry import (
     create_observation,
     extract_context_from_traceparent,
@@ -30,12 +32,18 @@ from protean.utils.telemetry import (
     set_span_error,
 )
 
+from .admission import AdmissionController
+from .deadlines import DeadlineScheduler
 from .dlq_maintenance import DLQMaintenanceTask
+from .drain import DrainPolicy
 from .health import HealthServer
 from .subscription.broker_subscription import BrokerSubscription
 from .subscription.factory import SubscriptionFactory
 from .tracing import TraceEmitter
 from .outbox_processor import OutboxProcessor
+from .memory import MemoryProfiler
+from .profiler import HandlerProfiler
+from .scheduler import ScheduledDelivery
 
 logger = logging.getLogger(__name__)
 
@@ -222,15 +230,29 @@ class Engine:
         if self.debug:
             logger.setLevel(logging.DEBUG)
 
-        # Initialize trace emitter for real-time message tracing
-        try:
-            observatory_config = domain.config.get("observatory", {})
-            trace_retention_days = int(
-                observatory_config.get("trace_retention_days", 7)
-            )
-        except (AttributeError, TypeError, ValueError):
-            trace_retention_days = 7
-        self.emitter = TraceEmitter(domain, trace_retention_days=trace_retention_days)
+        # Initialize trace emitter for real-time message tracing. Outside test
+        # mode, traces are flushed by a background thread so Redis round trips
+        # stay off the event loop.
+        self.emitter = TraceEmitter.from_config(domain, background=not test_mode)
+
+        # Engine-wide admission control: bounds in-flight messages across all
+        # subscriptions and pauses fetching while the DB pool is saturated.
+        # A no-op unless ``server.admission`` configures a limit.
+        self.admission = AdmissionController.from_config(domain)
+
+        # Opt-in sampling profiler attributing handler wall/CPU time
+        self.profiler = HandlerProfiler.from_config(domain)
+
+        # Opt-in tracemalloc sampling of memory each handler leaves allocated
+        self.memory_profiler = MemoryProfiler.from_config(domain)
+
+        # Sheds expired messages from fetched batches and orders the rest
+        # earliest deadline first
+        self.deadlines = DeadlineScheduler.from_config(domain)
+
+        # How subscriptions drain their in-flight batch and hand off what
+        # they hold on shutdown
+        self.drain = DrainPolicy.from_config(domain)
 
         # Create a new event loop instead of getting the current one
         # This avoids fragility when the caller already has a running loop
@@ -369,6 +391,16 @@ class Engine:
         except Exception:
             logger.debug("engine.dlq_maintenance_init_skipped", exc_info=True)
 
+        # Scheduled delivery — promotes messages stored with domain.schedule()
+        # to their streams when they fall due. Only activated when a
+        # [scheduler] backend is configured.
+        self._scheduled_delivery: ScheduledDelivery | None = None
+        try:
+            if self.domain.schedule_store is not None:
+                self._scheduled_delivery = ScheduledDelivery.from_config(self)
+        except Exception:
+            logger.exception("engine.scheduled_delivery_init_failed")
+
     def _has_dlq_capable_broker(self) -> bool:
         """Return True if any configured broker supports DLQ."""
         for broker in self.domain.brokers.values():
@@ -559,6 +591,26 @@ class Engine:
             unit="{subscription}",
         )
 
+        meter.create_observable_gauge(
+            "protean.subscription.lane_lag",
+            callbacks=[self._observe_lane_lag],
+            description="Messages not yet delivered, per priority lane",
+            unit="{message}",
+        )
+        meter.create_observable_gauge(
+            "protean.subscription.lane_service_rate",
+            callbacks=[self._observe_lane_service_rate],
+            description="Messages processed per second, per priority lane",
+            unit="{message}/s",
+        )
+
+        meter.create_observable_gauge(
+            "protean.engine.in_flight_messages",
+            callbacks=[self._observe_in_flight],
+            description="Messages fetched but not yet processed, engine-wide",
+            unit="{message}",
+        )
+
         setattr(self.domain, self._ENGINE_GAUGES_KEY, True)
 
     def _observe_engine_up(self, options: object = None) -> list:
@@ -571,6 +623,40 @@ class Engine:
         count = len(self._subscriptions) + len(self._broker_subscriptions)
         return [create_observation(count)]
 
+    def _observe_in_flight(self, options: object = None) -> list:
+        return [create_observation(self.admission.in_flight)]
+
+    def _lane_observations(self, field: str) -> list:
+        observations = []
+        for subscription in self._subscriptions.values():
+            if not getattr(subscription, "_lanes_enabled", False):
+                continue
+            try:
+                stats = subscription.lane_stats()
+            except Exception:
+                logger.debug("Failed to collect lane stats", exc_info=True)
+                continue
+            for lane, lane_stats in stats.items():
+                value = lane_stats.get(field)
+                if value is None:
+                    continue
+                observations.append(
+                    create_observation(
+                        value,
+                        {
+                            "subscription": subscription.subscriber_class_name,
+                            "lane": lane,
+                        },
+                    )
+                )
+        return observations
+
+    def _observe_lane_lag(self, options: object = None) -> list:
+        return self._lane_observations("lag")
+
+    def _observe_lane_service_rate(self, options: object = None) -> list:
+        return self._lane_observations("rate")
+
     async def handle_broker_message(
         self,
         subscriber_cls: Type[BaseSubscriber],
@@ -630,7 +716,11 @@ class Engine:
 
             try:
                 subscriber = subscriber_cls()
-                subscriber(message)
+                with (
+                    self.profiler.profile(subscriber_cls.__name__, "broker_message"),
+                    self.memory_profiler.track(subscriber_cls.__name__),
+                ):
+                    subscriber(message)
 
                 logger.debug(
                     "broker.message_processed",
@@ -651,6 +741,57 @@ class Engine:
             finally:
                 g.pop("message_in_context", None)
 
+    def shed_message(
+        self,
+        handler_name: str,
+        *,
+        message_type: str,
+        message_id: str,
+        stream: str,
+        deadline: datetime,
+        worker_id: str | None = None,
+        correlation_id: str | None = None,
+        causation_id: str | None = None,
+    ) -> None:
+        """Record that a message was skipped because its deadline had passed.
+
+        Called by subscriptions for messages shed from a fetched batch, and
+        by ``handle_message`` for messages that expired while waiting their
+        turn. The message is acknowledged by the caller, never retried.
+        """
+        deadline_iso = deadline.isoformat()
+        self.deadlines.record_shed(handler_name)
+
+        metrics = get_domain_metrics(self.domain)
+        metrics.command_expired.add(1, {"command_type": message_type})
+        metrics.handler_shed.add(
+            1, {"handler": handler_name, "message_type": message_type}
+        )
+        logger.info(
+            "engine.command_expired",
+            extra={
+                "message_type": message_type,
+                "message_id": message_id[:8],
+                "handler": handler_name,
+                "deadline": deadline_iso,
+            },
+        )
+        self.emitter.emit(
+            event="handler.skipped",
+            stream=stream,
+            message_id=message_id,
+            message_type=message_type,
+            status="expired",
+            handler=handler_name,
+            metadata={
+                "reason": "deadline_exceeded",
+                "deadline": deadline_iso,
+            },
+            worker_id=worker_id,
+            correlation_id=correlation_id,
+            causation_id=causation_id,
+        )
+
     async def handle_message(
         self,
         handler_cls: Type[Union[BaseCommandHandler, BaseEventHandler]],
@@ -691,6 +832,7 @@ class Engine:
             start_time = time.monotonic()
             correlation_id = None
             causation_id = None
+            stages = None
 
             try:
                 assert message.metadata is not None, "Message metadata cannot be None"
@@ -730,30 +872,12 @@ class Engine:
                 # no deadline, so this is a no-op for them.
                 headers = message.metadata.headers
                 if headers and headers.is_expired():
-                    deadline_iso = headers.deadline.isoformat()
-                    get_domain_metrics(self.domain).command_expired.add(
-                        1, {"command_type": message_type}
-                    )
-                    logger.info(
-                        "engine.command_expired",
-                        extra={
-                            "message_type": message_type,
-                            "message_id": message_id[:8],
-                            "handler": handler_name,
-                            "deadline": deadline_iso,
-                        },
-                    )
-                    self.emitter.emit(
-                        event="handler.skipped",
-                        stream=stream,
-                        message_id=message_id,
+                    self.shed_message(
+                        handler_name,
                         message_type=message_type,
-                        status="expired",
-                        handler=handler_name,
-                        metadata={
-                            "reason": "deadline_exceeded",
-                            "deadline": deadline_iso,
-                        },
+                        message_id=message_id,
+                        stream=stream,
+                        deadline=headers.deadline,
                         worker_id=worker_id,
                         correlation_id=correlation_id,
                         causation_id=causation_id,
@@ -824,11 +948,20 @@ class Engine:
                             msg_priority = getattr(
                                 message.metadata.domain, "priority", 0
                             )
-                        with processing_priority(msg_priority):
+                        with (
+                            processing_priority(msg_priority),
+                            self.profiler.profile(handler_name, message_type),
+                            self.memory_profiler.track(handler_name),
+                            message_stages({"handler_name": handler_name}) as stages,
+                        ):
                             handler_cls._handle(message)
                     except Exception as exc:
                         set_span_error(span, exc)
                         raise
+                    finally:
+                        if stages is not None and span.is_recording():
+                            for name, ms in stages.breakdown_ms().items():
+                                span.set_attribute(f"protean.stage.{name}_ms", ms)
 
                 duration_ms = (time.monotonic() - start_time) * 1000
                 logger.debug(
@@ -849,13 +982,17 @@ class Engine:
                     message_type=message_type,
                     handler=handler_name,
                     duration_ms=round(duration_ms, 2),
+                    metadata=self._stage_metadata(stages),
                     worker_id=worker_id,
                     correlation_id=correlation_id,
                     causation_id=causation_id,
                 )
 
-                # Emit pm.transition trace for process managers
-                if issubclass(handler_cls, BaseProcessManager):
+                # Emit pm.transition trace for process managers. Command
+                # dispatchers are instances, not classes.
+                if isinstance(handler_cls, type) and issubclass(
+                    handler_cls, BaseProcessManager
+                ):
                     self.emitter.emit(
                         event="pm.transition",
                         stream=stream,
@@ -897,6 +1034,7 @@ class Engine:
                     handler=handler_name,
                     duration_ms=round(duration_ms, 2),
                     error=str(exc),
+                    metadata=self._stage_metadata(stages),
                     worker_id=worker_id,
                     correlation_id=correlation_id,
                     causation_id=causation_id,
@@ -912,6 +1050,12 @@ class Engine:
             finally:
                 g.pop("message_in_context", None)
 
+    def _stage_metadata(self, stages: StageTimer | None) -> dict[str, Any] | None:
+        """Trace metadata carrying a message's stage breakdown, when enabled."""
+        if stages is None or not self.emitter.stage_breakdown:
+            return None
+        return {"stages": stages.breakdown_ms()}
+
     def _setup_signal_handlers(self):
         """
         Set up signal handlers using the appropriate method based on the platform.
@@ -961,6 +1105,14 @@ class Engine:
                     # Some signals may not be available on all platforms
                     logger.debug(f"Signal {s} not available on this platform: {e}")
 
+            # The supervisor sends SIGUSR1 before a rolling drain, so workers
+            # signalled later are not handed the messages of earlier ones
+            if hasattr(signal, "SIGUSR1"):
+                try:
+                    self.loop.add_signal_handler(signal.SIGUSR1, self.announce_drain)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"SIGUSR1 not available on this platform: {e}")
+
     def _cleanup_signal_handlers(self):
         """
         Clean up signal handlers when shutting down.
@@ -977,12 +1129,27 @@ class Engine:
         else:
             # Remove signal handlers from the event loop
             signals = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
+            if hasattr(signal, "SIGUSR1"):
+                signals += (signal.SIGUSR1,)
             for s in signals:
                 try:
                     self.loop.remove_signal_handler(s)
                 except (OSError, ValueError):
                     pass  # Ignore errors during cleanup
 
+    def announce_drain(self) -> None:
+        """Mark every subscription as scheduled to stop, without stopping it.
+
+        Subscriptions keep processing until ``shutdown()``; peers that drain
+        in the meantime no longer hand them their pending messages.
+        """
+        logger.info("engine.drain_announced")
+        for subscription in (
+            *self._subscriptions.values(),
+            *self._broker_subscriptions.values(),
+        ):
+            subscription.mark_draining()
+
     @staticmethod
     def _on_health_server_done(task: asyncio.Task) -> None:
         """Log unhandled exceptions from the health server startup task."""
@@ -997,8 +1164,10 @@ class Engine:
         Cleanup tasks tied to the service's shutdown.
 
         Shutdown ordering:
-        1. Signal all subscriptions to stop accepting new messages
-        2. Wait for in-flight tasks to complete (bounded timeout), then cancel stragglers
+        1. Drain all subscriptions: stop fetching, finish the in-flight batch
+           within the drain timeout, flush checkpoints and hand off pending
+           messages
+        2. Wait for remaining tasks to complete (bounded timeout), then cancel stragglers
         3. Close domain infrastructure (event store, brokers, caches, providers)
         4. Clean up signal handlers and stop the event loop
 
@@ -1007,6 +1176,7 @@ class Engine:
             exit_code (int): The exit code to be stored. Defaults to 0.
         """
         self.shutting_down = True  # Set shutdown flag
+        self.admission.stop()  # Release subscriptions parked at the gate
 
         try:
             sig_name = (
@@ -1027,8 +1197,9 @@ class Engine:
             # Step 0: Stop health check server so probes fail immediately
             await self._health_server.stop()
 
-            # Step 1: Signal all subscriptions to stop (sets keep_going=False
-            # and runs backend-specific cleanup like persisting positions)
+            # Step 1: Drain all subscriptions (sets keep_going=False, waits for
+            # the in-flight batch, then runs backend-specific cleanup like
+            # persisting positions and releasing pending messages)
             subscription_shutdown_coros = [
                 subscription.shutdown()
                 for _, subscription in self._subscriptions.items()
@@ -1042,6 +1213,8 @@ class Engine:
             )
             if self._dlq_maintenance is not None:
                 subscription_shutdown_coros.append(self._dlq_maintenance.shutdown())
+            if self._scheduled_delivery is not None:
+                subscription_shutdown_coros.append(self._scheduled_delivery.shutdown())
 
             await asyncio.gather(*subscription_shutdown_coros, return_exceptions=True)
             logger.info("engine.subscriptions_stopped")
@@ -1052,7 +1225,9 @@ class Engine:
             tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
             if tasks:
                 logger.debug("engine.draining_tasks", extra={"count": len(tasks)})
-                done, pending = await asyncio.wait(tasks, timeout=10.0)
+                done, pending = await asyncio.wait(
+                    tasks, timeout=self.drain.timeout_seconds
+                )
 
                 # Retrieve exceptions from completed tasks so Python doesn't
                 # emit "Task exception was never retrieved" warnings.
@@ -1073,7 +1248,11 @@ class Engine:
                         task.cancel()
                     await asyncio.gather(*pending, return_exceptions=True)
 
-            # Step 3: Close domain infrastructure connections
+            # Step 3: Flush queued traces and profiles, then close domain
+            # infrastructure connections
+            await asyncio.to_thread(self.emitter.close)
+            await asyncio.to_thread(self.profiler.stop)
+            self.memory_profiler.stop()
             try:
                 self.domain.close()
             except Exception:
@@ -1151,6 +1330,11 @@ class Engine:
             health_task.set_name("health-server")
             health_task.add_done_callback(self._on_health_server_done)
 
+        # Start the sampling profiler thread and memory tracing (no-ops
+        # unless enabled)
+        self.profiler.start()
+        self.memory_profiler.start()
+
         # Create all tasks with names for better debugging
         subscription_tasks = []
         for name, subscription in self._subscriptions.items():
@@ -1183,6 +1367,13 @@ class Engine:
             dlq_maintenance_tasks.append(task)
             logger.info("engine.dlq_maintenance_started")
 
+        # Start scheduled delivery if a schedule store is configured
+        scheduled_delivery_tasks = []
+        if self._scheduled_delivery is not None:
+            task = self.loop.create_task(self._scheduled_delivery.start())
+            task.set_name("scheduled-delivery")
+            scheduled_delivery_tasks.append(task)
+
         try:
             if self.test_mode:
                 # In test mode, run the loop multiple times to ensure all messages are processed
@@ -1194,6 +1385,7 @@ class Engine:
                         + broker_subscription_tasks
                         + outbox_processor_tasks
                         + dlq_maintenance_tasks
+                        + scheduled_delivery_tasks
                     )
 
                     # Run enough cycles to allow message propagation across
@@ -9,6 +9,8 @@ Endpoints:
     GET /livez    — Alias for /healthz
     GET /readyz   — Readiness: providers alive, broker connected,
                     subscriptions active, not shutting down → 200 / 503
+    GET /memory   — Per-handler memory report of the memory profiler
+                    (``[server.memory_profiling]``) → 200 / 404 when disabled
 
 Configuration (``domain.toml``):
 
@@ -188,6 +190,14 @@ class HealthServer:
                 result = _check_readiness(self.engine)
                 code = 200 if result["status"] == STATUS_OK else 503
                 writer.write(_json_response(code, result))
+            elif path == "/memory":
+                memory_profiler = self.engine.memory_profiler
+                if memory_profiler.enabled:
+                    writer.write(_json_response(200, memory_profiler.snapshot()))
+                else:
+                    writer.write(
+                        _json_response(404, {"error": "Memory profiling disabled"})
+                    )
             else:
                 writer.write(_json_response(404, {"error": "Not Found"}))
 
@@ -0,0 +1,337 @@
+"""Per-handler memory allocation profiling for the Protean Engine.
+
+A worker whose RSS keeps growing usually has a handler, projector or
+upcaster that holds on to objects between messages. ``MemoryProfiler``
+attributes that growth to handler classes with ``tracemalloc``:
+
+- While enabled, ``tracemalloc`` traces every allocation in the process.
+  This slows allocation-heavy code down noticeably, which is why the
+  profiler is opt-in.
+- ``Engine.handle_message`` wraps each handler call in ``track()``. A
+  ``sample_rate`` fraction of calls take a snapshot before and after the
+  handler. Their difference is the memory the call left allocated when it
+  returned, grouped by allocation site.
+- Per handler class the profiler keeps the net bytes of every sampled
+  call, the top ``top_sites`` allocation sites, and the net bytes of the
+  last ``leak_window`` samples. A handler whose last ``leak_window``
+  samples together retained at least ``leak_threshold_bytes`` is flagged
+  as a suspected leak, and a warning is logged once.
+
+Net bytes of every sampled call go to the
+``protean.handler.memory_allocated`` histogram. ``snapshot()`` returns the
+full report, which the health server serves at ``GET /memory``.
+
+Snapshots cover the whole process, so allocations made by other threads
+while a sampled handler runs are counted against it. Sample attribution
+is reliable for growth that repeats across many invocations, not for a
+single call.
+
+Disabled by default. When disabled, ``track()`` returns a shared no-op
+context manager and ``tracemalloc`` is not started.
+"""
+
+import logging
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import nullcontext
+from typing import Any
+
+from protean.utils.telemetry import get_domain_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_SAMPLE_RATE = 0.01
+DEFAULT_MEMORY_TRACEBACK_FRAMES = 1
+DEFAULT_MEMORY_TOP_SITES = 10
+DEFAULT_MEMORY_LEAK_WINDOW = 20
+DEFAULT_MEMORY_LEAK_THRESHOLD_BYTES = 1_048_576
+
+_NULL_CONTEXT = nullcontext()
+
+# Allocations made by tracemalloc itself and by the import machinery
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class _HandlerStats:
+    """Memory accounting of one handler class."""
+
+    __slots__ = (
+        "invocations",
+        "samples",
+        "net_bytes",
+        "sites",
+        "window",
+        "suspected_leak",
+    )
+
+    def __init__(self, window: int) -> None:
+        self.invocations = 0
+        self.samples = 0
+        self.net_bytes = 0
+        # "file:line" -> [net bytes, net blocks]
+        self.sites: dict[str, list[int]] = {}
+        self.window: deque[int] = deque(maxlen=window)
+        self.suspected_leak = False
+
+
+class _MemorySample:
+    """Context manager diffing tracemalloc snapshots around one handler call."""
+
+    __slots__ = ("_profiler", "_handler", "_before")
+
+    def __init__(self, profiler: "MemoryProfiler", handler: str) -> None:
+        self._profiler = profiler
+        self._handler = handler
+
+    def __enter__(self) -> "_MemorySample":
+        self._before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            after = tracemalloc.take_snapshot()
+            self._profiler._record_sample(self._handler, self._before, after)
+        except Exception:
+            # Never let profiling failures affect message processing
+            logger.debug("Memory sampling failed", exc_info=True)
+        finally:
+            self._before = None
+
+
+class MemoryProfiler:
+    """Sampled ``tracemalloc`` accounting of handler allocations.
+
+    Args:
+        domain: The domain whose metrics receive sampled allocations.
+        enabled: Whether profiling is on. When ``False`` every method is a
+            no-op.
+        sample_rate: Fraction of handler calls that are snapshotted.
+        traceback_frames: Frames ``tracemalloc`` stores per allocation.
+            Allocation sites are grouped by the innermost frame.
+        top_sites: Allocation sites kept per handler.
+        leak_window: Number of recent samples checked for growth.
+        leak_threshold_bytes: Net bytes the last ``leak_window`` samples
+            must retain together for a handler to be flagged.
+    """
+
+    def __init__(
+        self,
+        domain: Any,
+        *,
+        enabled: bool = False,
+        sample_rate: float = DEFAULT_MEMORY_SAMPLE_RATE,
+        traceback_frames: int = DEFAULT_MEMORY_TRACEBACK_FRAMES,
+        top_sites: int = DEFAULT_MEMORY_TOP_SITES,
+        leak_window: int = DEFAULT_MEMORY_LEAK_WINDOW,
+        leak_threshold_bytes: int = DEFAULT_MEMORY_LEAK_THRESHOLD_BYTES,
+    ) -> None:
+        self._domain = domain
+        self.enabled = enabled
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.traceback_frames = max(1, traceback_frames)
+        self.top_sites = max(1, top_sites)
+        self.leak_window = max(1, leak_window)
+        self.leak_threshold_bytes = leak_threshold_bytes
+
+        self._handlers: dict[str, _HandlerStats] = {}
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+        # Whether this profiler started tracemalloc and must stop it
+        self._owns_tracing = False
+
+    @classmethod
+    def from_config(cls, domain: Any) -> "MemoryProfiler":
+        """Build a profiler from the ``server.memory_profiling`` config section.
+
+        Invalid values fall back to the defaults rather than failing engine
+        startup.
+        """
+        try:
+            config = domain.config.get("server", {}).get("memory_profiling", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+
+        def _get(key: str, default: Any, cast: Any) -> Any:
+            value = config.get(key, default)
+            try:
+                return cast(value) if value is not None else default
+            except (TypeError, ValueError):
+                return default
+
+        return cls(
+            domain,
+            enabled=bool(config.get("enabled", False)),
+            sample_rate=_get("sample_rate", DEFAULT_MEMORY_SAMPLE_RATE, float),
+            traceback_frames=_get(
+                "traceback_frames", DEFAULT_MEMORY_TRACEBACK_FRAMES, int
+            ),
+            top_sites=_get("top_sites", DEFAULT_MEMORY_TOP_SITES, int),
+            leak_window=_get("leak_window", DEFAULT_MEMORY_LEAK_WINDOW, int),
+            leak_threshold_bytes=_get(
+                "leak_threshold_bytes", DEFAULT_MEMORY_LEAK_THRESHOLD_BYTES, int
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start ``tracemalloc``. No-op when disabled or already tracing."""
+        if not self.enabled or tracemalloc.is_tracing():
+            return
+        tracemalloc.start(self.traceback_frames)
+        self._owns_tracing = True
+        logger.info(
+            "memory_profiler.started",
+            extra={"sample_rate": self.sample_rate, "frames": self.traceback_frames},
+        )
+
+    def stop(self) -> None:
+        """Stop ``tracemalloc`` if this profiler started it."""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    # ------------------------------------------------------------------
+    # Hot path
+    # ------------------------------------------------------------------
+
+    def track(self, handler: str) -> Any:
+        """Return a context manager that samples one handler call."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+
+        with self._lock:
+            stats = self._handlers.get(handler)
+            if stats is None:
+                stats = self._handlers[handler] = _HandlerStats(self.leak_window)
+            stats.invocations += 1
+
+        if not tracemalloc.is_tracing() or random.random() >= self.sample_rate:
+            return _NULL_CONTEXT
+        return _MemorySample(self, handler)
+
+    def _record_sample(
+        self,
+        handler: str,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> None:
+        differences = after.filter_traces(_SNAPSHOT_FILTERS).compare_to(
+            before.filter_traces(_SNAPSHOT_FILTERS), "lineno"
+        )
+        net = sum(stat.size_diff for stat in differences)
+
+        with self._lock:
+            stats = self._handlers[handler]
+            stats.samples += 1
+            stats.net_bytes += net
+            stats.window.append(net)
+
+            for stat in differences:
+                if not stat.size_diff:
+                    continue
+                frame = stat.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                totals = stats.sites.setdefault(site, [0, 0])
+                totals[0] += stat.size_diff
+                totals[1] += stat.count_diff
+            if len(stats.sites) > self.top_sites * 4:
+                stats.sites = dict(self._top(stats.sites))
+
+            growing = (
+                len(stats.window) == self.leak_window
+                and sum(stats.window) >= self.leak_threshold_bytes
+            )
+            newly_flagged = growing and not stats.suspected_leak
+            stats.suspected_leak = growing
+            retained = sum(stats.window)
+
+        if newly_flagged:
+            logger.warning(
+                "memory_profiler.suspected_leak",
+                extra={
+                    "handler": handler,
+                    "retained_bytes": retained,
+                    "samples": self.leak_window,
+                },
+            )
+
+        try:
+            get_domain_metrics(self._domain).handler_memory_allocated.record(
+                net, {"handler_name": handler}
+            )
+        except Exception:
+            logger.debug("Memory metric recording failed", exc_info=True)
+
+    def _top(self, sites: dict[str, list[int]]) -> list[tuple[str, list[int]]]:
+        """The ``top_sites`` sites that retained the most bytes."""
+        return sorted(sites.items(), key=lambda item: item[1][0], reverse=True)[
+            : self.top_sites
+        ]
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def suspected_leaks(self) -> list[str]:
+        """Names of the handlers currently flagged as growing."""
+        with self._lock:
+            return [
+                name for name, stats in self._handlers.items() if stats.suspected_leak
+            ]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the per-handler report as a JSON-safe dict.
+
+        Handlers are ordered by net bytes retained, largest first.
+        """
+        with self._lock:
+            handlers = [
+                {
+                    "handler": name,
+                    "invocations": stats.invocations,
+                    "samples": stats.samples,
+                    "net_bytes": stats.net_bytes,
+                    "avg_net_bytes": (
+                        stats.net_bytes / stats.samples if stats.samples else 0
+                    ),
+                    "recent_net_bytes": sum(stats.window),
+                    "suspected_leak": stats.suspected_leak,
+                    "top_sites": [
+                        {"site": site, "net_bytes": size, "net_blocks": blocks}
+                        for site, (size, blocks) in self._top(stats.sites)
+                    ],
+                }
+                for name, stats in self._handlers.items()
+            ]
+
+        current, peak = (
+            tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        )
+        handlers.sort(key=lambda entry: entry["net_bytes"], reverse=True)
+        return {
+            "enabled": self.enabled,
+            "tracing": tracemalloc.is_tracing(),
+            "sample_rate": self.sample_rate,
+            "started_at": self._started_at,
+            "captured_at": time.time(),
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "handlers": handlers,
+        }
+
+    def reset(self) -> None:
+        """Discard all samples collected so far."""
+        with self._lock:
+            self._handlers.clear()
+            self._started_at = time.time()
@@ -19,6 +19,7 @@ Usage:
 import asyncio
 import ipaddress
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List
 
@@ -31,9 +32,14 @@ from fastapi.templating import Jinja2Templates
 from protean.domain import Domain
 
 from .api import create_api_router
-from .metrics import create_metrics_endpoint
+from .metrics import MetricsCollector, create_metrics_endpoint
 from .routes import create_all_routes
-from .sse import create_sse_endpoint
+from .sse import DEFAULT_SSE_QUEUE_SIZE, create_sse_endpoint
+from .timeline_index import (
+    DEFAULT_TIMELINE_CAPACITY,
+    DEFAULT_TIMELINE_POLL_INTERVAL,
+    TimelineIndex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +101,15 @@ class Observatory:
     - GET /api/*               — REST API endpoints
     - GET /metrics             — Prometheus text exposition
     - GET /static/*            — Vendored CSS/JS assets
+
+    The timeline API is served from a :class:`TimelineIndex` of the most
+    recent ``timeline_capacity`` messages, tailed from the event stores
+    every ``timeline_poll_interval`` seconds while the server runs.
+    ``/metrics`` is served from a :class:`MetricsCollector` refreshing
+    infrastructure metrics in the background, configured by the
+    ``[observatory.metrics]`` section of the first domain. ``/stream``
+    clients share one Redis subscription; each holds at most
+    ``sse_queue_size`` undelivered events before events are dropped.
     """
 
     def __init__(
@@ -103,11 +118,21 @@ class Observatory:
         title: str = "Protean Observatory",
         enable_cors: bool = True,
         cors_origins: list[str] = None,
+        timeline_capacity: int = DEFAULT_TIMELINE_CAPACITY,
+        timeline_poll_interval: float = DEFAULT_TIMELINE_POLL_INTERVAL,
+        sse_queue_size: int = DEFAULT_SSE_QUEUE_SIZE,
     ) -> None:
         self.domains = domains
         self.title = title
         self.enable_cors = enable_cors
         self.cors_origins = cors_origins or ["*"]
+        self.sse_queue_size = sse_queue_size
+        self.timeline_index = TimelineIndex(
+            domains,
+            capacity=timeline_capacity,
+            poll_interval=timeline_poll_interval,
+        )
+        self.metrics_collector = MetricsCollector.from_config(domains)
 
         # Jinja2 templates
         self.templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
@@ -118,11 +143,22 @@ class Observatory:
             description="Real-time message flow observability for Protean applications",
             docs_url=None,
             redoc_url=None,
+            lifespan=self._lifespan,
         )
 
         self._setup_middleware()
         self._setup_routes()
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        self.timeline_index.start()
+        self.metrics_collector.start()
+        try:
+            yield
+        finally:
+            self.metrics_collector.stop()
+            self.timeline_index.stop()
+
     def _setup_middleware(self) -> None:
         if self.enable_cors:
             self.app.add_middleware(
@@ -146,7 +182,9 @@ class Observatory:
         )
 
         # Page routes (Jinja2-rendered views)
-        page_router, new_api_router = create_all_routes(self.domains, self.templates)
+        page_router, new_api_router = create_all_routes(
+            self.domains, self.templates, timeline_index=self.timeline_index
+        )
         self.app.include_router(page_router)
 
         # REST API endpoints (existing + new)
@@ -155,7 +193,7 @@ class Observatory:
         self.app.include_router(new_api_router, prefix="/api")
 
         # SSE streaming endpoint
-        sse_endpoint = create_sse_endpoint(self.domains)
+        sse_endpoint = create_sse_endpoint(self.domains, queue_size=self.sse_queue_size)
         self.app.add_api_route("/stream", sse_endpoint, methods=["GET"])
 
         # Prometheus metrics endpoint
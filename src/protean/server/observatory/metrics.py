@@ -12,6 +12,16 @@ infrastructure gauges registered as ``ObservableGauge`` callbacks.
 When OTel is not installed (or telemetry is disabled), the endpoint falls back
 to a hand-rolled text format producing equivalent Prometheus metrics.
 
+**Background collection:**
+
+Infrastructure values (outbox counts, broker health, per-consumer stats,
+subscription lag and DLQ depth, projection staleness, contention, pool
+stats) are expensive to query.  While the Observatory runs, a
+:class:`MetricsCollector` refreshes each of them on its own interval in the
+background, and scrapes only read the latest values.  Without a running
+collector (e.g. an app created without its lifespan), values are computed
+on demand.
+
 **Naming convention:**
 
 OTEL instrument names use dot notation (``protean.db.pool_size``).  When
@@ -27,6 +37,9 @@ Infrastructure gauges (OTEL instrument name / Prometheus text name):
 - protean_subscription_dlq_depth — Dead letter queue depth per subscription
 - protean_subscription_status — Subscription health (1=ok, 0=not ok)
 - protean.projection.staleness_seconds — Seconds a projection is behind its source events
+- protean.aggregate.contention — Hottest aggregate instances per contention sketch
+  (conflicts, reloads, slow UoW milliseconds), limited to ``contention.report_top``
+  instances per sketch so cardinality stays bounded
 - protean.db.pool_size — Database connection pool size
 - protean.db.pool_checked_out — Checked out database connections
 - protean.db.pool_overflow — Overflow database connections
@@ -36,6 +49,11 @@ Infrastructure gauges (OTEL instrument name / Prometheus text name):
 - protean_broker_memory_bytes — Broker memory usage
 - protean_broker_connected_clients — Broker connected clients
 - protean_broker_ops_per_sec — Broker operations per second
+- protean.metrics.collector_age_seconds — Seconds since a background collector
+  last succeeded (-1 when it never has)
+- protean.metrics.collector_duration_seconds — Duration of a collector's last run
+- protean.metrics.collector_stale — 1 when a collector's value is older than its
+  interval plus its timeout
 
 Plus OTel counters and histograms when telemetry is active:
 
@@ -43,10 +61,14 @@ Plus OTel counters and histograms when telemetry is active:
 - protean.outbox.published, protean.outbox.failed
 - protean.command.duration, protean.handler.duration
 - protean.uow.events_per_commit, protean.outbox.latency
+- protean.aggregate.conflicts, protean.aggregate.reloads,
+  protean.aggregate.retry_duration
 """
 
 import logging
+import threading
 import time
+from dataclasses import dataclass, replace
 from typing import Any, Callable, List
 
 from fastapi import Response
@@ -76,7 +98,9 @@ class _ScrapeCache:
     callbacks would query ``collect_subscription_statuses()`` 4 times.
 
     This cache stores the result for ``ttl_seconds`` (default 2 s) so
-    all callbacks in the same scrape share one collection.
+    all callbacks in the same scrape share one collection.  It only
+    applies while no :class:`MetricsCollector` is running for the
+    scraped domains.
     """
 
     def __init__(self, ttl_seconds: float = 2.0) -> None:
@@ -104,62 +128,296 @@ class _ScrapeCache:
 _scrape_cache = _ScrapeCache()
 
 # ---------------------------------------------------------------------------
-# Shared data collection helpers
+# Collection helpers
 # ---------------------------------------------------------------------------
+#
+# Each ``_compute_*`` helper queries the infrastructure directly.  The
+# matching ``_collect_*`` accessor is what gauge callbacks and the
+# hand-rolled endpoint call: it returns the value precomputed by a running
+# MetricsCollector, and only falls back to computing on demand when none
+# is running.
 
 
-def _collect_subscription_statuses(domains: List[Domain]) -> list:
-    """Collect subscription statuses from all domains.
+class MetricsCollectionError(Exception):
+    """A collection failed for at least one domain.
+
+    ``partial`` holds what the other domains returned.  Scrapes computed on
+    demand serve it; a :class:`MetricsCollector` keeps its previous value
+    instead and records the failure.
+    """
+
+    def __init__(self, message: str, partial: Any = None) -> None:
+        super().__init__(message)
+        self.partial = partial
+
+
+def _per_domain(
+    domains: List[Domain], what: str, collect: Callable[[Domain], list]
+) -> list:
+    """Concatenate ``collect(domain)`` across *domains*.
+
+    Raises :class:`MetricsCollectionError` with the successful results when
+    any domain fails.
+    """
+    results: list = []
+    errors: list[str] = []
+    for domain in domains:
+        try:
+            results.extend(collect(domain))
+        except Exception as exc:
+            logger.debug("Metrics: %s failed for %s: %s", what, domain.name, exc)
+            errors.append(f"{domain.name}: {exc}")
+    if errors:
+        raise MetricsCollectionError(f"{what} failed ({'; '.join(errors)})", results)
+    return results
+
+
+def _compute_outbox_counts(domains: List[Domain]) -> list:
+    """Return ``(domain, counts_by_status)`` tuples for every domain's outbox."""
 
-    Results are cached for the duration of a single scrape cycle so
-    multiple gauge callbacks reuse the same data.
+    def collect(domain: Domain) -> list:
+        with domain.domain_context():
+            outbox_repo = domain._get_outbox_repo("default")
+            return [(domain, outbox_repo.count_by_status())]
+
+    return _per_domain(domains, "outbox query", collect)
+
+
+def _compute_broker_health(domains: List[Domain]) -> dict | None:
+    """Return ``health_stats()`` of the first domain's default broker, if any."""
+    if not domains:
+        return None
+    first_domain = domains[0]
+    with first_domain.domain_context():
+        broker = first_domain.brokers.get("default")
+        if broker:
+            return broker.health_stats()
+    return None
+
+
+def _compute_consumer_stats(domains: List[Domain]) -> list | None:
+    """Return ``(stream, group, consumer, pending, idle_ms)`` tuples via
+    ``XINFO CONSUMERS``, or ``None`` when no Redis connection is available.
     """
+    from protean.server.observatory.api import _discover_streams, _get_redis  # noqa: PLC0415
+
+    redis_conn = _get_redis(domains)
+    if not redis_conn:
+        return None
+
+    results: list = []
+    for stream_name in _discover_streams(redis_conn):
+        # Streams and groups can disappear between discovery and inspection
+        try:
+            groups = redis_conn.xinfo_groups(stream_name)
+            for grp in groups:
+                if not isinstance(grp, dict):
+                    continue
+                gname = grp.get("name") or grp.get(b"name")
+                if isinstance(gname, bytes):
+                    gname = gname.decode("utf-8")
+                if not gname:
+                    continue
+
+                try:
+                    for c in redis_conn.xinfo_consumers(stream_name, gname):
+                        if not isinstance(c, dict):
+                            continue
+                        cname = c.get("name") or c.get(b"name")
+                        if isinstance(cname, bytes):
+                            cname = cname.decode("utf-8")
+                        cpending = c.get("pending") or c.get(b"pending") or 0
+                        cidle = c.get("idle") or c.get(b"idle") or 0
+                        results.append(
+                            (stream_name, gname, cname, int(cpending), int(cidle))
+                        )
+                except Exception:
+                    pass
+        except Exception:
+            pass
+    return results
+
 
-    def _do_collect() -> list:
-        from protean.server.subscription_status import collect_subscription_statuses  # noqa: PLC0415
+def _compute_subscription_statuses(domains: List[Domain]) -> list:
+    """Return ``(domain, SubscriptionStatus)`` tuples from all domains."""
+    from protean.server.subscription_status import collect_subscription_statuses  # noqa: PLC0415
 
+    def collect(domain: Domain) -> list:
+        return [(domain, s) for s in collect_subscription_statuses(domain)]
+
+    return _per_domain(domains, "subscription status", collect)
+
+
+def _compute_projection_statuses(domains: List[Domain]) -> list:
+    """Return ``(domain, ProjectionStatus)`` tuples from all domains."""
+    from protean.server.projection_status import collect_projection_statuses  # noqa: PLC0415
+
+    def collect(domain: Domain) -> list:
+        # Scrape path only reads staleness; skip the row COUNT queries.
+        statuses = collect_projection_statuses(domain, include_row_count=False)
+        return [(domain, s) for s in statuses]
+
+    return _per_domain(domains, "projection status", collect)
+
+
+def _compute_contention(domains: List[Domain]) -> list:
+    """Return ``(domain_name, sketch, entry)`` tuples, at most
+    ``contention.report_top`` entries per sketch and domain.
+    """
+    from protean.server.observatory.api import _get_redis  # noqa: PLC0415
+    from protean.utils.contention import (  # noqa: PLC0415
+        DEFAULT_CONTENTION_REPORT_TOP,
+        SKETCHES,
+        collect_contention,
+    )
+
+    results: list = []
+    if not domains:
+        return results
+    top = int(
+        domains[0]
+        .config.get("contention", {})
+        .get("report_top", DEFAULT_CONTENTION_REPORT_TOP)
+    )
+    report = collect_contention(domains, redis=_get_redis(domains), top=top)
+
+    for domain_name, merged in report.items():
+        for sketch in SKETCHES:
+            for entry in merged.get(sketch, []):
+                results.append((domain_name, sketch, entry))
+    return results
+
+
+def _compute_pool_stats(domains: List[Domain]) -> list:
+    """Return ``(provider_name, database_type, stats_dict)`` tuples."""
+
+    def collect(domain: Domain) -> list:
         results: list = []
-        for domain in domains:
-            try:
-                statuses = collect_subscription_statuses(domain)
-                for s in statuses:
-                    results.append((domain, s))
-            except Exception as exc:
-                logger.debug(
-                    "Shared collection: subscription status failed for %s: %s",
-                    domain.name,
-                    exc,
-                )
+        with domain.domain_context():
+            providers = domain.providers
+            if providers and providers._providers:
+                for name, provider in providers._providers.items():
+                    stats = provider.pool_stats()
+                    if stats:
+                        db_type = getattr(provider, "__database__", "unknown")
+                        results.append((name, db_type, stats))
         return results
 
-    return _scrape_cache.get("subscription_statuses", _do_collect)
+    return _per_domain(domains, "pool stats", collect)
+
+
+def _compute_broker_pool_stats(domains: List[Domain]) -> list:
+    """Return ``(broker_name, active, available, max_conn)`` tuples."""
+
+    def collect(domain: Domain) -> list:
+        results: list = []
+        with domain.domain_context():
+            brokers = domain.brokers
+            if brokers and brokers._brokers:
+                for name, broker in brokers._brokers.items():
+                    redis_inst = getattr(broker, "redis_instance", None)
+                    if redis_inst is None:
+                        continue
+                    pool = getattr(redis_inst, "connection_pool", None)
+                    if pool is None:
+                        continue
+                    created = getattr(pool, "_created_connections", 0)
+                    available = len(getattr(pool, "_available_connections", []))
+                    max_conn = getattr(pool, "max_connections", 0)
+                    active = created - available
+                    results.append((name, active, available, max_conn))
+        return results
+
+    return _per_domain(domains, "broker pool stats", collect)
+
+
+# Collector name -> (compute function, value served before the first run,
+# whether on-demand results go through the per-scrape cache)
+_COLLECTORS: dict[str, tuple[Callable[[List[Domain]], Any], Any, bool]] = {
+    "outbox": (_compute_outbox_counts, [], False),
+    "broker": (_compute_broker_health, None, False),
+    "consumers": (_compute_consumer_stats, None, False),
+    "subscriptions": (_compute_subscription_statuses, [], True),
+    "projections": (_compute_projection_statuses, [], True),
+    "contention": (_compute_contention, [], True),
+    "pool": (_compute_pool_stats, [], True),
+    "broker_pool": (_compute_broker_pool_stats, [], True),
+}
+
+
+def _precomputed(name: str, domains: List[Domain]) -> Any:
+    """Return collector ``name``'s value for *domains*.
+
+    Reads the latest value of a running :class:`MetricsCollector` without
+    touching the infrastructure.  Without one, computes on demand.
+    """
+    collector = _collector_for(domains)
+    if collector is not None:
+        return collector.read(name)
+
+    _compute, _default, cached = _COLLECTORS[name]
+    if cached:
+        return _scrape_cache.get(name, lambda: _compute_on_demand(name, domains))
+    return _compute_on_demand(name, domains)
+
+
+def _compute_on_demand(name: str, domains: List[Domain]) -> Any:
+    """Compute collector ``name`` for a scrape, degrading instead of raising.
+
+    Serves whatever the healthy domains returned; falls back to the
+    collector's empty default when nothing could be collected.
+    """
+    compute, default, _cached = _COLLECTORS[name]
+    try:
+        return compute(domains)
+    except MetricsCollectionError as exc:
+        return exc.partial
+    except Exception as exc:
+        logger.debug("Metrics: %s collection failed: %s", name, exc)
+        return default
+
+
+def _collect_outbox_counts(domains: List[Domain]) -> list:
+    """``(domain, counts_by_status)`` tuples for every domain's outbox."""
+    return _precomputed("outbox", domains)
+
+
+def _collect_broker_health(domains: List[Domain]) -> dict | None:
+    """Health stats of the first domain's default broker, or ``None``."""
+    return _precomputed("broker", domains)
+
+
+def _collect_consumer_stats(domains: List[Domain]) -> list | None:
+    """Per-consumer ``(stream, group, consumer, pending, idle_ms)`` tuples,
+    or ``None`` when Redis is unavailable."""
+    return _precomputed("consumers", domains)
+
+
+def _collect_subscription_statuses(domains: List[Domain]) -> list:
+    """Collect subscription statuses from all domains.
+
+    Results are shared by every gauge callback in a scrape, so multiple
+    gauges reuse the same data.
+    """
+    return _precomputed("subscriptions", domains)
 
 
 def _collect_projection_statuses(domains: List[Domain]) -> list:
     """Collect projection statuses from all domains.
 
-    Cached per scrape cycle so the gauge callback and any other consumer reuse
-    the same data. Returns ``(domain, ProjectionStatus)`` tuples.
+    Shared so the gauge callback and any other consumer reuse the same
+    data. Returns ``(domain, ProjectionStatus)`` tuples.
     """
+    return _precomputed("projections", domains)
 
-    def _do_collect() -> list:
-        from protean.server.projection_status import collect_projection_statuses  # noqa: PLC0415
 
-        results: list = []
-        for domain in domains:
-            try:
-                # Scrape path only reads staleness; skip the row COUNT queries.
-                for s in collect_projection_statuses(domain, include_row_count=False):
-                    results.append((domain, s))
-            except Exception as exc:
-                logger.debug(
-                    "Shared collection: projection status failed for %s: %s",
-                    domain.name,
-                    exc,
-                )
-        return results
+def _collect_contention(domains: List[Domain]) -> list:
+    """Collect the hottest aggregate instances of every contention sketch.
 
-    return _scrape_cache.get("projection_statuses", _do_collect)
+    Returns ``(domain_name, sketch, entry)`` tuples, at most
+    ``contention.report_top`` entries per sketch and domain.
+    """
+    return _precomputed("contention", domains)
 
 
 def _collect_pool_stats(domains: List[Domain]) -> list:
@@ -167,28 +425,7 @@ def _collect_pool_stats(domains: List[Domain]) -> list:
 
     Returns a list of ``(provider_name, database_type, stats_dict)`` tuples.
     """
-
-    def _do_collect() -> list:
-        results: list = []
-        for domain in domains:
-            try:
-                with domain.domain_context():
-                    providers = domain.providers
-                    if providers and providers._providers:
-                        for name, provider in providers._providers.items():
-                            stats = provider.pool_stats()
-                            if stats:
-                                db_type = getattr(provider, "__database__", "unknown")
-                                results.append((name, db_type, stats))
-            except Exception as exc:
-                logger.debug(
-                    "Shared collection: pool stats failed for %s: %s",
-                    domain.name,
-                    exc,
-                )
-        return results
-
-    return _scrape_cache.get("pool_stats", _do_collect)
+    return _precomputed("pool", domains)
 
 
 def _collect_broker_pool_stats(domains: List[Domain]) -> list:
@@ -196,35 +433,309 @@ def _collect_broker_pool_stats(domains: List[Domain]) -> list:
 
     Returns a list of ``(broker_name, active, available, max_conn)`` tuples.
     """
+    return _precomputed("broker_pool", domains)
 
-    def _do_collect() -> list:
-        results: list = []
-        for domain in domains:
-            try:
-                with domain.domain_context():
-                    brokers = domain.brokers
-                    if brokers and brokers._brokers:
-                        for name, broker in brokers._brokers.items():
-                            redis_inst = getattr(broker, "redis_instance", None)
-                            if redis_inst is None:
-                                continue
-                            pool = getattr(redis_inst, "connection_pool", None)
-                            if pool is None:
-                                continue
-                            created = getattr(pool, "_created_connections", 0)
-                            available = len(getattr(pool, "_available_connections", []))
-                            max_conn = getattr(pool, "max_connections", 0)
-                            active = created - available
-                            results.append((name, active, available, max_conn))
-            except Exception as exc:
-                logger.debug(
-                    "Shared collection: broker pool stats failed for %s: %s",
-                    domain.name,
-                    exc,
-                )
-        return results
 
-    return _scrape_cache.get("broker_pool_stats", _do_collect)
+# ---------------------------------------------------------------------------
+# Background collection
+# ---------------------------------------------------------------------------
+
+DEFAULT_COLLECTOR_INTERVALS: dict[str, float] = {
+    "outbox": 15.0,
+    "broker": 10.0,
+    "consumers": 10.0,
+    "subscriptions": 10.0,
+    "projections": 15.0,
+    "contention": 15.0,
+    "pool": 5.0,
+    "broker_pool": 5.0,
+}
+DEFAULT_COLLECTOR_TIMEOUT = 10.0
+
+# Collectors currently running, looked up by the domains they cover
+_active_collectors: list["MetricsCollector"] = []
+_active_lock = threading.Lock()
+
+
+def _collector_for(domains: List[Domain]) -> "MetricsCollector | None":
+    with _active_lock:
+        for collector in _active_collectors:
+            if collector.covers(domains):
+                return collector
+    return None
+
+
+@dataclass
+class CollectorState:
+    """Latest result and timing of one background collector.
+
+    ``collected_at`` is the monotonic time of the last *successful*
+    collection, so ``age`` keeps growing while a collector fails or hangs.
+    A collector is stale once its value is older than one interval plus
+    its timeout.
+    """
+
+    name: str
+    interval: float
+    timeout: float
+    value: Any = None
+    collected_at: float | None = None
+    duration: float | None = None
+    error: str | None = None
+    failures: int = 0
+    timeouts: int = 0
+    next_run: float = 0.0
+    running_since: float | None = None
+    timed_out: bool = False
+
+    def age(self, now: float) -> float | None:
+        """Seconds since the last successful collection."""
+        if self.collected_at is None:
+            return None
+        return now - self.collected_at
+
+    def stale(self, now: float) -> bool:
+        age = self.age(now)
+        return age is None or age > self.interval + self.timeout
+
+
+class MetricsCollector:
+    """Refreshes infrastructure metrics in the background.
+
+    Each collector (outbox counts, broker health, per-consumer stats,
+    subscription and projection statuses, contention, pool stats) runs on
+    its own interval in a short-lived daemon thread, so a slow database or
+    Redis never delays a Prometheus scrape: scrapes only read the latest
+    values.  A collection that exceeds its timeout is recorded as timed out
+    and no new run of that collector starts until it returns; its result is
+    still kept when it eventually arrives.
+
+    Args:
+        domains: Domains whose infrastructure is collected.
+        intervals: Seconds between runs, per collector name. Collectors not
+            listed use :data:`DEFAULT_COLLECTOR_INTERVALS`.
+        timeout: Seconds a collection may take before it counts as timed out.
+        timeouts: Per-collector overrides of ``timeout``.
+    """
+
+    def __init__(
+        self,
+        domains: List[Domain],
+        intervals: dict[str, float] | None = None,
+        timeout: float = DEFAULT_COLLECTOR_TIMEOUT,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        self.domains = domains
+        intervals = {**DEFAULT_COLLECTOR_INTERVALS, **(intervals or {})}
+        timeouts = timeouts or {}
+        self._states = {
+            name: CollectorState(
+                name,
+                interval=max(0.01, float(intervals[name])),
+                timeout=max(0.01, float(timeouts.get(name, timeout))),
+            )
+            for name in _COLLECTORS
+        }
+        self._tick = min(1.0, min(s.interval for s in self._states.values()) / 2)
+
+        self._lock = threading.Lock()
+        self._scheduler: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    @classmethod
+    def from_config(cls, domains: List[Domain]) -> "MetricsCollector":
+        """Build a collector from the first domain's ``[observatory.metrics]``
+        configuration. Invalid values fall back to the defaults.
+        """
+        try:
+            config = domains[0].config.get("observatory", {}) or {}
+            config = config.get("metrics", {}) or {}
+        except (AttributeError, IndexError, TypeError):
+            config = {}
+        if not isinstance(config, dict):
+            config = {}
+
+        def _numbers(section: Any) -> dict[str, float]:
+            numbers: dict[str, float] = {}
+            if not isinstance(section, dict):
+                return numbers
+            for name, value in section.items():
+                try:
+                    if name in _COLLECTORS and float(value) > 0:
+                        numbers[name] = float(value)
+                except (TypeError, ValueError):
+                    continue
+            return numbers
+
+        try:
+            timeout = float(config.get("timeout", DEFAULT_COLLECTOR_TIMEOUT))
+        except (TypeError, ValueError):
+            timeout = DEFAULT_COLLECTOR_TIMEOUT
+        if timeout <= 0:
+            timeout = DEFAULT_COLLECTOR_TIMEOUT
+
+        return cls(
+            domains,
+            intervals=_numbers(config.get("intervals")),
+            timeout=timeout,
+            timeouts=_numbers(config.get("timeouts")),
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start collecting and serve scrapes from this collector.
+
+        No-op when already running.
+        """
+        if self.running:
+            return
+        self._stopping.clear()
+        self._scheduler = threading.Thread(
+            target=self._run, name="protean-metrics-collector", daemon=True
+        )
+        self._scheduler.start()
+        with _active_lock:
+            _active_collectors.append(self)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop scheduling collections. In-flight collections are abandoned."""
+        with _active_lock:
+            if self in _active_collectors:
+                _active_collectors.remove(self)
+        scheduler = self._scheduler
+        if scheduler is None:
+            return
+        self._stopping.set()
+        scheduler.join(timeout)
+        self._scheduler = None
+
+    @property
+    def running(self) -> bool:
+        return self._scheduler is not None and self._scheduler.is_alive()
+
+    def covers(self, domains: List[Domain]) -> bool:
+        """Whether this collector serves exactly *domains*."""
+        return domains is self.domains or (
+            len(domains) == len(self.domains)
+            and all(a is b for a, b in zip(domains, self.domains))
+        )
+
+    # ------------------------------------------------------------------
+    # Collection
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._schedule(time.monotonic())
+            self._stopping.wait(self._tick)
+
+    def _schedule(self, now: float) -> None:
+        """Start every collector that is due and flag overdue ones."""
+        for state in self._states.values():
+            with self._lock:
+                if state.running_since is not None:
+                    if (
+                        not state.timed_out
+                        and now - state.running_since > state.timeout
+                    ):
+                        state.timed_out = True
+                        state.timeouts += 1
+                        state.error = f"Timed out after {state.timeout:g}s"
+                        logger.warning(
+                            "Metrics collector %s timed out after %gs",
+                            state.name,
+                            state.timeout,
+                        )
+                    continue
+                if now < state.next_run:
+                    continue
+                state.running_since = now
+                state.timed_out = False
+                state.next_run = now + state.interval
+
+            threading.Thread(
+                target=self.collect,
+                args=(state.name,),
+                name=f"protean-metrics-{state.name}",
+                daemon=True,
+            ).start()
+
+    def collect(self, name: str) -> None:
+        """Run collector *name* once and store its result.
+
+        On failure the previous value is kept, so scrapes keep serving the
+        last good data while the staleness and failure gauges report the
+        problem.
+        """
+        state = self._states[name]
+        compute = _COLLECTORS[name][0]
+        started = time.monotonic()
+        try:
+            value = compute(self.domains)
+        except Exception as exc:
+            logger.debug("Metrics collector %s failed: %s", name, exc)
+            with self._lock:
+                state.running_since = None
+                state.duration = time.monotonic() - started
+                state.failures += 1
+                state.error = str(exc)
+            return
+
+        finished = time.monotonic()
+        with self._lock:
+            state.value = value
+            state.collected_at = finished
+            state.duration = finished - started
+            state.running_since = None
+            if not state.timed_out:
+                state.error = None
+
+    def refresh(self) -> None:
+        """Run every collector once, synchronously."""
+        for name in self._states:
+            self.collect(name)
+
+    def read(self, name: str) -> Any:
+        """Latest value of collector *name*, or its empty default before the
+        first successful collection."""
+        with self._lock:
+            state = self._states[name]
+            if state.collected_at is None:
+                return _COLLECTORS[name][1]
+            return state.value
+
+    def states(self) -> list[CollectorState]:
+        """Snapshot of every collector's state."""
+        with self._lock:
+            return [replace(state) for state in self._states.values()]
+
+
+def _collector_health(domains: List[Domain]) -> list[tuple[str, float, float, int]]:
+    """``(collector, age_seconds, duration_seconds, stale)`` for a running
+    collector covering *domains*; empty when there is none.
+
+    Collectors that have never succeeded report an age of ``-1``.
+    """
+    collector = _collector_for(domains)
+    if collector is None:
+        return []
+
+    now = time.monotonic()
+    results = []
+    for state in collector.states():
+        age = state.age(now)
+        results.append(
+            (
+                state.name,
+                -1.0 if age is None else round(age, 3),
+                round(state.duration or 0.0, 3),
+                1 if state.stale(now) else 0,
+            )
+        )
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -265,24 +776,10 @@ def _register_infrastructure_gauges(domains: List[Domain]) -> None:
 
     # --- Outbox gauges ---
     def _outbox_callback(_options):
-        observations = []
-        for domain in domains:
-            try:
-                with domain.domain_context():
-                    outbox_repo = domain._get_outbox_repo("default")
-                    counts = outbox_repo.count_by_status()
-                    pending_total = counts.get("pending", 0)
-                    observations.append(
-                        create_observation(
-                            pending_total,
-                            {"domain": domain.name},
-                        )
-                    )
-            except Exception as exc:
-                logger.debug(
-                    "Gauge callback: outbox query failed for %s: %s", domain.name, exc
-                )
-        return observations
+        return [
+            create_observation(counts.get("pending", 0), {"domain": domain.name})
+            for domain, counts in _collect_outbox_counts(domains)
+        ]
 
     meter.create_observable_gauge(
         "protean.outbox.pending_count",
@@ -290,57 +787,27 @@ def _register_infrastructure_gauges(domains: List[Domain]) -> None:
         description="Current pending outbox messages",
     )
 
-    # --- Broker gauges ---
+    # --- Broker gauges (shared collection) ---
+    def _broker_details() -> tuple[dict, dict]:
+        health = _collect_broker_health(domains) or {}
+        return health, health.get("details", {})
+
     def _broker_up_callback(_options):
-        try:
-            with target_domain.domain_context():
-                broker = target_domain.brokers.get("default")
-                if broker:
-                    health = broker.health_stats()
-                    details = health.get("details", {})
-                    is_up = (
-                        1 if health.get("connected") and details.get("healthy") else 0
-                    )
-                    return [create_observation(is_up)]
-        except Exception as exc:
-            logger.debug("Gauge callback: broker_up query failed: %s", exc)
-        return [create_observation(0)]
+        health, details = _broker_details()
+        is_up = 1 if health.get("connected") and details.get("healthy") else 0
+        return [create_observation(is_up)]
 
     def _broker_memory_callback(_options):
-        try:
-            with target_domain.domain_context():
-                broker = target_domain.brokers.get("default")
-                if broker:
-                    health = broker.health_stats()
-                    mem = health.get("details", {}).get("used_memory", 0)
-                    return [create_observation(mem)]
-        except Exception as exc:
-            logger.debug("Gauge callback: broker_memory query failed: %s", exc)
-        return [create_observation(0)]
+        _health, details = _broker_details()
+        return [create_observation(details.get("used_memory", 0))]
 
     def _broker_clients_callback(_options):
-        try:
-            with target_domain.domain_context():
-                broker = target_domain.brokers.get("default")
-                if broker:
-                    health = broker.health_stats()
-                    clients = health.get("details", {}).get("connected_clients", 0)
-                    return [create_observation(clients)]
-        except Exception as exc:
-            logger.debug("Gauge callback: broker_clients query failed: %s", exc)
-        return [create_observation(0)]
+        _health, details = _broker_details()
+        return [create_observation(details.get("connected_clients", 0))]
 
     def _broker_ops_callback(_options):
-        try:
-            with target_domain.domain_context():
-                broker = target_domain.brokers.get("default")
-                if broker:
-                    health = broker.health_stats()
-                    ops = health.get("details", {}).get("instantaneous_ops_per_sec", 0)
-                    return [create_observation(ops)]
-        except Exception as exc:
-            logger.debug("Gauge callback: broker_ops query failed: %s", exc)
-        return [create_observation(0)]
+        _health, details = _broker_details()
+        return [create_observation(details.get("instantaneous_ops_per_sec", 0))]
 
     meter.create_observable_gauge(
         "protean_broker_up",
@@ -480,6 +947,64 @@ def _register_infrastructure_gauges(domains: List[Domain]) -> None:
         unit="s",
     )
 
+    # --- Hot aggregate gauge (shared collection) ---
+    def _contention_callback(_options):
+        return [
+            create_observation(
+                entry["count"],
+                {
+                    "domain": domain_name,
+                    "sketch": sketch,
+                    "aggregate": entry["aggregate"],
+                    "aggregate_id": entry["aggregate_id"],
+                },
+            )
+            for domain_name, sketch, entry in _collect_contention(domains)
+        ]
+
+    meter.create_observable_gauge(
+        "protean.aggregate.contention",
+        callbacks=[_contention_callback],
+        description="Hottest aggregate instances per contention sketch",
+    )
+
+    # --- Background collector staleness gauges ---
+    def _make_collector_callback(index: int):
+        def callback(_options):
+            return [
+                create_observation(health[index], {"collector": health[0]})
+                for health in _collector_health(domains)
+            ]
+
+        return callback
+
+    for index, metric_name, description, unit in [
+        (
+            1,
+            "protean.metrics.collector_age_seconds",
+            "Seconds since a metrics collector last succeeded (-1=never)",
+            "s",
+        ),
+        (
+            2,
+            "protean.metrics.collector_duration_seconds",
+            "Duration of a metrics collector's last run",
+            "s",
+        ),
+        (
+            3,
+            "protean.metrics.collector_stale",
+            "Metrics collector value is stale (1=stale, 0=fresh)",
+            "1",
+        ),
+    ]:
+        meter.create_observable_gauge(
+            metric_name,
+            callbacks=[_make_collector_callback(index)],
+            description=description,
+            unit=unit,
+        )
+
     setattr(target_domain, _GAUGES_REGISTERED_KEY, True)
 
 
@@ -499,94 +1024,82 @@ def _hand_rolled_metrics(domains: List[Domain]) -> str:
     lines.append("# HELP protean_outbox_pending_count Current pending outbox messages")
     lines.append("# TYPE protean_outbox_pending_count gauge")
 
-    for domain in domains:
-        try:
-            with domain.domain_context():
-                outbox_repo = domain._get_outbox_repo("default")
-                counts = outbox_repo.count_by_status()
-                pending_total = counts.get("pending", 0)
-                lines.append(
-                    f'protean_outbox_pending_count{{domain="{domain.name}"}} {pending_total}'
-                )
-        except Exception as e:
-            logger.debug(f"Metrics: outbox query failed for {domain.name}: {e}")
+    try:
+        for domain, counts in _collect_outbox_counts(domains):
+            pending_total = counts.get("pending", 0)
+            lines.append(
+                f'protean_outbox_pending_count{{domain="{domain.name}"}} {pending_total}'
+            )
+    except Exception as e:
+        logger.debug(f"Metrics: outbox query failed: {e}")
 
     # --- Broker / stream metrics (from first domain's broker) ---
     try:
-        first_domain = domains[0]
-        with first_domain.domain_context():
-            broker = first_domain.brokers.get("default")
-            if broker:
-                health = broker.health_stats()
-                details = health.get("details", {})
-                is_connected = health.get("connected", False)
-
-                lines.append("")
-                lines.append("# HELP protean_broker_up Broker health (1=up, 0=down)")
-                lines.append("# TYPE protean_broker_up gauge")
-                lines.append(
-                    f"protean_broker_up {1 if is_connected and details.get('healthy') else 0}"
-                )
+        health = _collect_broker_health(domains)
+        if health is not None:
+            details = health.get("details", {})
+            is_connected = health.get("connected", False)
 
-                lines.append("")
-                lines.append(
-                    "# HELP protean_broker_memory_bytes Broker memory usage in bytes"
-                )
-                lines.append("# TYPE protean_broker_memory_bytes gauge")
-                lines.append(
-                    f"protean_broker_memory_bytes {details.get('used_memory', 0)}"
-                )
+            lines.append("")
+            lines.append("# HELP protean_broker_up Broker health (1=up, 0=down)")
+            lines.append("# TYPE protean_broker_up gauge")
+            lines.append(
+                f"protean_broker_up {1 if is_connected and details.get('healthy') else 0}"
+            )
 
-                lines.append("")
-                lines.append(
-                    "# HELP protean_broker_connected_clients Number of connected broker clients"
-                )
-                lines.append("# TYPE protean_broker_connected_clients gauge")
-                lines.append(
-                    f"protean_broker_connected_clients {details.get('connected_clients', 0)}"
-                )
+            lines.append("")
+            lines.append(
+                "# HELP protean_broker_memory_bytes Broker memory usage in bytes"
+            )
+            lines.append("# TYPE protean_broker_memory_bytes gauge")
+            lines.append(f"protean_broker_memory_bytes {details.get('used_memory', 0)}")
 
-                lines.append("")
-                lines.append(
-                    "# HELP protean_broker_ops_per_sec Broker operations per second"
-                )
-                lines.append("# TYPE protean_broker_ops_per_sec gauge")
-                lines.append(
-                    f"protean_broker_ops_per_sec {details.get('instantaneous_ops_per_sec', 0)}"
-                )
+            lines.append("")
+            lines.append(
+                "# HELP protean_broker_connected_clients Number of connected broker clients"
+            )
+            lines.append("# TYPE protean_broker_connected_clients gauge")
+            lines.append(
+                f"protean_broker_connected_clients {details.get('connected_clients', 0)}"
+            )
 
-                message_counts = details.get("message_counts", {})
-                lines.append("")
-                lines.append(
-                    "# HELP protean_stream_messages_total Total messages in streams"
-                )
-                lines.append("# TYPE protean_stream_messages_total gauge")
-                lines.append(
-                    f"protean_stream_messages_total {message_counts.get('total_messages', 0)}"
-                )
+            lines.append("")
+            lines.append(
+                "# HELP protean_broker_ops_per_sec Broker operations per second"
+            )
+            lines.append("# TYPE protean_broker_ops_per_sec gauge")
+            lines.append(
+                f"protean_broker_ops_per_sec {details.get('instantaneous_ops_per_sec', 0)}"
+            )
 
-                lines.append("")
-                lines.append(
-                    "# HELP protean_stream_pending Pending (in-flight) messages"
-                )
-                lines.append("# TYPE protean_stream_pending gauge")
-                lines.append(
-                    f"protean_stream_pending {message_counts.get('in_flight', 0)}"
-                )
+            message_counts = details.get("message_counts", {})
+            lines.append("")
+            lines.append(
+                "# HELP protean_stream_messages_total Total messages in streams"
+            )
+            lines.append("# TYPE protean_stream_messages_total gauge")
+            lines.append(
+                f"protean_stream_messages_total {message_counts.get('total_messages', 0)}"
+            )
+
+            lines.append("")
+            lines.append("# HELP protean_stream_pending Pending (in-flight) messages")
+            lines.append("# TYPE protean_stream_pending gauge")
+            lines.append(f"protean_stream_pending {message_counts.get('in_flight', 0)}")
 
-                streams_info = details.get("streams", {})
-                lines.append("")
-                lines.append("# HELP protean_streams_count Number of active streams")
-                lines.append("# TYPE protean_streams_count gauge")
-                lines.append(f"protean_streams_count {streams_info.get('count', 0)}")
+            streams_info = details.get("streams", {})
+            lines.append("")
+            lines.append("# HELP protean_streams_count Number of active streams")
+            lines.append("# TYPE protean_streams_count gauge")
+            lines.append(f"protean_streams_count {streams_info.get('count', 0)}")
 
-                cg_info = details.get("consumer_groups", {})
-                lines.append("")
-                lines.append(
-                    "# HELP protean_consumer_groups_count Number of consumer groups"
-                )
-                lines.append("# TYPE protean_consumer_groups_count gauge")
-                lines.append(f"protean_consumer_groups_count {cg_info.get('count', 0)}")
+            cg_info = details.get("consumer_groups", {})
+            lines.append("")
+            lines.append(
+                "# HELP protean_consumer_groups_count Number of consumer groups"
+            )
+            lines.append("# TYPE protean_consumer_groups_count gauge")
+            lines.append(f"protean_consumer_groups_count {cg_info.get('count', 0)}")
 
     except Exception as e:
         logger.debug(f"Metrics: broker query failed: {e}")
@@ -660,12 +1173,32 @@ def _hand_rolled_metrics(domains: List[Domain]) -> str:
     except Exception as e:
         logger.debug(f"Metrics: projection staleness failed: {e}")
 
-    # --- Per-consumer metrics (via XINFO CONSUMERS) ---
+    # --- Hot aggregate metrics (shared collection) ---
     try:
-        from protean.server.observatory.api import _discover_streams, _get_redis  # noqa: PLC0415
+        contention = _collect_contention(domains)
+        if contention:
+            lines.append("")
+            lines.append(
+                "# HELP protean_aggregate_contention Hottest aggregate instances "
+                "per contention sketch"
+            )
+            lines.append("# TYPE protean_aggregate_contention gauge")
+            for domain_name, sketch, entry in contention:
+                labels = (
+                    f'domain="{domain_name}",sketch="{sketch}",'
+                    f'aggregate="{entry["aggregate"]}",'
+                    f'aggregate_id="{entry["aggregate_id"]}"'
+                )
+                lines.append(
+                    f"protean_aggregate_contention{{{labels}}} {entry['count']}"
+                )
+    except Exception as e:
+        logger.debug(f"Metrics: contention failed: {e}")
 
-        redis_conn = _get_redis(domains)
-        if redis_conn:
+    # --- Per-consumer metrics (via XINFO CONSUMERS) ---
+    try:
+        consumers = _collect_consumer_stats(domains)
+        if consumers is not None:
             lines.append("")
             lines.append(
                 "# HELP protean_consumer_pending Per-consumer unacknowledged messages"
@@ -677,45 +1210,10 @@ def _hand_rolled_metrics(domains: List[Domain]) -> str:
             )
             lines.append("# TYPE protean_consumer_idle_ms gauge")
 
-            for stream_name in _discover_streams(redis_conn):
-                try:
-                    groups = redis_conn.xinfo_groups(stream_name)
-                    for grp in groups:
-                        if not isinstance(grp, dict):
-                            continue
-                        gname = grp.get("name") or grp.get(b"name")
-                        if isinstance(gname, bytes):
-                            gname = gname.decode("utf-8")
-                        if not gname:
-                            continue
-
-                        try:
-                            consumers_info = redis_conn.xinfo_consumers(
-                                stream_name, gname
-                            )
-                            for c in consumers_info:
-                                if not isinstance(c, dict):
-                                    continue
-                                cname = c.get("name") or c.get(b"name")
-                                if isinstance(cname, bytes):
-                                    cname = cname.decode("utf-8")
-                                cpending = c.get("pending") or c.get(b"pending") or 0
-                                cidle = c.get("idle") or c.get(b"idle") or 0
-                                labels = (
-                                    f'consumer="{cname}",'
-                                    f'group="{gname}",'
-                                    f'stream="{stream_name}"'
-                                )
-                                lines.append(
-                                    f"protean_consumer_pending{{{labels}}} {int(cpending)}"
-                                )
-                                lines.append(
-                                    f"protean_consumer_idle_ms{{{labels}}} {int(cidle)}"
-                                )
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            for stream_name, gname, cname, cpending, cidle in consumers:
+                labels = f'consumer="{cname}",group="{gname}",stream="{stream_name}"'
+                lines.append(f"protean_consumer_pending{{{labels}}} {cpending}")
+                lines.append(f"protean_consumer_idle_ms{{{labels}}} {cidle}")
     except Exception as e:
         logger.debug(f"Metrics: consumer metrics failed: {e}")
 
@@ -775,6 +1273,39 @@ def _hand_rolled_metrics(domains: List[Domain]) -> str:
     except Exception as e:
         logger.debug(f"Metrics: broker pool stats failed: {e}")
 
+    # --- Background collector staleness ---
+    try:
+        collector_health = _collector_health(domains)
+        if collector_health:
+            lines.append("")
+            lines.append(
+                "# HELP protean_metrics_collector_age_seconds Seconds since a "
+                "metrics collector last succeeded (-1=never)"
+            )
+            lines.append("# TYPE protean_metrics_collector_age_seconds gauge")
+            lines.append("")
+            lines.append(
+                "# HELP protean_metrics_collector_duration_seconds Duration of a "
+                "metrics collector's last run"
+            )
+            lines.append("# TYPE protean_metrics_collector_duration_seconds gauge")
+            lines.append("")
+            lines.append(
+                "# HELP protean_metrics_collector_stale Metrics collector value "
+                "is stale (1=stale, 0=fresh)"
+            )
+            lines.append("# TYPE protean_metrics_collector_stale gauge")
+
+            for name, age, duration, stale in collector_health:
+                labels = f'collector="{name}"'
+                lines.append(f"protean_metrics_collector_age_seconds{{{labels}}} {age}")
+                lines.append(
+                    f"protean_metrics_collector_duration_seconds{{{labels}}} {duration}"
+                )
+                lines.append(f"protean_metrics_collector_stale{{{labels}}} {stale}")
+    except Exception as e:
+        logger.debug(f"Metrics: collector health failed: {e}")
+
     lines.append("")  # Trailing newline
     return "\n".join(lines)
 
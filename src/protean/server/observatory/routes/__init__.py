@@ -4,28 +4,38 @@ Composes page routes (Jinja2-rendered views) and additional API routes
 into FastAPI routers that the Observatory class mounts.
 """
 
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 from fastapi import APIRouter
 from fastapi.templating import Jinja2Templates
 
 from protean.domain import Domain
 
+from .contention import create_contention_router
 from .domain import create_domain_router
 from .eventstore import create_eventstore_router
 from .handlers import create_handlers_router
 from .infrastructure import create_infrastructure_router
 from .pages import create_page_router
 from .processes import create_processes_router
+from .profile import create_profile_router
 from .timeline import create_timeline_router
 
+if TYPE_CHECKING:
+    from protean.server.observatory.timeline_index import TimelineIndex
+
 
 def create_all_routes(
     domains: List[Domain],
     templates: Jinja2Templates,
+    timeline_index: Optional["TimelineIndex"] = None,
 ) -> tuple[APIRouter, APIRouter]:
     """Create all Observatory routes.
 
+    Args:
+        timeline_index: Index serving the timeline routes. Without one,
+            they read the event store on every request.
+
     Returns:
         Tuple of (page_router, api_router).
         page_router: Jinja2-rendered page views.
@@ -39,6 +49,8 @@ def create_all_routes(
     api_router.include_router(create_processes_router(domains))
     api_router.include_router(create_eventstore_router(domains))
     api_router.include_router(create_infrastructure_router(domains))
-    api_router.include_router(create_timeline_router(domains))
+    api_router.include_router(create_timeline_router(domains, timeline_index))
+    api_router.include_router(create_profile_router(domains))
+    api_router.include_router(create_contention_router(domains))
 
     return page_router, api_router
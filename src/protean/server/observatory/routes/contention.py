@@ -0,0 +1,48 @@
+"""Aggregate contention API for the Protean Observatory.
+
+Serves the hot-aggregate sketches recorded by each process's
+``ContentionTracker``: version conflicts, retry reloads and slow Units of
+Work per aggregate instance, plus retry latency per aggregate type.
+Snapshots from all live workers are merged when Redis is available;
+otherwise the Observatory process's own trackers are reported.
+
+Endpoints:
+    GET /contention — Hottest aggregate instances per domain
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse
+
+from protean.utils.contention import collect_contention
+
+from .handlers import _get_redis
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+
+def create_contention_router(domains: list["Domain"]) -> APIRouter:
+    """Create the /contention API router."""
+    router = APIRouter()
+
+    @router.get("/contention")
+    async def aggregate_contention(
+        top: int = Query(20, ge=1, le=1000, description="Instances per sketch"),
+    ) -> JSONResponse:
+        """Merged contention sketches of all live workers, per domain."""
+        redis_conn = _get_redis(domains)
+        return JSONResponse(
+            content={
+                "source": "workers" if redis_conn is not None else "local",
+                "domains": collect_contention(domains, redis=redis_conn, top=top),
+            }
+        )
+
+    return router
@@ -75,6 +75,13 @@ def create_page_router(
         """Messages — Inspect failed and dead-letter queue messages."""
         return templates.TemplateResponse(request, "messages.html", _ctx("messages"))
 
+    @router.get("/contention")
+    async def contention(request: Request):
+        """Contention — Find the aggregate instances that conflict and retry most."""
+        return templates.TemplateResponse(
+            request, "contention.html", _ctx("contention")
+        )
+
     @router.get("/domain")
     async def domain(request: Request):
         """Domain — Visualize domain topology, event flows, and process managers."""
@@ -0,0 +1,73 @@
+"""Handler profile API for the Protean Observatory.
+
+Serves the aggregates published by each engine's ``HandlerProfiler``
+(enabled with ``[server.profiling]``). Snapshots from all live workers are
+merged, so the result covers the whole deployment.
+
+Endpoints:
+    GET /profile — Per-handler wall/CPU totals and a flame graph tree
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse
+
+from protean.server.profiler import (
+    merge_snapshots,
+    read_snapshots,
+    summarize,
+    to_flamegraph,
+)
+
+from .handlers import _get_redis
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+
+def create_profile_router(domains: list["Domain"]) -> APIRouter:
+    """Create the /profile API router."""
+    router = APIRouter()
+
+    @router.get("/profile")
+    async def handler_profile(
+        handler: Optional[str] = Query(
+            None, description="Restrict the flame graph to one handler"
+        ),
+    ) -> JSONResponse:
+        """Merged handler profile of all live workers."""
+        redis_conn = _get_redis(domains)
+        if redis_conn is None:
+            return JSONResponse(
+                status_code=503,
+                content={"error": "Redis is not available"},
+            )
+
+        snapshots = []
+        for domain in domains:
+            try:
+                snapshots.extend(read_snapshots(redis_conn, domain.name))
+            except Exception:
+                logger.debug(
+                    "Failed to read profile snapshots for %s",
+                    domain.name,
+                    exc_info=True,
+                )
+
+        merged = merge_snapshots(snapshots)
+        return JSONResponse(
+            content={
+                "workers": merged["workers"],
+                "samples": merged["samples"],
+                "handlers": summarize(merged),
+                "flamegraph": to_flamegraph(merged, handler=handler),
+            }
+        )
+
+    return router
@@ -8,6 +8,10 @@ Data sources:
 1. **Event store ``$all`` stream** — all messages in global order.
 2. **Domain registry metadata** — aggregate names and stream categories.
 
+When a :class:`~protean.server.observatory.timeline_index.TimelineIndex` is
+supplied, the collectors answer from its in-memory window of recent messages
+instead of reading ``$all`` on every request.
+
 Endpoints:
     GET /timeline/events          — Paginated event list with filtering
     GET /timeline/events/{message_id} — Single event detail
@@ -32,10 +36,21 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
 
 from protean.port.event_store import CausationNode
+from protean.server.observatory.timeline_messages import (
+    TimelineStats as _TimelineStats,
+    domain_from_stream as _domain_from_stream,
+    extract_correlation_id as _extract_correlation_id,
+    extract_event_type as _extract_event_type,
+    extract_message_id as _extract_message_id,
+    extract_stream_category as _extract_stream_category,
+    is_snapshot as _is_snapshot,
+    unique_store_domains as _unique_store_domains,
+)
 from protean.server.tracing import TRACE_STREAM
 
 if TYPE_CHECKING:
     from protean.domain import Domain
+    from protean.server.observatory.timeline_index import TimelineIndex
 
 logger = logging.getLogger(__name__)
 
@@ -44,62 +59,11 @@ _DEFAULT_LIMIT = 50
 _MAX_LIMIT = 200
 
 
-def _unique_store_domains(domains: list[Domain]) -> list[Domain]:
-    """Return a deduplicated list of domains, one per unique event store instance.
-
-    When multiple domains share the same event store (common in multi-bounded-context
-    apps using a single database), reading ``$all`` from each would return duplicate
-    messages.  This helper keeps only the first domain for each distinct store,
-    comparing by connection URI rather than object identity (each domain creates
-    its own store instance even when they share the same database).
-    """
-    seen_stores: set[str] = set()
-    unique: list[Domain] = []
-    for domain in domains:
-        try:
-            store = domain.event_store.store
-            # Use the database URI as the identity key — object identity
-            # doesn't work because each domain creates its own store instance.
-            store_key = (
-                store.conn_info.get("database_uri", "")
-                if hasattr(store, "conn_info")
-                else ""
-            )
-            if not store_key:
-                store_key = str(id(store))  # Fallback for stores without conn_info
-        except Exception:
-            store_key = str(id(domain))  # Fallback — treat as unique
-        if store_key not in seen_stores:
-            seen_stores.add(store_key)
-            unique.append(domain)
-    return unique
-
-
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _domain_from_stream(stream: str | None) -> str | None:
-    """Extract the domain name from a Protean stream name.
-
-    Protean stream names are domain-qualified and use ``::`` to separate the
-    domain from the remainder of the stream identifier. Common formats emitted
-    by Protean include:
-
-    - Aggregate/event streams: ``<domain>::<aggregate>-<id>``
-      (for example ``fulfillment::fulfillment-305d2c42``)
-    - Command streams: ``<domain>::<aggregate>:command-<id>``
-    - Fact streams: ``<domain>::<aggregate>-fact-<id>``
-
-    This helper returns the portion before ``::`` for any of these variants,
-    or ``None`` if the stream is empty or doesn't contain the separator.
-    """
-    if not stream or "::" not in stream:
-        return None
-    return stream.split("::")[0]
-
-
 def _serialize_message(raw_msg: dict[str, Any], domain_name: str) -> dict[str, Any]:
     """Convert a raw event store message dict to a JSON-safe timeline entry."""
     metadata = raw_msg.get("metadata", {})
@@ -145,34 +109,6 @@ def _serialize_message_detail(
     return summary
 
 
-def _extract_message_id(msg: dict[str, Any]) -> str | None:
-    """Extract the Protean message ID (headers.id) from a raw message dict."""
-    metadata = msg.get("metadata")
-    if not metadata or not isinstance(metadata, dict):
-        return None
-    headers = metadata.get("headers")
-    if not headers or not isinstance(headers, dict):
-        return None
-    return headers.get("id")
-
-
-def _extract_stream_category(msg: dict[str, Any]) -> str:
-    """Extract the stream category from a raw message."""
-    metadata = msg.get("metadata", {})
-    if isinstance(metadata, dict):
-        domain_meta = metadata.get("domain", {})
-        if isinstance(domain_meta, dict):
-            cat = domain_meta.get("stream_category")
-            if cat:
-                return cat
-
-    stream = msg.get("stream_name", "")
-    if stream:
-        category, _, _ = stream.partition("-")
-        return category
-    return ""
-
-
 def _extract_kind(msg: dict[str, Any]) -> str | None:
     """Extract the kind (EVENT/COMMAND) from a raw message."""
     metadata = msg.get("metadata", {})
@@ -183,11 +119,6 @@ def _extract_kind(msg: dict[str, Any]) -> str | None:
     return None
 
 
-def _extract_event_type(msg: dict[str, Any]) -> str | None:
-    """Extract the event type from a raw message."""
-    return msg.get("type")
-
-
 def _extract_aggregate_id(msg: dict[str, Any]) -> str | None:
     """Extract the aggregate ID from the stream name (part after '-')."""
     stream = msg.get("stream_name", "")
@@ -214,6 +145,7 @@ def collect_all_events(
     event_type: str | None = None,
     aggregate_id: str | None = None,
     kind: str | None = None,
+    index: TimelineIndex | None = None,
 ) -> tuple[list[dict[str, Any]], int | None]:
     """Read events from all domains' event stores with filtering and pagination.
 
@@ -221,25 +153,13 @@ def collect_all_events(
         Tuple of (events, next_cursor). next_cursor is None when there are
         no more results.
     """
-    all_events: list[tuple[dict[str, Any], str]] = []
-
-    for domain in _unique_store_domains(domains):
-        try:
-            with domain.domain_context():
-                store = domain.event_store.store
-                raw_messages = store._read("$all", no_of_messages=1_000_000)
-
-                for msg in raw_messages:
-                    # Exclude snapshot messages from the timeline
-                    stream = msg.get("stream_name", "")
-                    if ":snapshot-" in stream or msg.get("type") == "SNAPSHOT":
-                        continue
-                    # Derive domain from stream prefix so events from a
-                    # shared MessageDB get the correct domain attribution
-                    msg_domain = _domain_from_stream(stream) or domain.name
-                    all_events.append((msg, msg_domain))
-        except Exception:
-            logger.debug("Failed to read events from %s", domain.name, exc_info=True)
+    all_events: list[tuple[dict[str, Any], str]]
+    if index is not None:
+        all_events = index.events(
+            stream_category=stream_category, event_type=event_type
+        )
+    else:
+        all_events = _read_all_events(domains)
 
     # Sort by global_position (ascending)
     all_events.sort(key=lambda x: x[0].get("global_position", 0))
@@ -291,11 +211,50 @@ def collect_all_events(
     return page, next_cursor
 
 
-def find_event_by_id(domains: list[Domain], message_id: str) -> dict[str, Any] | None:
+def _read_all_events(domains: list[Domain]) -> list[tuple[dict[str, Any], str]]:
+    """Read ``$all`` from each distinct event store, without snapshots.
+
+    Returns ``(raw_msg, domain_name)`` tuples in store order.
+    """
+    all_events: list[tuple[dict[str, Any], str]] = []
+
+    for domain in _unique_store_domains(domains):
+        try:
+            with domain.domain_context():
+                store = domain.event_store.store
+                raw_messages = store._read("$all", no_of_messages=1_000_000)
+
+                for msg in raw_messages:
+                    # Exclude snapshot messages from the timeline
+                    if _is_snapshot(msg):
+                        continue
+                    # Derive domain from stream prefix so events from a
+                    # shared MessageDB get the correct domain attribution
+                    stream = msg.get("stream_name", "")
+                    msg_domain = _domain_from_stream(stream) or domain.name
+                    all_events.append((msg, msg_domain))
+        except Exception:
+            logger.debug("Failed to read events from %s", domain.name, exc_info=True)
+
+    return all_events
+
+
+def find_event_by_id(
+    domains: list[Domain],
+    message_id: str,
+    *,
+    index: TimelineIndex | None = None,
+) -> dict[str, Any] | None:
     """Find a single event by its message ID across all domains.
 
     Returns the full event detail dict, or None if not found.
     """
+    if index is not None:
+        entry = index.find(message_id)
+        if entry is None:
+            return None
+        return _serialize_message_detail(entry.message, entry.source.name)
+
     for domain in _unique_store_domains(domains):
         try:
             with domain.domain_context():
@@ -311,18 +270,22 @@ def find_event_by_id(domains: list[Domain], message_id: str) -> dict[str, Any] |
     return None
 
 
-def collect_timeline_stats(domains: list[Domain]) -> dict[str, Any]:
+def collect_timeline_stats(
+    domains: list[Domain], *, index: TimelineIndex | None = None
+) -> dict[str, Any]:
     """Collect summary statistics across all domains' event stores.
 
+    With an index, every figure covers the messages in its window.
+
     Returns:
         Dict with total_events, last_event_time, active_streams,
         events_per_minute.
     """
-    total_events = 0
+    if index is not None:
+        return index.stats()
+
+    stats = _TimelineStats()
     active_streams: set[str] = set()
-    last_event_time: str | None = None
-    last_event_datetime: datetime | None = None
-    first_event_datetime: datetime | None = None
 
     for domain in _unique_store_domains(domains):
         try:
@@ -332,59 +295,17 @@ def collect_timeline_stats(domains: list[Domain]) -> dict[str, Any]:
 
                 for msg in raw_messages:
                     # Exclude snapshot messages from stats
-                    stream = msg.get("stream_name", "")
-                    if ":snapshot-" in stream or msg.get("type") == "SNAPSHOT":
+                    if _is_snapshot(msg):
                         continue
 
-                    total_events += 1
-
+                    stats.add(msg)
+                    stream = msg.get("stream_name", "")
                     if stream:
                         active_streams.add(stream)
-
-                    raw_time = msg.get("time")
-                    if raw_time:
-                        if isinstance(raw_time, datetime):
-                            msg_dt = raw_time
-                        elif isinstance(raw_time, str):
-                            try:
-                                msg_dt = datetime.fromisoformat(raw_time)
-                            except (ValueError, TypeError):
-                                continue
-                        else:
-                            continue
-
-                        if last_event_datetime is None or msg_dt > last_event_datetime:
-                            last_event_datetime = msg_dt
-                            last_event_time = (
-                                raw_time.isoformat()
-                                if hasattr(raw_time, "isoformat")
-                                else str(raw_time)
-                            )
-
-                        if (
-                            first_event_datetime is None
-                            or msg_dt < first_event_datetime
-                        ):
-                            first_event_datetime = msg_dt
         except Exception:
             logger.debug("Failed to collect stats from %s", domain.name, exc_info=True)
 
-    # Calculate events per minute
-    events_per_minute: float | None = None
-    if first_event_datetime and last_event_datetime and total_events > 1:
-        # Normalize both to comparable datetimes
-        first = first_event_datetime.replace(tzinfo=None)
-        last = last_event_datetime.replace(tzinfo=None)
-        duration = (last - first).total_seconds()
-        if duration > 0:
-            events_per_minute = round(total_events / (duration / 60), 2)
-
-    return {
-        "total_events": total_events,
-        "last_event_time": last_event_time,
-        "active_streams": len(active_streams),
-        "events_per_minute": events_per_minute,
-    }
+    return stats.as_dict(len(active_streams))
 
 
 # ---------------------------------------------------------------------------
@@ -598,7 +519,10 @@ def _sum_tree_duration(node: CausationNode) -> float:
 
 
 def build_correlation_response(
-    domains: list[Domain], correlation_id: str
+    domains: list[Domain],
+    correlation_id: str,
+    *,
+    index: TimelineIndex | None = None,
 ) -> dict[str, Any] | None:
     """Build the correlation chain response for a given correlation ID.
 
@@ -616,6 +540,24 @@ def build_correlation_response(
         Dict with correlation_id, events, tree, total_duration_ms, and
         event_count; or None if no events found.
     """
+    if index is not None:
+        entries = index.correlation_group(correlation_id)
+        if not entries:
+            return None
+        # Chains are assembled per store, like the ``$all`` scan below
+        source = entries[0].source
+        group = [entry.message for entry in entries if entry.source is source]
+        try:
+            with source.domain_context():
+                return _correlation_response(domains, source, group, correlation_id)
+        except Exception:
+            logger.debug(
+                "Failed to build correlation chain from %s",
+                source.name,
+                exc_info=True,
+            )
+            return None
+
     for domain in _unique_store_domains(domains):
         try:
             with domain.domain_context():
@@ -624,31 +566,7 @@ def build_correlation_response(
                 if not group:
                     continue
 
-                # Serialize the flat event list
-                events = [_serialize_message(msg, domain.name) for msg in group]
-                events.sort(key=lambda e: e.get("global_position") or 0)
-
-                # Load trace data for enrichment (graceful fallback)
-                traces = _load_traces_for_correlation(domains, correlation_id)
-
-                # Build the causation tree from the already-loaded group
-                tree_root = _build_causation_tree_from_group(
-                    store, group, traces_by_message_id=traces
-                )
-                tree = asdict(tree_root) if tree_root else None
-
-                total_duration_ms: float | None = None
-                if tree_root:
-                    total = _sum_tree_duration(tree_root)
-                    total_duration_ms = round(total, 2) if total > 0 else None
-
-                return {
-                    "correlation_id": correlation_id,
-                    "events": events,
-                    "tree": tree,
-                    "total_duration_ms": total_duration_ms,
-                    "event_count": len(events),
-                }
+                return _correlation_response(domains, domain, group, correlation_id)
         except Exception:
             logger.debug(
                 "Failed to build correlation chain from %s",
@@ -659,15 +577,55 @@ def build_correlation_response(
     return None
 
 
+def _correlation_response(
+    domains: list[Domain],
+    domain: Domain,
+    group: list[dict[str, Any]],
+    correlation_id: str,
+) -> dict[str, Any]:
+    """Serialize a loaded correlation group with its causation tree."""
+    store = domain.event_store.store
+
+    # Serialize the flat event list
+    events = [_serialize_message(msg, domain.name) for msg in group]
+    events.sort(key=lambda e: e.get("global_position") or 0)
+
+    # Load trace data for enrichment (graceful fallback)
+    traces = _load_traces_for_correlation(domains, correlation_id)
+
+    # Build the causation tree from the already-loaded group
+    tree_root = _build_causation_tree_from_group(
+        store, group, traces_by_message_id=traces
+    )
+    tree = asdict(tree_root) if tree_root else None
+
+    total_duration_ms: float | None = None
+    if tree_root:
+        total = _sum_tree_duration(tree_root)
+        total_duration_ms = round(total, 2) if total > 0 else None
+
+    return {
+        "correlation_id": correlation_id,
+        "events": events,
+        "tree": tree,
+        "total_duration_ms": total_duration_ms,
+        "event_count": len(events),
+    }
+
+
 def collect_aggregate_history(
     domains: list[Domain],
     stream_category: str,
     aggregate_id: str,
+    *,
+    index: TimelineIndex | None = None,
 ) -> dict[str, Any] | None:
     """Collect the full event history for one aggregate instance.
 
     Reads the aggregate's stream and returns all events in position order
-    along with current version information.
+    along with current version information. An index answers only while it
+    holds every message in the store; once older messages have been evicted
+    or were never tailed, the stream is read from the store.
 
     Returns:
         Dict with stream, aggregate_id, current_version, events, and
@@ -675,6 +633,19 @@ def collect_aggregate_history(
     """
     stream_name = f"{stream_category}-{aggregate_id}"
 
+    if index is not None and index.complete:
+        entries = index.stream(stream_name)
+        if not entries:
+            return None
+        source = entries[0].source
+        return _aggregate_history(
+            [entry.message for entry in entries if entry.source is source],
+            source.name,
+            stream_name,
+            stream_category,
+            aggregate_id,
+        )
+
     for domain in _unique_store_domains(domains):
         try:
             with domain.domain_context():
@@ -683,20 +654,13 @@ def collect_aggregate_history(
                 if not raw_messages:
                     continue
 
-                events = [_serialize_message(msg, domain.name) for msg in raw_messages]
-
-                # Derive stream version from the last message's position
-                last_msg = raw_messages[-1]
-                current_version = last_msg.get("position")
-
-                return {
-                    "stream": stream_name,
-                    "aggregate_id": aggregate_id,
-                    "stream_category": stream_category,
-                    "current_version": current_version,
-                    "events": events,
-                    "event_count": len(events),
-                }
+                return _aggregate_history(
+                    raw_messages,
+                    domain.name,
+                    stream_name,
+                    stream_category,
+                    aggregate_id,
+                )
         except Exception:
             logger.debug(
                 "Failed to read aggregate history from %s",
@@ -707,24 +671,37 @@ def collect_aggregate_history(
     return None
 
 
+def _aggregate_history(
+    raw_messages: list[dict[str, Any]],
+    domain_name: str,
+    stream_name: str,
+    stream_category: str,
+    aggregate_id: str,
+) -> dict[str, Any]:
+    events = [_serialize_message(msg, domain_name) for msg in raw_messages]
+
+    # Derive stream version from the last message's position
+    last_msg = raw_messages[-1]
+    current_version = last_msg.get("position")
+
+    return {
+        "stream": stream_name,
+        "aggregate_id": aggregate_id,
+        "stream_category": stream_category,
+        "current_version": current_version,
+        "events": events,
+        "event_count": len(events),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Trace summary helpers
 # ---------------------------------------------------------------------------
 
 
-def _extract_correlation_id(msg: dict[str, Any]) -> str | None:
-    """Extract correlation_id from a raw message dict."""
-    metadata = msg.get("metadata")
-    if not metadata or not isinstance(metadata, dict):
-        return None
-    domain_meta = metadata.get("domain")
-    if not domain_meta or not isinstance(domain_meta, dict):
-        return None
-    return domain_meta.get("correlation_id")
-
-
 def _group_by_correlation(
     domains: list[Domain],
+    index: TimelineIndex | None = None,
 ) -> dict[str, list[tuple[dict[str, Any], str]]]:
     """Read all events from the event store and group by correlation_id.
 
@@ -734,26 +711,14 @@ def _group_by_correlation(
     """
     groups: dict[str, list[tuple[dict[str, Any], str]]] = defaultdict(list)
 
-    for domain in _unique_store_domains(domains):
-        try:
-            with domain.domain_context():
-                store = domain.event_store.store
-                raw_messages = store._read("$all", no_of_messages=1_000_000)
-
-                for msg in raw_messages:
-                    stream = msg.get("stream_name", "")
-                    if ":snapshot-" in stream or msg.get("type") == "SNAPSHOT":
-                        continue
-                    cid = _extract_correlation_id(msg)
-                    if cid:
-                        msg_domain = _domain_from_stream(stream) or domain.name
-                        groups[cid].append((msg, msg_domain))
-        except Exception:
-            logger.debug(
-                "Failed to read events from %s for grouping",
-                domain.name,
-                exc_info=True,
-            )
+    if index is not None:
+        # The index keeps a correlation inverted index, so no full pass is needed
+        groups.update(index.correlation_groups())
+    else:
+        for msg, msg_domain in _read_all_events(domains):
+            cid = _extract_correlation_id(msg)
+            if cid:
+                groups[cid].append((msg, msg_domain))
 
     # Sort each group by global_position
     for cid in groups:
@@ -813,6 +778,7 @@ def collect_recent_traces(
     domains: list[Domain],
     *,
     limit: int = _DEFAULT_LIMIT,
+    index: TimelineIndex | None = None,
 ) -> list[dict[str, Any]]:
     """Return the most recent correlation chains as trace summaries.
 
@@ -820,7 +786,7 @@ def collect_recent_traces(
     most recent first.  Each summary contains correlation_id, root_type,
     event_count, started_at, and streams.
     """
-    groups = _group_by_correlation(domains)
+    groups = _group_by_correlation(domains, index)
 
     summaries = [_build_trace_summary(cid, grp) for cid, grp in groups.items() if grp]
 
@@ -841,6 +807,7 @@ def search_traces(
     command_type: str | None = None,
     stream_category: str | None = None,
     limit: int = _DEFAULT_LIMIT,
+    index: TimelineIndex | None = None,
 ) -> list[dict[str, Any]]:
     """Search correlation chains by criteria.
 
@@ -855,6 +822,7 @@ def search_traces(
         stream_category: Match chains containing a message in this stream
             category.
         limit: Maximum number of results to return.
+        index: Timeline index to search instead of reading ``$all``.
 
     Returns:
         List of trace summaries matching the criteria, sorted by
@@ -869,7 +837,7 @@ def search_traces(
             "aggregate_id, event_type, command_type, or stream_category"
         )
 
-    groups = _group_by_correlation(domains)
+    groups = _group_by_correlation(domains, index)
 
     matching: list[dict[str, Any]] = []
 
@@ -911,10 +879,21 @@ def search_traces(
 # ---------------------------------------------------------------------------
 
 
-def create_timeline_router(domains: list["Domain"]) -> APIRouter:
-    """Create the /timeline API router."""
+def create_timeline_router(
+    domains: list["Domain"], index: TimelineIndex | None = None
+) -> APIRouter:
+    """Create the /timeline API router.
+
+    With an ``index``, routes are served from its in-memory window. While its
+    tailer thread is not running, each request first catches the index up.
+    """
     router = APIRouter()
 
+    def _current_index() -> TimelineIndex | None:
+        if index is not None:
+            index.ensure_fresh()
+        return index
+
     @router.get("/timeline/events")
     async def list_events(
         cursor: int = Query(0, ge=0, description="Global position cursor"),
@@ -941,6 +920,7 @@ def create_timeline_router(domains: list["Domain"]) -> APIRouter:
             event_type=event_type,
             aggregate_id=aggregate_id,
             kind=kind,
+            index=_current_index(),
         )
 
         return JSONResponse(
@@ -954,7 +934,7 @@ def create_timeline_router(domains: list["Domain"]) -> APIRouter:
     @router.get("/timeline/events/{message_id}")
     async def get_event(message_id: str) -> JSONResponse:
         """Single event detail with full payload and metadata."""
-        event = find_event_by_id(domains, message_id)
+        event = find_event_by_id(domains, message_id, index=_current_index())
         if event is None:
             raise HTTPException(status_code=404, detail="Event not found")
         return JSONResponse(content=event)
@@ -962,13 +942,15 @@ def create_timeline_router(domains: list["Domain"]) -> APIRouter:
     @router.get("/timeline/stats")
     async def get_stats() -> JSONResponse:
         """Summary statistics for the event store timeline."""
-        stats = collect_timeline_stats(domains)
+        stats = collect_timeline_stats(domains, index=_current_index())
         return JSONResponse(content=stats)
 
     @router.get("/timeline/correlation/{correlation_id}")
     async def get_correlation_chain(correlation_id: str) -> JSONResponse:
         """All events in a correlation chain with causation tree."""
-        result = build_correlation_response(domains, correlation_id)
+        result = build_correlation_response(
+            domains, correlation_id, index=_current_index()
+        )
         if result is None:
             raise HTTPException(
                 status_code=404,
@@ -981,7 +963,9 @@ def create_timeline_router(domains: list["Domain"]) -> APIRouter:
         stream_category: str, aggregate_id: str
     ) -> JSONResponse:
         """Full event history for one aggregate instance."""
-        result = collect_aggregate_history(domains, stream_category, aggregate_id)
+        result = collect_aggregate_history(
+            domains, stream_category, aggregate_id, index=_current_index()
+        )
         if result is None:
             raise HTTPException(
                 status_code=404,
@@ -996,7 +980,7 @@ def create_timeline_router(domains: list["Domain"]) -> APIRouter:
         ),
     ) -> JSONResponse:
         """Recent correlation chains with summary statistics."""
-        traces = collect_recent_traces(domains, limit=limit)
+        traces = collect_recent_traces(domains, limit=limit, index=_current_index())
         return JSONResponse(content={"traces": traces, "count": len(traces)})
 
     @router.get("/timeline/traces/search")
@@ -1025,6 +1009,7 @@ def create_timeline_router(domains: list["Domain"]) -> APIRouter:
             command_type=command_type,
             stream_category=stream_category,
             limit=limit,
+            index=_current_index(),
         )
         return JSONResponse(content={"traces": traces, "count": len(traces)})
 
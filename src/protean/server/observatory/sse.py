@@ -2,14 +2,24 @@
 
 Subscribes to Redis Pub/Sub channel 'protean:trace' and streams MessageTrace
 events to connected clients. Supports server-side filtering by domain, stream,
-event type, and message type.
+event type, handler, and message type.
+
+All clients of an Observatory share one upstream subscriber
+(:class:`TraceFanout`): a single Pub/Sub connection whose messages are decoded
+and serialized once, filtered per client, and pushed onto each client's
+bounded queue. A client that cannot keep up loses events instead of slowing
+the others down; once its queue has room again it receives a ``dropped``
+event summarizing what it missed.
 """
 
 import asyncio
+import functools
 import json
 import logging
+from collections import Counter
+from dataclasses import dataclass, field
 from fnmatch import fnmatch
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from fastapi import Query, Request
 from fastapi.responses import StreamingResponse
@@ -20,13 +30,210 @@ from ..tracing import TRACE_CHANNEL
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SSE_QUEUE_SIZE = 1000
+DEFAULT_SSE_KEEPALIVE_INTERVAL = 1.0
+
+# Seconds to wait before resubscribing after the upstream connection fails
+_UPSTREAM_RETRY_DELAY = 1.0
+
+
+@dataclass(frozen=True)
+class TraceFilter:
+    """Server-side filter of one SSE client.
+
+    ``domain`` and ``stream`` match exactly; ``event``, ``handler`` and
+    ``message_type`` accept glob patterns. Unset filters match everything.
+    """
+
+    domain: Optional[str] = None
+    stream: Optional[str] = None
+    event: Optional[str] = None
+    handler: Optional[str] = None
+    message_type: Optional[str] = None
+
+    def matches(self, data: dict) -> bool:
+        if self.domain and data.get("domain") != self.domain:
+            return False
+        if self.stream and data.get("stream") != self.stream:
+            return False
+        if self.event and not fnmatch(data.get("event") or "", self.event):
+            return False
+        if self.handler and not fnmatch(data.get("handler") or "", self.handler):
+            return False
+        if self.message_type and not fnmatch(
+            data.get("message_type") or "", self.message_type
+        ):
+            return False
+        return True
+
+
+@dataclass(eq=False)
+class TraceSubscriber:
+    """One connected SSE client: its filter, bounded queue and drop tally."""
+
+    filter: TraceFilter
+    queue: asyncio.Queue
+    dropped: int = 0
+    dropped_by_event: Counter = field(default_factory=Counter)
+    dropped_total: int = 0
+
+    def offer(self, data: dict, frame: str) -> None:
+        """Queue a formatted event, or count it as dropped when full.
+
+        Pending drops are reported with a ``dropped`` marker ahead of the
+        next event that fits, so the client sees where the gap is.
+        """
+        if self.dropped and self.queue.qsize() < self.queue.maxsize - 1:
+            self.queue.put_nowait(
+                _format_sse(
+                    {
+                        "dropped": self.dropped,
+                        "events": dict(self.dropped_by_event),
+                    },
+                    event_type="dropped",
+                )
+            )
+            self.dropped = 0
+            self.dropped_by_event.clear()
+
+        if self.dropped or self.queue.full():
+            self.dropped += 1
+            self.dropped_total += 1
+            self.dropped_by_event[data.get("event") or "unknown"] += 1
+            return
+        self.queue.put_nowait(frame)
+
+
+class TraceFanout:
+    """Shares one Redis Pub/Sub subscription among all SSE clients.
+
+    The upstream pump runs as a task on the event loop while at least one
+    client is connected. Blocking Pub/Sub reads run in the default executor.
+    Each trace is decoded and formatted once, then offered to every client
+    whose filter matches.
+
+    Args:
+        domains: Domains whose brokers may provide the Redis connection.
+        queue_size: Maximum number of undelivered events per client.
+    """
+
+    def __init__(
+        self, domains: List[Domain], queue_size: int = DEFAULT_SSE_QUEUE_SIZE
+    ) -> None:
+        self.domains = domains
+        # A marker needs a slot next to the event that follows it
+        self.queue_size = max(2, int(queue_size))
+        self._subscribers: list[TraceSubscriber] = []
+        self._pump: Optional[asyncio.Task] = None
+        self._pump_stopping: Optional[asyncio.Event] = None
+        self.received = 0
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def _redis(self) -> Any:
+        """Redis connection of the first domain with a Redis broker."""
+        for d in self.domains:
+            try:
+                with d.domain_context():
+                    broker = d.brokers.get("default")
+                    if broker and hasattr(broker, "redis_instance"):
+                        return broker.redis_instance
+            except Exception:
+                continue
+        return None
+
+    def join(self, trace_filter: TraceFilter) -> Optional[TraceSubscriber]:
+        """Register a client and start the upstream pump if needed.
+
+        Returns ``None`` when no Redis connection is available.
+        """
+        if self._pump is None or self._pump.done():
+            redis_conn = self._redis()
+            if not redis_conn:
+                return None
+            self._pump_stopping = asyncio.Event()
+            self._pump = asyncio.get_running_loop().create_task(
+                self._run(redis_conn, self._pump_stopping), name="protean-sse-fanout"
+            )
+
+        subscriber = TraceSubscriber(
+            trace_filter, asyncio.Queue(maxsize=self.queue_size)
+        )
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    async def leave(self, subscriber: TraceSubscriber) -> None:
+        """Unregister a client; the last one out stops the upstream pump."""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+        if self._subscribers or self._pump is None:
+            return
+
+        pump, self._pump = self._pump, None
+        self._pump_stopping.set()
+        try:
+            # The pump closes its subscription once its current read returns
+            await asyncio.shield(pump)
+        except Exception:
+            logger.debug("SSE fan-out pump stopped with an error", exc_info=True)
+
+    def publish(self, raw: Any) -> None:
+        """Decode one Pub/Sub payload and offer it to matching clients."""
+        try:
+            data = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return
+        if not isinstance(data, dict):
+            return
+
+        self.received += 1
+        frame: Optional[str] = None
+        for subscriber in list(self._subscribers):
+            if not subscriber.filter.matches(data):
+                continue
+            if frame is None:
+                frame = _format_sse(data)
+            subscriber.offer(data, frame)
+
+    async def _run(self, redis_conn: Any, stopping: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        while not stopping.is_set():
+            pubsub = redis_conn.pubsub()
+            try:
+                await loop.run_in_executor(None, pubsub.subscribe, TRACE_CHANNEL)
+                read = functools.partial(
+                    pubsub.get_message, ignore_subscribe_messages=True, timeout=1.0
+                )
+                while not stopping.is_set():
+                    message = await loop.run_in_executor(None, read)
+                    if message and message["type"] == "message":
+                        self.publish(message["data"])
+            except Exception as exc:
+                logger.warning("SSE fan-out lost its Redis subscription: %s", exc)
+                await asyncio.sleep(_UPSTREAM_RETRY_DELAY)
+            finally:
+                try:
+                    pubsub.unsubscribe(TRACE_CHANNEL)
+                    pubsub.close()
+                except Exception:
+                    logger.debug("Failed to close SSE pubsub", exc_info=True)
+
 
-def create_sse_endpoint(domains: List[Domain]):
+def create_sse_endpoint(
+    domains: List[Domain],
+    queue_size: int = DEFAULT_SSE_QUEUE_SIZE,
+    keepalive_interval: float = DEFAULT_SSE_KEEPALIVE_INTERVAL,
+):
     """Create the SSE streaming endpoint function.
 
     Args:
         domains: List of Protean domains to monitor.
+        queue_size: Maximum number of undelivered events per client.
+        keepalive_interval: Seconds without events before a keepalive comment.
     """
+    fanout = TraceFanout(domains, queue_size=queue_size)
 
     async def stream_events(
         request: Request,
@@ -35,74 +242,46 @@ def create_sse_endpoint(domains: List[Domain]):
         event: Optional[str] = Query(
             None, description="Filter by event type (supports glob: handler.*)"
         ),
+        handler: Optional[str] = Query(
+            None, description="Filter by handler name (supports glob)"
+        ),
         type: Optional[str] = Query(
             None, description="Filter by message type (supports glob)"
         ),
     ):
         """Stream real-time MessageTrace events via Server-Sent Events."""
+        trace_filter = TraceFilter(
+            domain=domain,
+            stream=stream,
+            event=event,
+            handler=handler,
+            message_type=type,
+        )
 
         async def event_generator():
-            # Get Redis connection from the first domain's broker
-            redis_conn = None
-            for d in domains:
-                try:
-                    with d.domain_context():
-                        broker = d.brokers.get("default")
-                        if broker and hasattr(broker, "redis_instance"):
-                            redis_conn = broker.redis_instance
-                            break
-                except Exception:
-                    continue
-
-            if not redis_conn:
+            subscriber = fanout.join(trace_filter)
+            if subscriber is None:
                 yield _format_sse({"error": "Redis not available"}, event_type="error")
                 return
 
-            # Create a dedicated pub/sub subscriber
-            pubsub = redis_conn.pubsub()
             try:
-                pubsub.subscribe(TRACE_CHANNEL)
-
                 while True:
                     # Check if client disconnected
                     if await request.is_disconnected():
                         break
 
-                    # Offload synchronous Redis pubsub to thread pool
-                    # to avoid blocking the async event loop
-                    message = await asyncio.to_thread(
-                        pubsub.get_message,
-                        ignore_subscribe_messages=True,
-                        timeout=1.0,
-                    )
-
-                    if message and message["type"] == "message":
-                        try:
-                            data = json.loads(message["data"])
-
-                            # Apply filters
-                            if domain and data.get("domain") != domain:
-                                continue
-                            if stream and data.get("stream") != stream:
-                                continue
-                            if event and not fnmatch(data.get("event", ""), event):
-                                continue
-                            if type and not fnmatch(data.get("message_type", ""), type):
-                                continue
-
-                            yield _format_sse(data)
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-                    else:
+                    try:
+                        frame = await asyncio.wait_for(
+                            subscriber.queue.get(), timeout=keepalive_interval
+                        )
+                    except asyncio.TimeoutError:
                         # No message, yield a keepalive comment to prevent timeouts
                         yield ": keepalive\n\n"
+                        continue
 
-                    # Yield control to event loop
-                    await asyncio.sleep(0.01)
-
+                    yield frame
             finally:
-                pubsub.unsubscribe(TRACE_CHANNEL)
-                pubsub.close()
+                await fanout.leave(subscriber)
 
         return StreamingResponse(
             event_generator(),
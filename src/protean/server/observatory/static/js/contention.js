@@ -0,0 +1,143 @@
+/**
+ * Contention View Module
+ *
+ * Fetches the hot-aggregate sketches from /api/contention and renders the
+ * hottest instances per sketch and the conflict retry latency per aggregate.
+ */
+(function () {
+  'use strict';
+
+  // ---------------------------------------------------------------------------
+  // State
+  // ---------------------------------------------------------------------------
+  let _domains = {};
+  let _sketch = 'conflicts';
+
+  const _COUNT_HEADERS = {
+    conflicts: 'Conflicts',
+    reloads: 'Reloads',
+    slow: 'UoW Time',
+  };
+
+  // ---------------------------------------------------------------------------
+  // Rendering
+  // ---------------------------------------------------------------------------
+
+  function _entries(key) {
+    const rows = [];
+    for (const [domainName, merged] of Object.entries(_domains)) {
+      for (const entry of (merged[key] || [])) {
+        rows.push(Object.assign({ domain: domainName }, entry));
+      }
+    }
+    return rows;
+  }
+
+  function _formatCount(value) {
+    return _sketch === 'slow' ? Observatory.fmt.duration(value) : Observatory.fmt.number(value);
+  }
+
+  function _renderHot() {
+    const $tbody = document.getElementById('hot-tbody');
+    if (!$tbody) return;
+
+    const $header = document.getElementById('count-header');
+    if ($header) $header.textContent = _COUNT_HEADERS[_sketch];
+
+    const rows = _entries(_sketch).sort((a, b) => b.count - a.count);
+    if (rows.length === 0) {
+      $tbody.innerHTML = '<tr><td colspan="5" class="text-center text-base-content/50 py-8">No contention recorded.</td></tr>';
+      return;
+    }
+
+    $tbody.innerHTML = rows.map(r => `<tr class="hover">
+        <td class="font-medium">${Observatory.escapeHtml(r.aggregate)}</td>
+        <td class="text-sm font-mono">${Observatory.escapeHtml(r.aggregate_id)}</td>
+        <td class="text-right font-mono-metric">${_formatCount(r.count)}</td>
+        <td class="text-right font-mono-metric text-base-content/50">${r.error ? _formatCount(r.error) : '0'}</td>
+        <td class="text-sm text-base-content/60">${Observatory.escapeHtml(r.domain)}</td>
+      </tr>`).join('');
+  }
+
+  function _renderLatency() {
+    const $tbody = document.getElementById('latency-tbody');
+    if (!$tbody) return;
+
+    const rows = _entries('retry_latency').sort((a, b) => b.max_ms - a.max_ms);
+    if (rows.length === 0) {
+      $tbody.innerHTML = '<tr><td colspan="5" class="text-center text-base-content/50 py-4">No conflict retries recorded.</td></tr>';
+      return;
+    }
+
+    $tbody.innerHTML = rows.map(r => `<tr class="hover">
+        <td class="font-medium">${Observatory.escapeHtml(r.aggregate)}</td>
+        <td class="text-right font-mono-metric">${Observatory.fmt.number(r.retries)}</td>
+        <td class="text-right font-mono-metric">${Observatory.fmt.duration(r.mean_ms)}</td>
+        <td class="text-right font-mono-metric">${Observatory.fmt.duration(r.max_ms)}</td>
+        <td class="text-sm text-base-content/60">${Observatory.escapeHtml(r.domain)}</td>
+      </tr>`).join('');
+  }
+
+  function _updateSummary() {
+    const el = (id, val) => {
+      const e = document.getElementById(id);
+      if (e) e.textContent = val;
+    };
+    const sum = key => _entries(key).reduce((total, r) => total + r.count, 0);
+    const maxRetry = _entries('retry_latency').reduce((m, r) => Math.max(m, r.max_ms), 0);
+    const workers = new Set();
+    for (const merged of Object.values(_domains)) {
+      (merged.workers || []).forEach(w => workers.add(w));
+    }
+
+    el('summary-conflicts', Observatory.fmt.number(sum('conflicts')));
+    el('summary-reloads', Observatory.fmt.number(sum('reloads')));
+    el('summary-max-retry', maxRetry ? Observatory.fmt.duration(maxRetry) : '--');
+    el('summary-workers', workers.size);
+  }
+
+  // ---------------------------------------------------------------------------
+  // Data Loading
+  // ---------------------------------------------------------------------------
+
+  function _onDataLoaded(data) {
+    if (!data) return;
+    _domains = data.domains || {};
+    _updateSummary();
+    _renderHot();
+    _renderLatency();
+  }
+
+  // ---------------------------------------------------------------------------
+  // Event Binding
+  // ---------------------------------------------------------------------------
+
+  function _bindEvents() {
+    document.querySelectorAll('#sketch-tabs [data-sketch]').forEach(tab => {
+      tab.addEventListener('click', () => {
+        document.querySelectorAll('#sketch-tabs .tab').forEach(t => t.classList.remove('tab-active'));
+        tab.classList.add('tab-active');
+        _sketch = tab.getAttribute('data-sketch');
+        _renderHot();
+      });
+    });
+  }
+
+  // ---------------------------------------------------------------------------
+  // Init
+  // ---------------------------------------------------------------------------
+
+  function init() {
+    _bindEvents();
+
+    // Register poller for contention data (10s — snapshots publish every 10s)
+    Observatory.poller.register('contention', '/api/contention', 10000, _onDataLoaded);
+  }
+
+  // Wait for DOM
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
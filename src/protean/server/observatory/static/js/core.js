@@ -69,6 +69,15 @@ const Observatory = (() => {
         }
       });
 
+      _eventSource.addEventListener('dropped', (event) => {
+        // The server dropped events this client was too slow to receive
+        try {
+          console.warn('SSE events dropped:', JSON.parse(event.data));
+        } catch (e) {
+          // Ignore malformed markers
+        }
+      });
+
       _eventSource.addEventListener('error', (event) => {
         try {
           const data = JSON.parse(event.data);
@@ -386,6 +395,7 @@ const Observatory = (() => {
     't': '/timeline',
     'i': '/infrastructure',
     'm': '/messages',
+    'c': '/contention',
     'd': '/domain',
   };
 
@@ -0,0 +1,353 @@
+"""In-memory index of recent event store messages for the Observatory timeline.
+
+The timeline routes answer questions about recent activity: the latest
+page of events, a message by id, a correlation chain, an aggregate's
+history. Reading ``$all`` from the event store on every request makes each
+of those a full scan. :class:`TimelineIndex` instead tails ``$all`` from
+the last global position it has seen, keeps a bounded window of recent
+messages in arrival order, and maintains inverted indexes over it:
+
+- message id -> message
+- correlation id, stream, stream category and message type -> messages
+
+The first read starts ``capacity`` positions behind the head of ``$all``
+rather than at its beginning. When the window is full, the oldest message
+is evicted from the window and every index. A daemon thread polls the
+store while the Observatory runs; without it,
+:meth:`TimelineIndex.ensure_fresh` catches up on demand.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from protean.server.observatory.timeline_messages import (
+    TimelineStats,
+    domain_from_stream,
+    extract_correlation_id,
+    extract_event_type,
+    extract_message_id,
+    extract_stream_category,
+    is_snapshot,
+    unique_store_domains,
+)
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMELINE_CAPACITY = 100_000
+DEFAULT_TIMELINE_POLL_INTERVAL = 1.0
+DEFAULT_TIMELINE_BATCH_SIZE = 1000
+
+
+class IndexedMessage(NamedTuple):
+    """A raw message held by the index."""
+
+    message: dict[str, Any]
+    domain_name: str  # Domain owning the stream, derived from its prefix
+    source: Any  # Domain whose event store the message was read from
+
+
+class _Window:
+    """Append-only list of entries whose head advances as entries are evicted.
+
+    Readers take :meth:`view` under the index lock and slice it after
+    releasing the lock. That is safe because the backing list is never
+    shrunk or overwritten in place: appends land past the view, eviction
+    only moves ``head``, and compaction rebinds ``items`` to a new list.
+    """
+
+    __slots__ = ("items", "head")
+
+    def __init__(self) -> None:
+        self.items: list[IndexedMessage] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.items) - self.head
+
+    def append(self, entry: IndexedMessage) -> None:
+        self.items.append(entry)
+
+    def first(self) -> IndexedMessage | None:
+        return self.items[self.head] if len(self) else None
+
+    def popleft(self) -> IndexedMessage:
+        entry = self.items[self.head]
+        self.head += 1
+        # Compact once evicted entries make up half the list
+        if self.head * 2 >= len(self.items):
+            self.items = self.items[self.head :]
+            self.head = 0
+        return entry
+
+    def view(self) -> tuple[list[IndexedMessage], int, int]:
+        return self.items, self.head, len(self.items)
+
+
+_EMPTY_VIEW: tuple[list[IndexedMessage], int, int] = ([], 0, 0)
+
+
+def _pairs(
+    view: tuple[list[IndexedMessage], int, int],
+) -> list[tuple[dict[str, Any], str]]:
+    items, start, stop = view
+    return [(entry.message, entry.domain_name) for entry in items[start:stop]]
+
+
+class TimelineIndex:
+    """Bounded, incrementally updated index of the ``$all`` stream.
+
+    Args:
+        domains: Domains to tail. Domains sharing an event store are read once.
+        capacity: Maximum number of messages kept in the window.
+        poll_interval: Seconds between polls of the tailer thread.
+        batch_size: Messages read from the store per request.
+    """
+
+    def __init__(
+        self,
+        domains: list[Domain],
+        capacity: int = DEFAULT_TIMELINE_CAPACITY,
+        poll_interval: float = DEFAULT_TIMELINE_POLL_INTERVAL,
+        batch_size: int = DEFAULT_TIMELINE_BATCH_SIZE,
+    ) -> None:
+        self.domains = domains
+        self.capacity = max(1, int(capacity))
+        self.poll_interval = poll_interval
+        self.batch_size = max(1, int(batch_size))
+
+        # Next global position to read, per source domain
+        self._sources: Optional[list[Domain]] = None
+        self._positions: dict[int, int] = {}
+
+        self._entries = _Window()
+        self._by_id: dict[str, IndexedMessage] = {}
+        self._by_correlation: dict[str, _Window] = {}
+        self._by_stream: dict[str, _Window] = {}
+        self._by_category: dict[str, _Window] = {}
+        self._by_type: dict[str, _Window] = {}
+        self._stats = TimelineStats()
+        self.evicted = 0
+        # Whether messages older than the window were skipped on the first read
+        self.truncated = False
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._tailer: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Tailing
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the tailer thread. No-op when already running."""
+        if self._tailer is not None and self._tailer.is_alive():
+            return
+        self._stopping.clear()
+        self._tailer = threading.Thread(
+            target=self._run, name="protean-timeline-tailer", daemon=True
+        )
+        self._tailer.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the tailer thread."""
+        tailer = self._tailer
+        if tailer is None:
+            return
+        self._stopping.set()
+        tailer.join(timeout)
+        self._tailer = None
+
+    @property
+    def tailing(self) -> bool:
+        return self._tailer is not None and self._tailer.is_alive()
+
+    def ensure_fresh(self) -> None:
+        """Catch up with the store unless the tailer thread keeps the index current."""
+        if not self.tailing:
+            self.refresh()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.refresh()
+            self._stopping.wait(self.poll_interval)
+
+    def refresh(self) -> int:
+        """Read messages appended since the last refresh into the index.
+
+        Returns:
+            The number of messages read.
+        """
+        with self._refresh_lock:
+            if self._sources is None:
+                self._sources = unique_store_domains(self.domains)
+
+            read = 0
+            for source in self._sources:
+                try:
+                    read += self._catch_up(source)
+                except Exception:
+                    logger.debug(
+                        "Failed to tail events from %s", source.name, exc_info=True
+                    )
+            return read
+
+    def _catch_up(self, source: Domain) -> int:
+        read = 0
+        with source.domain_context():
+            store = source.event_store.store
+            if id(source) not in self._positions:
+                self._positions[id(source)] = self._start_position(store)
+            while True:
+                position = self._positions[id(source)]
+                batch = store._read(
+                    "$all", position=position, no_of_messages=self.batch_size
+                )
+                if not batch:
+                    break
+
+                with self._lock:
+                    for msg in batch:
+                        self._add(msg, source)
+
+                last_position = batch[-1].get("global_position")
+                self._positions[id(source)] = (
+                    last_position + 1
+                    if last_position is not None
+                    else position + len(batch)
+                )
+                read += len(batch)
+                if len(batch) < self.batch_size:
+                    break
+        return read
+
+    def _start_position(self, store: Any) -> int:
+        """Position of the oldest message that fits in the window.
+
+        The first catch-up reads only the last ``capacity`` positions of
+        ``$all`` instead of the whole store; older messages are never
+        indexed, so the window is marked truncated when any exist.
+        """
+        head = store.stream_head_position("$all")
+        start = max(0, head - self.capacity + 1)
+        if start:
+            oldest = store._read("$all", position=0, no_of_messages=1)
+            if oldest and oldest[0].get("global_position", start) < start:
+                self.truncated = True
+        return start
+
+    def _add(self, msg: dict[str, Any], source: Domain) -> None:
+        if is_snapshot(msg):
+            return
+
+        stream = msg.get("stream_name", "")
+        entry = IndexedMessage(msg, domain_from_stream(stream) or source.name, source)
+        self._entries.append(entry)
+        self._stats.add(msg)
+
+        message_id = extract_message_id(msg)
+        if message_id:
+            self._by_id[message_id] = entry
+        for index, key in self._keys(entry):
+            index.setdefault(key, _Window()).append(entry)
+
+        if len(self._entries) > self.capacity:
+            self._evict()
+
+    def _evict(self) -> None:
+        oldest = self._entries.popleft()
+        self.evicted += 1
+        first = self._entries.first()
+        self._stats.discard(oldest.message, first.message if first else None)
+
+        message_id = extract_message_id(oldest.message)
+        if message_id and self._by_id.get(message_id) is oldest:
+            del self._by_id[message_id]
+        # Entries join every index in arrival order, so the oldest entry
+        # is at the head of each of its index lists
+        for index, key in self._keys(oldest):
+            entries = index[key]
+            entries.popleft()
+            if not entries:
+                del index[key]
+
+    def _keys(self, entry: IndexedMessage) -> list[tuple[dict, str]]:
+        msg = entry.message
+        keys = [
+            (self._by_correlation, extract_correlation_id(msg)),
+            (self._by_stream, msg.get("stream_name")),
+            (self._by_category, extract_stream_category(msg)),
+            (self._by_type, extract_event_type(msg)),
+        ]
+        return [(index, key) for index, key in keys if key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def complete(self) -> bool:
+        """Whether the window holds every message in the tailed stores."""
+        return self.evicted == 0 and not self.truncated
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def events(
+        self,
+        *,
+        stream_category: str | None = None,
+        event_type: str | None = None,
+    ) -> list[tuple[dict[str, Any], str]]:
+        """Return ``(raw_msg, domain_name)`` pairs, narrowed by the given filters.
+
+        Callers still apply every filter; the indexes only shrink the
+        candidates they have to look at. Only the bounds of the candidates
+        are taken under the lock; they are copied after it is released.
+        """
+        empty = _Window()
+        with self._lock:
+            candidates = self._entries
+            if stream_category:
+                candidates = self._by_category.get(stream_category, empty)
+            if event_type:
+                by_type = self._by_type.get(event_type, empty)
+                if len(by_type) < len(candidates):
+                    candidates = by_type
+            view = candidates.view()
+        return _pairs(view)
+
+    def find(self, message_id: str) -> IndexedMessage | None:
+        with self._lock:
+            return self._by_id.get(message_id)
+
+    def stream(self, stream_name: str) -> list[IndexedMessage]:
+        return self._slice(self._by_stream, stream_name)
+
+    def correlation_group(self, correlation_id: str) -> list[IndexedMessage]:
+        return self._slice(self._by_correlation, correlation_id)
+
+    def correlation_groups(self) -> dict[str, list[tuple[dict[str, Any], str]]]:
+        """Return every correlation chain in the window as ``(raw_msg, domain_name)`` lists."""
+        with self._lock:
+            views = {
+                correlation_id: group.view()
+                for correlation_id, group in self._by_correlation.items()
+            }
+        return {correlation_id: _pairs(view) for correlation_id, view in views.items()}
+
+    def _slice(self, index: dict[str, _Window], key: str) -> list[IndexedMessage]:
+        with self._lock:
+            window = index.get(key)
+            items, start, stop = window.view() if window is not None else _EMPTY_VIEW
+        return items[start:stop]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return self._stats.as_dict(len(self._by_stream))
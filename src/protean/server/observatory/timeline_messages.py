@@ -0,0 +1,186 @@
+"""Helpers for reading raw event store messages on the Observatory timeline.
+
+Shared by the timeline routes, which scan ``$all`` on demand, and
+:class:`~protean.server.observatory.timeline_index.TimelineIndex`, which
+tails it into memory.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+
+def unique_store_domains(domains: list[Domain]) -> list[Domain]:
+    """Return a deduplicated list of domains, one per unique event store instance.
+
+    When multiple domains share the same event store (common in multi-bounded-context
+    apps using a single database), reading ``$all`` from each would return duplicate
+    messages.  This helper keeps only the first domain for each distinct store,
+    comparing by connection URI rather than object identity (each domain creates
+    its own store instance even when they share the same database).
+    """
+    seen_stores: set[str] = set()
+    unique: list[Domain] = []
+    for domain in domains:
+        try:
+            store = domain.event_store.store
+            # Use the database URI as the identity key — object identity
+            # doesn't work because each domain creates its own store instance.
+            store_key = (
+                store.conn_info.get("database_uri", "")
+                if hasattr(store, "conn_info")
+                else ""
+            )
+            if not store_key:
+                store_key = str(id(store))  # Fallback for stores without conn_info
+        except Exception:
+            store_key = str(id(domain))  # Fallback — treat as unique
+        if store_key not in seen_stores:
+            seen_stores.add(store_key)
+            unique.append(domain)
+    return unique
+
+
+def domain_from_stream(stream: str | None) -> str | None:
+    """Extract the domain name from a Protean stream name.
+
+    Protean stream names are domain-qualified and use ``::`` to separate the
+    domain from the remainder of the stream identifier. Common formats emitted
+    by Protean include:
+
+    - Aggregate/event streams: ``<domain>::<aggregate>-<id>``
+      (for example ``fulfillment::fulfillment-305d2c42``)
+    - Command streams: ``<domain>::<aggregate>:command-<id>``
+    - Fact streams: ``<domain>::<aggregate>-fact-<id>``
+
+    This helper returns the portion before ``::`` for any of these variants,
+    or ``None`` if the stream is empty or doesn't contain the separator.
+    """
+    if not stream or "::" not in stream:
+        return None
+    return stream.split("::")[0]
+
+
+def is_snapshot(msg: dict[str, Any]) -> bool:
+    """Whether a raw message is an aggregate snapshot, hidden from the timeline."""
+    return ":snapshot-" in msg.get("stream_name", "") or msg.get("type") == "SNAPSHOT"
+
+
+def extract_message_id(msg: dict[str, Any]) -> str | None:
+    """Extract the Protean message ID (headers.id) from a raw message dict."""
+    metadata = msg.get("metadata")
+    if not metadata or not isinstance(metadata, dict):
+        return None
+    headers = metadata.get("headers")
+    if not headers or not isinstance(headers, dict):
+        return None
+    return headers.get("id")
+
+
+def extract_correlation_id(msg: dict[str, Any]) -> str | None:
+    """Extract correlation_id from a raw message dict."""
+    metadata = msg.get("metadata")
+    if not metadata or not isinstance(metadata, dict):
+        return None
+    domain_meta = metadata.get("domain")
+    if not domain_meta or not isinstance(domain_meta, dict):
+        return None
+    return domain_meta.get("correlation_id")
+
+
+def extract_stream_category(msg: dict[str, Any]) -> str:
+    """Extract the stream category from a raw message."""
+    metadata = msg.get("metadata", {})
+    if isinstance(metadata, dict):
+        domain_meta = metadata.get("domain", {})
+        if isinstance(domain_meta, dict):
+            cat = domain_meta.get("stream_category")
+            if cat:
+                return cat
+
+    stream = msg.get("stream_name", "")
+    if stream:
+        category, _, _ = stream.partition("-")
+        return category
+    return ""
+
+
+def extract_event_type(msg: dict[str, Any]) -> str | None:
+    """Extract the event type from a raw message."""
+    return msg.get("type")
+
+
+def _message_datetime(msg: dict[str, Any]) -> datetime | None:
+    raw_time = msg.get("time")
+    if isinstance(raw_time, datetime):
+        return raw_time
+    if raw_time and isinstance(raw_time, str):
+        try:
+            return datetime.fromisoformat(raw_time)
+        except (ValueError, TypeError):
+            return None
+    return None
+
+
+class TimelineStats:
+    """Running totals behind ``/timeline/stats``, fed one message at a time."""
+
+    def __init__(self) -> None:
+        self.total_events = 0
+        self.last_event_time: str | None = None
+        self.last_event_datetime: datetime | None = None
+        self.first_event_datetime: datetime | None = None
+
+    def add(self, msg: dict[str, Any]) -> None:
+        self.total_events += 1
+
+        raw_time = msg.get("time")
+        msg_dt = _message_datetime(msg)
+        if msg_dt is None:
+            return
+
+        if self.last_event_datetime is None or msg_dt > self.last_event_datetime:
+            self.last_event_datetime = msg_dt
+            self.last_event_time = (
+                raw_time.isoformat()
+                if hasattr(raw_time, "isoformat")
+                else str(raw_time)
+            )
+
+        if self.first_event_datetime is None or msg_dt < self.first_event_datetime:
+            self.first_event_datetime = msg_dt
+
+    def discard(self, msg: dict[str, Any], oldest: dict[str, Any] | None) -> None:
+        """Take an evicted message out of the totals.
+
+        ``oldest`` is the message now at the head of the window. Messages
+        arrive in time order, so its time becomes the first event time.
+        """
+        self.total_events -= 1
+        self.first_event_datetime = _message_datetime(oldest) if oldest else None
+
+    def as_dict(self, active_streams: int) -> dict[str, Any]:
+        # Calculate events per minute
+        events_per_minute: float | None = None
+        if (
+            self.first_event_datetime
+            and self.last_event_datetime
+            and self.total_events > 1
+        ):
+            # Normalize both to comparable datetimes
+            first = self.first_event_datetime.replace(tzinfo=None)
+            last = self.last_event_datetime.replace(tzinfo=None)
+            duration = (last - first).total_seconds()
+            if duration > 0:
+                events_per_minute = round(self.total_events / (duration / 60), 2)
+
+        return {
+            "total_events": self.total_events,
+            "last_event_time": self.last_event_time,
+            "active_streams": active_streams,
+            "events_per_minute": events_per_minute,
+        }
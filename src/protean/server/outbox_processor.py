@@ -124,6 +124,9 @@ class OutboxProcessor(BaseSubscription):
 
         self.tick_count = 0
 
+        # Ids of claimed messages not processed yet, released on drain
+        self._unprocessed: set[str] = set()
+
         # Will be initialized in initialize() method
         self.subscriber_name: Optional[str] = None
         self.broker: Optional[BaseBroker] = None
@@ -202,6 +205,7 @@ class OutboxProcessor(BaseSubscription):
             target_broker,
         )
         if messages:
+            self._unprocessed = {message.id for message in messages}
             logger.debug(
                 "outbox.batch_fetched",
                 extra={"count": len(messages)},
@@ -256,6 +260,7 @@ class OutboxProcessor(BaseSubscription):
 
             for message in messages:
                 success = await self._process_single_message(message)
+                self._unprocessed.discard(message.id)
                 if success:
                     successful_count += 1
                 # Yield control after each message for better interleaving
@@ -284,10 +289,14 @@ class OutboxProcessor(BaseSubscription):
         any work — doubling on empty polls (up to ``max_tick_interval``) and
         resetting to the base interval whenever a non-empty batch is fetched.
         """
-        messages = await self.get_next_batch_of_messages()
+        async with self.admission_slot() as slot, self.in_flight():
+            messages = await self.get_next_batch_of_messages()
+            slot.admit(len(messages) if messages else 0)
+            if messages:
+                await self.process_batch(messages)
+
         if messages:
             self.tick_interval = self._base_tick_interval
-            await self.process_batch(messages)
         elif self.max_tick_interval > self._base_tick_interval:
             # Double the wait, capped at the configured maximum.
             self.tick_interval = min(self.tick_interval * 2, self.max_tick_interval)
@@ -548,17 +557,45 @@ class OutboxProcessor(BaseSubscription):
         """
         Perform cleanup tasks during shutdown.
 
-        This method handles any necessary cleanup when the processor is shutting down.
+        With drain handoff on, claimed messages the processor did not get to
+        before its drain timeout are returned to ``PENDING``, so another
+        processor can claim them without waiting for their lock to expire.
         """
+        released = 0
+        if self._unprocessed and self.outbox_repo and self.drain_policy.handoff:
+            released = self._release_unprocessed()
+
         logger.debug(
             "outbox.cleanup",
             extra={
                 "database_provider": self.database_provider_name,
                 "broker_provider": self.broker_provider_name,
+                "released": released,
             },
         )
-        # Any cleanup specific to outbox processor can be added here
-        pass
+
+    def _release_unprocessed(self) -> int:
+        """Release this processor's claim on messages it has not processed.
+
+        Returns:
+            int: The number of messages released.
+        """
+        released = 0
+        with self.engine.domain.domain_context():
+            for message_id in list(self._unprocessed):
+                try:
+                    with UnitOfWork():
+                        message = self.outbox_repo.get(message_id)
+                        if message.release(self.worker_id):
+                            self.outbox_repo.add(message)
+                            released += 1
+                except Exception:
+                    logger.exception(
+                        "outbox.release_failed",
+                        extra={"message_id": str(message_id)[:8]},
+                    )
+        self._unprocessed.clear()
+        return released
 
     def _mark_message_failed(self, message: Outbox, error: Exception) -> None:
         """
@@ -0,0 +1,494 @@
+"""Sampling profiler that attributes handler time for the Protean Engine.
+
+Spans and traces record how long each message took, but not where the time
+went inside the handler. ``HandlerProfiler`` fills that gap without a
+tracing profiler's overhead:
+
+- ``Engine.handle_message`` wraps each handler call in ``profile()``, which
+  accumulates call count, wall time and CPU time (``time.thread_time``) per
+  handler class and message type.
+- A daemon thread wakes every ``interval`` seconds, reads the stack of each
+  thread currently inside a handler via ``sys._current_frames()``, and
+  counts the stack against the handler and message type. Frames above the
+  handler boundary (the engine and event loop) are cut off.
+- Every ``publish_interval`` seconds the aggregates are written as a JSON
+  snapshot to Redis under ``protean:profile:<domain>:<worker>``, with a TTL
+  so snapshots of stopped workers expire on their own.
+
+Aggregates are cumulative since the profiler started, so any two snapshots
+can be subtracted to get the profile of the window between them. That is
+what ``protean profile`` does. The Observatory ``/api/profile`` endpoint
+merges the snapshots of all live workers and renders them as a flame graph
+tree (``{"name", "value", "children"}``).
+
+Disabled by default. When disabled, ``profile()`` returns a shared no-op
+context manager and no thread is started.
+"""
+
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for published profile snapshots
+PROFILE_KEY_PREFIX = "protean:profile"
+
+DEFAULT_PROFILE_INTERVAL_MS = 10
+DEFAULT_PROFILE_PUBLISH_INTERVAL = 5.0
+DEFAULT_PROFILE_MAX_DEPTH = 64
+DEFAULT_PROFILE_MAX_STACKS = 5_000
+
+# Frame label used once ``max_stacks`` distinct stacks have been recorded
+_TRUNCATED_FRAME = "[truncated]"
+
+_NULL_CONTEXT = nullcontext()
+
+
+def profile_key(domain_name: str, worker: str) -> str:
+    """Redis key holding one worker's snapshot."""
+    return f"{PROFILE_KEY_PREFIX}:{domain_name}:{worker}"
+
+
+def _frame_label(frame: Any) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    path = code.co_filename.replace(os.sep, "/").rsplit("/", 2)
+    return f"{name} ({'/'.join(path[-2:])}:{code.co_firstlineno})"
+
+
+class _HandlerCall:
+    """Context manager timing one handler call on the current thread."""
+
+    __slots__ = ("_profiler", "_key", "_wall", "_cpu", "_thread")
+
+    def __init__(self, profiler: "HandlerProfiler", key: tuple[str, str]) -> None:
+        self._profiler = profiler
+        self._key = key
+
+    def __enter__(self) -> "_HandlerCall":
+        self._thread = threading.get_ident()
+        # The caller's frame marks where handler stacks are cut off
+        self._profiler._active[self._thread] = (self._key, sys._getframe(1))
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        self._profiler._active.pop(self._thread, None)
+        self._profiler._record_call(self._key, wall, cpu)
+
+
+class HandlerProfiler:
+    """Per-handler wall/CPU accounting plus background stack sampling.
+
+    Args:
+        domain: The domain whose broker Redis connection receives snapshots.
+        enabled: Whether profiling is on. When ``False`` every method is a
+            no-op.
+        interval: Seconds between stack samples.
+        publish_interval: Seconds between snapshots published to Redis.
+        max_depth: Maximum frames kept per sampled stack, counted from the
+            handler boundary.
+        max_stacks: Maximum distinct stacks kept. Samples of further stacks
+            are folded into a single ``[truncated]`` frame per handler.
+        worker: Identifier of this worker in published snapshots. Defaults
+            to ``<hostname>-<pid>``.
+    """
+
+    def __init__(
+        self,
+        domain: Any,
+        *,
+        enabled: bool = False,
+        interval: float = DEFAULT_PROFILE_INTERVAL_MS / 1000,
+        publish_interval: float = DEFAULT_PROFILE_PUBLISH_INTERVAL,
+        max_depth: int = DEFAULT_PROFILE_MAX_DEPTH,
+        max_stacks: int = DEFAULT_PROFILE_MAX_STACKS,
+        worker: Optional[str] = None,
+    ) -> None:
+        self._domain = domain
+        self._domain_name = domain.name
+        self.enabled = enabled
+        self.interval = interval
+        self.publish_interval = publish_interval
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+        self.worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+
+        # thread id -> ((handler, message_type), boundary frame)
+        self._active: dict[int, tuple[tuple[str, str], Any]] = {}
+        # (handler, message_type) -> [count, wall seconds, cpu seconds]
+        self._calls: dict[tuple[str, str], list] = {}
+        # (handler, message_type, frames) -> samples
+        self._stacks: dict[tuple[str, str, tuple[str, ...]], int] = {}
+        self._samples = 0
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+
+        self._redis = None
+        self._redis_initialized = False
+        self._sampler: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @classmethod
+    def from_config(cls, domain: Any) -> "HandlerProfiler":
+        """Build a profiler from the ``server.profiling`` config section.
+
+        Invalid values fall back to the defaults rather than failing engine
+        startup.
+        """
+        try:
+            config = domain.config.get("server", {}).get("profiling", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+
+        def _get(key: str, default: Any, cast: Any) -> Any:
+            value = config.get(key, default)
+            try:
+                return cast(value) if value is not None else default
+            except (TypeError, ValueError):
+                return default
+
+        return cls(
+            domain,
+            enabled=bool(config.get("enabled", False)),
+            interval=_get("interval_ms", DEFAULT_PROFILE_INTERVAL_MS, float) / 1000,
+            publish_interval=_get(
+                "publish_interval_seconds", DEFAULT_PROFILE_PUBLISH_INTERVAL, float
+            ),
+            max_depth=_get("max_stack_depth", DEFAULT_PROFILE_MAX_DEPTH, int),
+            max_stacks=_get("max_stacks", DEFAULT_PROFILE_MAX_STACKS, int),
+        )
+
+    # ------------------------------------------------------------------
+    # Hot path
+    # ------------------------------------------------------------------
+
+    def profile(self, handler: str, message_type: str) -> Any:
+        """Return a context manager that profiles one handler call."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _HandlerCall(self, (handler, message_type))
+
+    def _record_call(self, key: tuple[str, str], wall: float, cpu: float) -> None:
+        with self._lock:
+            totals = self._calls.get(key)
+            if totals is None:
+                self._calls[key] = [1, wall, cpu]
+            else:
+                totals[0] += 1
+                totals[1] += wall
+                totals[2] += cpu
+
+    # ------------------------------------------------------------------
+    # Sampling thread
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the sampling thread. No-op when disabled or already running."""
+        if not self.enabled or (self._sampler and self._sampler.is_alive()):
+            return
+        self._stopping.clear()
+        self._sampler = threading.Thread(
+            target=self._run,
+            name=f"protean-profiler-{self._domain_name}",
+            daemon=True,
+        )
+        self._sampler.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop sampling and publish a final snapshot."""
+        sampler = self._sampler
+        if sampler is None:
+            return
+        self._stopping.set()
+        sampler.join(timeout)
+        self._sampler = None
+
+    def _run(self) -> None:
+        next_publish = time.monotonic() + self.publish_interval
+        while not self._stopping.wait(self.interval):
+            try:
+                self.sample()
+                if time.monotonic() >= next_publish:
+                    next_publish = time.monotonic() + self.publish_interval
+                    self.publish()
+            except Exception:
+                # Never let profiling failures affect message processing
+                logger.debug("Profiler sampling failed", exc_info=True)
+        self.publish()
+
+    def sample(self) -> None:
+        """Record the current stack of every thread inside a handler."""
+        if not self._active:
+            return
+
+        frames = sys._current_frames()
+        for thread_id, (key, boundary) in list(self._active.items()):
+            frame = frames.get(thread_id)
+            labels: list[str] = []
+            while (
+                frame is not None
+                and frame is not boundary
+                and len(labels) < self.max_depth
+            ):
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.reverse()
+            self._record_stack(key, tuple(labels))
+
+    def _record_stack(self, key: tuple[str, str], labels: tuple[str, ...]) -> None:
+        stack_key = (key[0], key[1], labels)
+        with self._lock:
+            self._samples += 1
+            if stack_key not in self._stacks and len(self._stacks) >= self.max_stacks:
+                stack_key = (key[0], key[1], (_TRUNCATED_FRAME,))
+            self._stacks[stack_key] = self._stacks.get(stack_key, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the cumulative aggregates as a JSON-safe dict."""
+        with self._lock:
+            calls = [
+                {
+                    "handler": handler,
+                    "message_type": message_type,
+                    "count": count,
+                    "wall_ms": wall * 1000,
+                    "cpu_ms": cpu * 1000,
+                }
+                for (handler, message_type), (count, wall, cpu) in self._calls.items()
+            ]
+            stacks = [
+                {
+                    "handler": handler,
+                    "message_type": message_type,
+                    "frames": list(frames),
+                    "samples": samples,
+                }
+                for (handler, message_type, frames), samples in self._stacks.items()
+            ]
+            samples = self._samples
+
+        return {
+            "domain": self._domain_name,
+            "worker": self.worker,
+            "interval_ms": self.interval * 1000,
+            "started_at": self._started_at,
+            "captured_at": time.time(),
+            "samples": samples,
+            "calls": calls,
+            "stacks": stacks,
+        }
+
+    def reset(self) -> None:
+        """Discard all aggregates collected so far."""
+        with self._lock:
+            self._calls.clear()
+            self._stacks.clear()
+            self._samples = 0
+            self._started_at = time.time()
+
+    def publish(self) -> None:
+        """Write the current snapshot to Redis, if a Redis broker is available."""
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            redis.set(
+                profile_key(self._domain_name, self.worker),
+                json.dumps(self.snapshot()),
+                ex=max(int(self.publish_interval * 3), 1),
+            )
+        except Exception:
+            logger.debug("Profiler publish failed", exc_info=True)
+
+    def _get_redis(self) -> Any:
+        if not self._redis_initialized:
+            self._redis_initialized = True
+            try:
+                broker = self._domain.brokers.get("default")
+                if broker and hasattr(broker, "redis_instance"):
+                    self._redis = broker.redis_instance
+            except Exception:
+                logger.debug("Profiler: Redis not available", exc_info=True)
+        return self._redis
+
+
+# ----------------------------------------------------------------------
+# Snapshot arithmetic and rendering
+# ----------------------------------------------------------------------
+
+
+def read_snapshots(redis: Any, domain_name: Optional[str] = None) -> list[dict]:
+    """Read the published snapshots of all live workers."""
+    pattern = profile_key(domain_name or "*", "*")
+    snapshots = []
+    for key in redis.scan_iter(match=pattern, count=200):
+        raw = redis.get(key)
+        if not raw:
+            continue
+        try:
+            snapshots.append(json.loads(raw))
+        except (TypeError, ValueError):
+            logger.debug("Skipping malformed profile snapshot %s", key)
+    return snapshots
+
+
+def merge_snapshots(snapshots: Iterable[dict]) -> dict[str, Any]:
+    """Sum the calls and stacks of several snapshots."""
+    calls: dict[tuple, list] = {}
+    stacks: dict[tuple, int] = {}
+    samples = 0
+    workers = []
+
+    for snapshot in snapshots:
+        workers.append(snapshot.get("worker"))
+        samples += snapshot.get("samples", 0)
+        for call in snapshot.get("calls", []):
+            key = (call["handler"], call["message_type"])
+            totals = calls.setdefault(key, [0, 0.0, 0.0])
+            totals[0] += call["count"]
+            totals[1] += call["wall_ms"]
+            totals[2] += call["cpu_ms"]
+        for stack in snapshot.get("stacks", []):
+            key = (stack["handler"], stack["message_type"], tuple(stack["frames"]))
+            stacks[key] = stacks.get(key, 0) + stack["samples"]
+
+    return _build_snapshot(calls, stacks, samples, workers=workers)
+
+
+def diff_snapshots(before: dict, after: dict) -> dict[str, Any]:
+    """Return what ``after`` recorded beyond ``before``.
+
+    Both snapshots must come from the same workers. Entries that did not
+    grow are dropped.
+    """
+    calls: dict[tuple, list] = {}
+    for call in after.get("calls", []):
+        key = (call["handler"], call["message_type"])
+        calls[key] = [call["count"], call["wall_ms"], call["cpu_ms"]]
+    for call in before.get("calls", []):
+        key = (call["handler"], call["message_type"])
+        if key in calls:
+            totals = calls[key]
+            totals[0] -= call["count"]
+            totals[1] -= call["wall_ms"]
+            totals[2] -= call["cpu_ms"]
+
+    stacks: dict[tuple, int] = {}
+    for stack in after.get("stacks", []):
+        key = (stack["handler"], stack["message_type"], tuple(stack["frames"]))
+        stacks[key] = stack["samples"]
+    for stack in before.get("stacks", []):
+        key = (stack["handler"], stack["message_type"], tuple(stack["frames"]))
+        if key in stacks:
+            stacks[key] -= stack["samples"]
+
+    calls = {key: totals for key, totals in calls.items() if totals[0] > 0}
+    stacks = {key: samples for key, samples in stacks.items() if samples > 0}
+    samples = after.get("samples", 0) - before.get("samples", 0)
+    return _build_snapshot(calls, stacks, samples, workers=after.get("workers"))
+
+
+def _build_snapshot(
+    calls: dict[tuple, list],
+    stacks: dict[tuple, int],
+    samples: int,
+    workers: Optional[list] = None,
+) -> dict[str, Any]:
+    return {
+        "workers": workers or [],
+        "samples": samples,
+        "calls": [
+            {
+                "handler": handler,
+                "message_type": message_type,
+                "count": count,
+                "wall_ms": wall_ms,
+                "cpu_ms": cpu_ms,
+            }
+            for (handler, message_type), (count, wall_ms, cpu_ms) in calls.items()
+        ],
+        "stacks": [
+            {
+                "handler": handler,
+                "message_type": message_type,
+                "frames": list(frames),
+                "samples": count,
+            }
+            for (handler, message_type, frames), count in stacks.items()
+        ],
+    }
+
+
+def summarize(snapshot: dict) -> dict[str, dict[str, Any]]:
+    """Group call totals by handler, with a per-message-type breakdown.
+
+    Returns:
+        ``{handler: {"count", "wall_ms", "cpu_ms", "message_types":
+        {message_type: {"count", "wall_ms", "cpu_ms"}}}}``
+    """
+    handlers: dict[str, dict[str, Any]] = {}
+    for call in snapshot.get("calls", []):
+        entry = handlers.setdefault(
+            call["handler"],
+            {"count": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "message_types": {}},
+        )
+        entry["count"] += call["count"]
+        entry["wall_ms"] += call["wall_ms"]
+        entry["cpu_ms"] += call["cpu_ms"]
+        entry["message_types"][call["message_type"]] = {
+            "count": call["count"],
+            "wall_ms": call["wall_ms"],
+            "cpu_ms": call["cpu_ms"],
+        }
+    return handlers
+
+
+def to_flamegraph(snapshot: dict, handler: Optional[str] = None) -> dict[str, Any]:
+    """Render stack samples as a flame graph tree.
+
+    The tree is rooted at ``all``, then branches by handler, then by message
+    type, then by frame. Every node carries ``name``, ``value`` (samples)
+    and ``children``, the format consumed by d3-flame-graph and speedscope.
+
+    Args:
+        snapshot: A snapshot, merged snapshot, or diff.
+        handler: When given, only that handler's stacks are included.
+    """
+    root: dict[str, Any] = {"name": "all", "value": 0, "children": []}
+    index: dict[int, dict[str, dict]] = {}
+
+    def _child(node: dict, name: str) -> dict:
+        children = index.setdefault(id(node), {})
+        child = children.get(name)
+        if child is None:
+            child = {"name": name, "value": 0, "children": []}
+            children[name] = child
+            node["children"].append(child)
+        return child
+
+    for stack in snapshot.get("stacks", []):
+        if handler is not None and stack["handler"] != handler:
+            continue
+        samples = stack["samples"]
+        root["value"] += samples
+        node = root
+        for name in (stack["handler"], stack["message_type"], *stack["frames"]):
+            node = _child(node, name)
+            node["value"] += samples
+
+    return root
@@ -0,0 +1,369 @@
+"""Delayed delivery of scheduled messages and in-process timers.
+
+``domain.schedule()`` stores a command in the durable schedule store (see
+``protean.port.scheduler``). The Engine's ``ScheduledDelivery`` task turns
+those entries into deliveries:
+
+1. Every ``poll_interval`` seconds it reads the entries due within the next
+   ``horizon`` seconds, in one query, and files them on a ``TimerWheel``.
+2. Every tick it advances the wheel. Entries that fall due are leased
+   from the store, appended to their streams with one ``append_many()``
+   call, and only then removed from the store.
+
+Long delays cost nothing until they come within the horizon. Near-term
+timers fire within one tick of their due time, instead of the
+next-poll-plus-query latency of checking a table every second. When
+several workers run, all of them load the same entries; the store's
+``claim()`` leases each one to a single worker. If that worker dies
+before removing what it appended, the lease runs out and another worker
+appends the entry again, with the same message id.
+
+The wheel also runs in-process callbacks, through ``call_later()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+from protean.port.scheduler import ScheduledMessage
+from protean.utils.eventing import Message
+
+if TYPE_CHECKING:
+    from protean.server.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Hierarchical timing wheel.
+
+    Level 0 has ``slots`` slots of one ``tick`` each. Every higher level
+    has ``slots`` slots, each as wide as the whole level below it. A timer
+    is filed at the lowest level whose span covers its delay. When a lower
+    level wraps around, the next slot of the level above is cascaded
+    down. Adding and cancelling are O(1), and each tick touches only the
+    timers that are due or cascading.
+
+    Timers beyond the top level's span are parked in its farthest slot and
+    re-filed as they cascade.
+
+    Args:
+        tick: Width of a level 0 slot, in seconds.
+        slots: Slots per level. Must be a power of two.
+        levels: Number of levels.
+        now: Monotonic start time. Defaults to ``time.monotonic()``.
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.1,
+        slots: int = 64,
+        levels: int = 3,
+        now: Optional[float] = None,
+    ) -> None:
+        if tick <= 0:
+            raise ValueError(f"tick must be positive, got {tick!r}")
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError(f"slots must be a power of two, got {slots!r}")
+        if levels < 1:
+            raise ValueError(f"levels must be at least 1, got {levels!r}")
+
+        self.tick = tick
+        self._slots = slots
+        self._bits = slots.bit_length() - 1
+        self._levels: list[list[dict[Hashable, tuple[int, Any]]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._origin = time.monotonic() if now is None else now
+        self._current = 0
+        # Key -> (level, slot) where its timer is filed
+        self._index: dict[Hashable, tuple[int, int]] = {}
+        self._ready: dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._ready)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._index or key in self._ready
+
+    @property
+    def span(self) -> float:
+        """Seconds covered before timers have to be parked."""
+        return self.tick * self._slots ** len(self._levels)
+
+    def _tick_of(self, when: float) -> int:
+        return math.ceil((when - self._origin) / self.tick - 1e-9)
+
+    def _file(self, key: Hashable, expiry: int, item: Any) -> None:
+        delta = expiry - self._current
+        if delta <= 0:
+            self._ready[key] = item
+            return
+
+        top = len(self._levels) - 1
+        for level in range(top + 1):
+            if delta < self._slots ** (level + 1) or level == top:
+                break
+        if delta >= self._slots ** (level + 1):
+            # Park in the farthest slot of the top level
+            expiry_slot = self._current + self._slots**top * (self._slots - 1)
+        else:
+            expiry_slot = expiry
+        slot = (expiry_slot >> (self._bits * level)) & (self._slots - 1)
+        self._levels[level][slot][key] = (expiry, item)
+        self._index[key] = (level, slot)
+
+    def add(self, key: Hashable, when: float, item: Any) -> None:
+        """File ``item`` under ``key`` to fire at monotonic time ``when``.
+
+        Re-adding an existing key replaces its timer.
+        """
+        self.cancel(key)
+        self._file(key, self._tick_of(when), item)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Remove the timer filed under ``key``. Returns whether there was one."""
+        if self._ready.pop(key, None) is not None:
+            return True
+        position = self._index.pop(key, None)
+        if position is None:
+            return False
+        level, slot = position
+        self._levels[level][slot].pop(key, None)
+        return True
+
+    def _cascade(self, level: int) -> None:
+        """Re-file the timers of the current slot of ``level`` one level down."""
+        slot = (self._current >> (self._bits * level)) & (self._slots - 1)
+        bucket = self._levels[level][slot]
+        self._levels[level][slot] = {}
+        for key, (expiry, item) in bucket.items():
+            del self._index[key]
+            self._file(key, expiry, item)
+
+    def advance(self, now: Optional[float] = None) -> list[tuple[Hashable, Any]]:
+        """Move the wheel to ``now`` and return the ``(key, item)`` pairs due."""
+        now = time.monotonic() if now is None else now
+        target = math.floor((now - self._origin) / self.tick + 1e-9)
+        while self._current < target:
+            self._current += 1
+            # Cascade every level whose lower neighbour just wrapped around
+            for level in range(1, len(self._levels)):
+                if self._current & ((1 << (self._bits * level)) - 1):
+                    break
+                self._cascade(level)
+
+            slot = self._current & (self._slots - 1)
+            bucket = self._levels[0][slot]
+            if bucket:
+                self._levels[0][slot] = {}
+                for key, (_, item) in bucket.items():
+                    del self._index[key]
+                    self._ready[key] = item
+
+        due = list(self._ready.items())
+        self._ready.clear()
+        return due
+
+
+class ScheduledDelivery:
+    """Engine task that delivers scheduled messages and runs timers.
+
+    Attributes:
+        engine: The Protean Engine instance.
+        store: The domain's schedule store, or None when scheduling is not
+            configured. The wheel still runs ``call_later()`` callbacks.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        tick: float = 0.1,
+        slots: int = 64,
+        levels: int = 3,
+        horizon: float = 60.0,
+        poll_interval: float = 1.0,
+        batch_size: int = 500,
+        lease: float = 60.0,
+    ) -> None:
+        self.engine = engine
+        self.domain = engine.domain
+        self.store = None
+        self.wheel = TimerWheel(tick=tick, slots=slots, levels=levels)
+        self.horizon = min(horizon, self.wheel.span)
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.lease = lease
+
+        self.keep_going = True
+        self.running = False
+        self.delivered = 0
+        self._last_poll = -math.inf
+        self._callback_ids = itertools.count()
+
+    @classmethod
+    def from_config(cls, engine: Engine) -> ScheduledDelivery:
+        """Build the task from the ``scheduler`` section of the domain config."""
+        config = engine.domain.config.get("scheduler", {}) or {}
+        delivery = cls(
+            engine,
+            tick=config.get("tick_ms", 100) / 1000,
+            slots=config.get("wheel_slots", 64),
+            levels=config.get("wheel_levels", 3),
+            horizon=config.get("horizon_seconds", 60),
+            poll_interval=config.get("poll_interval_seconds", 1.0),
+            batch_size=config.get("batch_size", 500),
+            lease=config.get("lease_seconds", 60),
+        )
+        try:
+            delivery.store = engine.domain.schedule_store
+        except Exception:
+            logger.exception("scheduler.store_unavailable")
+        return delivery
+
+    @property
+    def subscriber_name(self) -> str:
+        return "scheduled-delivery"
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> Hashable:
+        """Run ``callback`` on the engine loop after ``delay`` seconds.
+
+        Returns a key that can be passed to ``cancel()``.
+        """
+        key = ("callback", next(self._callback_ids))
+        self.wheel.add(key, time.monotonic() + delay, callback)
+        return key
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel a timer created with ``call_later()``."""
+        return self.wheel.cancel(key)
+
+    async def start(self) -> None:
+        """Start the delivery loop."""
+        self.running = True
+        logger.info(
+            "scheduler.started",
+            extra={"durable": self.store is not None, "tick": self.wheel.tick},
+        )
+        loop_task = self.engine.loop.create_task(self._run())
+        loop_task.set_name("scheduled-delivery-loop")
+
+    async def _run(self) -> None:
+        """Main loop: refill the wheel from the store, then fire what is due."""
+        try:
+            while self.keep_going and not self.engine.shutting_down:
+                try:
+                    with self.domain.domain_context():
+                        await self.run_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("scheduler.cycle_failed")
+                await asyncio.sleep(self.wheel.tick)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.running = False
+
+    async def run_once(self, now: Optional[float] = None) -> int:
+        """Poll the store if due, advance the wheel, and deliver what fired.
+
+        Returns the number of scheduled messages delivered.
+        """
+        now = time.monotonic() if now is None else now
+        messages: list[ScheduledMessage] = []
+        if self.store is not None and now - self._last_poll >= self.poll_interval:
+            self._last_poll = now
+            # Entries already due skip the wheel and go out this round
+            messages.extend(await self.load_due(now))
+
+        for key, item in self.wheel.advance(now):
+            if isinstance(item, ScheduledMessage):
+                messages.append(item)
+                continue
+            try:
+                item()
+            except Exception:
+                logger.exception("scheduler.callback_failed", extra={"key": key})
+
+        delivered = 0
+        for start in range(0, len(messages), self.batch_size):
+            delivered += await asyncio.to_thread(
+                self._deliver, messages[start : start + self.batch_size]
+            )
+        return delivered
+
+    async def load_due(self, now: Optional[float] = None) -> list[ScheduledMessage]:
+        """File the store's entries due within the horizon on the wheel.
+
+        Returns the entries that are already due instead of filing them.
+        """
+        assert self.store is not None
+        now = time.monotonic() if now is None else now
+        wall_now = datetime.now(timezone.utc)
+
+        entries = await asyncio.to_thread(
+            self.store.due,
+            wall_now + timedelta(seconds=self.horizon),
+            self.batch_size,
+        )
+        overdue = []
+        for entry in entries:
+            key = ("message", entry.id)
+            if key in self.wheel:
+                continue
+            delay = (entry.deliver_at - wall_now).total_seconds()
+            if delay <= 0:
+                overdue.append(entry)
+            else:
+                self.wheel.add(key, now + delay, entry)
+        return overdue
+
+    def _deliver(self, messages: list[ScheduledMessage]) -> int:
+        """Lease ``messages``, append the ones won to their streams, and
+        remove them from the store once they are appended."""
+        assert self.store is not None
+        with self.domain.domain_context():
+            claimed = self.store.claim((message.id for message in messages), self.lease)
+            if not claimed:
+                return 0
+
+            objects, appended = [], []
+            for message in messages:
+                if message.id not in claimed:
+                    continue
+                try:
+                    objects.append(
+                        Message.deserialize(message.payload).to_domain_object()
+                    )
+                    appended.append(message.id)
+                except Exception:
+                    logger.exception(
+                        "scheduler.message_undeliverable",
+                        extra={"schedule_id": message.id, "stream": message.stream},
+                    )
+
+            try:
+                self.domain.event_store.store.append_many(objects)
+            except Exception:
+                # Nothing was removed; release the batch for a later round
+                self.store.release(appended)
+                raise
+
+            # Undeliverable entries go too, or they would be retried forever
+            self.store.remove(claimed)
+
+        self.delivered += len(objects)
+        logger.debug("scheduler.delivered", extra={"count": len(objects)})
+        return len(objects)
+
+    async def shutdown(self) -> None:
+        """Stop the delivery loop. Undelivered entries stay in the store."""
+        self.keep_going = False
+        logger.info("scheduler.shutdown")
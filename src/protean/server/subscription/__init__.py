@@ -1,6 +1,13 @@
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, asynccontextmanager
+
+from protean.server.admission import NULL_SLOT, AdmissionController
+from protean.server.deadlines import DeadlineScheduler
+from protean.server.drain import DrainPolicy
+from protean.utils.stages import STAGE_FETCH, record_stage, stage
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +43,12 @@ class BaseSubscription(ABC):
 
         self.keep_going = True  # Initially set to keep going
 
+        # The polling task, and whether it is between batches. ``shutdown()``
+        # waits for the current batch before cancelling the task.
+        self._poll_task: asyncio.Task | None = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
     async def start(self) -> None:
         """
         Start the subscription.
@@ -54,7 +67,7 @@ class BaseSubscription(ABC):
         await self.initialize()
 
         # Start the polling loop
-        self.loop.create_task(self.poll())
+        self._poll_task = self.loop.create_task(self.poll())
 
     async def poll(self) -> None:
         """
@@ -113,26 +126,155 @@ class BaseSubscription(ABC):
         Returns:
             None
         """
-        messages = await self.get_next_batch_of_messages()
+        async with self.admission_slot() as slot, self.in_flight():
+            started = time.perf_counter()
+            messages = await self.get_next_batch_of_messages()
+            self.record_fetch(started, messages)
+            slot.admit(len(messages) if messages else 0)
+            if messages:
+                await self.process_batch(messages)
+
+    def admission_slot(self):
+        """
+        Return the engine's admission slot for one fetch-and-process cycle.
+
+        Subscriptions wrap each fetch in this slot so the engine can pause
+        fetching when in-flight work, per-subscription quotas, or database
+        pool saturation hit their configured limits.
+
+        Returns:
+            An async context manager whose ``admit(count)`` records the
+            number of messages fetched.
+        """
+        admission = getattr(self.engine, "admission", None)
+        if not isinstance(admission, AdmissionController):
+            return NULL_SLOT
+        name = getattr(self, "subscriber_class_name", None) or self.subscriber_name
+        return admission.slot(name)
+
+    @asynccontextmanager
+    async def in_flight(self):
+        """
+        Mark one fetch-and-process cycle as in flight.
+
+        ``shutdown()`` waits for the cycle to finish before cancelling the
+        polling task, so a batch is not abandoned halfway through.
+        """
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._idle.set()
+
+    @property
+    def drain_policy(self) -> DrainPolicy:
+        """The engine's drain policy, or the default one."""
+        policy = getattr(self.engine, "drain", None)
+        return policy if isinstance(policy, DrainPolicy) else DrainPolicy()
+
+    @property
+    def _stage_attributes(self) -> dict[str, str]:
+        name = getattr(self, "subscriber_class_name", None) or self.subscriber_name
+        return {"handler_name": name}
+
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """
+        Time a pipeline stage of this subscription, like an ack.
+
+        Recorded in the ``protean.message.stage_duration`` histogram,
+        labelled with the subscriber name.
+        """
+        return stage(name, self.engine.domain, self._stage_attributes)
+
+    def record_fetch(self, started: float, messages) -> None:
+        """
+        Record the fetch of a batch that started at ``started``.
+
+        ``started`` is a ``time.perf_counter()`` reading. Empty fetches are
+        not recorded, so blocking reads that time out do not count as
+        fetch latency.
+        """
         if messages:
-            await self.process_batch(messages)
+            record_stage(
+                STAGE_FETCH,
+                time.perf_counter() - started,
+                self.engine.domain,
+                self._stage_attributes,
+            )
+
+    def schedule_batch(self, items, deadline_of, stream_of) -> tuple[list, list]:
+        """
+        Order a fetched batch earliest deadline first and split off expired items.
+
+        Uses the engine's ``DeadlineScheduler``. Engines without one get the
+        batch back unchanged.
+
+        Args:
+            items: The fetched batch, in arrival order.
+            deadline_of: Returns an item's deadline, or ``None``.
+            stream_of: Returns an item's stream name.
+
+        Returns:
+            A ``(ready, expired)`` tuple.
+        """
+        deadlines = getattr(self.engine, "deadlines", None)
+        if not isinstance(deadlines, DeadlineScheduler):
+            return list(items), []
+        return deadlines.schedule(items, deadline_of, stream_of)
 
     async def shutdown(self):
         """
-        Shutdown the subscription.
+        Drain and shut down the subscription.
 
-        This method signals the subscription to stop polling and performs any necessary cleanup.
+        Announces the drain with ``mark_draining()``, stops fetching, waits
+        up to the drain timeout for the in-flight batch to finish, cancels
+        the polling task, and then runs ``cleanup()`` to flush checkpoints
+        and release anything the subscription still holds.
 
         Returns:
             None
         """
+        self.mark_draining()
         self.keep_going = False  # Signal to stop polling
+
+        drained = True
+        task = self._poll_task
+        if task is not None and not task.done():
+            try:
+                await asyncio.wait_for(
+                    self._idle.wait(), self.drain_policy.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                drained = False
+                logger.warning(
+                    "subscription.drain_timeout",
+                    extra={
+                        "subscriber": self.subscriber_name,
+                        "timeout_seconds": self.drain_policy.timeout_seconds,
+                    },
+                )
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
         await self.cleanup()
         logger.info(
             "subscription.shutdown",
-            extra={"subscriber": self.subscriber_name},
+            extra={"subscriber": self.subscriber_name, "drained": drained},
         )
 
+    def mark_draining(self) -> None:
+        """
+        Announce that this subscription is scheduled to stop.
+
+        Called when the subscription starts draining, and by the engine when
+        the supervisor announces a shutdown. Backends that hand messages to
+        peers override it so peers stop choosing this consumer.
+
+        Returns:
+            None
+        """
+        pass
+
     async def initialize(self) -> None:
         """
         Perform backend-specific initialization.
@@ -11,6 +11,7 @@ from typing import Dict, Type
 from protean.core.subscriber import BaseSubscriber
 from protean.port.broker import BaseBroker
 from protean.utils import fqn
+from protean.utils.stages import STAGE_ACK
 from protean.utils.telemetry import get_domain_metrics
 
 from . import BaseSubscription
@@ -190,9 +191,10 @@ class BrokerSubscription(BaseSubscription):
 
             if is_successful:
                 # Acknowledge successful processing
-                ack_result = self.broker.ack(
-                    self.stream_name, identifier, self.subscriber_name
-                )
+                with self.stage(STAGE_ACK):
+                    ack_result = self.broker.ack(
+                        self.stream_name, identifier, self.subscriber_name
+                    )
                 if ack_result:
                     successful_count += 1
                     # Clear retry count on success
@@ -7,15 +7,21 @@ import time
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 from protean.core.command_handler import BaseCommandHandler
 from protean.core.event_handler import BaseEventHandler
 from protean.exceptions import ConfigurationError
 from protean.port.event_store import BaseEventStore
+from protean.server.deadlines import (
+    PositionWatermark,
+    message_deadline,
+    message_stream,
+)
 from protean.utils.eventing import Message, MessageType
 from protean.utils import fqn
+from protean.utils.stages import STAGE_ACK, STAGE_IDEMPOTENCY
 
 from . import BaseSubscription
 
@@ -154,6 +160,9 @@ class EventStoreSubscription(BaseSubscription):
         self.current_position: int = -1
         self.messages_since_last_position_write: int = 0
 
+        # Idempotency keys of commands handled but not yet recorded as done
+        self._unrecorded_successes: dict[str, Any] = {}
+
         # Resolve recovery configuration from domain config
         server_config = engine.domain.config.get("server", {})
         es_config = server_config.get("event_store_subscription", {})
@@ -344,26 +353,30 @@ class EventStoreSubscription(BaseSubscription):
         """
         logger.debug(f"Updating Read Position of {self.subscriber_name} to {position}")
 
+        # A written position must never pass a success that is not recorded
+        self._record_successes()
+
         self.messages_since_last_position_write = 0  # Reset counter
 
-        return await asyncio.to_thread(
-            self.store._write,
-            self.subscriber_stream_name,
-            "Read",
-            {"position": position},
-            metadata={
-                "headers": {
-                    "id": str(uuid4()),
-                    "type": "Read",
-                    "time": datetime.now(timezone.utc).isoformat(),
-                    "stream": self.subscriber_stream_name,
-                },
-                "domain": {
-                    "kind": MessageType.READ_POSITION.value,
-                    "origin_stream": self.stream_category,
+        with self.stage(STAGE_ACK):
+            return await asyncio.to_thread(
+                self.store._write,
+                self.subscriber_stream_name,
+                "Read",
+                {"position": position},
+                metadata={
+                    "headers": {
+                        "id": str(uuid4()),
+                        "type": "Read",
+                        "time": datetime.now(timezone.utc).isoformat(),
+                        "stream": self.subscriber_stream_name,
+                    },
+                    "domain": {
+                        "kind": MessageType.READ_POSITION.value,
+                        "origin_stream": self.stream_category,
+                    },
                 },
-            },
-        )
+            )
 
     def filter_on_origin(self, messages: List[Message]) -> List[Message]:
         """
@@ -426,7 +439,11 @@ class EventStoreSubscription(BaseSubscription):
 
         Messages with an idempotency key that have already been processed (recorded
         as ``status: success`` in the idempotency store) are skipped to prevent
-        duplicate handling after crash recovery or subscription replay.
+        duplicate handling after crash recovery or subscription replay. The
+        store is consulted once per batch (``check_many``), and successes are
+        recorded with one ``record_many`` when the batch ends, or earlier if
+        the read position is written mid-batch. A written position therefore
+        never passes a success that was not recorded.
 
         Args:
             messages (List[Message]): The batch of messages to process.
@@ -434,11 +451,74 @@ class EventStoreSubscription(BaseSubscription):
         Returns:
             int: The number of messages processed successfully.
         """
-        successful_count = 0
-
         # Get the idempotency store (may be inactive if Redis is not configured)
         idempotency_store = self.engine.domain.idempotency_store
 
+        # Resolve idempotency records for the whole batch up front
+        processed_keys: set[str] = set()
+        if idempotency_store.is_active:
+            batch_keys = [
+                message.metadata.headers.idempotency_key
+                for message in messages
+                if message.metadata.headers and message.metadata.headers.idempotency_key
+            ]
+            if batch_keys:
+                with self.stage(STAGE_IDEMPOTENCY):
+                    records = idempotency_store.check_many(batch_keys)
+                processed_keys = {
+                    key
+                    for key, record in records.items()
+                    if record and record.get("status") == "success"
+                }
+
+        try:
+            return await self._process_batch_messages(
+                messages, processed_keys, idempotency_store
+            )
+        finally:
+            self._record_successes()
+
+    def _record_successes(self) -> None:
+        """Record the successes collected so far, in one round trip."""
+        if not self._unrecorded_successes:
+            return
+
+        successes, self._unrecorded_successes = self._unrecorded_successes, {}
+        with self.stage(STAGE_IDEMPOTENCY):
+            self.engine.domain.idempotency_store.record_many(successes)
+
+    async def _process_batch_messages(
+        self,
+        messages,
+        processed_keys: set[str],
+        idempotency_store: Any,
+    ) -> int:
+        """Handle each message of a batch, skipping already-processed commands.
+
+        ``processed_keys`` holds idempotency keys known to have succeeded; keys
+        of commands that succeed here are added to it, so duplicates within
+        the batch are skipped too, and queued for ``_record_successes()``.
+        """
+        successful_count = 0
+
+        # The read position only advances past messages once everything
+        # before them is done, since the batch may be handled out of order
+        watermark = PositionWatermark(
+            message.metadata.event_store.global_position for message in messages
+        )
+
+        # Shed expired commands before they reach a handler, and handle the
+        # rest earliest deadline first
+        messages, expired = self.schedule_batch(
+            messages, self._async_deadline, message_stream
+        )
+        for message in expired:
+            self._shed_message(message)
+            await self._advance_position(
+                watermark, message.metadata.event_store.global_position
+            )
+            successful_count += 1
+
         for message in messages:
             message_type = message.metadata.headers.type or "unknown"
             message_id = message.metadata.headers.id or "unknown"
@@ -458,7 +538,7 @@ class EventStoreSubscription(BaseSubscription):
                     f"[{self.subscriber_class_name}] "
                     f"{message_type} (pos: {position}) — already processed inline"
                 )
-                await self.update_read_position(position)
+                await self._advance_position(watermark, position)
                 continue
 
             # Check idempotency store for already-processed commands
@@ -467,28 +547,28 @@ class EventStoreSubscription(BaseSubscription):
                 if message.metadata.headers
                 else None
             )
-            if idempotency_key and idempotency_store.is_active:
-                existing = idempotency_store.check(idempotency_key)
-                if existing and existing.get("status") == "success":
-                    logger.info(
-                        f"[{self.subscriber_class_name}] "
-                        f"{message_type} (ID: {short_id}...) — already processed (idempotent)"
-                    )
-                    await self.update_read_position(position)
-                    successful_count += 1
-                    continue
+            if idempotency_key and idempotency_key in processed_keys:
+                logger.info(
+                    f"[{self.subscriber_class_name}] "
+                    f"{message_type} (ID: {short_id}...) — already processed (idempotent)"
+                )
+                await self._advance_position(watermark, position)
+                successful_count += 1
+                continue
 
             # Process the message and get a success/failure result
             is_successful = await self.engine.handle_message(
                 self.handler, message, worker_id=self.subscription_id
             )
 
-            # Always update position to avoid reprocessing the message
-            await self.update_read_position(position)
+            # Remember success for dedup within this batch and beyond
+            if is_successful and idempotency_key:
+                processed_keys.add(idempotency_key)
+                if idempotency_store.is_active:
+                    self._unrecorded_successes[idempotency_key] = True
 
-            # Record success in idempotency store for future dedup
-            if is_successful and idempotency_key and idempotency_store.is_active:
-                idempotency_store.record_success(idempotency_key, True)
+            # Always update position to avoid reprocessing the message
+            await self._advance_position(watermark, position)
 
             if is_successful:
                 successful_count += 1
@@ -523,6 +603,39 @@ class EventStoreSubscription(BaseSubscription):
 
         return successful_count
 
+    async def _advance_position(
+        self, watermark: PositionWatermark, position: int
+    ) -> None:
+        """Mark ``position`` done and move the read position as far as is safe."""
+        safe_position = watermark.complete(position)
+        if safe_position is not None:
+            await self.update_read_position(safe_position)
+
+    @staticmethod
+    def _async_deadline(message: Message) -> Optional[datetime]:
+        """Deadline of a message still to be handled here.
+
+        Synchronous messages were already handled inline, so their deadline
+        no longer matters.
+        """
+        if not (message.metadata.domain and message.metadata.domain.asynchronous):
+            return None
+        return message_deadline(message)
+
+    def _shed_message(self, message: Message) -> None:
+        """Report an expired message skipped without handling it."""
+        domain_meta = message.metadata.domain
+        self.engine.shed_message(
+            self.subscriber_class_name,
+            message_type=message.metadata.headers.type or "unknown",
+            message_id=message.metadata.headers.id or "unknown",
+            stream=(domain_meta.stream_category if domain_meta else None) or "unknown",
+            deadline=message.metadata.headers.deadline,
+            worker_id=self.subscription_id,
+            correlation_id=domain_meta.correlation_id if domain_meta else None,
+            causation_id=domain_meta.causation_id if domain_meta else None,
+        )
+
     # ──────────────────────────────────────────────────────────────────────
     # Failed Position Tracking
     # ──────────────────────────────────────────────────────────────────────
@@ -0,0 +1,178 @@
+"""Weighted fair scheduling between a subscription's priority lanes.
+
+``StreamSubscription`` reads from a primary stream and, when priority lanes
+are enabled, a backfill stream. With strict priority (the default) backfill
+is served only when primary is empty, so sustained production load starves
+it completely. ``LaneScheduler`` lets backfill claim a guaranteed share of
+throughput instead, using stride scheduling: every lane carries a *pass*
+value that advances by ``messages / weight`` each time it is served, and
+the lane with the lowest pass is tried first. Over any busy period each
+lane receives messages in proportion to its weight.
+
+A lane that turns out to be empty has its pass pulled forward to the other
+lane's, so idle time is not banked as credit that would later let it burst
+past its share.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+# Window over which per-lane service rates are measured, in seconds
+DEFAULT_RATE_WINDOW = 10.0
+
+
+class _LaneState:
+    __slots__ = (
+        "name",
+        "weight",
+        "passes",
+        "served",
+        "rate",
+        "window_count",
+        "window_start",
+    )
+
+    def __init__(self, name: str, weight: float, now: float) -> None:
+        self.name = name
+        self.weight = weight
+        self.passes = 0.0
+        self.served = 0
+        self.rate = 0.0
+        self.window_count = 0
+        self.window_start = now
+
+
+class LaneScheduler:
+    """Decide which priority lane a subscription reads next.
+
+    Args:
+        primary: Name of the primary stream.
+        backfill: Name of the backfill stream.
+        backfill_share: Fraction of messages, in ``[0, 1)``, guaranteed to
+            the backfill lane while both lanes have work. ``0`` keeps strict
+            priority: primary is always tried first.
+        rate_window: Seconds over which service rates are measured.
+    """
+
+    def __init__(
+        self,
+        primary: str,
+        backfill: str,
+        backfill_share: float = 0.0,
+        rate_window: float = DEFAULT_RATE_WINDOW,
+    ) -> None:
+        if not 0.0 <= backfill_share < 1.0:
+            raise ValueError(
+                f"backfill_share must be in [0, 1), got {backfill_share!r}"
+            )
+
+        now = time.monotonic()
+        self.primary = primary
+        self.backfill = backfill
+        self.backfill_share = backfill_share
+        self._rate_window = rate_window
+        self._lanes = {
+            primary: _LaneState(primary, 1.0 - backfill_share, now),
+            backfill: _LaneState(backfill, backfill_share, now),
+        }
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls, primary: str, backfill: str, lanes_config: dict[str, Any]
+    ) -> "LaneScheduler":
+        """Build a scheduler from the ``server.priority_lanes`` section.
+
+        ``weights`` (``{"primary": 9, "backfill": 1}``) and
+        ``min_backfill_share`` may be combined; backfill receives whichever
+        share is larger.
+        """
+        share = 0.0
+        weights = lanes_config.get("weights") or {}
+        if weights:
+            primary_weight = float(weights.get("primary", 1))
+            backfill_weight = float(weights.get("backfill", 0))
+            total = primary_weight + backfill_weight
+            if total > 0:
+                share = backfill_weight / total
+        share = max(share, float(lanes_config.get("min_backfill_share", 0.0)))
+        return cls(primary, backfill, backfill_share=share)
+
+    @property
+    def strict(self) -> bool:
+        """Whether backfill is served only when primary is empty."""
+        return self.backfill_share == 0.0
+
+    def order(self) -> list[str]:
+        """Return lane names in the order they should be tried.
+
+        Ties go to the primary lane.
+        """
+        if self.strict:
+            return [self.primary, self.backfill]
+        with self._lock:
+            return sorted(
+                self._lanes,
+                key=lambda name: (self._lanes[name].passes, name != self.primary),
+            )
+
+    def charge(self, lane: str, count: int) -> None:
+        """Account for ``count`` messages served from ``lane``."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._lanes[lane]
+            if state.weight > 0:
+                state.passes += count / state.weight
+            state.served += count
+            state.window_count += count
+            self._roll_window(state, now)
+
+    def idle(self, lane: str) -> None:
+        """Record that ``lane`` had nothing to read.
+
+        Pulls the lane's pass up to the busiest competitor's so it does not
+        accumulate credit while empty.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._lanes[lane]
+            others = [s.passes for name, s in self._lanes.items() if name != lane]
+            if others:
+                state.passes = max(state.passes, min(others))
+            self._roll_window(state, now)
+
+    def _roll_window(self, state: _LaneState, now: float) -> None:
+        elapsed = now - state.window_start
+        if elapsed >= self._rate_window:
+            state.rate = state.window_count / elapsed
+            state.window_count = 0
+            state.window_start = now
+
+    def snapshot(
+        self, lags: Optional[dict[str, Optional[int]]] = None
+    ) -> dict[str, dict[str, Any]]:
+        """Per-lane scheduling stats.
+
+        Args:
+            lags: Optional mapping of lane name to its current lag, merged
+                into the result.
+
+        Returns:
+            A dict keyed by lane name with ``weight``, ``served`` (messages
+            since start), ``rate`` (messages/second over the last complete
+            window), and ``lag``.
+        """
+        lags = lags or {}
+        now = time.monotonic()
+        with self._lock:
+            result = {}
+            for name, state in self._lanes.items():
+                self._roll_window(state, now)
+                result[name] = {
+                    "weight": state.weight,
+                    "served": state.served,
+                    "rate": state.rate,
+                    "lag": lags.get(name),
+                }
+            return result
@@ -4,17 +4,21 @@ import os
 import secrets
 import socket
 import time
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from protean.core.command_handler import BaseCommandHandler
 from protean.core.event_handler import BaseEventHandler
 from protean.exceptions import ConfigurationError
 from protean.port.broker import BaseBroker
+from protean.server.deadlines import payload_deadline, payload_stream
+from protean.server.scheduler import ScheduledDelivery
 from protean.utils import fqn
 from protean.utils.eventing import Message
+from protean.utils.stages import STAGE_ACK, STAGE_DESERIALIZE
 from protean.utils.telemetry import get_domain_metrics
 
 from . import BaseSubscription
+from .lane_scheduler import LaneScheduler
 
 if TYPE_CHECKING:
     from .profiles import SubscriptionConfig
@@ -32,10 +36,12 @@ class StreamSubscription(BaseSubscription):
 
     When priority lanes are enabled, the subscription reads from two streams:
     - Primary stream (e.g., ``customer``): Production traffic, always drained first.
-    - Backfill stream (e.g., ``customer:backfill``): Migration/bulk traffic, read only
-      when the primary stream is empty.
+    - Backfill stream (e.g., ``customer:backfill``): Migration/bulk traffic.
 
-    This ensures production events are always processed before backfill events.
+    By default the primary stream is always drained first and backfill is read
+    only when primary is empty. Setting ``weights`` or ``min_backfill_share``
+    switches to weighted fair scheduling (see ``LaneScheduler``), which
+    guarantees backfill a share of throughput under sustained primary load.
     """
 
     def __init__(
@@ -137,6 +143,17 @@ class StreamSubscription(BaseSubscription):
         self._backfill_suffix = lanes_config.get("backfill_suffix", "backfill")
         self.backfill_stream = f"{self.stream_category}:{self._backfill_suffix}"
         self.backfill_dlq_stream = f"{self.backfill_stream}:dlq"
+        self._backfill_batch_size: int = int(
+            lanes_config.get("backfill_batch_size") or self.messages_per_tick
+        )
+        self._lane_scheduler = LaneScheduler.from_config(
+            self.stream_category, self.backfill_stream, lanes_config
+        )
+        self._lag_refresh_interval: float = float(
+            lanes_config.get("lag_refresh_interval", 5.0)
+        )
+        self._lane_lags: dict[str, Optional[int]] = {}
+        self._lane_lags_at: float = 0.0
 
         # Default stream used when callers don't provide an explicit stream
         # (e.g. standard mode where only one stream exists).
@@ -274,6 +291,21 @@ class StreamSubscription(BaseSubscription):
                 f"primary='{self.stream_category}', backfill='{self.backfill_stream}'"
             )
 
+        # Take over messages released by consumers that drained while no
+        # peer was active
+        for stream in self._streams():
+            try:
+                claimed = self.broker.claim_released(
+                    stream, self.consumer_group, self.consumer_name
+                )
+                if claimed > 0:
+                    logger.info(
+                        f"Claimed {claimed} released message(s) for "
+                        f"{self.subscriber_name} on '{stream}'"
+                    )
+            except Exception:
+                pass  # Non-critical — they stay parked for the next consumer
+
         logger.debug(
             f"Initialized subscription for {self.subscriber_name} "
             f"on stream '{self.stream_category}' with consumer group '{self.consumer_group}'"
@@ -286,15 +318,23 @@ class StreamSubscription(BaseSubscription):
         When priority lanes are disabled (default), uses standard blocking reads
         on the single stream.
 
-        When priority lanes are enabled, implements a two-lane priority system:
+        When priority lanes are enabled, implements a two-lane system. Under
+        strict priority (the default):
         1. Non-blocking read on primary stream (production traffic)
         2. If messages found → process them, loop back to step 1
         3. If primary is empty → blocking read on backfill stream (short timeout)
         4. Process backfill messages, loop back to step 1
 
-        This ensures production events are always processed before backfill events.
+        Under weighted scheduling the lane the scheduler owes the most
+        service is read first, so backfill keeps its configured share even
+        while primary is busy. See ``_read_next_lane``.
+
         The backfill blocking timeout is capped at 1 second so we re-check the
         primary stream frequently.
+
+        Every read is wrapped in the engine's admission slot, so fetching
+        pauses while engine-wide limits are reached. The read and its batch
+        are marked in flight, so ``shutdown()`` lets the batch finish.
         """
         batches_processed = 0
         consecutive_errors = 0
@@ -302,34 +342,39 @@ class StreamSubscription(BaseSubscription):
         while self.keep_going and not self.engine.shutting_down:
             try:
                 if self._lanes_enabled:
-                    # PRIORITY LANES MODE
-                    # Step 1: Non-blocking read on primary (production) stream
-                    messages = await self._read_primary_nonblocking()
+                    # PRIORITY LANES MODE: the scheduler picks the lane order
+                    async with self.admission_slot() as slot, self.in_flight():
+                        started = time.perf_counter()
+                        stream, messages = await self._read_next_lane()
+                        self.record_fetch(started, messages)
+                        slot.admit(len(messages))
+                        if messages:
+                            await self.process_batch(messages, stream=stream)
 
                     if messages:
-                        await self.process_batch(messages, stream=self.stream_category)
+                        self._lane_scheduler.charge(stream, len(messages))
                         batches_processed += 1
-                        # Loop back immediately to check primary again
-                        if batches_processed % 10 == 0:
+                        if (
+                            stream == self.backfill_stream
+                            or batches_processed % 10 == 0
+                        ):
                             await asyncio.sleep(0)
-                        consecutive_errors = 0
-                        continue
-
-                    # Step 2: Primary empty → blocking read on backfill stream
-                    messages = await self._read_backfill_blocking()
-
-                    if messages:
-                        await self.process_batch(messages, stream=self.backfill_stream)
-                        batches_processed += 1
-
-                    # Yield control before re-checking primary
-                    await asyncio.sleep(0)
+                    else:
+                        # Yield control before re-checking primary
+                        await asyncio.sleep(0)
                 else:
                     # STANDARD MODE: unchanged behavior
-                    messages = await self.get_next_batch_of_messages()
+                    async with self.admission_slot() as slot, self.in_flight():
+                        started = time.perf_counter()
+                        messages = await self.get_next_batch_of_messages()
+                        self.record_fetch(started, messages)
+                        slot.admit(len(messages))
+                        if messages:
+                            await self.process_batch(
+                                messages, stream=self.stream_category
+                            )
 
                     if messages:
-                        await self.process_batch(messages, stream=self.stream_category)
                         batches_processed += 1
 
                         # Yield control only after processing a batch
@@ -356,6 +401,38 @@ class StreamSubscription(BaseSubscription):
                 backoff = min(2 ** (consecutive_errors - 1), 30)
                 await asyncio.sleep(backoff)
 
+    async def _read_next_lane(self) -> tuple[str, List[tuple[str, dict]]]:
+        """Read the next batch from whichever lane the scheduler picks.
+
+        Lanes are tried in scheduler order with non-blocking reads, except
+        that a backfill lane in last position gets the capped blocking read.
+        Empty lanes are reported to the scheduler so they do not bank credit.
+        When every lane comes back empty and no blocking read has happened
+        yet, waits briefly on backfill to avoid spinning.
+
+        Returns:
+            ``(stream, messages)``; ``messages`` is empty when nothing was read.
+        """
+        order = self._lane_scheduler.order()
+        for stream in order:
+            if stream == self.stream_category:
+                messages = await self._read_primary_nonblocking()
+            elif stream == order[-1]:
+                messages = await self._read_backfill_blocking()
+            else:
+                messages = await self._read_backfill_nonblocking()
+
+            if messages:
+                return stream, messages
+            self._lane_scheduler.idle(stream)
+
+        if order[-1] != self.backfill_stream:
+            messages = await self._read_backfill_blocking()
+            if messages:
+                return self.backfill_stream, messages
+
+        return self.stream_category, []
+
     async def _read_primary_nonblocking(self) -> List[tuple[str, dict]]:
         """Non-blocking read from primary (production) stream.
 
@@ -382,6 +459,31 @@ class StreamSubscription(BaseSubscription):
             logger.error(f"Error reading primary stream {self.stream_category}: {e}")
             return []
 
+    async def _read_backfill_nonblocking(self) -> List[tuple[str, dict]]:
+        """Non-blocking read from the backfill stream.
+
+        Used under weighted scheduling when backfill is owed service ahead
+        of primary, so a momentarily empty backfill never delays primary.
+
+        Returns:
+            List of ``(id, payload)`` tuples from the backfill stream.
+        """
+        if not self.broker:
+            return []
+
+        try:
+            return await asyncio.to_thread(
+                self.broker.read_blocking,
+                stream=self.backfill_stream,
+                consumer_group=self.consumer_group,
+                consumer_name=self.consumer_name,
+                timeout_ms=0,  # Non-blocking
+                count=self._backfill_batch_size,
+            )
+        except Exception as e:
+            logger.error(f"Error reading backfill stream {self.backfill_stream}: {e}")
+            return []
+
     async def _read_backfill_blocking(self) -> List[tuple[str, dict]]:
         """Blocking read from backfill stream with capped timeout.
 
@@ -404,12 +506,60 @@ class StreamSubscription(BaseSubscription):
                 consumer_group=self.consumer_group,
                 consumer_name=self.consumer_name,
                 timeout_ms=backfill_timeout,
-                count=self.messages_per_tick,
+                count=self._backfill_batch_size,
             )
         except Exception as e:
             logger.error(f"Error reading backfill stream {self.backfill_stream}: {e}")
             return []
 
+    def lane_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-lane scheduling weight, messages served, service rate and lag.
+
+        Lag is read from the broker's consumer-group info at most once every
+        ``lag_refresh_interval`` seconds; between refreshes the last values
+        are reported.
+
+        Returns:
+            A dict keyed by stream name. See ``LaneScheduler.snapshot``.
+        """
+        now = time.monotonic()
+        if now - self._lane_lags_at >= self._lag_refresh_interval:
+            self._lane_lags = {
+                stream: self._lane_lag(stream)
+                for stream in (self.stream_category, self.backfill_stream)
+            }
+            self._lane_lags_at = now
+        return self._lane_scheduler.snapshot(self._lane_lags)
+
+    def _lane_lag(self, stream: str) -> Optional[int]:
+        """Entries in ``stream`` not yet delivered to this consumer group.
+
+        Uses the Redis 7+ ``lag`` field of ``XINFO GROUPS`` and falls back to
+        the group's pending count on older servers. Returns None when the
+        broker does not expose stream info.
+        """
+        redis_conn = getattr(self.broker, "redis_instance", None)
+        if redis_conn is None:
+            return None
+
+        try:
+            groups = redis_conn.xinfo_groups(stream)
+        except Exception:
+            return None
+
+        for group in groups:
+            if not isinstance(group, dict):
+                continue
+            if self.broker._get_field_value(group, "name") != self.consumer_group:
+                continue
+            lag = self.broker._get_field_value(group, "lag", convert_to_int=True)
+            if lag is None:
+                lag = self.broker._get_field_value(
+                    group, "pending", convert_to_int=True
+                )
+            return lag
+        return None
+
     async def get_next_batch_of_messages(self) -> List[tuple[str, dict]]:
         """
         Get the next batch of messages using blocking read.
@@ -473,6 +623,17 @@ class StreamSubscription(BaseSubscription):
             "stream": stream,
         }
 
+        # Shed expired messages before paying for deserialization, and
+        # handle the rest earliest deadline first
+        messages, expired = self.schedule_batch(
+            messages,
+            lambda item: payload_deadline(item[1]),
+            lambda item: payload_stream(item[1]),
+        )
+        for identifier, payload in expired:
+            if await self._shed_message(identifier, payload, stream):
+                successful_count += 1
+
         for identifier, payload in messages:
             message = await self._deserialize_message(identifier, payload, stream)
             if not message:
@@ -517,12 +678,33 @@ class StreamSubscription(BaseSubscription):
 
         return successful_count
 
+    async def _shed_message(
+        self, identifier: str, payload: dict, stream: str | None = None
+    ) -> bool:
+        """Acknowledge an expired message without deserializing or handling it."""
+        metadata = payload.get("metadata") or {}
+        headers = metadata.get("headers") or {}
+        domain_meta = metadata.get("domain") or {}
+
+        self.engine.shed_message(
+            self.subscriber_class_name,
+            message_type=headers.get("type") or "unknown",
+            message_id=headers.get("id") or identifier,
+            stream=payload_stream(payload) or stream or self._default_stream,
+            deadline=payload_deadline(payload),
+            worker_id=self.subscription_id,
+            correlation_id=domain_meta.get("correlation_id"),
+            causation_id=domain_meta.get("causation_id"),
+        )
+        return await self._acknowledge_message(identifier, None, stream)
+
     async def _deserialize_message(
         self, identifier: str, payload: dict, stream: str | None = None
     ) -> Optional[Message]:
         """Deserialize a message payload, handling errors by moving to DLQ."""
         try:
-            return Message.deserialize(payload)
+            with self.stage(STAGE_DESERIALIZE):
+                return Message.deserialize(payload)
         except Exception as e:
             logger.error(f"Deserialization failed for message {identifier}: {e}")
             await self.move_to_dlq(identifier, payload, stream)
@@ -543,7 +725,8 @@ class StreamSubscription(BaseSubscription):
         """
         assert self.broker is not None, "Broker not initialized"
         stream = stream or self._default_stream
-        ack_result = self.broker.ack(stream, identifier, self.consumer_group)
+        with self.stage(STAGE_ACK):
+            ack_result = self.broker.ack(stream, identifier, self.consumer_group)
         if ack_result:
             # Clear retry count if exists
             self.retry_counts.pop(identifier, None)
@@ -640,10 +823,23 @@ class StreamSubscription(BaseSubscription):
             worker_id=self.subscription_id,
         )
 
-        await asyncio.sleep(self.retry_delay_seconds)
+        def nack() -> None:
+            # NACK the message to make it available for reprocessing
+            self.broker.nack(stream, identifier, self.consumer_group)
+
+        # Hand the delay to the engine's timer wheel when it runs, so the
+        # subscription keeps consuming while the message waits
+        timers = getattr(self.engine, "_scheduled_delivery", None)
+        if (
+            self.retry_delay_seconds > 0
+            and isinstance(timers, ScheduledDelivery)
+            and timers.running
+        ):
+            timers.call_later(self.retry_delay_seconds, nack)
+            return
 
-        # NACK the message to make it available for reprocessing
-        self.broker.nack(stream, identifier, self.consumer_group)
+        await asyncio.sleep(self.retry_delay_seconds)
+        nack()
 
     async def _exhaust_retries(
         self, identifier: str, payload: dict, stream: str | None = None
@@ -749,15 +945,63 @@ class StreamSubscription(BaseSubscription):
             },
         }
 
+    def _streams(self) -> List[str]:
+        """The streams this subscription reads."""
+        if self._lanes_enabled:
+            return [self.stream_category, self.backfill_stream]
+        return [self.stream_category]
+
+    def mark_draining(self) -> None:
+        """
+        Announce to the consumer group that this consumer is scheduled to stop.
+
+        Draining peers then park their pending messages, or hand them to a
+        consumer that keeps running, instead of handing them to this one.
+
+        Returns:
+            None
+        """
+        if self.broker is None or not self.drain_policy.handoff:
+            return
+        for stream in self._streams():
+            try:
+                self.broker.mark_draining(
+                    stream, self.consumer_group, self.consumer_name
+                )
+            except Exception:
+                logger.debug(
+                    f"Failed to mark {self.subscriber_name} as draining on '{stream}'"
+                )
+
     async def cleanup(self) -> None:
         """
         Perform cleanup tasks during shutdown.
 
-        This method clears any in-memory state during shutdown.
+        Runs once the subscription has drained. With drain handoff on,
+        messages still pending on this consumer are released to the
+        consumer group so another consumer handles them right away, and
+        in-memory state is cleared.
 
         Returns:
             None
         """
+        if self.broker is not None and self.drain_policy.handoff:
+            for stream in self._streams():
+                try:
+                    released = self.broker.release_pending(
+                        stream, self.consumer_group, self.consumer_name
+                    )
+                    if released > 0:
+                        logger.info(
+                            f"Released {released} pending message(s) of "
+                            f"{self.subscriber_name} on '{stream}'"
+                        )
+                except Exception:
+                    logger.exception(
+                        f"Failed to release pending messages of "
+                        f"{self.subscriber_name} on '{stream}'"
+                    )
+
         # Clear retry counts
         self.retry_counts.clear()
         logger.debug(f"Cleanup completed for subscription: {self.subscriber_name}")
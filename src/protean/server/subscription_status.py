@@ -145,8 +145,8 @@ def _collect_event_store_status(
             current_position = last_msg["data"]["position"] if last_msg else -1
             last_updated = _extract_position_time(last_msg)
 
-            # Head of the category stream
-            head_position = store.stream_head_position(stream_category)
+            # Head of the category stream, shared by every subscription to it
+            head_position = store.stream_head_position(stream_category, cached=True)
 
             # Lag
             if head_position >= 0:
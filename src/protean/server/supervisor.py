@@ -41,6 +41,8 @@ class Supervisor:
     - Spawning workers using the ``spawn`` multiprocessing start method
     - Propagating shutdown signals (SIGINT, SIGTERM) to all workers
     - Monitoring workers and detecting crashes
+    - Optionally draining workers one at a time on shutdown, within the
+      same overall timeout
     - Enforcing a shutdown timeout with SIGKILL as a last resort
     - In multi-worker mode, running a ``QueueListener`` on the supervisor so
       worker log lines never interleave at byte boundaries (long JSON records
@@ -54,6 +56,7 @@ class Supervisor:
         num_workers: int,
         test_mode: bool = False,
         debug: bool = False,
+        rolling_drain: bool = False,
     ) -> None:
         """Initialize the Supervisor.
 
@@ -64,6 +67,9 @@ class Supervisor:
             test_mode: If True, each worker Engine runs in test mode
                 (limited cycles, then exit).
             debug: If True, workers run with DEBUG-level logging.
+            rolling_drain: If True, workers are stopped one at a time on
+                shutdown. If False, all workers are signalled at once. Either
+                way the whole shutdown shares one timeout.
         """
         if num_workers < 1:
             raise ValueError("num_workers must be >= 1")
@@ -72,6 +78,7 @@ class Supervisor:
         self.num_workers = num_workers
         self.test_mode = test_mode
         self.debug = debug
+        self.rolling_drain = rolling_drain
 
         self.workers: list[multiprocessing.Process] = []
         self.exit_code: int = 0
@@ -198,31 +205,60 @@ class Supervisor:
     # ------------------------------------------------------------------
 
     def _shutdown_workers(self) -> None:
-        """Send SIGTERM to all workers, wait with timeout, then SIGKILL."""
-        # Send SIGTERM to each living worker
-        for worker in self.workers:
-            if worker.is_alive() and worker.pid:
-                try:
-                    os.kill(worker.pid, signal.SIGTERM)
-                except (ProcessLookupError, OSError):
-                    pass
+        """Send SIGTERM to workers, wait with timeout, then SIGKILL.
 
-        # Wait for workers to exit gracefully
+        With ``rolling_drain`` each worker is signalled only once the previous
+        one has exited. Every worker is first told that it is scheduled to
+        stop, so a draining worker never hands its pending messages to one
+        that is about to drain too. The whole shutdown, rolling or not, is
+        bounded by a single timeout.
+        """
         deadline = time.monotonic() + _SHUTDOWN_TIMEOUT_SECONDS
-        for worker in list(self.workers):
-            remaining = max(0, deadline - time.monotonic())
-            worker.join(timeout=remaining)
-            if worker.is_alive():
-                logger.warning(
-                    f"Worker {worker.name} did not stop within "
-                    f"{_SHUTDOWN_TIMEOUT_SECONDS}s timeout, killing"
-                )
-                worker.kill()
-                worker.join(timeout=5)
-            self.workers.remove(worker)
+        if self.rolling_drain:
+            for worker in self.workers:
+                self._announce_drain(worker)
+            for worker in list(self.workers):
+                self._terminate(worker)
+                self._reap(worker, deadline)
+        else:
+            for worker in self.workers:
+                self._terminate(worker)
+
+            # Wait for workers to exit gracefully
+            for worker in list(self.workers):
+                self._reap(worker, deadline)
 
         logger.info("All workers have been shut down")
 
+    def _announce_drain(self, worker: multiprocessing.Process) -> None:
+        """Send SIGUSR1 to a living worker, where the platform has it."""
+        if hasattr(signal, "SIGUSR1") and worker.is_alive() and worker.pid:
+            try:
+                os.kill(worker.pid, signal.SIGUSR1)
+            except (ProcessLookupError, OSError):
+                pass
+
+    def _terminate(self, worker: multiprocessing.Process) -> None:
+        """Send SIGTERM to a living worker."""
+        if worker.is_alive() and worker.pid:
+            try:
+                os.kill(worker.pid, signal.SIGTERM)
+            except (ProcessLookupError, OSError):
+                pass
+
+    def _reap(self, worker: multiprocessing.Process, deadline: float) -> None:
+        """Wait for a worker to exit until ``deadline``, then SIGKILL it."""
+        remaining = max(0, deadline - time.monotonic())
+        worker.join(timeout=remaining)
+        if worker.is_alive():
+            logger.warning(
+                f"Worker {worker.name} did not stop within "
+                f"{_SHUTDOWN_TIMEOUT_SECONDS}s timeout, killing"
+            )
+            worker.kill()
+            worker.join(timeout=5)
+        self.workers.remove(worker)
+
 
 def _build_queue_listener(
     queue: multiprocessing.Queue,
@@ -297,6 +333,11 @@ def _worker_entry(
     # available.
     configure_logging(level="DEBUG" if debug else "INFO")
 
+    # A drain announcement that arrives before the engine installs its
+    # handler must not terminate the worker
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+
     worker_logger = logging.getLogger(f"protean.server.worker-{worker_id}")
     worker_logger.info(f"Worker {worker_id} (PID {os.getpid()}) starting...")
 
@@ -7,11 +7,19 @@ dashboard data.
 
 Zero overhead when nobody is listening and persistence is disabled — the emitter
 checks subscriber count and short-circuits before any serialization.
+
+In background mode, ``emit()`` only serializes the trace and enqueues it on a
+bounded queue; a daemon flusher thread drains the queue and writes batches to
+Redis through a single non-transactional pipeline. When the queue is full the
+trace is dropped and counted instead of blocking the caller.
 """
 
 import json
 import logging
+import queue
+import threading
 import time
+import zlib
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -30,6 +38,18 @@ DEFAULT_TRACE_RETENTION_DAYS = 7
 # How often (seconds) to check if anyone is subscribed
 _SUBSCRIBER_CHECK_TTL = 2.0
 
+# Background flushing defaults
+DEFAULT_TRACE_QUEUE_SIZE = 10_000
+DEFAULT_TRACE_BATCH_SIZE = 200
+DEFAULT_TRACE_FLUSH_INTERVAL = 0.05  # seconds
+
+# Sampling modes
+SAMPLING_HEAD = "head"
+SAMPLING_TAIL = "tail"
+
+# Statuses that tail sampling always keeps
+_TAIL_KEEP_STATUSES = frozenset({"error", "retry", "expired"})
+
 
 @dataclass
 class MessageTrace:
@@ -73,22 +93,127 @@ class TraceEmitter:
       Uses MINID trimming to retain entries for the configured number of days.
 
     Short-circuits all work when both channels are inactive.
+
+    Optional cost controls:
+    - **Background flushing** (``background=True``): traces are queued on a
+      bounded queue and written in pipelined batches by a daemon thread.
+      Traces that do not fit in the queue are dropped and counted.
+    - **Sampling** (``sample_rate < 1.0``): ``"head"`` sampling keeps or drops
+      a whole message journey, keyed on correlation id so every stage of a
+      kept chain is kept. ``"tail"`` sampling additionally keeps every failed,
+      retried or expired trace and every trace slower than
+      ``slow_threshold_ms``, regardless of the rate.
+    - **Payload truncation** (``max_payload_bytes``): payloads whose JSON
+      encoding exceeds the limit are replaced by a truncated preview.
+
+    With ``stage_breakdown=True`` the Engine adds each message's per-stage
+    latencies (see ``protean.utils.stages``) to its handler traces.
     """
 
     def __init__(
-        self, domain: Any, trace_retention_days: int = DEFAULT_TRACE_RETENTION_DAYS
+        self,
+        domain: Any,
+        trace_retention_days: int = DEFAULT_TRACE_RETENTION_DAYS,
+        *,
+        background: bool = False,
+        queue_size: int = DEFAULT_TRACE_QUEUE_SIZE,
+        batch_size: int = DEFAULT_TRACE_BATCH_SIZE,
+        flush_interval: float = DEFAULT_TRACE_FLUSH_INTERVAL,
+        sample_rate: float = 1.0,
+        sampling: str = SAMPLING_HEAD,
+        slow_threshold_ms: Optional[float] = None,
+        max_payload_bytes: Optional[int] = None,
+        subscriber_check_ttl: float = _SUBSCRIBER_CHECK_TTL,
+        stage_breakdown: bool = False,
     ) -> None:
+        if sampling not in (SAMPLING_HEAD, SAMPLING_TAIL):
+            raise ValueError(
+                f"Invalid trace sampling mode '{sampling}'. "
+                f"Expected '{SAMPLING_HEAD}' or '{SAMPLING_TAIL}'."
+            )
+
         self._domain = domain
         self._domain_name = domain.name
         self._redis = None
         self._has_subscribers = False
         self._last_subscriber_check = 0.0
+        self._subscriber_check_ttl = subscriber_check_ttl
         self._initialized = False
 
         # Stream persistence settings
         self._persist = trace_retention_days > 0
         self._retention_ms = trace_retention_days * 86_400_000
 
+        # Sampling and truncation settings
+        self._sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+        self._sampling = sampling
+        self._slow_threshold_ms = slow_threshold_ms
+        self._max_payload_bytes = max_payload_bytes
+        self.stage_breakdown = stage_breakdown
+
+        # Background flushing settings
+        self._background = background
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+        # Accounting counters
+        self.emitted = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.truncated = 0
+        self.flush_errors = 0
+
+    @classmethod
+    def from_config(cls, domain: Any, background: bool = False) -> "TraceEmitter":
+        """Build an emitter from the domain's ``[observatory]`` configuration.
+
+        ``background`` is the default for ``trace_background`` when the
+        configuration does not set it explicitly. Invalid values fall back
+        to the defaults rather than failing domain or engine startup.
+        """
+        try:
+            config = domain.config.get("observatory", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+
+        def _get(key: str, default: Any, cast: Any) -> Any:
+            value = config.get(key, default)
+            if value is None:
+                return default
+            try:
+                return cast(value)
+            except (TypeError, ValueError):
+                return default
+
+        sampling = config.get("trace_sampling", SAMPLING_HEAD)
+        if sampling not in (SAMPLING_HEAD, SAMPLING_TAIL):
+            sampling = SAMPLING_HEAD
+
+        return cls(
+            domain,
+            trace_retention_days=_get(
+                "trace_retention_days", DEFAULT_TRACE_RETENTION_DAYS, int
+            ),
+            background=bool(config.get("trace_background", background)),
+            queue_size=_get("trace_queue_size", DEFAULT_TRACE_QUEUE_SIZE, int),
+            batch_size=_get("trace_batch_size", DEFAULT_TRACE_BATCH_SIZE, int),
+            flush_interval=_get(
+                "trace_flush_interval", DEFAULT_TRACE_FLUSH_INTERVAL, float
+            ),
+            sample_rate=_get("trace_sample_rate", 1.0, float),
+            sampling=sampling,
+            slow_threshold_ms=_get("trace_slow_threshold_ms", None, float),
+            max_payload_bytes=_get("trace_max_payload_bytes", None, int),
+            subscriber_check_ttl=_get(
+                "trace_subscriber_check_ttl", _SUBSCRIBER_CHECK_TTL, float
+            ),
+            stage_breakdown=bool(config.get("trace_stage_breakdown", False)),
+        )
+
     def _ensure_initialized(self) -> bool:
         """Lazily initialize Redis connection from the domain's broker."""
         if self._initialized:
@@ -108,7 +233,7 @@ class TraceEmitter:
     def _check_subscribers(self) -> bool:
         """Check if anyone is subscribed to the trace channel. Cached for efficiency."""
         now = time.monotonic()
-        if now - self._last_subscriber_check < _SUBSCRIBER_CHECK_TTL:
+        if now - self._last_subscriber_check < self._subscriber_check_ttl:
             return self._has_subscribers
 
         self._last_subscriber_check = now
@@ -128,6 +253,55 @@ class TraceEmitter:
 
         return self._has_subscribers
 
+    def _is_sampled(
+        self,
+        message_id: str,
+        correlation_id: Optional[str],
+        status: str,
+        duration_ms: Optional[float],
+    ) -> bool:
+        """Decide whether a trace is kept under the configured sampling policy.
+
+        The decision hashes the correlation id (falling back to the message
+        id), so it is stable across stages and across worker processes.
+        """
+        if self._sample_rate >= 1.0:
+            return True
+
+        if self._sampling == SAMPLING_TAIL:
+            if status in _TAIL_KEEP_STATUSES:
+                return True
+            if (
+                self._slow_threshold_ms is not None
+                and duration_ms is not None
+                and duration_ms >= self._slow_threshold_ms
+            ):
+                return True
+
+        if self._sample_rate <= 0.0:
+            return False
+
+        key = correlation_id or message_id or ""
+        bucket = zlib.crc32(key.encode("utf-8")) / 0xFFFFFFFF
+        return bucket < self._sample_rate
+
+    def _truncate_payload(self, payload: Optional[dict]) -> Optional[dict]:
+        """Replace payloads larger than ``max_payload_bytes`` with a preview."""
+        if payload is None or self._max_payload_bytes is None:
+            return payload
+
+        encoded = json.dumps(payload, default=str)
+        size = len(encoded.encode("utf-8"))
+        if size <= self._max_payload_bytes:
+            return payload
+
+        self.truncated += 1
+        return {
+            "_truncated": True,
+            "_size": size,
+            "_preview": encoded[: self._max_payload_bytes],
+        }
+
     def emit(
         self,
         event: str,
@@ -156,6 +330,11 @@ class TraceEmitter:
         if not self._ensure_initialized():
             return
 
+        # Sampling runs before serialization so dropped traces cost nothing
+        if not self._is_sampled(message_id, correlation_id, status, duration_ms):
+            self.sampled_out += 1
+            return
+
         try:
             trace = MessageTrace(
                 event=event,
@@ -168,26 +347,139 @@ class TraceEmitter:
                 duration_ms=duration_ms,
                 error=error,
                 metadata=metadata or {},
-                payload=payload,
+                payload=self._truncate_payload(payload),
                 worker_id=worker_id,
                 correlation_id=correlation_id,
                 causation_id=causation_id,
             )
-            json_str = trace.to_json()
-
-            # Persist to time-bounded Redis Stream for dashboard history
-            if self._persist:
-                min_id = str(int(time.time() * 1000) - self._retention_ms)
-                self._redis.xadd(
-                    TRACE_STREAM,
-                    {"data": json_str},
-                    minid=min_id,
-                    approximate=True,
-                )
-
-            # Broadcast to Pub/Sub for real-time SSE clients
-            if has_subscribers:
-                self._redis.publish(TRACE_CHANNEL, json_str)
+            entry = (trace.to_json(), has_subscribers)
+        except Exception as e:
+            logger.debug(f"TraceEmitter serialization failed: {e}")
+            return
+
+        if self._background:
+            self._enqueue(entry)
+        else:
+            self._write_batch([entry])
+
+    def _enqueue(self, entry: tuple[str, bool]) -> None:
+        """Queue a serialized trace for the flusher, dropping it when full."""
+        self._ensure_flusher()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher thread on first use."""
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+
+        with self._flusher_lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._stopping.clear()
+            self._flusher = threading.Thread(
+                target=self._run_flusher,
+                name=f"protean-trace-flusher-{self._domain_name}",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        """Drain the queue in batches until stopped, then flush what is left."""
+        while not self._stopping.is_set():
+            batch = self._drain(block=True)
+            if batch:
+                self._write_batch(batch)
+
+        # Final drain on shutdown
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                break
+            self._write_batch(batch)
+
+    def _drain(self, block: bool) -> list[tuple[str, bool]]:
+        """Pull up to ``batch_size`` entries off the queue."""
+        batch: list[tuple[str, bool]] = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self._flush_interval))
+            else:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            return batch
+
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: list[tuple[str, bool]]) -> None:
+        """Write serialized traces to Redis in a single pipelined round trip."""
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            min_id = (
+                str(int(time.time() * 1000) - self._retention_ms)
+                if self._persist
+                else None
+            )
+            for json_str, publish in batch:
+                # Persist to time-bounded Redis Stream for dashboard history
+                if self._persist:
+                    pipe.xadd(
+                        TRACE_STREAM,
+                        {"data": json_str},
+                        minid=min_id,
+                        approximate=True,
+                    )
+
+                # Broadcast to Pub/Sub for real-time SSE clients
+                if publish:
+                    pipe.publish(TRACE_CHANNEL, json_str)
+            pipe.execute()
+            self.emitted += len(batch)
         except Exception as e:
             # Never let tracing failures affect message processing
+            self.flush_errors += 1
             logger.debug(f"TraceEmitter publish failed: {e}")
+        finally:
+            if self._background:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until queued traces have been written or ``timeout`` elapses."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            if self._flusher is None or not self._flusher.is_alive():
+                break
+            time.sleep(self._flush_interval / 2 or 0.001)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the flusher thread after writing any queued traces."""
+        flusher = self._flusher
+        if flusher is None:
+            return
+
+        self._stopping.set()
+        flusher.join(timeout)
+        self._flusher = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return emitter accounting counters and queue depth."""
+        return {
+            "background": self._background,
+            "sampling": self._sampling,
+            "sample_rate": self._sample_rate,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "truncated": self.truncated,
+            "flush_errors": self.flush_errors,
+        }
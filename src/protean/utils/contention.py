@@ -0,0 +1,433 @@
+"""Hot-aggregate contention tracking.
+
+Optimistic concurrency conflicts, slow Units of Work and the reloads caused
+by retries concentrate on a few aggregate instances: a popular SKU, a busy
+account. Counting them per aggregate *type* hides the hot instances, and
+counting them per *id* in a metric label would give unbounded cardinality.
+
+``ContentionTracker`` keeps per-id counts in space-saving sketches instead.
+A sketch of capacity ``k`` holds at most ``k`` ids. When a new id arrives
+and the sketch is full, it replaces the id with the smallest count and
+inherits that count as its possible overestimate (``error``). Any id whose
+true count exceeds ``total / k`` is guaranteed to be in the sketch, so the
+heavy hitters are always reported, in bounded memory.
+
+Three sketches are kept:
+
+- ``conflicts``: ``ExpectedVersionError`` raised by a Unit of Work, per
+  aggregate id.
+- ``reloads``: aggregates loaded again because a handler was retried after
+  a conflict.
+- ``slow``: Unit of Work time spent on an aggregate, for Units of Work that
+  took longer than ``slow_uow_threshold_ms``, in milliseconds.
+
+OTel metrics are labelled by aggregate type only: ``protean.aggregate.
+conflicts``, ``protean.aggregate.reloads`` and the
+``protean.aggregate.retry_duration`` histogram (time from the first conflict
+to the end of a handler's retries).
+
+Snapshots are published to Redis under ``protean:contention:<domain>:
+<worker>`` at most every ``publish_interval_seconds``, when something is
+recorded. The Observatory merges the snapshots of all workers on its
+Contention page and exports the top ``report_top`` ids of each sketch as
+Prometheus gauges.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from protean.utils.telemetry import get_domain_metrics
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for published contention snapshots
+CONTENTION_KEY_PREFIX = "protean:contention"
+
+SKETCHES = ("conflicts", "reloads", "slow")
+
+DEFAULT_CONTENTION_CAPACITY = 100
+DEFAULT_CONTENTION_REPORT_TOP = 10
+DEFAULT_CONTENTION_PUBLISH_INTERVAL = 10.0
+DEFAULT_CONTENTION_SNAPSHOT_TTL = 3600
+DEFAULT_SLOW_UOW_THRESHOLD_MS = 100.0
+
+_CONTENTION_TRACKER_KEY = "_contention_tracker"
+
+
+def contention_key(domain_name: str, worker: str) -> str:
+    """Redis key holding one worker's snapshot."""
+    return f"{CONTENTION_KEY_PREFIX}:{domain_name}:{worker}"
+
+
+class SpaceSaving:
+    """Space-saving top-K sketch over weighted keys.
+
+    Args:
+        capacity: Maximum number of keys tracked.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CONTENTION_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity!r}")
+        self.capacity = capacity
+        self.total = 0.0
+        # key -> [count, error]
+        self._counters: dict[Any, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def add(self, key: Any, weight: float = 1) -> None:
+        """Count ``weight`` occurrences of ``key``."""
+        self.total += weight
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+            return
+
+        if len(self._counters) < self.capacity:
+            self._counters[key] = [weight, 0]
+            return
+
+        # Replace the smallest counter; the newcomer may have been counted
+        # up to that many times before it was evicted
+        victim = min(self._counters, key=lambda k: self._counters[k][0])
+        floor = self._counters.pop(victim)[0]
+        self._counters[key] = [floor + weight, floor]
+
+    def top(self, n: Optional[int] = None) -> list[tuple[Any, float, float]]:
+        """Return up to ``n`` ``(key, count, error)`` tuples, largest first."""
+        ranked = sorted(
+            ((key, c[0], c[1]) for key, c in self._counters.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return ranked if n is None else ranked[:n]
+
+
+class ContentionTracker:
+    """Per-aggregate contention sketches for one domain.
+
+    Args:
+        domain: The domain whose metrics and broker Redis connection are used.
+        enabled: When ``False`` every ``record_*`` method is a no-op.
+        capacity: Ids tracked per sketch.
+        slow_uow_threshold_ms: Units of Work faster than this are not counted
+            in the ``slow`` sketch.
+        publish_interval: Minimum seconds between snapshots published to Redis.
+        snapshot_ttl: Seconds a published snapshot lives without being
+            refreshed.
+        worker: Identifier of this process in published snapshots. Defaults
+            to ``<hostname>-<pid>``.
+    """
+
+    def __init__(
+        self,
+        domain: Domain,
+        *,
+        enabled: bool = True,
+        capacity: int = DEFAULT_CONTENTION_CAPACITY,
+        slow_uow_threshold_ms: float = DEFAULT_SLOW_UOW_THRESHOLD_MS,
+        publish_interval: float = DEFAULT_CONTENTION_PUBLISH_INTERVAL,
+        snapshot_ttl: int = DEFAULT_CONTENTION_SNAPSHOT_TTL,
+        worker: Optional[str] = None,
+    ) -> None:
+        self._domain = domain
+        self.enabled = enabled
+        self.slow_uow_threshold = slow_uow_threshold_ms / 1000
+        self.publish_interval = publish_interval
+        self.snapshot_ttl = snapshot_ttl
+        self.worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+
+        self._sketches = {name: SpaceSaving(capacity) for name in SKETCHES}
+        # aggregate -> [retries, total seconds, max seconds]
+        self._retry_latency: dict[str, list[float]] = {}
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+
+        self._next_publish = 0.0
+        self._redis = None
+        self._redis_initialized = False
+
+    @classmethod
+    def from_config(cls, domain: Domain) -> ContentionTracker:
+        """Build a tracker from the ``contention`` config section.
+
+        Invalid values fall back to the defaults.
+        """
+        try:
+            config = domain.config.get("contention", {}) or {}
+        except (AttributeError, TypeError):
+            config = {}
+
+        def _get(key: str, default: Any, cast: Any) -> Any:
+            value = config.get(key, default)
+            try:
+                return cast(value) if value is not None else default
+            except (TypeError, ValueError):
+                return default
+
+        return cls(
+            domain,
+            enabled=bool(config.get("enabled", True)),
+            capacity=max(_get("capacity", DEFAULT_CONTENTION_CAPACITY, int), 1),
+            slow_uow_threshold_ms=_get(
+                "slow_uow_threshold_ms", DEFAULT_SLOW_UOW_THRESHOLD_MS, float
+            ),
+            publish_interval=_get(
+                "publish_interval_seconds", DEFAULT_CONTENTION_PUBLISH_INTERVAL, float
+            ),
+            snapshot_ttl=_get(
+                "snapshot_ttl_seconds", DEFAULT_CONTENTION_SNAPSHOT_TTL, int
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_conflict(self, aggregate: str, aggregate_id: Any) -> None:
+        """Count a version conflict on one aggregate instance."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sketches["conflicts"].add((aggregate, str(aggregate_id)))
+        get_domain_metrics(self._domain).aggregate_conflicts.add(
+            1, {"aggregate": aggregate}
+        )
+        self._maybe_publish()
+
+    def record_reload(self, aggregate: str, aggregate_id: Any) -> None:
+        """Count an aggregate loaded again for a retry."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sketches["reloads"].add((aggregate, str(aggregate_id)))
+        get_domain_metrics(self._domain).aggregate_reloads.add(
+            1, {"aggregate": aggregate}
+        )
+        self._maybe_publish()
+
+    def record_retry_latency(self, aggregate: str, seconds: float) -> None:
+        """Record the time from a first conflict to the end of its retries."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._retry_latency.setdefault(aggregate, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+        get_domain_metrics(self._domain).aggregate_retry_duration.record(
+            seconds, {"aggregate": aggregate}
+        )
+
+    def record_uow(self, aggregates: Iterable[tuple[str, Any]], seconds: float) -> None:
+        """Attribute a slow Unit of Work's duration to the aggregates it held."""
+        if not self.enabled or seconds < self.slow_uow_threshold:
+            return
+        with self._lock:
+            for aggregate, aggregate_id in aggregates:
+                self._sketches["slow"].add(
+                    (aggregate, str(aggregate_id)), seconds * 1000
+                )
+        self._maybe_publish()
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def top(self, sketch: str, n: Optional[int] = None) -> list[dict[str, Any]]:
+        """Return the ``n`` hottest aggregate instances of one sketch."""
+        with self._lock:
+            entries = self._sketches[sketch].top(n)
+        return [
+            {
+                "aggregate": aggregate,
+                "aggregate_id": aggregate_id,
+                "count": count,
+                "error": error,
+            }
+            for (aggregate, aggregate_id), count, error in entries
+        ]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of all sketches."""
+        snapshot: dict[str, Any] = {
+            "worker": self.worker,
+            "started_at": self._started_at,
+            "captured_at": time.time(),
+        }
+        for name in SKETCHES:
+            snapshot[name] = self.top(name)
+        with self._lock:
+            snapshot["retry_latency"] = [
+                {
+                    "aggregate": aggregate,
+                    "retries": int(stats[0]),
+                    "total_ms": stats[1] * 1000,
+                    "max_ms": stats[2] * 1000,
+                }
+                for aggregate, stats in sorted(self._retry_latency.items())
+            ]
+        return snapshot
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            for name in SKETCHES:
+                self._sketches[name] = SpaceSaving(self._sketches[name].capacity)
+            self._retry_latency.clear()
+            self._started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def _maybe_publish(self) -> None:
+        now = time.monotonic()
+        if now < self._next_publish:
+            return
+        self._next_publish = now + self.publish_interval
+        self.publish()
+
+    def publish(self) -> None:
+        """Write the current snapshot to Redis, if a Redis broker is available."""
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            redis.set(
+                contention_key(self._domain.name, self.worker),
+                json.dumps(self.snapshot()),
+                ex=max(self.snapshot_ttl, 1),
+            )
+        except Exception:
+            logger.debug("Contention snapshot publish failed", exc_info=True)
+
+    def _get_redis(self) -> Any:
+        if not self._redis_initialized:
+            self._redis_initialized = True
+            try:
+                broker = self._domain.brokers.get("default")
+                if broker and hasattr(broker, "redis_instance"):
+                    self._redis = broker.redis_instance
+            except Exception:
+                logger.debug("Contention tracker: Redis not available", exc_info=True)
+        return self._redis
+
+
+def get_contention_tracker(domain: Domain) -> ContentionTracker:
+    """Return (and lazily create) the ``ContentionTracker`` for *domain*."""
+    tracker = getattr(domain, _CONTENTION_TRACKER_KEY, None)
+    if tracker is None:
+        tracker = ContentionTracker.from_config(domain)
+        setattr(domain, _CONTENTION_TRACKER_KEY, tracker)
+    return tracker
+
+
+# ----------------------------------------------------------------------
+# Snapshot merging
+# ----------------------------------------------------------------------
+
+
+def read_snapshots(redis: Any, domain_name: Optional[str] = None) -> list[dict]:
+    """Read the published snapshots of all live workers."""
+    pattern = contention_key(domain_name or "*", "*")
+    snapshots = []
+    for key in redis.scan_iter(match=pattern, count=200):
+        raw = redis.get(key)
+        if not raw:
+            continue
+        try:
+            snapshots.append(json.loads(raw))
+        except (TypeError, ValueError):
+            logger.debug("Skipping malformed contention snapshot %s", key)
+    return snapshots
+
+
+def merge_snapshots(
+    snapshots: Iterable[dict], top: Optional[int] = None
+) -> dict[str, Any]:
+    """Combine several workers' snapshots.
+
+    Counts and errors of the same aggregate id are summed, so merged counts
+    stay upper bounds with the same guarantee as each worker's sketch.
+    """
+    sketches: dict[str, dict[tuple[str, str], list[float]]] = {
+        name: {} for name in SKETCHES
+    }
+    latency: dict[str, list[float]] = {}
+    workers = []
+
+    for snapshot in snapshots:
+        workers.append(snapshot.get("worker"))
+        for name in SKETCHES:
+            for entry in snapshot.get(name, []):
+                key = (entry["aggregate"], entry["aggregate_id"])
+                totals = sketches[name].setdefault(key, [0, 0])
+                totals[0] += entry["count"]
+                totals[1] += entry.get("error", 0)
+        for entry in snapshot.get("retry_latency", []):
+            stats = latency.setdefault(entry["aggregate"], [0, 0.0, 0.0])
+            stats[0] += entry["retries"]
+            stats[1] += entry["total_ms"]
+            stats[2] = max(stats[2], entry["max_ms"])
+
+    merged: dict[str, Any] = {"workers": workers}
+    for name in SKETCHES:
+        ranked = sorted(sketches[name].items(), key=lambda kv: kv[1][0], reverse=True)
+        merged[name] = [
+            {
+                "aggregate": aggregate,
+                "aggregate_id": aggregate_id,
+                "count": count,
+                "error": error,
+            }
+            for (aggregate, aggregate_id), (count, error) in ranked[:top]
+        ]
+    merged["retry_latency"] = [
+        {
+            "aggregate": aggregate,
+            "retries": int(retries),
+            "mean_ms": total / retries if retries else 0.0,
+            "max_ms": max_ms,
+        }
+        for aggregate, (retries, total, max_ms) in sorted(latency.items())
+    ]
+    return merged
+
+
+def collect_contention(
+    domains: Iterable[Domain], redis: Any = None, top: Optional[int] = None
+) -> dict[str, dict[str, Any]]:
+    """Merge contention snapshots per domain.
+
+    Reads the snapshots published by all workers when ``redis`` is given,
+    otherwise the trackers of this process.
+    """
+    report = {}
+    for domain in domains:
+        try:
+            if redis is not None:
+                snapshots = read_snapshots(redis, domain.name)
+            else:
+                snapshots = [get_contention_tracker(domain).snapshot()]
+        except Exception:
+            logger.debug(
+                "Failed to read contention snapshots for %s",
+                domain.name,
+                exc_info=True,
+            )
+            snapshots = []
+        report[domain.name] = merge_snapshots(snapshots, top=top)
+    return report
@@ -24,6 +24,7 @@ from protean.fields.spec import FieldSpec, resolve_fieldspecs
 from protean.utils.container import OptionsMixin
 from protean.utils.reflection import _FIELDS, _ID_FIELD_NAME
 from protean.utils.globals import current_domain
+from protean.utils.stages import STAGE_UPCAST, stage
 
 if TYPE_CHECKING:
     from protean.core.command import BaseCommand
@@ -864,7 +865,8 @@ class Message(BaseModel, OptionsMixin):
                 # Parse "DomainName.EventName.v1" → base + int version
                 base_type, _, version_str = type_string.rpartition(".")
                 from_version = int(version_str.lstrip("v"))
-                data = upcaster_chain.upcast(base_type, from_version, data)
+                with stage(STAGE_UPCAST):
+                    data = upcaster_chain.upcast(base_type, from_version, data)
 
             return element_cls(_metadata=self.metadata, **data)
 
@@ -1,29 +1,96 @@
 """Idempotency store for command deduplication.
 
-A lightweight utility wrapping Redis to track command processing status.
-Used internally by domain.process() and EventStoreSubscription to implement
-submission-level and subscription-level dedup.
+A lightweight utility that tracks command processing status in a pluggable
+backend (Redis, in-process memory, or a database table — see
+``protean.port.idempotency``). Used internally by domain.process() and
+EventStoreSubscription to implement submission-level and subscription-level
+dedup.
 
-When Redis is not configured (redis_url is None), all operations are no-ops
-and the system behaves as if idempotency is disabled.
+When no backend is configured, all operations are no-ops and the system
+behaves as if idempotency is disabled.
+
+Successful records are also remembered in a bounded in-process LRU so that
+redeliveries of recently processed messages are answered without a backend
+round trip.
 """
 
-import json
 import logging
-from typing import Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+
+from protean.adapters.idempotency.redis import RedisIdempotencyBackend
+from protean.port.idempotency import BaseIdempotencyBackend
+from protean.utils.globals import current_uow
 
 logger = logging.getLogger(__name__)
 
+# Default number of success records remembered in-process
+DEFAULT_LOCAL_CACHE_SIZE = 10_000
+
+
+class _LocalCache:
+    """Thread-safe, size-bounded LRU of success records with per-entry expiry.
+
+    Only success records are cached: they are terminal for the lifetime of
+    their TTL. Error records are short-lived by design and must stay visible
+    to retries, so they always go to the backend.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, record = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return record
+
+    def put(self, key: str, record: dict[str, Any], ttl: float) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, record)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class IdempotencyStore:
-    """Redis-backed idempotency cache for command deduplication.
+    """Idempotency cache for command deduplication.
 
-    Stores entries keyed as ``idempotency:{key}`` with JSON payloads
-    containing status, result, and error information. Entries have
-    configurable TTL.
+    Stores entries keyed by idempotency key with payloads containing
+    status, result, and error information. Entries have configurable TTL.
+    Storage is delegated to a ``BaseIdempotencyBackend``; passing only a
+    ``redis_url`` connects a ``RedisIdempotencyBackend``.
 
-    Falls back gracefully when Redis is not configured — all check/record
-    operations become no-ops.
+    Falls back gracefully when no backend is configured or the backend
+    fails — check/record operations become no-ops and are logged.
+
+    Success records are kept in a local LRU tier of ``local_cache_size``
+    entries (``0`` disables it) unless the backend already lives in
+    process. ``check_many`` and ``record_many`` resolve a whole batch with
+    one backend round trip.
     """
 
     def __init__(
@@ -31,17 +98,16 @@ class IdempotencyStore:
         redis_url: Optional[str] = None,
         ttl: int = 86400,
         error_ttl: int = 60,
+        local_cache_size: int = DEFAULT_LOCAL_CACHE_SIZE,
+        backend: Optional[BaseIdempotencyBackend] = None,
     ) -> None:
-        self._redis = None
+        self._backend = backend
         self._ttl = ttl
         self._error_ttl = error_ttl
 
-        if redis_url:
+        if backend is None and redis_url:
             try:
-                import redis  # noqa: PLC0415
-
-                self._redis = redis.Redis.from_url(redis_url)
-                self._redis.ping()
+                self._backend = RedisIdempotencyBackend.from_url(redis_url)
                 logger.info("Idempotency store connected to Redis at %s", redis_url)
             except Exception:
                 logger.warning(
@@ -49,33 +115,45 @@ class IdempotencyStore:
                     redis_url,
                     exc_info=True,
                 )
-                self._redis = None
-        else:
-            logger.debug("No redis_url configured for idempotency — dedup is disabled")
+        elif backend is None:
+            logger.debug("No idempotency backend configured — dedup is disabled")
+
+        if self._backend is not None and not self._backend.local_tier:
+            local_cache_size = 0
+        self._local = _LocalCache(local_cache_size)
 
     @property
     def is_active(self) -> bool:
-        """Whether the store has an active Redis connection."""
-        return self._redis is not None
+        """Whether the store has a usable backend."""
+        return self._backend is not None
 
-    def _key(self, idempotency_key: str) -> str:
-        return f"idempotency:{idempotency_key}"
+    @property
+    def backend(self) -> Optional[BaseIdempotencyBackend]:
+        """The backend records are stored in, or None when inactive."""
+        return self._backend
+
+    @property
+    def transactional(self) -> bool:
+        """Whether success records are written inside the handler's Unit of
+        Work, committing or rolling back with its changes."""
+        return self._backend is not None and self._backend.transactional
 
     def check(self, idempotency_key: str) -> Optional[dict[str, Any]]:
         """Look up an idempotency record.
 
         Returns:
             A dict with ``status``, ``result`` (or ``error``), or None if
-            no record exists (or Redis is unavailable).
+            no record exists (or the backend is unavailable).
         """
-        if not self._redis:
+        if self._backend is None:
             return None
 
+        cached = self._local.get(idempotency_key)
+        if cached is not None:
+            return cached
+
         try:
-            raw = self._redis.get(self._key(idempotency_key))
-            if raw is None:
-                return None
-            return json.loads(raw)
+            record = self._backend.get(idempotency_key)
         except Exception:
             logger.warning(
                 "Idempotency check failed for key %s — proceeding without dedup",
@@ -84,6 +162,71 @@ class IdempotencyStore:
             )
             return None
 
+        if record is not None:
+            self._remember(idempotency_key, record)
+        return record
+
+    def check_many(
+        self, idempotency_keys: Iterable[str]
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Look up several idempotency records at once.
+
+        Keys found in the local tier are answered in-process; the rest are
+        fetched from the backend in a single round trip.
+
+        Returns:
+            A dict mapping every requested key to its record, or None when
+            no record exists (or the backend is unavailable).
+        """
+        keys = list(dict.fromkeys(idempotency_keys))
+        results: dict[str, Optional[dict[str, Any]]] = dict.fromkeys(keys)
+        if self._backend is None or not keys:
+            return results
+
+        misses = []
+        for key in keys:
+            cached = self._local.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                misses.append(key)
+
+        if not misses:
+            return results
+
+        try:
+            fetched = self._backend.get_many(misses)
+        except Exception:
+            logger.warning(
+                "Idempotency batch check failed for %d keys — proceeding without dedup",
+                len(misses),
+                exc_info=True,
+            )
+            return results
+
+        for key in misses:
+            record = fetched.get(key)
+            if record is None:
+                continue
+            results[key] = record
+            self._remember(key, record)
+
+        return results
+
+    def _in_transaction(self) -> bool:
+        """Whether writes join an active Unit of Work and may roll back with it."""
+        return bool(
+            self._backend is not None
+            and self._backend.transactional
+            and current_uow
+            and current_uow.in_progress
+        )
+
+    def _remember(self, idempotency_key: str, record: dict[str, Any]) -> None:
+        """Keep success records in the local tier for at most ``ttl`` seconds."""
+        if record.get("status") == "success":
+            self._local.put(idempotency_key, record, self._ttl)
+
     def record_success(
         self,
         idempotency_key: str,
@@ -92,24 +235,78 @@ class IdempotencyStore:
     ) -> None:
         """Record a successful command processing.
 
+        With a transactional backend, calling this inside an active Unit of
+        Work commits the record together with the handler's changes. A
+        failed write then raises instead of being logged: the database has
+        usually aborted the transaction, and the handler's changes cannot
+        commit without the record anyway.
+
         Args:
             idempotency_key: The caller-provided idempotency key.
             result: The handler result (must be JSON-serializable).
             ttl: Override the default TTL (seconds).
         """
-        if not self._redis:
+        if self._backend is None:
             return
 
         ttl = ttl if ttl is not None else self._ttl
-        entry = json.dumps({"status": "success", "result": result})
+        record = {"status": "success", "result": result}
+        in_transaction = self._in_transaction()
         try:
-            self._redis.setex(self._key(idempotency_key), ttl, entry)
+            self._backend.set(idempotency_key, record, ttl)
         except Exception:
+            if in_transaction:
+                raise
             logger.warning(
                 "Failed to record idempotency success for key %s",
                 idempotency_key,
                 exc_info=True,
             )
+            return
+
+        # A record written inside a Unit of Work may still roll back; only
+        # cache it once it is known to be durable.
+        if not in_transaction:
+            self._local.put(idempotency_key, record, ttl)
+
+    def record_many(
+        self,
+        results: dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Record several successful command processings in one round trip.
+
+        Failures inside a Unit of Work raise, as for ``record_success``.
+
+        Args:
+            results: Mapping of idempotency key to handler result (each
+                result must be JSON-serializable).
+            ttl: Override the default TTL (seconds).
+        """
+        if self._backend is None or not results:
+            return
+
+        ttl = ttl if ttl is not None else self._ttl
+        records = {
+            key: {"status": "success", "result": result}
+            for key, result in results.items()
+        }
+        in_transaction = self._in_transaction()
+        try:
+            self._backend.set_many(records, ttl)
+        except Exception:
+            if in_transaction:
+                raise
+            logger.warning(
+                "Failed to record idempotency success for %d keys",
+                len(records),
+                exc_info=True,
+            )
+            return
+
+        if not in_transaction:
+            for key, record in records.items():
+                self._local.put(key, record, ttl)
 
     def record_error(
         self,
@@ -126,13 +323,13 @@ class IdempotencyStore:
             error: A string description of the error.
             ttl: Override the default error TTL (seconds).
         """
-        if not self._redis:
+        if self._backend is None:
             return
 
         ttl = ttl if ttl is not None else self._error_ttl
-        entry = json.dumps({"status": "error", "error": error})
+        self._local.discard(idempotency_key)
         try:
-            self._redis.setex(self._key(idempotency_key), ttl, entry)
+            self._backend.set(idempotency_key, {"status": "error", "error": error}, ttl)
         except Exception:
             logger.warning(
                 "Failed to record idempotency error for key %s",
@@ -140,12 +337,34 @@ class IdempotencyStore:
                 exc_info=True,
             )
 
+    def purge_expired(self) -> int:
+        """Remove expired records from the backend.
+
+        Returns:
+            The number of records removed (always 0 for backends that
+            expire records natively).
+        """
+        if self._backend is None:
+            return 0
+
+        try:
+            return self._backend.purge_expired()
+        except Exception:
+            logger.warning("Failed to purge expired idempotency records", exc_info=True)
+            return 0
+
     def flush(self) -> None:
         """Remove all idempotency entries. Useful for testing."""
-        if not self._redis:
+        self._local.clear()
+        if self._backend is None:
             return
 
         try:
-            self._redis.flushdb()
+            self._backend.flush()
         except Exception:
             logger.warning("Failed to flush idempotency store", exc_info=True)
+
+    def close(self) -> None:
+        """Release the backend's connections."""
+        if self._backend is not None:
+            self._backend.close()
@@ -4,7 +4,7 @@ import logging
 import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Union
 
 from protean.core.command import BaseCommand
 from protean.core.event import BaseEvent
@@ -16,9 +16,11 @@ from protean.exceptions import (
     SendError,
 )
 from protean.utils import DomainObjects
+from protean.utils.contention import get_contention_tracker
 from protean.utils.eventing import Message
-from protean.utils.globals import current_domain, g
+from protean.utils.globals import current_domain, current_uow, g
 from protean.utils.logging import access_log_handler
+from protean.utils.stages import STAGE_DESERIALIZE, STAGE_HANDLER, stage
 from protean.utils.telemetry import get_domain_metrics, set_span_error
 
 logger = logging.getLogger(__name__)
@@ -265,6 +267,46 @@ def _record_handler_retry(instance: Any, exc: BaseException) -> None:
         pass
 
 
+def _record_conflict_reload(exc: ExpectedVersionError) -> None:
+    """Count the reload of a conflicting aggregate caused by a version retry."""
+    try:
+        if current_domain and exc.aggregate is not None:
+            get_contention_tracker(current_domain).record_reload(
+                exc.aggregate, exc.aggregate_id
+            )
+    except Exception:  # metrics must never break the retry path
+        pass
+
+
+def _record_conflict_retries(aggregate: str, started_at: float) -> None:
+    """Record how long the retries caused by a version conflict took."""
+    try:
+        if current_domain:
+            get_contention_tracker(current_domain).record_retry_latency(
+                aggregate, time.monotonic() - started_at
+            )
+    except Exception:  # metrics must never break the retry path
+        pass
+
+
+def _invoke(fn: Callable, instance: Any, target_obj: Any) -> Any:
+    """Run a handler method inside its Unit of Work.
+
+    When the command carries an idempotency key and the idempotency backend
+    is transactional, the success record is written before the Unit of Work
+    exits, so it commits or rolls back together with the handler's changes.
+    """
+    result = fn(instance, target_obj)
+
+    if isinstance(target_obj, BaseCommand) and current_domain:
+        headers = getattr(target_obj._metadata, "headers", None)
+        idempotency_key = headers.idempotency_key if headers else None
+        if idempotency_key and current_domain.idempotency_store.transactional:
+            current_domain.idempotency_store.record_success(idempotency_key, result)
+
+    return result
+
+
 def _deadline_exceeded_after(delay: float) -> bool:
     """Return ``True`` when the in-context command's deadline would pass before
     the next retry attempt (i.e. after sleeping ``delay`` seconds).
@@ -351,74 +393,91 @@ class handle:
                 transient_cfg["exceptions"] if transient_max > 0 else ()
             )
 
+            # Inside a batch UnitOfWork (``domain.process_many``) the handler
+            # joins the shared transaction. A failure rolls back the batch,
+            # which then re-runs its commands one by one with retries.
+            if current_uow and current_uow.in_progress and current_uow.is_batch:
+                with stage(STAGE_HANDLER):
+                    return _invoke(fn, instance, target_obj)
+
             # Fast path: neither policy active — run once without a retry loop.
             if version_max == 0 and transient_max == 0:
-                with UnitOfWork():
-                    return fn(instance, target_obj)
+                with UnitOfWork(), stage(STAGE_HANDLER):
+                    return _invoke(fn, instance, target_obj)
 
             version_attempt = 0
             transient_attempt = 0
-            while True:
-                try:
-                    with UnitOfWork():
-                        return fn(instance, target_obj)
-                except ExpectedVersionError:
-                    if version_attempt >= version_max:
-                        raise
-                    # Version (OCC) retry is always exponential.
-                    delay = _transient_backoff_delay(
-                        "exponential",
-                        version_attempt,
-                        version_cfg["base_delay_seconds"],
-                        version_cfg["max_delay_seconds"],
-                    )
-                    # Never sleep into an attempt that would start past the
-                    # command deadline — surface the conflict instead.
-                    if _deadline_exceeded_after(delay):
+            # Set on the first version conflict, to measure how long the
+            # retries it caused take
+            conflict: Optional[tuple[str, float]] = None
+            try:
+                while True:
+                    try:
+                        with UnitOfWork(), stage(STAGE_HANDLER):
+                            return _invoke(fn, instance, target_obj)
+                    except ExpectedVersionError as exc:
+                        if conflict is None and exc.aggregate is not None:
+                            conflict = (exc.aggregate, time.monotonic())
+                        if version_attempt >= version_max:
+                            raise
+                        # Version (OCC) retry is always exponential.
+                        delay = _transient_backoff_delay(
+                            "exponential",
+                            version_attempt,
+                            version_cfg["base_delay_seconds"],
+                            version_cfg["max_delay_seconds"],
+                        )
+                        # Never sleep into an attempt that would start past the
+                        # command deadline — surface the conflict instead.
+                        if _deadline_exceeded_after(delay):
+                            logger.debug(
+                                "Command deadline would elapse before retrying %s; "
+                                "stopping version retry",
+                                fn.__qualname__,
+                            )
+                            raise
                         logger.debug(
-                            "Command deadline would elapse before retrying %s; "
-                            "stopping version retry",
+                            "Version conflict in %s, retrying (%d/%d) after %.3fs",
                             fn.__qualname__,
+                            version_attempt + 1,
+                            version_max,
+                            delay,
                         )
-                        raise
-                    logger.debug(
-                        "Version conflict in %s, retrying (%d/%d) after %.3fs",
-                        fn.__qualname__,
-                        version_attempt + 1,
-                        version_max,
-                        delay,
-                    )
-                    version_attempt += 1
-                    time.sleep(delay)
-                except transient_excs as exc:
-                    if transient_attempt >= transient_max:
-                        raise
-                    delay = _transient_backoff_delay(
-                        transient_cfg["backoff"],
-                        transient_attempt,
-                        transient_cfg["base_delay_seconds"],
-                        transient_cfg["max_delay_seconds"],
-                    )
-                    # Never sleep into an attempt that would start past the
-                    # command deadline — surface the transient failure instead.
-                    if _deadline_exceeded_after(delay):
+                        _record_conflict_reload(exc)
+                        version_attempt += 1
+                        time.sleep(delay)
+                    except transient_excs as exc:
+                        if transient_attempt >= transient_max:
+                            raise
+                        delay = _transient_backoff_delay(
+                            transient_cfg["backoff"],
+                            transient_attempt,
+                            transient_cfg["base_delay_seconds"],
+                            transient_cfg["max_delay_seconds"],
+                        )
+                        # Never sleep into an attempt that would start past the
+                        # command deadline — surface the transient failure instead.
+                        if _deadline_exceeded_after(delay):
+                            logger.debug(
+                                "Command deadline would elapse before retrying %s; "
+                                "stopping transient retry",
+                                fn.__qualname__,
+                            )
+                            raise
                         logger.debug(
-                            "Command deadline would elapse before retrying %s; "
-                            "stopping transient retry",
+                            "Transient error %s in %s, retrying (%d/%d) after %.3fs",
+                            type(exc).__name__,
                             fn.__qualname__,
+                            transient_attempt + 1,
+                            transient_max,
+                            delay,
                         )
-                        raise
-                    logger.debug(
-                        "Transient error %s in %s, retrying (%d/%d) after %.3fs",
-                        type(exc).__name__,
-                        fn.__qualname__,
-                        transient_attempt + 1,
-                        transient_max,
-                        delay,
-                    )
-                    _record_handler_retry(instance, exc)
-                    transient_attempt += 1
-                    time.sleep(delay)
+                        _record_handler_retry(instance, exc)
+                        transient_attempt += 1
+                        time.sleep(delay)
+            finally:
+                if conflict is not None:
+                    _record_conflict_retries(*conflict)
 
         setattr(wrapper, "_target_cls", self._target_cls)
         setattr(wrapper, "_start", self._start)
@@ -485,7 +544,9 @@ class HandlerMixin:
             Any: Return value from the handler method (for command and query handlers)
         """
         # Convert Message to object if necessary
-        item = item.to_domain_object() if isinstance(item, Message) else item
+        if isinstance(item, Message):
+            with stage(STAGE_DESERIALIZE):
+                item = item.to_domain_object()
 
         # Use specific handlers if available, or fallback on `$any` if defined
         handlers = cls._handlers[item.__class__.__type__] or cls._handlers["$any"]
@@ -259,6 +259,26 @@ class Outbox(BaseAggregate):
         self._clear_lock()
         return True
 
+    def release(self, worker_id: str) -> bool:
+        """Give up a worker's claim without counting a processing attempt.
+
+        Used when a draining worker returns claimed messages it did not get
+        to, so another worker can claim them right away.
+
+        Args:
+            worker_id: Identifier of the worker that claimed the message
+
+        Returns:
+            True if the claim was released, False if the message is not
+            being processed by ``worker_id``
+        """
+        if self.status != OutboxStatus.PROCESSING.value or self.locked_by != worker_id:
+            return False
+
+        self.status = OutboxStatus.PENDING.value
+        self._clear_lock()
+        return True
+
     def update_priority(self, new_priority: int) -> None:
         """Update message priority for reordering.
 
@@ -733,13 +753,14 @@ class OutboxRepository(BaseRepository):
     def count_by_status(self) -> dict:
         """Get count of messages by their status.
 
+        Issues a single grouped count (``GROUP BY status`` on SQL providers)
+        rather than one ``COUNT`` per status.
+
         Returns:
             Dictionary with status as key and count as value
         """
-        return {
-            status.value: self._dao.query.filter(status=status.value).count()
-            for status in OutboxStatus
-        }
+        counts = self._dao._count_by("status")
+        return {status.value: counts.get(status.value, 0) for status in OutboxStatus}
 
     def _cleanup_batch_size(self) -> int:
         """Resolve the cleanup batch size from ``[outbox.cleanup]`` config.
@@ -0,0 +1,265 @@
+"""Process manager stream compaction.
+
+Process managers persist their full state as a transition event after every
+handler, so only the last transition of a stream is ever needed to load an
+instance. Compaction reclaims the rest:
+
+1. Lists the instances of a process manager from its stream category.
+2. Selects streams with at least ``min_transitions`` transitions whose
+   instance is complete, or has been idle for ``idle_days``.
+3. Appends a terminal snapshot transition carrying the current state,
+   with the stream's version as the expected version. An instance that
+   moved on in the meantime fails the check and is left alone.
+4. Optionally archives the older transitions to a JSON Lines file, then
+   truncates them from the stream.
+
+A stream whose last transition is a snapshot that still has transitions
+before it was interrupted between steps 3 and 4; the next run archives and
+truncates them without writing another snapshot. The store's ability to
+truncate is checked before any snapshot is written.
+
+Compacted streams keep working: process managers load from their last
+transition, and an idle instance that receives another event continues
+after the snapshot. Truncation needs event store support (the in-memory
+store and Message DB provide it).
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from protean.exceptions import ConfigurationError, NotSupportedError
+from protean.utils import DomainObjects
+from protean.utils.eventing import Message
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+logger = logging.getLogger(__name__)
+
+# Handler name recorded on the terminal snapshot transition
+COMPACTION_HANDLER = "$compaction"
+
+
+@dataclass
+class CompactionResult:
+    """Result of compacting the streams of one process manager."""
+
+    process_manager: str
+    streams_examined: int = 0
+    streams_compacted: int = 0
+    transitions_removed: int = 0
+    transitions_archived: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return len(self.errors) == 0
+
+
+def compact_process_manager(
+    domain: "Domain",
+    pm_cls: type,
+    *,
+    idle_days: float | None = None,
+    min_transitions: int | None = None,
+    archive: str | Path | None = None,
+    dry_run: bool = False,
+) -> CompactionResult:
+    """Compact the transition streams of a process manager.
+
+    Args:
+        domain: The initialized domain instance.
+        pm_cls: The process manager class to compact.
+        idle_days: Also compact incomplete instances whose last transition
+            is older than this many days. Defaults to the
+            ``process_manager.compaction.idle_days`` config; ``None`` there
+            compacts completed instances only.
+        min_transitions: Leave streams with fewer transitions alone.
+            Defaults to ``process_manager.compaction.min_transitions``.
+        archive: JSON Lines file the removed transitions are appended to
+            before they are truncated.
+        dry_run: Count what would be compacted without writing anything.
+
+    Returns:
+        CompactionResult with counts and any errors.
+    """
+    config = domain.config.get("process_manager", {}).get("compaction", {})
+    if idle_days is None:
+        idle_days = config.get("idle_days")
+    if min_transitions is None:
+        min_transitions = config.get("min_transitions", 10)
+    min_transitions = max(2, min_transitions)
+
+    result = CompactionResult(process_manager=pm_cls.__name__)
+    store = domain.event_store.store
+    category = pm_cls.meta_.stream_category
+    cutoff = (
+        datetime.now(timezone.utc) - timedelta(days=idle_days)
+        if idle_days is not None
+        else None
+    )
+
+    if not dry_run:
+        try:
+            store._check_truncate_support()
+        except (NotSupportedError, ConfigurationError) as exc:
+            logger.error(
+                "Cannot compact process manager `%s`: %s", pm_cls.__name__, exc
+            )
+            result.errors.append(str(exc))
+            return result
+
+    archive_file: TextIO | None = None
+    try:
+        if archive is not None and not dry_run:
+            archive_file = open(archive, "a", encoding="utf-8")
+
+        for identifier in store._stream_identifiers(category):
+            stream_name = f"{category}-{identifier}"
+            last = store._read_last_message(stream_name)
+            if last is None:
+                continue
+            result.streams_examined += 1
+
+            if not _is_eligible(store, stream_name, last, cutoff, min_transitions):
+                continue
+
+            if dry_run:
+                result.streams_compacted += 1
+                result.transitions_removed += _transition_count(
+                    store, stream_name, last
+                ) - int(_is_snapshot(last))
+                continue
+
+            try:
+                _compact_stream(
+                    store, pm_cls, stream_name, identifier, last, archive_file, result
+                )
+            except (NotSupportedError, ConfigurationError) as exc:
+                result.errors.append(str(exc))
+                break
+            except Exception as exc:
+                logger.error("Failed to compact stream `%s`: %s", stream_name, exc)
+                result.errors.append(f"Stream `{stream_name}`: {exc}")
+    finally:
+        if archive_file is not None:
+            archive_file.close()
+
+    logger.info(
+        "Compacted %d of %d stream(s) of process manager `%s`, removing %d "
+        "transition(s)",
+        result.streams_compacted,
+        result.streams_examined,
+        pm_cls.__name__,
+        result.transitions_removed,
+    )
+    return result
+
+
+def compact_all_process_managers(
+    domain: "Domain",
+    *,
+    idle_days: float | None = None,
+    min_transitions: int | None = None,
+    archive: str | Path | None = None,
+    dry_run: bool = False,
+) -> dict[str, CompactionResult]:
+    """Compact the transition streams of every process manager in the domain.
+
+    Returns:
+        Dictionary mapping process manager class names to their results.
+    """
+    results: dict[str, CompactionResult] = {}
+
+    for _, record in domain.registry._elements[
+        DomainObjects.PROCESS_MANAGER.value
+    ].items():
+        results[record.cls.__name__] = compact_process_manager(
+            domain,
+            record.cls,
+            idle_days=idle_days,
+            min_transitions=min_transitions,
+            archive=archive,
+            dry_run=dry_run,
+        )
+
+    return results
+
+
+def _transition_count(store: Any, stream_name: str, last: dict[str, Any]) -> int:
+    """Count a stream's transitions, which may start after position 0."""
+    (first,) = store._read(stream_name, no_of_messages=1)
+    return last["position"] - first["position"] + 1
+
+
+def _is_snapshot(message: dict[str, Any]) -> bool:
+    return (message.get("data") or {}).get("handler_name") == COMPACTION_HANDLER
+
+
+def _is_eligible(
+    store: Any,
+    stream_name: str,
+    last: dict[str, Any],
+    cutoff: datetime | None,
+    min_transitions: int,
+) -> bool:
+    # A snapshot with transitions still before it is an interrupted
+    # compaction, finished regardless of the retention policy
+    if _is_snapshot(last):
+        return _transition_count(store, stream_name, last) > 1
+
+    data = last.get("data") or {}
+
+    if not data.get("is_complete"):
+        if cutoff is None:
+            return False
+        written_at = store._parse_event_time(last.get("time"))
+        if written_at is None:
+            return False
+        written_at, cutoff = store._make_comparable(written_at, cutoff)
+        if written_at > cutoff:
+            return False
+
+    return _transition_count(store, stream_name, last) >= min_transitions
+
+
+def _compact_stream(
+    store: Any,
+    pm_cls: type,
+    stream_name: str,
+    identifier: str,
+    last: dict[str, Any],
+    archive_file: TextIO | None,
+    result: CompactionResult,
+) -> None:
+    """Write the terminal snapshot, archive and truncate the older transitions.
+
+    Each step can be retried: a failure after the snapshot is written leaves
+    the stream eligible, and the next run resumes from the existing snapshot.
+    """
+    if _is_snapshot(last):
+        snapshot_position = last["position"]
+    else:
+        pm = pm_cls._from_last_transition(Message.deserialize(last), identifier)
+        pm_cls._persist_transition(pm, COMPACTION_HANDLER)
+        snapshot_position = pm._version
+
+    if archive_file is not None:
+        position = 0
+        while True:
+            page = store._read(stream_name, position=position, no_of_messages=1000)
+            page = [m for m in page if m["position"] < snapshot_position]
+            for message in page:
+                archive_file.write(json.dumps(message, default=str) + "\n")
+            result.transitions_archived += len(page)
+            if len(page) < 1000:
+                break
+            position = page[-1]["position"] + 1
+        archive_file.flush()
+
+    result.transitions_removed += store.truncate_stream(stream_name, snapshot_position)
+    result.streams_compacted += 1
@@ -7,32 +7,80 @@ The rebuild process:
 
 1. Discovers all projectors targeting a given projection class.
 2. Truncates existing projection data (database rows or cache entries).
-3. Reads events from each projector's stream categories, merges them by
-   ``global_position`` for correct cross-aggregate ordering, and dispatches
-   each event through the projector's ``_handle()`` method.
+3. Streams events from each projector's stream categories page by page,
+   merges them by ``global_position`` for correct cross-aggregate ordering,
+   and dispatches each event through the projector's ``_handle()`` method.
 
 Upcasters are applied automatically during replay via ``to_domain_object()``.
 Events whose type cannot be resolved (deprecated events without an upcaster
 chain) are caught, logged, and skipped.
 
-The rebuild is **idempotent** -- running it again truncates and replays from
-scratch with no checkpointing or partial state.
+Each page of ``batch_size`` events is applied in a single batch
+``UnitOfWork``, so a page costs one commit instead of one per event. When an
+event in the page fails, the page is rolled back and replayed one event at
+a time so that only the failing events are skipped.
+
+After every committed page the rebuild writes a checkpoint -- the
+``global_position`` of the last event applied -- to a
+``rebuild-<projection>-<projector>-<partition>`` stream in the event store.
+A rebuild started with ``resume=True`` skips truncation and continues after
+the checkpoints left by an interrupted run. At most one page is replayed
+twice, so handlers must tolerate seeing an event again after a crash.
+
+With ``workers > 1`` each projector's events are split into partitions by a
+stable hash of a partition key, and the partitions are replayed on separate
+threads. The event store is read once per projector: the reading thread
+routes each page-worth of a partition's events to that partition's worker.
+The default key is the projection's identifier when the event carries a
+field of that name, and the event's stream identifier otherwise. Events for
+the same projection record therefore stay in one partition and in global
+order. Providers with simulated transactions (the in-memory provider)
+cannot apply concurrent units of work safely, so their pages are applied on
+the reading thread instead.
+
+With ``shadow=True`` the live projection is left alone while the rebuild
+runs. The provider creates shadow storage next to it (a table, an index or
+an in-memory schema), the replay writes there, and once the shadow has
+caught up with the event store the provider swaps it in atomically and
+drops the old copy. A last pass applies events appended during the swap,
+and the projectors' subscription positions are moved up to the rebuilt
+copy's position, so subscriptions started afterwards continue from there.
 """
 
+import heapq
 import logging
+import queue
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-
-from protean.exceptions import ConfigurationError
-from protean.utils import DomainObjects
-from protean.utils.eventing import Message
+from datetime import datetime, timezone
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+from uuid import uuid4
+
+from protean.core.unit_of_work import UnitOfWork
+from protean.exceptions import ConfigurationError, NotSupportedError
+from protean.port.provider import DatabaseCapabilities, use_shadow_storage
+from protean.utils import DomainObjects, fqn
+from protean.utils.eventing import Message, MessageType
 from protean.utils.inflection import underscore
+from protean.utils.reflection import id_field
 
 if TYPE_CHECKING:
     from protean.domain import Domain
 
 logger = logging.getLogger(__name__)
 
+PartitionKey = Callable[[Message], Any]
+
+# Replay passes a shadow rebuild makes to catch up before swapping
+SHADOW_CATCH_UP_PASSES = 5
+
+# Pages routed to a partition worker that may wait for it; bounds how far
+# the reader runs ahead of the slowest partition
+PARTITION_QUEUE_PAGES = 2
+
 
 @dataclass
 class RebuildResult:
@@ -47,6 +95,8 @@ class RebuildResult:
             during handler execution.
         errors: Error messages (empty on success). Non-empty errors cause
             ``success`` to return ``False``.
+        resumed: Whether the rebuild continued from the checkpoints of an
+            earlier run instead of starting from scratch.
     """
 
     projection_name: str
@@ -55,6 +105,7 @@ class RebuildResult:
     events_dispatched: int = 0
     events_skipped: int = 0
     errors: list[str] = field(default_factory=list)
+    resumed: bool = False
 
     @property
     def success(self) -> bool:
@@ -62,10 +113,34 @@ class RebuildResult:
         return len(self.errors) == 0
 
 
+@dataclass
+class _Partition:
+    """One slice of a projector's events, chosen by a stable key hash."""
+
+    index: int = 0
+    count: int = 1
+    key: PartitionKey | None = None
+
+    def owns(self, message: Message) -> bool:
+        return self.index_of(message) == self.index
+
+    def index_of(self, message: Message) -> int:
+        """Index of the partition a message belongs to."""
+        if self.count <= 1 or self.key is None:
+            return 0
+        digest = zlib.crc32(str(self.key(message)).encode("utf-8"))
+        return digest % self.count
+
+
 def rebuild_projection(
     domain: "Domain",
     projection_cls: type,
     batch_size: int = 500,
+    *,
+    resume: bool = False,
+    workers: int = 1,
+    partition_key: PartitionKey | None = None,
+    shadow: bool = False,
 ) -> RebuildResult:
     """Rebuild a projection by replaying events through its projectors.
 
@@ -73,14 +148,22 @@ def rebuild_projection(
     event store through each projector that targets this projection.
     Upcasters are applied automatically during replay.
 
-    Events are read from the ``$all`` stream and filtered to only the
-    categories each projector listens to, ensuring correct global ordering
-    for cross-aggregate projections.
+    Events are streamed from each category the projector listens to and
+    merged by global position, ensuring correct global ordering for
+    cross-aggregate projections.
 
     Args:
         domain: The initialized domain instance.
         projection_cls: The projection class to rebuild.
-        batch_size: Number of events to read per batch from the event store.
+        batch_size: Number of events to read and apply per page.
+        resume: Continue from the checkpoints of an interrupted rebuild
+            instead of truncating. Falls back to a full rebuild when no
+            checkpoints exist.
+        workers: Number of partitions to replay in parallel.
+        partition_key: Callable returning the partition key of a message.
+            Defaults to the projection's identifier, read from the event.
+        shadow: Build into shadow storage and swap it in when caught up,
+            leaving the live projection readable throughout.
 
     Returns:
         RebuildResult with counts and any errors.
@@ -95,44 +178,77 @@ def rebuild_projection(
         )
         return result
 
-    # Truncate projection data
-    _truncate_projection(domain, projection_cls)
-    logger.info("Truncated projection `%s`", projection_cls.__name__)
-
-    # Replay events through each projector
+    workers = max(1, workers)
+    key = partition_key or _default_partition_key(projection_cls)
+    checkpoint_streams = {
+        projector_cls: [
+            _checkpoint_stream(projection_cls, projector_cls, index, workers)
+            for index in range(workers)
+        ]
+        for projector_cls in projectors
+    }
     for projector_cls in projectors:
         result.projectors_processed += 1
-        categories = list(projector_cls.meta_.stream_categories)
-        result.categories_processed += len(categories)
+        result.categories_processed += len(projector_cls.meta_.stream_categories)
+
+    if shadow:
+        if resume:
+            result.errors.append("A shadow rebuild cannot be resumed")
+            return result
+        _rebuild_into_shadow(
+            domain, projection_cls, checkpoint_streams, result, batch_size, key
+        )
+        return result
 
-        dispatched, skipped = _replay_projector(
-            domain, projector_cls, categories, batch_size
+    all_streams = [s for streams in checkpoint_streams.values() for s in streams]
+    positions = {stream: _read_checkpoint(domain, stream) for stream in all_streams}
+    result.resumed = resume and all(p is not None for p in positions.values())
+
+    if not result.resumed:
+        # Truncate projection data, then reset the checkpoints so that an
+        # interruption from here on can be resumed.
+        _truncate_projection(domain, projection_cls)
+        logger.info("Truncated projection `%s`", projection_cls.__name__)
+        for stream in all_streams:
+            _write_checkpoint(domain, stream, -1)
+            positions[stream] = -1
+    else:
+        logger.info(
+            "Resuming rebuild of projection `%s` from checkpoints",
+            projection_cls.__name__,
         )
-        result.events_dispatched += dispatched
-        result.events_skipped += skipped
 
-    logger.info(
-        "Rebuilt projection `%s`: %d events dispatched, %d skipped, "
-        "%d projector(s), %d category/categories",
-        projection_cls.__name__,
-        result.events_dispatched,
-        result.events_skipped,
-        result.projectors_processed,
-        result.categories_processed,
+    _replay_pass(
+        domain,
+        projection_cls,
+        checkpoint_streams,
+        positions,
+        result,
+        batch_size,
+        key,
+        persist=True,
     )
 
+    _log_result(result)
     return result
 
 
 def rebuild_all_projections(
     domain: "Domain",
     batch_size: int = 500,
+    *,
+    resume: bool = False,
+    workers: int = 1,
+    shadow: bool = False,
 ) -> dict[str, RebuildResult]:
     """Rebuild all projections registered in the domain.
 
     Args:
         domain: The initialized domain instance.
-        batch_size: Number of events to read per batch from the event store.
+        batch_size: Number of events to read and apply per page.
+        resume: Continue each projection from its rebuild checkpoints.
+        workers: Number of partitions to replay in parallel per projector.
+        shadow: Rebuild each projection into shadow storage and swap it in.
 
     Returns:
         Dictionary mapping projection class names to their RebuildResult.
@@ -142,12 +258,180 @@ def rebuild_all_projections(
     for _, record in domain.registry._elements[DomainObjects.PROJECTION.value].items():
         if record.internal:
             continue
-        result = rebuild_projection(domain, record.cls, batch_size)
+        result = rebuild_projection(
+            domain,
+            record.cls,
+            batch_size,
+            resume=resume,
+            workers=workers,
+            shadow=shadow,
+        )
         results[record.cls.__name__] = result
 
     return results
 
 
+def _rebuild_into_shadow(
+    domain: "Domain",
+    projection_cls: type,
+    checkpoint_streams: dict[type, list[str]],
+    result: RebuildResult,
+    batch_size: int,
+    key: PartitionKey,
+) -> None:
+    """Rebuild into shadow storage, swap it in and hand over positions.
+
+    The shadow is replayed until a pass applies fewer than ``batch_size``
+    events, then swapped in. Events appended since the last pass went to
+    the old copy only, so one more pass applies them to the new live copy.
+    Live projectors may handle some of those events too; as on any
+    subscription restart, they are delivered at least once.
+    """
+    if projection_cls.meta_.cache:
+        result.errors.append("Shadow rebuilds need a database-backed projection")
+        return
+
+    provider = domain.providers[projection_cls.meta_.provider]
+    database_model_cls = domain.repository_for(projection_cls)._database_model
+    try:
+        shadow_name = provider.create_shadow(projection_cls, database_model_cls)
+    except NotSupportedError as exc:
+        result.errors.append(str(exc))
+        return
+    logger.info(
+        "Rebuilding projection `%s` into `%s`", projection_cls.__name__, shadow_name
+    )
+
+    positions = {s: -1 for streams in checkpoint_streams.values() for s in streams}
+    replay = partial(
+        _replay_pass,
+        domain,
+        projection_cls,
+        checkpoint_streams,
+        positions,
+        result,
+        batch_size,
+        key,
+        persist=False,
+    )
+
+    try:
+        with use_shadow_storage(projection_cls, shadow_name):
+            applied, passes = replay(), 1
+            while applied >= batch_size and passes < SHADOW_CATCH_UP_PASSES:
+                applied, passes = replay(), passes + 1
+    except BaseException:
+        provider.drop_shadow(projection_cls, database_model_cls, shadow_name)
+        raise
+
+    if result.errors:
+        provider.drop_shadow(projection_cls, database_model_cls, shadow_name)
+        return
+
+    provider.swap_shadow(projection_cls, database_model_cls, shadow_name)
+    logger.info("Swapped `%s` in for `%s`", shadow_name, projection_cls.__name__)
+
+    replay()
+    _hand_over_positions(domain, checkpoint_streams, max(positions.values()))
+    _log_result(result)
+
+
+def _hand_over_positions(
+    domain: "Domain", checkpoint_streams: dict[type, list[str]], position: int
+) -> None:
+    """Move projector subscription positions up to the rebuilt copy's position.
+
+    A subscription that starts afterwards continues after the last event the
+    new copy already contains, instead of handling those events again.
+    """
+    if position < 0:
+        return
+
+    for projector_cls in checkpoint_streams:
+        for category in projector_cls.meta_.stream_categories:
+            stream = f"position-{fqn(projector_cls)}-{category}"
+            current = _read_checkpoint(domain, stream)
+            if current is None or current < position:
+                _write_checkpoint(domain, stream, position, origin_stream=category)
+
+
+def _replay_pass(
+    domain: "Domain",
+    projection_cls: type,
+    checkpoint_streams: dict[type, list[str]],
+    positions: dict[str, int],
+    result: RebuildResult,
+    batch_size: int,
+    key: PartitionKey,
+    *,
+    persist: bool,
+) -> int:
+    """Replay every partition of every projector once, from ``positions``.
+
+    Advances ``positions`` as pages are applied (and, with ``persist``,
+    writes them to the checkpoint streams). Returns the number of events
+    handled in the pass.
+    """
+    transactional = _supports_batching(domain, projection_cls)
+    handled = 0
+
+    for projector_cls, streams in checkpoint_streams.items():
+        categories = list(projector_cls.meta_.stream_categories)
+        workers = len(streams)
+
+        def checkpointer(stream: str) -> Callable[[int], None]:
+            def checkpoint(position: int) -> None:
+                positions[stream] = position
+                if persist:
+                    _write_checkpoint(domain, stream, position)
+
+            return checkpoint
+
+        outcomes = _replay_partitions(
+            domain,
+            projector_cls,
+            categories,
+            batch_size,
+            [positions[stream] for stream in streams],
+            [checkpointer(stream) for stream in streams],
+            key,
+            transactional=transactional,
+            concurrent=workers > 1 and _supports_concurrency(domain, projection_cls),
+        )
+
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "Partition %d of `%s` failed: %s",
+                    index,
+                    projector_cls.__name__,
+                    outcome,
+                )
+                result.errors.append(
+                    f"Partition {index} of projector `{projector_cls.__name__}` "
+                    f"failed: {outcome}"
+                )
+                continue
+            dispatched, skipped = outcome
+            result.events_dispatched += dispatched
+            result.events_skipped += skipped
+            handled += dispatched + skipped
+
+    return handled
+
+
+def _log_result(result: RebuildResult) -> None:
+    logger.info(
+        "Rebuilt projection `%s`: %d events dispatched, %d skipped, "
+        "%d projector(s), %d category/categories",
+        result.projection_name,
+        result.events_dispatched,
+        result.events_skipped,
+        result.projectors_processed,
+        result.categories_processed,
+    )
+
+
 def _truncate_projection(domain: "Domain", projection_cls: type) -> None:
     """Truncate all data for a projection.
 
@@ -162,15 +446,300 @@ def _truncate_projection(domain: "Domain", projection_cls: type) -> None:
         repo._dao._delete_all()
 
 
+def _default_partition_key(projection_cls: type) -> PartitionKey:
+    """Key messages by the projection record they are likely to update.
+
+    Events usually carry the projection's identifier (``user_id`` for a
+    projection keyed by ``user_id``), even when they come from another
+    aggregate's stream. Events without it fall back to their stream
+    identifier.
+    """
+    identifier = id_field(projection_cls)
+    field_name = identifier.field_name if identifier else None
+
+    def key(message: Message) -> Any:
+        if field_name and message.data and message.data.get(field_name) is not None:
+            return message.data[field_name]
+        stream = message.metadata.headers.stream if message.metadata else None
+        return (stream or "").split("-", 1)[-1]
+
+    return key
+
+
+def _supports_concurrency(domain: "Domain", projection_cls: type) -> bool:
+    """Whether partitions can be replayed on parallel threads.
+
+    Simulated transactions copy the whole database per unit of work and
+    swap it in on commit, so concurrent units of work overwrite each other.
+    The in-memory event store keeps its messages the same way.
+    """
+    from protean.adapters.event_store.memory import MemoryEventStore  # noqa: PLC0415
+
+    if isinstance(domain.event_store.store, MemoryEventStore):
+        return False
+    if projection_cls.meta_.cache:
+        return True
+    provider = domain.providers[projection_cls.meta_.provider]
+    return not provider.has_capability(DatabaseCapabilities.SIMULATED_TRANSACTIONS)
+
+
+def _supports_batching(domain: "Domain", projection_cls: type) -> bool:
+    """Whether a page of events can be applied in one unit of work.
+
+    A failed page is rolled back and replayed event by event, which is only
+    safe when the rollback actually discards the page's writes.
+    """
+    if projection_cls.meta_.cache:
+        return False
+    provider = domain.providers[projection_cls.meta_.provider]
+    return provider.has_capability(
+        DatabaseCapabilities.TRANSACTIONS
+    ) or provider.has_capability(DatabaseCapabilities.SIMULATED_TRANSACTIONS)
+
+
+def _checkpoint_stream(
+    projection_cls: type, projector_cls: type, partition: int, workers: int
+) -> str:
+    """Name of the stream holding a partition's rebuild checkpoints.
+
+    The partition count is part of the name, so a rebuild with a different
+    number of workers never resumes from incompatible checkpoints.
+    """
+    return (
+        f"rebuild-{underscore(projection_cls.__name__)}"
+        f"-{underscore(projector_cls.__name__)}-{partition}.{workers}"
+    )
+
+
+def _read_checkpoint(domain: "Domain", stream: str) -> int | None:
+    """Return the last checkpointed global position, or ``None``."""
+    message = domain.event_store.store._read_last_message(stream)
+    if message:
+        return message["data"]["position"]
+    return None
+
+
+def _write_checkpoint(
+    domain: "Domain", stream: str, position: int, origin_stream: str | None = None
+) -> None:
+    domain_meta = {"kind": MessageType.READ_POSITION.value}
+    if origin_stream:
+        domain_meta["origin_stream"] = origin_stream
+    domain.event_store.store._write(
+        stream,
+        "Read",
+        {"position": position},
+        metadata={
+            "headers": {
+                "id": str(uuid4()),
+                "type": "Read",
+                "time": datetime.now(timezone.utc).isoformat(),
+                "stream": stream,
+            },
+            "domain": domain_meta,
+        },
+    )
+
+
+def _global_position(message: Message) -> int:
+    return message.metadata.event_store.global_position or 0
+
+
+def _stream_category(
+    domain: "Domain", category: str, after: int, batch_size: int
+) -> Iterator[Message]:
+    """Yield a category's messages past ``after``, one page at a time."""
+    position = after + 1
+    while True:
+        page = domain.event_store.store.read(
+            category, position=position, no_of_messages=batch_size
+        )
+        yield from page
+        if len(page) < batch_size:
+            return
+        position = _global_position(page[-1]) + 1
+
+
+def _routed_pages(
+    domain: "Domain",
+    stream_categories: list[str],
+    afters: list[int],
+    batch_size: int,
+    partition: _Partition,
+) -> Iterator[tuple[int, list[Message]]]:
+    """Read the categories once and split them into per-partition pages.
+
+    Messages are merged by ``global_position``. Yields ``(partition index,
+    page)`` pairs; each partition's pages hold up to ``batch_size`` of its
+    messages past its own position in ``afters``.
+    """
+    merged = heapq.merge(
+        *(
+            _stream_category(domain, category, min(afters), batch_size)
+            for category in stream_categories
+        ),
+        key=_global_position,
+    )
+    pages: list[list[Message]] = [[] for _ in afters]
+    for message in merged:
+        index = partition.index_of(message)
+        if _global_position(message) <= afters[index]:
+            continue
+        pages[index].append(message)
+        if len(pages[index]) >= batch_size:
+            yield index, pages[index]
+            pages[index] = []
+    for index, page in enumerate(pages):
+        if page:
+            yield index, page
+
+
+def _replay_partitions(
+    domain: "Domain",
+    projector_cls: type,
+    stream_categories: list[str],
+    batch_size: int,
+    afters: list[int],
+    checkpoints: list[Callable[[int], None] | None],
+    key: PartitionKey | None,
+    *,
+    transactional: bool,
+    concurrent: bool,
+) -> list[tuple[int, int] | Exception]:
+    """Replay a projector's partitions from a single read of its categories.
+
+    The calling thread reads the categories and routes each page to its
+    partition. With ``concurrent`` every partition applies its pages on its
+    own thread, fed through a bounded queue; otherwise pages are applied as
+    they are read. Returns each partition's ``(dispatched, skipped)``
+    counts, or the exception that stopped it.
+    """
+    count = len(afters)
+    partition = _Partition(count=count, key=key)
+    logger.info(
+        "Replaying categories %s through `%s` (%d partition(s))",
+        stream_categories,
+        projector_cls.__name__,
+        count,
+    )
+    routed = _routed_pages(domain, stream_categories, afters, batch_size, partition)
+
+    if not concurrent:
+        outcomes: list[tuple[int, int] | Exception] = [(0, 0)] * count
+        try:
+            for index, page in routed:
+                if isinstance(outcomes[index], Exception):
+                    continue
+                try:
+                    dispatched, skipped = _apply_pages(
+                        projector_cls, [page], checkpoints[index], transactional
+                    )
+                except Exception as exc:
+                    outcomes[index] = exc
+                    continue
+                total_dispatched, total_skipped = outcomes[index]
+                outcomes[index] = (
+                    total_dispatched + dispatched,
+                    total_skipped + skipped,
+                )
+        except Exception as exc:
+            # The read failed: every partition still running stops here
+            outcomes = [
+                outcome if isinstance(outcome, Exception) else exc
+                for outcome in outcomes
+            ]
+        return outcomes
+
+    queues: list[queue.Queue] = [
+        queue.Queue(maxsize=PARTITION_QUEUE_PAGES) for _ in range(count)
+    ]
+
+    def run(index: int) -> tuple[int, int]:
+        pages = iter(queues[index].get, None)
+        try:
+            with domain.domain_context():
+                return _apply_pages(
+                    projector_cls, pages, checkpoints[index], transactional
+                )
+        finally:
+            # Keep taking pages until the reader is done, so it never blocks
+            # on a partition that stopped
+            for _ in pages:
+                pass
+
+    with ThreadPoolExecutor(
+        max_workers=count,
+        thread_name_prefix=f"rebuild-{underscore(projector_cls.__name__)}",
+    ) as executor:
+        # Copy the context so shadow storage routing reaches the threads
+        futures = [
+            executor.submit(copy_context().run, run, index) for index in range(count)
+        ]
+        read_error: Exception | None = None
+        try:
+            for index, page in routed:
+                queues[index].put(page)
+        except Exception as exc:
+            read_error = exc
+        finally:
+            for pages in queues:
+                pages.put(None)
+
+        outcomes = []
+        for future in futures:
+            exc = future.exception()
+            if exc is None:
+                outcomes.append(read_error or future.result())
+            elif isinstance(exc, Exception):
+                outcomes.append(exc)
+            else:
+                raise exc
+
+    return outcomes
+
+
+def _apply_pages(
+    projector_cls: type,
+    pages: Iterable[list[Message]],
+    checkpoint: Callable[[int], None] | None,
+    transactional: bool,
+) -> tuple[int, int]:
+    """Apply pages of messages in order, checkpointing after each one.
+
+    Returns ``(dispatched, skipped)``.
+    """
+    dispatched = 0
+    skipped = 0
+
+    for page in pages:
+        if transactional and _apply_page(projector_cls, page):
+            dispatched += len(page)
+        else:
+            for message in page:
+                if _apply_one(projector_cls, message):
+                    dispatched += 1
+                else:
+                    skipped += 1
+
+        if checkpoint:
+            checkpoint(_global_position(page[-1]))
+
+    return dispatched, skipped
+
+
 def _replay_projector(
     domain: "Domain",
     projector_cls: type,
     stream_categories: list[str],
     batch_size: int,
+    *,
+    after: int = -1,
+    checkpoint: Callable[[int], None] | None = None,
+    transactional: bool = True,
 ) -> tuple[int, int]:
     """Replay events through a projector in global order.
 
-    Reads all events from each stream category, merges them by
+    Streams events from each stream category, merges them by
     ``global_position``, and dispatches in chronological order.
     This ensures correct cross-aggregate ordering — e.g., a
     ``Registered`` event from the ``user`` category is always
@@ -181,72 +750,75 @@ def _replay_projector(
         domain: The initialized domain instance.
         projector_cls: The projector class to dispatch events through.
         stream_categories: Stream categories to include.
-        batch_size: Number of events to read per batch per category.
+        batch_size: Number of events to read and apply per page.
+        after: Global position to continue after.
+        checkpoint: Called with the last global position after each page.
+        transactional: Whether to apply each page in one batch unit of work.
 
     Returns:
         Tuple of (events_dispatched, events_skipped).
     """
-    logger.info(
-        "Replaying categories %s through `%s`",
+    (outcome,) = _replay_partitions(
+        domain,
+        projector_cls,
         stream_categories,
-        projector_cls.__name__,
+        batch_size,
+        [after],
+        [checkpoint],
+        None,
+        transactional=transactional,
+        concurrent=False,
     )
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
 
-    # Collect all messages from all categories.
-    #
-    # We read all events per category in a single call rather than
-    # paginating, because the Memory event store's per-stream position
-    # field doesn't support correct cross-stream pagination within a
-    # category.  For production stores (MessageDB) a single large read
-    # per category is equally efficient thanks to server-side cursors.
-    all_messages: list[Message] = []
-    for category in stream_categories:
-        messages = domain.event_store.store.read(
-            category,
-            position=0,
-            no_of_messages=1_000_000,
-        )
-        all_messages.extend(messages)
-
-    # Sort by global_position for correct cross-category ordering
-    all_messages.sort(key=lambda m: m.metadata.event_store.global_position or 0)
-
-    dispatched = 0
-    skipped = 0
-
-    for message in all_messages:
-        try:
-            projector_cls._handle(message)
-            dispatched += 1
-        except ConfigurationError as exc:
-            # Unresolvable event type (deprecated event without upcaster)
-            logger.warning(
-                "Skipping unresolvable message type `%s` at position %s: %s",
-                message.metadata.headers.type
-                if message.metadata.headers
-                else "unknown",
-                message.metadata.event_store.global_position
-                if message.metadata.event_store
-                else "unknown",
-                exc,
-            )
-            skipped += 1
-        except Exception as exc:
-            logger.warning(
-                "Error processing message at position %s: %s",
-                message.metadata.event_store.global_position
-                if message.metadata.event_store
-                else "unknown",
-                exc,
-            )
-            skipped += 1
 
-    logger.info(
-        "Replayed %d events (%d skipped) from %s through `%s`",
-        dispatched,
-        skipped,
-        stream_categories,
-        projector_cls.__name__,
-    )
+def _apply_page(projector_cls: type, page: list[Message]) -> bool:
+    """Apply a page of messages in one batch unit of work.
 
-    return dispatched, skipped
+    Returns ``False`` when any message fails or the commit does; the page's
+    writes are rolled back and the caller replays it message by message.
+    """
+    if len(page) == 1:
+        return False
+
+    try:
+        with UnitOfWork(batch=True):
+            for message in page:
+                projector_cls._handle(message)
+    except Exception:
+        logger.debug(
+            "Message failed in a page of %d; replaying them one by one",
+            len(page),
+            exc_info=True,
+        )
+        return False
+
+    return True
+
+
+def _apply_one(projector_cls: type, message: Message) -> bool:
+    """Apply a single message, logging and skipping it when it fails."""
+    try:
+        projector_cls._handle(message)
+        return True
+    except ConfigurationError as exc:
+        # Unresolvable event type (deprecated event without upcaster)
+        logger.warning(
+            "Skipping unresolvable message type `%s` at position %s: %s",
+            message.metadata.headers.type if message.metadata.headers else "unknown",
+            message.metadata.event_store.global_position
+            if message.metadata.event_store
+            else "unknown",
+            exc,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Error processing message at position %s: %s",
+            message.metadata.event_store.global_position
+            if message.metadata.event_store
+            else "unknown",
+            exc,
+        )
+    return False
@@ -0,0 +1,175 @@
+"""Stage-level latency of the message pipeline.
+
+A message's processing time is split into stages: fetching it from the
+broker or event store, deserializing and upcasting it, checking
+idempotency, loading aggregates, running the handler body, and the parts
+of the Unit of Work commit (outbox insert, session flush, event append,
+broker publish), followed by the ack or read position update.
+
+Every stage is recorded in the ``protean.message.stage_duration``
+histogram, labelled by ``stage``. While ``Engine.handle_message()`` runs,
+stage timings are also collected into a ``StageTimer`` held in ``g``, the
+way the access log collects its counters. The engine attaches that
+per-message breakdown to the handler's span and, when
+``observatory.trace_stage_breakdown`` is on, to its trace events.
+
+Stages nest. Time spent in an inner stage, like ``load`` inside
+``handler``, is not counted again in the outer one, so the stages of a
+message add up to at most its processing time.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from protean.utils.globals import _domain_context_stack
+
+if TYPE_CHECKING:
+    from protean.domain import Domain
+
+STAGE_FETCH = "fetch"
+STAGE_DESERIALIZE = "deserialize"
+STAGE_UPCAST = "upcast"
+STAGE_IDEMPOTENCY = "idempotency"
+STAGE_LOAD = "load"
+STAGE_HANDLER = "handler"
+STAGE_OUTBOX = "outbox"
+STAGE_FLUSH = "flush"
+STAGE_APPEND = "append"
+STAGE_PUBLISH = "publish"
+STAGE_ACK = "ack"
+
+STAGES = (
+    STAGE_FETCH,
+    STAGE_DESERIALIZE,
+    STAGE_UPCAST,
+    STAGE_IDEMPOTENCY,
+    STAGE_LOAD,
+    STAGE_HANDLER,
+    STAGE_OUTBOX,
+    STAGE_FLUSH,
+    STAGE_APPEND,
+    STAGE_PUBLISH,
+    STAGE_ACK,
+)
+
+_STAGE_TIMER_KEY = "_stage_timer"
+
+
+class StageTimer:
+    """Exclusive time spent in each stage while handling one message.
+
+    Args:
+        attributes: Extra labels for the stage histogram, like the handler
+            name.
+    """
+
+    __slots__ = ("durations", "attributes", "_nested")
+
+    def __init__(self, attributes: Optional[dict[str, Any]] = None) -> None:
+        self.durations: dict[str, float] = {}
+        self.attributes = attributes or {}
+        # Time spent in inner stages, one entry per stage currently open
+        self._nested: list[float] = []
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add ``seconds`` to ``stage``."""
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+    def breakdown_ms(self) -> dict[str, float]:
+        """Stage durations in milliseconds, in pipeline order."""
+        return {
+            stage: round(seconds * 1000, 3)
+            for stage, seconds in sorted(
+                self.durations.items(),
+                key=lambda item: (
+                    STAGES.index(item[0]) if item[0] in STAGES else len(STAGES)
+                ),
+            )
+        }
+
+
+def current_stage_timer() -> Optional[StageTimer]:
+    """Return the ``StageTimer`` of the message being handled, if any."""
+    top = _domain_context_stack.top
+    if top is None:
+        return None
+    return top.g.get(_STAGE_TIMER_KEY)
+
+
+@contextmanager
+def message_stages(attributes: Optional[dict[str, Any]] = None) -> Iterator[StageTimer]:
+    """Collect the stages of the message handled within the block.
+
+    Must run inside a domain context. The previous timer, if any, is
+    restored on exit.
+    """
+    timer = StageTimer(attributes)
+    g = _domain_context_stack.top.g
+    previous = g.get(_STAGE_TIMER_KEY)
+    setattr(g, _STAGE_TIMER_KEY, timer)
+    try:
+        yield timer
+    finally:
+        if previous is None:
+            g.pop(_STAGE_TIMER_KEY, None)
+        else:
+            setattr(g, _STAGE_TIMER_KEY, previous)
+
+
+def record_stage(
+    name: str,
+    seconds: float,
+    domain: Optional[Domain] = None,
+    attributes: Optional[dict[str, Any]] = None,
+) -> None:
+    """Record a stage duration in the stage histogram.
+
+    Stages timed outside ``stage()``, like a batch fetch, are recorded
+    here directly. ``domain`` defaults to the active domain.
+    """
+    if domain is None:
+        top = _domain_context_stack.top
+        if top is None:
+            return
+        domain = top.domain
+    from protean.utils.telemetry import get_domain_metrics  # noqa: PLC0415
+
+    try:
+        get_domain_metrics(domain).message_stage_duration.record(
+            seconds, {"stage": name, **(attributes or {})}
+        )
+    except Exception:  # metrics must never break message processing
+        pass
+
+
+@contextmanager
+def stage(
+    name: str,
+    domain: Optional[Domain] = None,
+    attributes: Optional[dict[str, Any]] = None,
+) -> Iterator[None]:
+    """Time the block as pipeline stage ``name``.
+
+    Inside ``message_stages()`` the time is added to the message's timer
+    and labelled with its attributes. Elsewhere it is only recorded in the
+    histogram, with ``domain`` and ``attributes``.
+    """
+    timer = current_stage_timer()
+    if timer is not None:
+        timer._nested.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if timer is None:
+            record_stage(name, elapsed, domain, attributes)
+        else:
+            exclusive = elapsed - timer._nested.pop()
+            if timer._nested:
+                timer._nested[-1] += elapsed
+            timer.add(name, exclusive)
+            record_stage(name, exclusive, attributes=timer.attributes)
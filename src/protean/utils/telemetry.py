@@ -509,6 +509,11 @@ class DomainMetrics:
             description="Commands rejected because their deadline had passed",
             unit="{command}",
         )
+        self.handler_shed = meter.create_counter(
+            "protean.handler.shed",
+            description="Messages skipped by a handler because their deadline had passed",
+            unit="{message}",
+        )
         self.handler_invocations = meter.create_counter(
             "protean.handler.invocations",
             description="Handler invocations",
@@ -535,6 +540,17 @@ class DomainMetrics:
             unit="{message}",
         )
 
+        self.aggregate_conflicts = meter.create_counter(
+            "protean.aggregate.conflicts",
+            description="Version conflicts raised by Units of Work, per aggregate type",
+            unit="{conflict}",
+        )
+        self.aggregate_reloads = meter.create_counter(
+            "protean.aggregate.reloads",
+            description="Aggregates reloaded to retry a handler after a conflict",
+            unit="{reload}",
+        )
+
         # --- Subscription counters --------------------------------------------
         self.subscription_messages_processed = meter.create_counter(
             "protean.subscription.messages_processed",
@@ -586,6 +602,24 @@ class DomainMetrics:
             unit="s",
         )
 
+        self.aggregate_retry_duration = meter.create_histogram(
+            "protean.aggregate.retry_duration",
+            description="Time from a version conflict to the end of its handler retries",
+            unit="s",
+        )
+
+        self.handler_memory_allocated = meter.create_histogram(
+            "protean.handler.memory_allocated",
+            description="Memory a sampled handler call left allocated when it returned",
+            unit="By",
+        )
+
+        self.message_stage_duration = meter.create_histogram(
+            "protean.message.stage_duration",
+            description="Time a message spends in one pipeline stage",
+            unit="s",
+        )
+
         # --- Subscription histograms ------------------------------------------
         self.subscription_processing_duration = meter.create_histogram(
             "protean.subscription.processing_duration",
@@ -1,3 +1,8 @@
+from unittest.mock import patch
+
+from protean.adapters.event_store.memory import MemoryMessageRepository
+
+
 def _create_test_metadata(stream_name, message_type, message_id=None):
     """Helper to create metadata with required headers for tests."""
     return {
@@ -92,6 +97,53 @@ def test_reading_targeted_stream_messages(test_domain):
     assert messages[4]["data"] == {"foo": "baz4"}
 
 
+def _write_interleaved(test_domain, streams=("testStream-123", "testStream-456")):
+    # Interleave streams so stream and global positions diverge
+    for i in range(3):
+        for stream in streams:
+            test_domain.event_store.store._write(
+                stream,
+                "Event1",
+                {"foo": f"{stream}-{i}"},
+                _create_test_metadata(stream, "Event1", f"{stream}-msg-{i}"),
+            )
+
+
+def test_reading_category_from_global_position(test_domain):
+    _write_interleaved(test_domain)
+
+    messages = test_domain.event_store.store._read("testStream")
+    third = messages[2]["global_position"]
+
+    remaining = test_domain.event_store.store._read("testStream", position=third)
+
+    assert [m["global_position"] for m in remaining] == [
+        m["global_position"] for m in messages[2:]
+    ]
+    assert remaining[0]["position"] == 1
+
+
+def test_reading_all_from_global_position(test_domain):
+    _write_interleaved(test_domain, streams=("testStream-123", "otherStream-123"))
+
+    messages = test_domain.event_store.store._read("$all")
+    positions = [m["global_position"] for m in messages]
+
+    assert positions == sorted(positions)
+    assert [
+        m["global_position"]
+        for m in test_domain.event_store.store._read("$all", position=positions[3])
+    ] == positions[3:]
+
+
+def test_reading_stream_from_stream_position(test_domain):
+    _write_interleaved(test_domain)
+
+    messages = test_domain.event_store.store._read("testStream-456", position=1)
+
+    assert [m["position"] for m in messages] == [1, 2]
+
+
 def test_read_last_message(test_domain):
     for i in range(5):
         test_domain.event_store.store._write(
@@ -105,6 +157,37 @@ def test_read_last_message(test_domain):
     assert message["position"] == 4
 
 
+def test_read_last_message_does_not_page_through_stream(test_domain):
+    for i in range(3):
+        test_domain.event_store.store._write(
+            "testStream-123",
+            "Event1",
+            {"foo": f"bar{i}"},
+            _create_test_metadata("testStream-123", "Event1", f"last-msg-{i}"),
+        )
+
+    # Reading pages is capped, so the last message must come from a direct query
+    with patch.object(MemoryMessageRepository, "read", side_effect=AssertionError):
+        message = test_domain.event_store.store._read_last_message("testStream-123")
+
+    assert message["position"] == 2
+
+
 def test_read_last_message_when_there_are_no_messages(test_domain):
     message = test_domain.event_store.store._read_last_message("foo-bar")
     assert message is None
+
+
+def test_stream_version(test_domain):
+    store = test_domain.event_store.store
+    assert store._stream_version("testStream-123") == -1
+
+    for i in range(3):
+        store._write(
+            "testStream-123",
+            "Event1",
+            {"foo": f"bar{i}"},
+            _create_test_metadata("testStream-123", "Event1", f"version-msg-{i}"),
+        )
+
+    assert store._stream_version("testStream-123") == 2
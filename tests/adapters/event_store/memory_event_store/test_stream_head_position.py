@@ -85,3 +85,57 @@ def test_head_position_with_multiple_streams(test_domain):
     assert head_a == all_a[-1]["global_position"]
     assert head_b == all_b[-1]["global_position"]
     assert head_a != head_b
+
+
+def test_category_head_ignores_similarly_named_categories(test_domain):
+    """A category's head excludes ``<category>:command`` streams."""
+    store = test_domain.event_store.store
+    store._write(
+        "user-1", "Registered", {}, _create_test_metadata("user-1", "Registered")
+    )
+    store._write(
+        "user:command-1",
+        "Register",
+        {},
+        _create_test_metadata("user:command-1", "Register"),
+    )
+
+    user_msgs = store._read("user")
+
+    assert store.stream_head_position("user") == user_msgs[-1]["global_position"]
+    assert store.stream_head_position("user:command") > store.stream_head_position(
+        "user"
+    )
+
+
+def test_all_and_single_stream_heads(test_domain):
+    """``$all`` and single streams report their newest global position."""
+    store = test_domain.event_store.store
+    for stream in ("streamA-1", "streamB-1", "streamA-2"):
+        store._write(stream, "Event", {}, _create_test_metadata(stream, "Event"))
+
+    all_msgs = store._read("$all")
+
+    assert store.stream_head_position("$all") == all_msgs[-1]["global_position"]
+    assert store.stream_head_position("streamB-1") == all_msgs[1]["global_position"]
+
+
+def test_cached_head_reflects_local_writes(test_domain):
+    """Writes through the store discard the cached head of their category."""
+    store = test_domain.event_store.store
+    store._write("streamA-1", "Event", {}, _create_test_metadata("streamA-1", "E1"))
+    first = store.stream_head_position("streamA", cached=True)
+
+    store._write("streamA-1", "Event", {}, _create_test_metadata("streamA-1", "E2"))
+
+    assert store.stream_head_position("streamA", cached=True) > first
+
+
+def test_data_reset_clears_cached_heads(test_domain):
+    store = test_domain.event_store.store
+    store._write("streamA-1", "Event", {}, _create_test_metadata("streamA-1", "E1"))
+    store.stream_head_position("streamA", cached=True)
+
+    store._data_reset()
+
+    assert store.stream_head_position("streamA", cached=True) == -1
@@ -121,6 +121,26 @@ class TestMessageDBEventStore:
         message = test_domain.event_store.store._read_last_message("foo-bar")
         assert message is None
 
+    def test_stream_version(self, test_domain):
+        store = test_domain.event_store.store
+        assert store._stream_version("testStream-123") == -1
+
+        for i in range(3):
+            store._write("testStream-123", "Event1", {"foo": f"bar{i}"})
+
+        assert store._stream_version("testStream-123") == 2
+
+    def test_truncating_without_delete_privilege(self, test_domain):
+        store = test_domain.event_store.store
+        store._write("testStream-123", "Event1", {"foo": "bar"})
+        # Roles limited to Message DB's functions cannot delete messages
+        store._can_delete = False
+
+        with pytest.raises(ConfigurationError, match="DELETE on message_store"):
+            store.truncate_stream("testStream-123", 1)
+
+        assert len(store._read("testStream-123")) == 1
+
     def test_stream_head_position_empty_stream(self, test_domain):
         """stream_head_position returns -1 for a stream with no messages."""
         result = test_domain.event_store.store.stream_head_position("nonexistent")
@@ -155,3 +175,29 @@ class TestMessageDBEventStore:
         assert head_a >= 0
         assert head_b >= 0
         assert head_a != head_b
+
+    def test_stream_head_position_for_all_and_single_streams(self, test_domain):
+        store = test_domain.event_store.store
+        store._write("streamA-123", "EventA", {"idx": 0})
+        store._write("streamB-456", "EventB", {"idx": 1})
+        store._write("streamA-789", "EventA", {"idx": 2})
+
+        all_msgs = store._read("$all", no_of_messages=1_000_000)
+        stream_msgs = store._read("streamB-456")
+
+        assert store.stream_head_position("$all") == max(
+            m["global_position"] for m in all_msgs
+        )
+        assert (
+            store.stream_head_position("streamB-456")
+            == (stream_msgs[-1]["global_position"])
+        )
+
+    def test_cached_stream_head_position_sees_local_writes(self, test_domain):
+        store = test_domain.event_store.store
+        store._write("streamA-123", "EventA", {"idx": 0})
+        first = store.stream_head_position("streamA", cached=True)
+
+        store._write("streamA-123", "EventA", {"idx": 1})
+
+        assert store.stream_head_position("streamA", cached=True) > first
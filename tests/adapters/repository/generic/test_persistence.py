@@ -146,3 +146,4 @@ class TestConcurrency:
         # _update was the original version (0), and the stored version is 1.
         assert "Wrong expected version:" in exc.value.args[0]
         assert f"Aggregate: Person({identifier})" in exc.value.args[0]
+        assert exc.value.stream == f"{Person.meta_.stream_category}-{identifier}"
@@ -1,9 +1,12 @@
 """Test Memory Session and Unit of Work integration"""
 
+import threading
+
 import pytest
 
 from protean import UnitOfWork
 from protean.core.aggregate import BaseAggregate
+from protean.exceptions import ExpectedVersionError
 from protean.fields import String, Integer
 
 
@@ -126,6 +129,123 @@ def test_memory_session_commit_without_uow(test_domain):
     assert new_session._db["data"][schema_name][product_id]["price"] == 250
 
 
+def test_concurrent_unit_of_work_commits_keep_both_writes(test_domain):
+    """Two threads whose Units of Work overlap each keep their write"""
+    repo = test_domain.repository_for(Product)
+    first = Product(name="Keyboard", price=50)
+    second = Product(name="Mouse", price=25)
+    repo.add(first)
+    repo.add(second)
+
+    both_loaded = threading.Barrier(2)
+    first_committed = threading.Event()
+
+    def update(product_id, price, commit_first):
+        with test_domain.domain_context():
+            with UnitOfWork():
+                product = test_domain.repository_for(Product).get(product_id)
+                both_loaded.wait(timeout=5)
+                if not commit_first:
+                    first_committed.wait(timeout=5)
+                product.price = price
+                test_domain.repository_for(Product).add(product)
+            first_committed.set()
+
+    threads = [
+        threading.Thread(target=update, args=(first.id, 60, True)),
+        threading.Thread(target=update, args=(second.id, 30, False)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert repo.get(first.id).price == 60
+    assert repo.get(second.id).price == 30
+
+
+def test_commit_does_not_resurrect_records_deleted_elsewhere(test_domain):
+    """A session only applies what it changed, not its whole snapshot"""
+    repo = test_domain.repository_for(Product)
+    kept = Product(name="Cable", price=5)
+    removed = Product(name="Adapter", price=15)
+    repo.add(kept)
+    repo.add(removed)
+
+    provider = test_domain.providers["default"]
+    session = provider.get_session()
+    session._db["data"]["product"][kept.id]["price"] = 6
+
+    repo._dao._delete_all()
+    repo.add(kept)
+
+    session.commit()
+
+    assert provider._databases["product"][kept.id]["price"] == 6
+    assert removed.id not in provider._databases["product"]
+
+
+def test_commit_rejects_a_record_committed_elsewhere(test_domain):
+    """A session may not overwrite a newer version of a record"""
+    repo = test_domain.repository_for(Product)
+    product = Product(name="Cable", price=5)
+    repo.add(product)
+
+    provider = test_domain.providers["default"]
+    session = provider.get_session()
+    session._db["data"]["product"][product.id]["price"] = 6
+
+    # Another writer commits a new version first
+    other = repo.get(product.id)
+    other.price = 7
+    repo.add(other)
+
+    with pytest.raises(ExpectedVersionError) as exc:
+        session.commit()
+
+    assert exc.value.aggregate == "Product"
+    assert exc.value.stream == f"{Product.meta_.stream_category}-{product.id}"
+    assert repo.get(product.id).price == 7
+
+
+def test_concurrent_unit_of_work_commits_on_one_record_conflict(test_domain):
+    """Of two overlapping Units of Work on one record, the later one fails"""
+    repo = test_domain.repository_for(Product)
+    product = Product(name="Keyboard", price=50)
+    repo.add(product)
+
+    both_loaded = threading.Barrier(2)
+    first_committed = threading.Event()
+    errors = []
+
+    def update(price, commit_first):
+        with test_domain.domain_context():
+            try:
+                with UnitOfWork():
+                    loaded = test_domain.repository_for(Product).get(product.id)
+                    both_loaded.wait(timeout=5)
+                    if not commit_first:
+                        first_committed.wait(timeout=5)
+                    loaded.price = price
+                    test_domain.repository_for(Product).add(loaded)
+            except ExpectedVersionError as exc:
+                errors.append(exc)
+            finally:
+                first_committed.set()
+
+    threads = [
+        threading.Thread(target=update, args=(60, True)),
+        threading.Thread(target=update, args=(70, False)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 1
+    assert repo.get(product.id).price == 60
+
+
 def test_memory_session_isolation_with_multiple_providers(test_domain):
     """Test that sessions are properly isolated per provider"""
     test_domain.config["databases"]["secondary"] = {"provider": "memory"}
@@ -0,0 +1,156 @@
+"""SQLite coverage for shadow tables used by blue/green projection rebuilds."""
+
+import pytest
+from sqlalchemy import inspect
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.index import Index
+from protean.fields import Integer, String
+from protean.port.provider import shadow_storage_active, use_shadow_storage
+
+
+class Ledger(BaseAggregate):
+    name = String(max_length=50)
+    total = Integer(default=0)
+
+
+@pytest.fixture
+def ledger_domain(test_domain):
+    test_domain.register(Ledger)
+    test_domain.init(traverse=False)
+    provider = test_domain.providers["default"]
+    dao = test_domain.repository_for(Ledger)._dao
+    provider._metadata.create_all(provider._engine)
+    dao._delete_all()
+    return test_domain
+
+
+class Account(BaseAggregate):
+    owner = String(max_length=50)
+    balance = Integer(default=0)
+    code = String(max_length=20)
+
+
+ACCOUNT_INDEXES = [
+    Index("owner", "balance"),
+    Index("balance", name="account_by_balance"),
+    Index.from_sql("sqlite", "CREATE INDEX account_by_code ON account (code)"),
+]
+
+
+@pytest.fixture
+def account_domain(test_domain):
+    test_domain.register(Account, indexes=ACCOUNT_INDEXES)
+    test_domain.init(traverse=False)
+    provider = test_domain.providers["default"]
+    model = test_domain.repository_for(Account)._database_model
+    provider._metadata.create_all(provider._engine, tables=[model.__table__])
+    return test_domain
+
+
+def _index_names(provider, table_name):
+    return sorted(
+        index["name"] for index in inspect(provider._engine).get_indexes(table_name)
+    )
+
+
+def _shadow(domain):
+    provider = domain.providers["default"]
+    model = domain.repository_for(Ledger)._database_model
+    return provider, model, provider.create_shadow(Ledger, model)
+
+
+@pytest.mark.sqlite
+class TestSqliteShadowTables:
+    def test_shadow_table_is_created_next_to_live_table(self, ledger_domain):
+        provider, model, shadow = _shadow(ledger_domain)
+
+        tables = inspect(provider._engine).get_table_names()
+        assert shadow.startswith("ledger__rebuild_")
+        assert {"ledger", shadow} <= set(tables)
+
+        provider.drop_shadow(Ledger, model, shadow)
+
+    def test_writes_are_routed_to_shadow_table(self, ledger_domain):
+        repo = ledger_domain.repository_for(Ledger)
+        repo.add(Ledger(name="live", total=1))
+        provider, model, shadow = _shadow(ledger_domain)
+
+        with use_shadow_storage(Ledger, shadow):
+            repo.add(Ledger(name="rebuilt", total=2))
+            assert [ledger.name for ledger in repo._dao.query.all().items] == [
+                "rebuilt"
+            ]
+
+        assert [ledger.name for ledger in repo._dao.query.all().items] == ["live"]
+        provider.drop_shadow(Ledger, model, shadow)
+
+    def test_swap_replaces_live_table(self, ledger_domain):
+        repo = ledger_domain.repository_for(Ledger)
+        repo.add(Ledger(name="live", total=1))
+        provider, model, shadow = _shadow(ledger_domain)
+        with use_shadow_storage(Ledger, shadow):
+            repo.add(Ledger(name="rebuilt", total=2))
+
+        provider.swap_shadow(Ledger, model, shadow)
+
+        tables = set(inspect(provider._engine).get_table_names())
+        assert shadow not in tables
+        assert not any(table.endswith("__retired") for table in tables)
+        assert [ledger.name for ledger in repo._dao.query.all().items] == ["rebuilt"]
+
+    def test_drop_removes_shadow_table(self, ledger_domain):
+        provider, model, shadow = _shadow(ledger_domain)
+
+        provider.drop_shadow(Ledger, model, shadow)
+
+        assert shadow not in inspect(provider._engine).get_table_names()
+
+    def test_routing_is_only_active_inside_the_block(self, ledger_domain):
+        provider, model, shadow = _shadow(ledger_domain)
+
+        assert not shadow_storage_active()
+        with use_shadow_storage(Ledger, shadow):
+            assert shadow_storage_active()
+        assert not shadow_storage_active()
+
+        provider.drop_shadow(Ledger, model, shadow)
+
+
+@pytest.mark.sqlite
+class TestSqliteShadowIndexes:
+    def test_shadow_indexes_get_their_own_names(self, account_domain):
+        provider = account_domain.providers["default"]
+        model = account_domain.repository_for(Account)._database_model
+
+        shadow = provider.create_shadow(Account, model)
+        token = shadow.rsplit("_", 1)[-1]
+
+        # Explicit names are suffixed rather than reused, and the verbatim
+        # RawIndex DDL, which names the live table, is not run
+        assert _index_names(provider, shadow) == [
+            f"account_by_balance__{token}",
+            f"ix_account_owner_balance__{token}",
+        ]
+        assert _index_names(provider, "account") == [
+            "account_by_balance",
+            "account_by_code",
+            "ix_account_owner_balance",
+        ]
+
+        provider.drop_shadow(Account, model, shadow)
+
+    def test_swap_restores_declared_index_names(self, account_domain):
+        provider = account_domain.providers["default"]
+        model = account_domain.repository_for(Account)._database_model
+
+        # Swap twice: the second rebuild must not collide with the first
+        for _ in range(2):
+            shadow = provider.create_shadow(Account, model)
+            provider.swap_shadow(Account, model, shadow)
+
+            assert _index_names(provider, "account") == [
+                "account_by_balance",
+                "account_by_code",
+                "ix_account_owner_balance",
+            ]
@@ -0,0 +1,98 @@
+"""SQLite coverage for ``SqlalchemyDAO._upsert`` — verifies the
+``INSERT … ON CONFLICT DO UPDATE`` path is used on a supported dialect and
+that unsupported dialects fall back to the portable ``BaseDAO._upsert``."""
+
+import pytest
+from sqlalchemy import event
+
+from protean.core.aggregate import BaseAggregate
+from protean.fields import Identifier, String
+from protean.port.dao import BaseDAO
+
+
+class Preference(BaseAggregate):
+    name = Identifier(identifier=True, max_length=50)
+    value = String(max_length=50)
+
+
+@pytest.fixture
+def preference_domain(test_domain):
+    test_domain.register(Preference)
+    test_domain.init(traverse=False)
+    dao = test_domain.repository_for(Preference)._dao
+    provider = test_domain.providers["default"]
+    provider._metadata.create_all(provider._engine)
+    # Start from a clean slate; the table is shared across tests in this module.
+    dao._delete_all()
+    yield test_domain
+
+
+def _spy_on_portable_default(monkeypatch):
+    """Record calls into the portable ``BaseDAO._upsert`` default."""
+    calls = []
+    original = BaseDAO._upsert
+
+    def spy(self, identifier, values):
+        calls.append(True)
+        return original(self, identifier, values)
+
+    monkeypatch.setattr(BaseDAO, "_upsert", spy)
+    return calls
+
+
+@pytest.mark.sqlite
+class TestSqliteUpsertDispatch:
+    def test_supported_dialect_uses_single_statement_path(
+        self, preference_domain, monkeypatch
+    ):
+        dao = preference_domain.repository_for(Preference)._dao
+        portable_calls = _spy_on_portable_default(monkeypatch)
+
+        dao._upsert("theme", {"value": "dark"})
+        dao._upsert("theme", {"value": "light"})
+
+        assert dao.query.count() == 1
+        assert dao.get("theme").value == "light"
+        assert portable_calls == []
+
+    def test_upsert_many_writes_the_batch_in_one_statement(
+        self, preference_domain, monkeypatch
+    ):
+        dao = preference_domain.repository_for(Preference)._dao
+        dao._upsert("theme", {"value": "dark"})
+        portable_calls = _spy_on_portable_default(monkeypatch)
+
+        statements = []
+        engine = preference_domain.providers["default"]._engine
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            dao._upsert_many({"theme": {"value": "light"}, "font": {"value": "mono"}})
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert len(statements) == 1
+        assert portable_calls == []
+        assert dao.query.count() == 2
+        assert dao.get("theme").value == "light"
+        assert dao.get("font").value == "mono"
+
+    def test_unsupported_dialect_falls_back_to_portable_default(
+        self, preference_domain, monkeypatch
+    ):
+        dao = preference_domain.repository_for(Preference)._dao
+
+        # Pretend this dialect lacks a native upsert.
+        monkeypatch.setattr(type(dao), "_UPSERT_DIALECTS", {})
+        portable_calls = _spy_on_portable_default(monkeypatch)
+
+        dao._upsert("theme", {"value": "dark"})
+        dao._upsert("theme", {"value": "light"})
+
+        assert dao.query.count() == 1
+        assert dao.get("theme").value == "light"
+        assert portable_calls == [True, True]
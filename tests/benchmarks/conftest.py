@@ -0,0 +1,65 @@
+"""Fixtures for the micro-benchmarks.
+
+Benchmarks run against the memory adapters of the shared ``test_domain``.
+They are excluded from regular test runs; see ``pytest --benchmarks``.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from protean.core.unit_of_work import UnitOfWork
+
+from .elements import (
+    Account,
+    AccountOpened,
+    Deposited,
+    LineItem,
+    Order,
+    OrderConfirmed,
+    order_kwargs,
+)
+
+# Size of the seeded order table used by query benchmarks
+ORDER_COUNT = 500
+
+# Events in the stream replayed by ``load_aggregate`` benchmarks
+ACCOUNT_EVENTS = 50
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Order)
+    test_domain.register(LineItem, part_of=Order)
+    test_domain.register(OrderConfirmed, part_of=Order)
+    test_domain.register(Account, is_event_sourced=True)
+    test_domain.register(AccountOpened, part_of=Account)
+    test_domain.register(Deposited, part_of=Account)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def seeded_orders(test_domain):
+    """Persist ``ORDER_COUNT`` orders and return the repository."""
+    repository = test_domain.repository_for(Order)
+    with UnitOfWork():
+        for index in range(ORDER_COUNT):
+            repository.add(Order(**order_kwargs(index, items=1)))
+    return repository
+
+
+@pytest.fixture
+def account_stream(test_domain):
+    """Write an ``Account`` stream of ``ACCOUNT_EVENTS`` events; return its id."""
+    # Measure a full replay: no snapshot is taken on the first load
+    test_domain.config["snapshot_threshold"] = ACCOUNT_EVENTS + 1
+
+    account_id = str(uuid4())
+    account = Account(id=account_id)
+    account.raise_(AccountOpened(id=account_id, holder="Jane"))
+    for _ in range(ACCOUNT_EVENTS - 1):
+        account.raise_(Deposited(id=account_id, amount=10.0))
+
+    for event in account._events:
+        test_domain.event_store.store.append(event)
+    return account_id
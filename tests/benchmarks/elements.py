@@ -0,0 +1,88 @@
+"""Representative domain elements for the micro-benchmarks.
+
+``Order`` is a state-stored aggregate with a child entity collection and an
+embedded value object, so construction exercises field resolution, entity
+wiring and value object validation together. ``Account`` is event sourced
+and is rebuilt from its event stream.
+"""
+
+from protean.core.aggregate import BaseAggregate, apply
+from protean.core.entity import BaseEntity
+from protean.core.event import BaseEvent
+from protean.core.value_object import BaseValueObject
+from protean.fields import (
+    Float,
+    HasMany,
+    Identifier,
+    Integer,
+    String,
+    ValueObject,
+)
+
+
+class Money(BaseValueObject):
+    currency: String(max_length=3, required=True)
+    amount: Float(required=True)
+
+
+class LineItem(BaseEntity):
+    sku: String(max_length=20, required=True)
+    quantity: Integer(min_value=1, required=True)
+    price = ValueObject(Money)
+
+
+class Order(BaseAggregate):
+    customer: String(max_length=50, required=True)
+    status: String(max_length=20, default="PENDING")
+    total = ValueObject(Money)
+    items = HasMany(LineItem)
+
+    def confirm(self) -> None:
+        self.status = "CONFIRMED"
+        self.raise_(OrderConfirmed(order_id=self.id, customer=self.customer))
+
+
+class OrderConfirmed(BaseEvent):
+    order_id: Identifier(required=True)
+    customer: String(required=True)
+
+
+class AccountOpened(BaseEvent):
+    id: Identifier(required=True)
+    holder: String(required=True)
+
+
+class Deposited(BaseEvent):
+    id: Identifier(required=True)
+    amount: Float(required=True)
+
+
+class Account(BaseAggregate):
+    holder: String(max_length=50)
+    balance: Float(default=0.0)
+
+    @apply
+    def opened(self, event: AccountOpened) -> None:
+        self.id = event.id
+        self.holder = event.holder
+        self.balance = 0.0
+
+    @apply
+    def deposited(self, event: Deposited) -> None:
+        self.balance += event.amount
+
+
+def order_kwargs(index: int = 0, items: int = 3) -> dict:
+    """Keyword arguments for a representative ``Order``."""
+    return {
+        "customer": f"customer-{index}",
+        "total": Money(currency="USD", amount=30.0 * items),
+        "items": [
+            LineItem(
+                sku=f"SKU-{n}",
+                quantity=n + 1,
+                price=Money(currency="USD", amount=10.0),
+            )
+            for n in range(items)
+        ],
+    }
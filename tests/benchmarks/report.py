@@ -0,0 +1,106 @@
+"""Render trend tables from saved micro-benchmark runs.
+
+pytest-benchmark writes one JSON file per saved run under
+``.benchmarks/<machine>/``. This script lines up the most recent runs and
+shows how each benchmark moved between them::
+
+    python tests/benchmarks/report.py
+    python tests/benchmarks/report.py --last 10 --stat mean
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from rich import print
+from rich.table import Table
+
+STATS = ("min", "max", "mean", "median", "stddev", "ops")
+
+
+def load_runs(storage: Path, last: int) -> list[dict]:
+    """Load the ``last`` saved runs in the order they were recorded."""
+    runs = []
+    for path in storage.glob("*/*.json"):
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            continue
+        data["_name"] = path.stem
+        runs.append(data)
+
+    runs.sort(key=lambda run: run.get("datetime", ""))
+    return runs[-last:]
+
+
+def trend(runs: list[dict], stat: str) -> dict[str, list]:
+    """Map each benchmark name to its ``stat`` value in every run."""
+    rows: dict[str, list] = {}
+    for index, run in enumerate(runs):
+        for bench in run.get("benchmarks", []):
+            values = rows.setdefault(bench["fullname"], [None] * len(runs))
+            values[index] = bench["stats"].get(stat)
+    return rows
+
+
+def _change(old, new) -> str:
+    if old in (None, 0) or new is None:
+        return "-"
+    percent = (new - old) / old * 100
+    # A positive change is a slowdown
+    style = "green" if percent <= 0 else "red"
+    return f"[{style}]{percent:+.1f}%[/{style}]"
+
+
+def render(runs: list[dict], stat: str) -> Table:
+    unit = "ops/s" if stat == "ops" else "µs"
+    table = Table(title=f"Benchmark trend ({stat}, {unit})")
+    table.add_column("Benchmark", style="bold")
+    for run in runs:
+        table.add_column(run["_name"].split("_", 1)[0], justify="right")
+    table.add_column("vs first", justify="right")
+    table.add_column("vs previous", justify="right")
+
+    scale = 1 if stat == "ops" else 1_000_000
+    for name, values in sorted(trend(runs, stat).items()):
+        if stat == "ops":
+            # Invert so that a positive change is always a slowdown
+            changes = [None if v is None else 1 / v for v in values]
+        else:
+            changes = values
+        table.add_row(
+            name.split("::", 1)[-1],
+            *("-" if v is None else f"{v * scale:,.2f}" for v in values),
+            _change(changes[0], changes[-1]),
+            _change(changes[-2] if len(changes) > 1 else None, changes[-1]),
+        )
+    return table
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--storage",
+        type=Path,
+        default=Path(".benchmarks"),
+        help="pytest-benchmark storage directory",
+    )
+    parser.add_argument(
+        "--last", type=int, default=5, help="Number of most recent runs to show"
+    )
+    parser.add_argument(
+        "--stat", choices=STATS, default="median", help="Statistic to compare"
+    )
+    args = parser.parse_args(argv)
+
+    runs = load_runs(args.storage, args.last)
+    if not runs:
+        print(f"No saved benchmark runs found in {args.storage}")
+        return 1
+
+    print(render(runs, args.stat))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
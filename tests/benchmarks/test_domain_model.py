@@ -0,0 +1,23 @@
+"""Construction and event-raising cost of domain objects."""
+
+from uuid import uuid4
+
+from .elements import LineItem, Money, Order, order_kwargs
+
+
+def test_entity_init(benchmark):
+    price = Money(currency="USD", amount=10.0)
+    benchmark(LineItem, sku="SKU-1", quantity=2, price=price)
+
+
+def test_aggregate_init_with_entities(benchmark):
+    kwargs = order_kwargs(items=3)
+    benchmark(Order, **kwargs)
+
+
+def test_aggregate_raise(benchmark):
+    # A fresh aggregate per round keeps the pending-event list from growing
+    def setup():
+        return (Order(id=str(uuid4()), customer="jane"),), {}
+
+    benchmark.pedantic(Order.confirm, setup=setup, rounds=500)
@@ -0,0 +1,13 @@
+"""Cost of rebuilding an event-sourced aggregate from its stream."""
+
+from .conftest import ACCOUNT_EVENTS
+from .elements import Account
+
+
+def test_load_aggregate(benchmark, test_domain, account_stream):
+    store = test_domain.event_store.store
+
+    account = benchmark(store.load_aggregate, Account, account_stream)
+
+    assert account._version == ACCOUNT_EVENTS - 1
+    assert account.balance == 10.0 * (ACCOUNT_EVENTS - 1)
@@ -0,0 +1,11 @@
+"""Cost of rebuilding messages read from the event store."""
+
+from protean.utils.eventing import Message
+
+
+def test_message_deserialize(benchmark, test_domain, account_stream):
+    raw = test_domain.event_store.store._read(f"test::account-{account_stream}")[1]
+
+    message = benchmark(Message.deserialize, raw)
+
+    assert message.metadata.headers.type == "Test.Deposited.v1"
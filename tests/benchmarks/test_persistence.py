@@ -0,0 +1,39 @@
+"""Cost of committing and querying through the memory adapter."""
+
+from protean.core.queryset import Q
+from protean.core.unit_of_work import UnitOfWork
+
+from .conftest import ORDER_COUNT
+from .elements import Order, order_kwargs
+
+
+def test_unit_of_work_commit(benchmark, test_domain):
+    repository = test_domain.repository_for(Order)
+
+    def setup():
+        uow = UnitOfWork()
+        uow.start()
+        order = Order(**order_kwargs())
+        order.confirm()
+        repository.add(order)
+        return (uow,), {}
+
+    benchmark.pedantic(UnitOfWork.commit, setup=setup, rounds=200)
+
+
+def test_memory_session_filter(benchmark, seeded_orders):
+    dao = seeded_orders._dao
+    criteria = Q(customer__contains="customer-4") & Q(status="PENDING")
+
+    result = benchmark(dao._filter, criteria, limit=ORDER_COUNT)
+
+    assert result.total == 111
+
+
+def test_queryset_all(benchmark, seeded_orders):
+    def query():
+        return seeded_orders._dao.query.filter(status="PENDING").limit(100).all()
+
+    result = benchmark(query)
+
+    assert len(result.items) == 100
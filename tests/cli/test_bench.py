@@ -0,0 +1,70 @@
+"""Tests for the ``protean bench`` CLI command."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from protean.cli import app
+from tests.server.test_bench import build_domain
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def bench_domain():
+    domain = build_domain()
+    yield domain
+
+    # Only commands that got past validation initialized the domain
+    if domain.event_store.store is not None:
+        with domain.domain_context():
+            for provider in domain.providers.values():
+                provider._data_reset()
+            domain.event_store.store._data_reset()
+
+
+def _invoke(domain, *args):
+    with patch("protean.cli.bench.derive_domain", return_value=domain):
+        return runner.invoke(app, ["bench", "--commands", "3", *args])
+
+
+class TestBenchCommand:
+    def test_json_report(self, bench_domain):
+        result = _invoke(bench_domain, "--mode", "sync", "--json")
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.output)
+        assert report["commands"] == 3
+        assert report["adapters"] == "memory"
+        assert report["latency_ms"]["PlaceOrder"]["count"] == 3
+
+    def test_table_and_output_file(self, bench_domain, tmp_path):
+        output = tmp_path / "bench.json"
+        result = _invoke(bench_domain, "--mode", "sync", "--output", str(output))
+
+        assert result.exit_code == 0, result.output
+        assert "Commands/sec" in result.output
+        assert "PlaceOrder" in result.output
+        assert json.loads(output.read_text())["seed"] == 42
+
+    def test_invalid_mode(self, bench_domain):
+        result = _invoke(bench_domain, "--mode", "turbo")
+        assert result.exit_code != 0
+        assert "--mode must be" in result.output
+
+    def test_invalid_adapters(self, bench_domain):
+        result = _invoke(bench_domain, "--adapters", "mongo")
+        assert result.exit_code != 0
+        assert "Unknown adapters" in result.output
+
+    def test_invalid_scenario_path(self, bench_domain):
+        result = _invoke(bench_domain, "--scenario", "no_colon")
+        assert result.exit_code != 0
+        assert "module:callable" in result.output
+
+    def test_no_commands_to_generate(self, bench_domain):
+        result = _invoke(bench_domain, "--command", "ArchiveOrders")
+        assert result.exit_code == 1
+        assert "No commands" in result.output
@@ -0,0 +1,136 @@
+"""Tests for CLI process manager commands (protean pm ...)."""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from protean.cli import app
+from protean.exceptions import NoDomainException
+from protean.utils.process_manager_compactor import CompactionResult
+from tests.shared import change_working_directory_to
+
+runner = CliRunner()
+
+
+class TestPMCompact:
+    """Tests for `protean pm compact`."""
+
+    @pytest.fixture(autouse=True)
+    def reset_path(self):
+        original_path = sys.path[:]
+        cwd = Path.cwd()
+        yield
+        sys.path[:] = original_path
+        os.chdir(cwd)
+
+    @staticmethod
+    def _domain_with(name="OrderFulfillmentPM"):
+        mock_domain = MagicMock()
+        mock_record = MagicMock()
+        mock_record.cls.__name__ = name
+        mock_domain.registry._elements = {
+            "PROCESS_MANAGER": {f"some.fqn.{name}": mock_record}
+        }
+        return mock_domain, mock_record
+
+    def _invoke(self, mock_domain, *extra):
+        change_working_directory_to("test7")
+        with patch("protean.cli.pm.derive_domain", return_value=mock_domain):
+            return runner.invoke(
+                app, ["pm", "compact", "--domain", "publishing7.py", *extra]
+            )
+
+    def test_compact_specific_process_manager(self):
+        mock_domain, mock_record = self._domain_with()
+        mock_domain.compact_process_manager.return_value = CompactionResult(
+            process_manager="OrderFulfillmentPM",
+            streams_examined=4,
+            streams_compacted=2,
+            transitions_removed=30,
+            transitions_archived=30,
+        )
+
+        result = self._invoke(
+            mock_domain,
+            "--process-manager",
+            "OrderFulfillmentPM",
+            "--idle-days",
+            "7",
+            "--archive",
+            "out.jsonl",
+        )
+
+        assert result.exit_code == 0
+        assert "Compacted 2 of 4 stream(s), removing 30 transition(s)" in result.output
+        assert "(30 archived)" in result.output
+        mock_domain.compact_process_manager.assert_called_once_with(
+            mock_record.cls,
+            idle_days=7.0,
+            min_transitions=None,
+            archive="out.jsonl",
+            dry_run=False,
+        )
+
+    def test_compact_all_process_managers(self):
+        mock_domain, _ = self._domain_with()
+        mock_domain.compact_all_process_managers.return_value = {
+            "OrderFulfillmentPM": CompactionResult(
+                process_manager="OrderFulfillmentPM",
+                streams_examined=3,
+                streams_compacted=1,
+                transitions_removed=12,
+            ),
+            "Broken": CompactionResult(
+                process_manager="Broken", errors=["does not support truncating"]
+            ),
+        }
+
+        result = self._invoke(mock_domain, "--dry-run")
+
+        assert result.exit_code == 0
+        assert "OrderFulfillmentPM: Would compact 1 of 3 stream(s)" in result.output
+        assert "Broken: ERROR - does not support truncating" in result.output
+        mock_domain.compact_all_process_managers.assert_called_once_with(
+            idle_days=None, min_transitions=None, archive=None, dry_run=True
+        )
+
+    def test_no_process_managers(self):
+        mock_domain, _ = self._domain_with()
+        mock_domain.compact_all_process_managers.return_value = {}
+
+        result = self._invoke(mock_domain)
+
+        assert result.exit_code == 0
+        assert "No process managers found" in result.output
+
+    def test_errors_abort(self):
+        mock_domain, _ = self._domain_with()
+        mock_domain.compact_process_manager.return_value = CompactionResult(
+            process_manager="OrderFulfillmentPM", errors=["Wrong expected version"]
+        )
+
+        result = self._invoke(mock_domain, "--process-manager", "OrderFulfillmentPM")
+
+        assert result.exit_code != 0
+        assert "Error: Wrong expected version" in result.output
+
+    def test_unknown_process_manager(self):
+        mock_domain, _ = self._domain_with()
+
+        result = self._invoke(mock_domain, "--process-manager", "NonExistent")
+
+        assert result.exit_code != 0
+        assert "Process manager 'NonExistent' not found" in result.output
+
+    def test_invalid_domain(self):
+        with patch(
+            "protean.cli.pm.derive_domain",
+            side_effect=NoDomainException("Not found"),
+        ):
+            result = runner.invoke(app, ["pm", "compact", "--domain", "invalid.py"])
+        assert result.exit_code != 0
+        assert "Error loading Protean domain" in result.output
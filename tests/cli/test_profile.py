@@ -0,0 +1,82 @@
+"""Tests for the ``protean profile`` CLI command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from protean.cli import app
+
+runner = CliRunner()
+
+
+def _snapshot(count: int, samples: int) -> dict:
+    return {
+        "worker": "w1",
+        "samples": samples,
+        "calls": [
+            {
+                "handler": "OrderProjector",
+                "message_type": "OrderPlaced",
+                "count": count,
+                "wall_ms": 4.0 * count,
+                "cpu_ms": 1.0 * count,
+            }
+        ],
+        "stacks": [
+            {
+                "handler": "OrderProjector",
+                "message_type": "OrderPlaced",
+                "frames": ["apply", "save"],
+                "samples": samples,
+            }
+        ],
+    }
+
+
+def _mock_domain() -> MagicMock:
+    domain = MagicMock()
+    domain.name = "shop"
+    domain.brokers.get.return_value.redis_instance = MagicMock()
+    return domain
+
+
+def _invoke(snapshots, *args):
+    with (
+        patch("protean.cli.profile.derive_domain", return_value=_mock_domain()),
+        patch("protean.server.profiler.read_snapshots", side_effect=snapshots),
+        patch("protean.cli.profile.time.sleep") as sleep,
+    ):
+        result = runner.invoke(app, ["profile", "--duration", "5", *args])
+    return result, sleep
+
+
+class TestProfileCommand:
+    def test_reports_window_between_snapshots(self):
+        result, sleep = _invoke([[_snapshot(10, 20)], [_snapshot(15, 32)]])
+
+        assert result.exit_code == 0
+        sleep.assert_called_once_with(5.0)
+        assert "OrderProjector" in result.output
+        assert "12 stack samples" in result.output
+
+    def test_json_output_and_flamegraph_file(self, tmp_path):
+        output = tmp_path / "profile.json"
+        result, _ = _invoke(
+            [[_snapshot(10, 20)], [_snapshot(15, 32)]],
+            "--json",
+            "--output",
+            str(output),
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["handlers"]["OrderProjector"]["count"] == 5
+        assert json.loads(output.read_text())["value"] == 12
+
+    def test_exits_when_no_worker_publishes(self):
+        result, sleep = _invoke([[], []])
+
+        assert result.exit_code == 1
+        assert "No profile snapshots found" in result.output
+        sleep.assert_not_called()
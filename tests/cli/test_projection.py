@@ -67,6 +67,44 @@ class TestProjectionRebuildSingle:
             assert "42 events processed" in result.output
             assert "1 projector(s)" in result.output
 
+    def test_rebuild_with_resume_and_workers(self):
+        change_working_directory_to("test7")
+
+        mock_domain = MagicMock()
+        mock_domain.rebuild_projection.return_value = RebuildResult(
+            projection_name="Balances",
+            projectors_processed=1,
+            categories_processed=2,
+            events_dispatched=7,
+            resumed=True,
+        )
+        mock_record = MagicMock()
+        mock_record.cls.__name__ = "Balances"
+        mock_domain.registry._elements = {
+            "PROJECTION": {"some.fqn.Balances": mock_record}
+        }
+
+        with patch("protean.cli.projection.derive_domain", return_value=mock_domain):
+            result = runner.invoke(
+                app,
+                [
+                    "projection",
+                    "rebuild",
+                    "--domain",
+                    "publishing7.py",
+                    "--projection",
+                    "Balances",
+                    "--resume",
+                    "--workers",
+                    "4",
+                ],
+            )
+            assert result.exit_code == 0
+            assert "Resumed projection 'Balances'" in result.output
+            mock_domain.rebuild_projection.assert_called_once_with(
+                mock_record.cls, 500, resume=True, workers=4, shadow=False
+            )
+
     def test_rebuild_with_skipped_events(self):
         change_working_directory_to("test7")
 
@@ -161,6 +199,24 @@ class TestProjectionRebuildAll:
             assert "UserDirectory: 10 events processed" in result.output
             assert "30 total events processed" in result.output
 
+    def test_rebuild_all_into_shadow(self):
+        change_working_directory_to("test7")
+
+        mock_domain = MagicMock()
+        mock_domain.rebuild_all_projections.return_value = {
+            "Balances": RebuildResult(projection_name="Balances", events_dispatched=20),
+        }
+
+        with patch("protean.cli.projection.derive_domain", return_value=mock_domain):
+            result = runner.invoke(
+                app,
+                ["projection", "rebuild", "--domain", "publishing7.py", "--shadow"],
+            )
+            assert result.exit_code == 0
+            mock_domain.rebuild_all_projections.assert_called_once_with(
+                500, resume=False, workers=1, shadow=True
+            )
+
     def test_rebuild_all_no_projections(self):
         change_working_directory_to("test7")
 
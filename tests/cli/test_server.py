@@ -183,6 +183,7 @@ class TestServerCommand:
                 num_workers=2,
                 test_mode=False,
                 debug=False,
+                rolling_drain=False,
             )
             mock_supervisor.run.assert_called_once()
 
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 import pytest
 
+from protean.adapters.idempotency import RedisIdempotencyBackend
 from protean.core.aggregate import BaseAggregate
 from protean.core.command import BaseCommand
 from protean.core.command_handler import BaseCommandHandler
@@ -216,8 +217,8 @@ class TestIdempotencyStoreWithoutRedis:
         store.flush()  # Should not raise
 
     def test_key_formatting(self):
-        store = IdempotencyStore(redis_url=None)
-        assert store._key("abc-123") == "idempotency:abc-123"
+        backend = RedisIdempotencyBackend(MagicMock())
+        assert backend._key("abc-123") == "idempotency:abc-123"
 
 
 class TestIdempotencyStoreInvalidUrl:
@@ -285,9 +286,8 @@ class TestIdempotencyStoreErrorHandling:
     """
 
     def _make_store_with_mock(self) -> tuple[IdempotencyStore, MagicMock]:
-        store = IdempotencyStore(redis_url=None)
         mock_redis = MagicMock()
-        store._redis = mock_redis  # Inject a mock Redis connection
+        store = IdempotencyStore(backend=RedisIdempotencyBackend(mock_redis))
         return store, mock_redis
 
     def test_check_returns_none_on_redis_error(self):
@@ -316,3 +316,130 @@ class TestIdempotencyStoreErrorHandling:
 
         # Should not raise
         store.flush()
+
+    def test_check_many_returns_none_on_redis_error(self):
+        store, mock_redis = self._make_store_with_mock()
+        mock_redis.mget.side_effect = ConnectionError("Redis down")
+
+        assert store.check_many(["key-1", "key-2"]) == {"key-1": None, "key-2": None}
+
+    def test_record_many_handles_redis_error(self):
+        store, mock_redis = self._make_store_with_mock()
+        mock_redis.pipeline.return_value.execute.side_effect = ConnectionError(
+            "Redis down"
+        )
+
+        # Should not raise, and nothing is remembered locally
+        store.record_many({"key-1": True})
+        assert len(store._local) == 0
+
+
+class TestIdempotencyStoreBatchAndLocalTier:
+    """Batch APIs and the in-process LRU tier, using a mocked Redis client."""
+
+    def _make_store_with_mock(self, **kwargs) -> tuple[IdempotencyStore, MagicMock]:
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+        store = IdempotencyStore(backend=RedisIdempotencyBackend(mock_redis), **kwargs)
+        return store, mock_redis
+
+    def test_check_many_uses_a_single_mget(self):
+        store, mock_redis = self._make_store_with_mock()
+        mock_redis.mget.return_value = [
+            b'{"status": "success", "result": 1}',
+            None,
+        ]
+
+        results = store.check_many(["key-1", "key-2"])
+
+        mock_redis.mget.assert_called_once_with(
+            ["idempotency:key-1", "idempotency:key-2"]
+        )
+        assert results == {
+            "key-1": {"status": "success", "result": 1},
+            "key-2": None,
+        }
+
+    def test_check_many_with_no_keys_skips_redis(self):
+        store, mock_redis = self._make_store_with_mock()
+
+        assert store.check_many([]) == {}
+        mock_redis.mget.assert_not_called()
+
+    def test_record_many_uses_a_pipeline(self):
+        store, mock_redis = self._make_store_with_mock()
+        pipe = mock_redis.pipeline.return_value
+
+        store.record_many({"key-1": "a", "key-2": "b"}, ttl=30)
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_called_once()
+
+    def test_recorded_success_is_served_locally(self):
+        store, mock_redis = self._make_store_with_mock()
+
+        store.record_success("key-1", {"counter": 1})
+
+        assert store.check("key-1") == {"status": "success", "result": {"counter": 1}}
+        assert store.check_many(["key-1"])["key-1"]["status"] == "success"
+        mock_redis.get.assert_not_called()
+        mock_redis.mget.assert_not_called()
+
+    def test_success_read_from_redis_is_remembered(self):
+        store, mock_redis = self._make_store_with_mock()
+        mock_redis.get.return_value = b'{"status": "success", "result": true}'
+
+        store.check("key-1")
+        store.check("key-1")
+
+        mock_redis.get.assert_called_once()
+
+    def test_error_records_are_not_remembered(self):
+        store, mock_redis = self._make_store_with_mock()
+        mock_redis.get.return_value = b'{"status": "error", "error": "boom"}'
+
+        store.check("key-1")
+        store.check("key-1")
+
+        assert mock_redis.get.call_count == 2
+
+    def test_record_error_evicts_local_success(self):
+        store, mock_redis = self._make_store_with_mock()
+        store.record_success("key-1", True)
+
+        store.record_error("key-1", "handler_failed")
+        store.check("key-1")
+
+        mock_redis.get.assert_called_once()
+
+    def test_local_tier_is_bounded(self):
+        store, _ = self._make_store_with_mock(local_cache_size=2)
+
+        for key in ("key-1", "key-2", "key-3"):
+            store.record_success(key, True)
+
+        assert len(store._local) == 2
+        assert store._local.get("key-1") is None
+
+    def test_local_entries_expire_with_ttl(self):
+        store, mock_redis = self._make_store_with_mock()
+        store.record_success("key-1", True, ttl=0)
+
+        store.check("key-1")
+
+        mock_redis.get.assert_called_once()
+
+    def test_local_tier_can_be_disabled(self):
+        store, _ = self._make_store_with_mock(local_cache_size=0)
+        store.record_success("key-1", True)
+
+        assert len(store._local) == 0
+
+    def test_flush_clears_local_tier(self):
+        store, _ = self._make_store_with_mock()
+        store.record_success("key-1", True)
+
+        store.flush()
+
+        assert len(store._local) == 0
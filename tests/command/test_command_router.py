@@ -0,0 +1,200 @@
+"""Tests for per-aggregate command serialization with ``CommandRouter``."""
+
+import asyncio
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean import current_domain, handle
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.unit_of_work import UnitOfWork
+from protean.domain.command_processor import CommandStatus
+from protean.domain.command_router import CommandRouter, HashRing
+from protean.exceptions import CommandRoutingError, IncorrectUsageError
+from protean.fields import Identifier, Integer
+
+
+class Stock(BaseAggregate):
+    sku = Identifier(identifier=True)
+    available = Integer(default=0)
+
+
+class Restock(BaseCommand):
+    sku = Identifier(identifier=True)
+    quantity = Integer()
+
+
+class StockCommandHandler(BaseCommandHandler):
+    @handle(Restock)
+    def restock(self, command: Restock) -> int:
+        repository = current_domain.repository_for(Stock)
+        stock = repository.get(command.sku)
+        stock.available += command.quantity
+        repository.add(stock)
+        return stock.available
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Stock)
+    test_domain.register(Restock, part_of=Stock)
+    test_domain.register(StockCommandHandler, part_of=Stock)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def sku(test_domain):
+    sku = str(uuid4())
+    test_domain.repository_for(Stock).add(Stock(sku=sku))
+    return sku
+
+
+@pytest.fixture
+def batch_commits():
+    """Collect the command counts of committed batch UnitOfWorks."""
+    commits = []
+    original = UnitOfWork.commit
+
+    def commit(uow):
+        if uow.is_batch:
+            commits.append(uow)
+        return original(uow)
+
+    with patch.object(UnitOfWork, "commit", commit):
+        yield commits
+
+
+def _available(test_domain, sku):
+    return test_domain.repository_for(Stock).get(sku).available
+
+
+class TestSerialization:
+    async def test_concurrent_commands_are_coalesced(
+        self, test_domain, sku, batch_commits
+    ):
+        router = CommandRouter(test_domain)
+
+        results = await asyncio.gather(
+            *(router.submit(Restock(sku=sku, quantity=1)) for _ in range(10))
+        )
+
+        assert [result.status for result in results] == [CommandStatus.PROCESSED] * 10
+        assert [result.result for result in results] == list(range(1, 11))
+        assert len(batch_commits) == 1
+        assert _available(test_domain, sku) == 10
+
+    async def test_max_batch_bounds_each_commit(self, test_domain, sku, batch_commits):
+        router = CommandRouter(test_domain, max_batch=4)
+
+        await asyncio.gather(
+            *(router.submit(Restock(sku=sku, quantity=1)) for _ in range(10))
+        )
+
+        # Batches of 4, 4 and 2
+        assert len(batch_commits) == 3
+        assert _available(test_domain, sku) == 10
+
+    async def test_aggregates_are_queued_separately(self, test_domain, sku):
+        other_sku = str(uuid4())
+        test_domain.repository_for(Stock).add(Stock(sku=other_sku))
+        router = CommandRouter(test_domain)
+
+        await asyncio.gather(
+            router.submit(Restock(sku=sku, quantity=1)),
+            router.submit(Restock(sku=other_sku, quantity=5)),
+            router.submit(Restock(sku=sku, quantity=2)),
+        )
+
+        assert _available(test_domain, sku) == 3
+        assert _available(test_domain, other_sku) == 5
+
+    async def test_queues_are_released_when_drained(self, test_domain, sku):
+        router = CommandRouter(test_domain)
+
+        await router.submit(Restock(sku=sku, quantity=1))
+        await router.close()
+
+        assert router._queues == {}
+        assert router._workers == {}
+        assert router.pending == 0
+
+    async def test_idempotency_keys_are_honoured(self, test_domain, sku):
+        test_domain.config["idempotency"]["backend"] = "memory"
+        test_domain._idempotency_store = None
+        router = CommandRouter(test_domain)
+
+        first = await router.submit(Restock(sku=sku, quantity=1), "restock-1")
+        second = await router.submit(Restock(sku=sku, quantity=1), "restock-1")
+
+        assert first.status == CommandStatus.PROCESSED
+        assert second.status == CommandStatus.DUPLICATE
+        assert _available(test_domain, sku) == 1
+        test_domain.idempotency_store.flush()
+
+
+class TestOwnership:
+    async def test_commands_owned_by_another_node_are_rejected(self, test_domain):
+        router = CommandRouter(test_domain, nodes=["a", "b"], node="a")
+        command = next(
+            command
+            for command in (Restock(sku=str(uuid4()), quantity=1) for _ in range(100))
+            if router.owner_of(command) == "b"
+        )
+
+        with pytest.raises(CommandRoutingError) as exc:
+            await router.submit(command)
+
+        assert exc.value.owner == "b"
+
+    def test_owner_is_none_without_a_ring(self, test_domain):
+        router = CommandRouter(test_domain)
+        assert router.owner_of(Restock(sku="A-1", quantity=1)) is None
+
+    def test_node_must_be_on_the_ring(self, test_domain):
+        with pytest.raises(IncorrectUsageError, match="not one of the ring nodes"):
+            CommandRouter(test_domain, nodes=["a", "b"], node="c")
+
+    def test_router_is_built_from_config(self, test_domain):
+        test_domain.config["command_router"] = {
+            "max_batch": 7,
+            "nodes": ["a", "b"],
+            "node": "b",
+        }
+        test_domain._command_router = None
+
+        router = test_domain.command_router
+
+        assert router.max_batch == 7
+        assert router.node == "b"
+        assert router.ring.nodes == {"a", "b"}
+
+
+class TestHashRing:
+    def test_assignment_is_stable(self):
+        keys = [f"stock-{i}" for i in range(100)]
+
+        first = [HashRing(["a", "b", "c"]).node_for(key) for key in keys]
+        second = [HashRing(["c", "b", "a"]).node_for(key) for key in keys]
+
+        assert first == second
+        assert set(first) == {"a", "b", "c"}
+
+    def test_removing_a_node_only_moves_its_keys(self):
+        keys = [f"stock-{i}" for i in range(500)]
+        ring = HashRing(["a", "b", "c"])
+        before = {key: ring.node_for(key) for key in keys}
+
+        ring.remove_node("c")
+
+        for key in keys:
+            if before[key] != "c":
+                assert ring.node_for(key) == before[key]
+            else:
+                assert ring.node_for(key) in {"a", "b"}
+
+    def test_empty_ring(self):
+        with pytest.raises(IncorrectUsageError, match="no nodes"):
+            HashRing().node_for("stock-1")
@@ -0,0 +1,260 @@
+"""Tests for pluggable idempotency backends (memory and database)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from protean.adapters.idempotency import MemoryIdempotencyBackend
+from protean.adapters.idempotency.database import DatabaseIdempotencyBackend
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.unit_of_work import UnitOfWork
+from protean.exceptions import ConfigurationError
+from protean.fields import Identifier
+from protean.utils.globals import current_domain, current_uow
+from protean.utils.idempotency import IdempotencyStore
+from protean.utils.mixins import handle
+
+SUCCESS = {"status": "success", "result": {"counter": 1}}
+
+
+class _Clock:
+    """Stand-in for ``time.monotonic`` that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with patch("protean.adapters.idempotency.memory.time.monotonic", clock):
+        yield clock
+
+
+class TestMemoryBackend:
+    def test_set_and_get(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set("key-1", SUCCESS, ttl=60)
+        assert backend.get("key-1") == SUCCESS
+        assert backend.get("missing") is None
+
+    def test_returned_records_are_copies(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set("key-1", SUCCESS, ttl=60)
+        backend.get("key-1")["status"] = "tampered"
+        assert backend.get("key-1") == SUCCESS
+
+    def test_record_expires_after_ttl(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set("key-1", SUCCESS, ttl=10)
+
+        clock.now += 9
+        assert backend.get("key-1") == SUCCESS
+        clock.now += 2
+        assert backend.get("key-1") is None
+
+    def test_wheel_sweep_removes_only_expired_records(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set_many({"a": SUCCESS, "b": SUCCESS}, ttl=5)
+        backend.set("c", SUCCESS, ttl=60)
+
+        clock.now += 10
+        assert backend.purge_expired() == 2
+        assert len(backend) == 1
+        assert backend.get("c") == SUCCESS
+
+    def test_rewritten_key_survives_its_old_slot(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set("key-1", {"status": "error", "error": "boom"}, ttl=5)
+        backend.set("key-1", SUCCESS, ttl=60)
+
+        clock.now += 10
+        assert backend.purge_expired() == 0
+        assert backend.get("key-1") == SUCCESS
+
+    def test_bounded_by_max_entries(self, clock):
+        backend = MemoryIdempotencyBackend(max_entries=2)
+        backend.set("a", SUCCESS, ttl=60)
+        backend.set("b", SUCCESS, ttl=60)
+        backend.set("c", SUCCESS, ttl=60)
+
+        assert len(backend) == 2
+        assert backend.get("a") is None
+
+    def test_get_many(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set("a", SUCCESS, ttl=60)
+        assert backend.get_many(["a", "b"]) == {"a": SUCCESS, "b": None}
+
+    def test_delete_and_flush(self, clock):
+        backend = MemoryIdempotencyBackend()
+        backend.set_many({"a": SUCCESS, "b": SUCCESS}, ttl=60)
+        backend.delete("a")
+        assert backend.get("a") is None
+
+        backend.flush()
+        assert len(backend) == 0
+
+    def test_store_skips_local_tier(self):
+        store = IdempotencyStore(backend=MemoryIdempotencyBackend())
+        store.record_success("key-1", 42)
+
+        assert store.is_active is True
+        assert len(store._local) == 0
+        assert store.check("key-1") == {"status": "success", "result": 42}
+
+
+@pytest.fixture
+def database_store(test_domain):
+    test_domain.config["idempotency"]["backend"] = "database"
+    test_domain.init(traverse=False)
+    with test_domain.domain_context():
+        store = test_domain.idempotency_store
+        yield store
+        store.flush()
+
+
+class TestDatabaseBackend:
+    def test_domain_builds_database_backend(self, database_store):
+        assert isinstance(database_store.backend, DatabaseIdempotencyBackend)
+
+    def test_record_success_and_check(self, database_store):
+        database_store.record_success("key-1", {"counter": 1})
+        database_store._local.clear()
+
+        assert database_store.check("key-1") == SUCCESS
+
+    def test_overwrite_existing_record(self, database_store):
+        database_store.record_error("key-1", "boom")
+        assert database_store.check("key-1") == {"status": "error", "error": "boom"}
+
+        database_store.record_success("key-1", {"counter": 1})
+        database_store._local.clear()
+        assert database_store.check("key-1") == SUCCESS
+
+    def test_check_many_and_record_many(self, database_store):
+        database_store.record_many({"a": 1, "b": 2})
+        database_store._local.clear()
+
+        assert database_store.check_many(["a", "b", "c"]) == {
+            "a": {"status": "success", "result": 1},
+            "b": {"status": "success", "result": 2},
+            "c": None,
+        }
+
+    def test_expired_records_are_invisible_and_purged(self, database_store):
+        database_store.record_error("stale", "boom", ttl=-1)
+        database_store.record_success("fresh", True)
+
+        assert database_store.check("stale") is None
+        assert database_store.purge_expired() == 1
+        assert database_store.check("fresh") == {"status": "success", "result": True}
+
+    def test_write_inside_unit_of_work_rolls_back_with_it(
+        self, test_domain, database_store
+    ):
+        uow = UnitOfWork()
+        uow.start()
+        database_store.record_success("key-uow", True)
+        uow.rollback()
+        database_store._local.clear()
+
+        assert database_store.check("key-uow") is None
+
+    def test_failed_write_inside_unit_of_work_raises(self, database_store):
+        uow = UnitOfWork()
+        uow.start()
+        with patch.object(
+            database_store.backend, "set", side_effect=RuntimeError("db down")
+        ):
+            with pytest.raises(RuntimeError, match="db down"):
+                database_store.record_success("key-uow", True)
+        uow.rollback()
+
+    def test_failed_write_outside_unit_of_work_is_logged(self, database_store):
+        with patch.object(
+            database_store.backend, "set_many", side_effect=RuntimeError("db down")
+        ):
+            database_store.record_many({"a": 1})
+
+        assert database_store.check("a") is None
+
+
+class Ledger(BaseAggregate):
+    ledger_id = Identifier(identifier=True)
+
+
+class OpenLedger(BaseCommand):
+    ledger_id = Identifier(identifier=True)
+
+
+class LedgerCommandHandler(BaseCommandHandler):
+    @handle(OpenLedger)
+    def open_ledger(self, command: OpenLedger):
+        current_domain.repository_for(Ledger).add(Ledger(ledger_id=command.ledger_id))
+        return {"ledger_id": command.ledger_id}
+
+
+@pytest.fixture
+def ledger_domain(test_domain):
+    test_domain.config["idempotency"]["backend"] = "database"
+    test_domain.register(Ledger)
+    test_domain.register(OpenLedger, part_of=Ledger)
+    test_domain.register(LedgerCommandHandler, part_of=Ledger)
+    test_domain.init(traverse=False)
+    with test_domain.domain_context():
+        yield test_domain
+        test_domain.idempotency_store.flush()
+
+
+class TestTransactionalRecording:
+    def test_success_is_recorded_inside_the_handler_unit_of_work(self, ledger_domain):
+        store = ledger_domain.idempotency_store
+        in_uow = []
+        original_set = store.backend.set_many
+
+        def spy(records, ttl):
+            in_uow.append(bool(current_uow and current_uow.in_progress))
+            return original_set(records, ttl)
+
+        with patch.object(store.backend, "set_many", spy):
+            ledger_domain.process(OpenLedger(ledger_id="l-1"), idempotency_key="k-1")
+
+        assert in_uow == [True]
+        assert store.check("k-1") == {
+            "status": "success",
+            "result": {"ledger_id": "l-1"},
+        }
+
+    def test_record_rolls_back_when_the_handler_commit_fails(self, ledger_domain):
+        store = ledger_domain.idempotency_store
+
+        original_commit = UnitOfWork.commit
+
+        def failing_commit(uow):
+            # Fail only the handler's Unit of Work, not the command append
+            if any(name == "Ledger" for name, _ in uow._aggregates()):
+                raise RuntimeError("commit failed")
+            return original_commit(uow)
+
+        with patch.object(UnitOfWork, "commit", failing_commit):
+            with pytest.raises(RuntimeError):
+                ledger_domain.process(
+                    OpenLedger(ledger_id="l-1"), idempotency_key="k-1"
+                )
+
+        # The success written inside the handler's Unit of Work is gone; only
+        # the processor's short-lived error record remains, so a retry runs.
+        store._local.clear()
+        assert store.check("k-1") == {"status": "error", "error": "handler_failed"}
+
+
+def test_unknown_backend_is_rejected(test_domain):
+    test_domain.config["idempotency"]["backend"] = "carrier-pigeon"
+    with pytest.raises(ConfigurationError, match="Unknown idempotency backend"):
+        test_domain.idempotency_store
@@ -0,0 +1,372 @@
+"""Tests for batch command processing with ``domain.process_many``."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean import apply, current_domain, handle
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.core.unit_of_work import UnitOfWork
+from protean.domain.command_processor import CommandStatus
+from protean.exceptions import (
+    IncorrectUsageError,
+    ObjectNotFoundError,
+    ValidationError,
+)
+from protean.fields import Float, Identifier, String
+from protean.port.dao import BaseDAO
+
+deposits_seen = []
+
+
+class Account(BaseAggregate):
+    account_id = Identifier(identifier=True)
+    holder = String()
+    balance = Float(default=0.0)
+
+
+class Deposited(BaseEvent):
+    account_id = Identifier(identifier=True)
+    amount = Float()
+
+
+class OpenAccount(BaseCommand):
+    account_id = Identifier(identifier=True)
+    holder = String()
+
+
+class Deposit(BaseCommand):
+    account_id = Identifier(identifier=True)
+    amount = Float()
+
+
+class AccountCommandHandler(BaseCommandHandler):
+    @handle(OpenAccount)
+    def open(self, command: OpenAccount) -> str:
+        current_domain.repository_for(Account).add(
+            Account(account_id=command.account_id, holder=command.holder)
+        )
+        return command.account_id
+
+    @handle(Deposit)
+    def deposit(self, command: Deposit) -> float:
+        if command.amount <= 0:
+            raise ValidationError({"amount": ["must be positive"]})
+
+        repository = current_domain.repository_for(Account)
+        account = repository.get(command.account_id)
+        account.balance += command.amount
+        account.raise_(Deposited(account_id=account.account_id, amount=command.amount))
+        repository.add(account)
+        return account.balance
+
+
+class DepositTracker(BaseEventHandler):
+    @handle(Deposited)
+    def track(self, event: Deposited) -> None:
+        deposits_seen.append(event.amount)
+
+
+class WalletCredited(BaseEvent):
+    wallet_id = Identifier(identifier=True)
+    amount = Float()
+
+
+class Wallet(BaseAggregate):
+    wallet_id = Identifier(identifier=True)
+    balance = Float(default=0.0)
+
+    @apply
+    def credited(self, event: WalletCredited) -> None:
+        self.wallet_id = event.wallet_id
+        self.balance = (self.balance or 0.0) + event.amount
+
+
+class CreditWallet(BaseCommand):
+    wallet_id = Identifier(identifier=True)
+    amount = Float()
+
+
+class WalletCommandHandler(BaseCommandHandler):
+    @handle(CreditWallet)
+    def credit(self, command: CreditWallet) -> None:
+        repository = current_domain.repository_for(Wallet)
+        try:
+            wallet = repository.get(command.wallet_id)
+        except ObjectNotFoundError:
+            wallet = Wallet(wallet_id=command.wallet_id)
+        wallet.raise_(
+            WalletCredited(wallet_id=command.wallet_id, amount=command.amount)
+        )
+        repository.add(wallet)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Account)
+    test_domain.register(Deposited, part_of=Account)
+    test_domain.register(OpenAccount, part_of=Account)
+    test_domain.register(Deposit, part_of=Account)
+    test_domain.register(AccountCommandHandler, part_of=Account)
+    test_domain.register(DepositTracker, part_of=Account)
+    test_domain.register(Wallet, is_event_sourced=True)
+    test_domain.register(WalletCredited, part_of=Wallet)
+    test_domain.register(CreditWallet, part_of=Wallet)
+    test_domain.register(WalletCommandHandler, part_of=Wallet)
+    test_domain.init(traverse=False)
+
+    deposits_seen.clear()
+
+
+@pytest.fixture
+def account_id(test_domain):
+    account_id = str(uuid4())
+    test_domain.process(OpenAccount(account_id=account_id, holder="John"))
+    return account_id
+
+
+@pytest.fixture
+def batch_commits():
+    """Count commits of batch UnitOfWorks."""
+    commits = []
+    original = UnitOfWork.commit
+
+    def commit(uow):
+        if uow.is_batch:
+            commits.append(uow)
+        return original(uow)
+
+    with patch.object(UnitOfWork, "commit", commit):
+        yield commits
+
+
+def _balance(test_domain, account_id):
+    return test_domain.repository_for(Account).get(account_id).balance
+
+
+class TestSynchronousBatches:
+    def test_results_follow_submission_order(self, test_domain, account_id):
+        results = test_domain.process_many(
+            [Deposit(account_id=account_id, amount=amount) for amount in (10, 20, 30)]
+        )
+
+        assert [result.status for result in results] == [CommandStatus.PROCESSED] * 3
+        assert [result.result for result in results] == [10.0, 30.0, 60.0]
+        assert all(result.ok for result in results)
+        assert _balance(test_domain, account_id) == 60.0
+        assert deposits_seen == [10.0, 20.0, 30.0]
+
+    def test_group_commits_once_and_loads_aggregate_once(
+        self, test_domain, account_id, batch_commits
+    ):
+        original_get = BaseDAO.get
+        loads = []
+
+        def get(dao, identifier):
+            loads.append(identifier)
+            return original_get(dao, identifier)
+
+        with patch.object(BaseDAO, "get", get):
+            test_domain.process_many(
+                [Deposit(account_id=account_id, amount=5) for _ in range(4)]
+            )
+
+        assert len(batch_commits) == 1
+        assert loads == [account_id]
+        assert _balance(test_domain, account_id) == 20.0
+
+    def test_batch_size_splits_groups(self, test_domain, account_id, batch_commits):
+        results = test_domain.process_many(
+            [Deposit(account_id=account_id, amount=1) for _ in range(5)],
+            batch_size=2,
+        )
+
+        # Chunks of 2, 2 and a final single command handled on its own
+        assert len(batch_commits) == 2
+        assert all(result.ok for result in results)
+        assert _balance(test_domain, account_id) == 5.0
+
+    def test_chunks_keep_each_aggregate_together(
+        self, test_domain, account_id, batch_commits
+    ):
+        other_id = str(uuid4())
+        test_domain.process(OpenAccount(account_id=other_id, holder="Jane"))
+        original_get = BaseDAO.get
+        loads = []
+
+        def get(dao, identifier):
+            loads.append(identifier)
+            return original_get(dao, identifier)
+
+        with patch.object(BaseDAO, "get", get):
+            results = test_domain.process_many(
+                [
+                    Deposit(account_id=account_id, amount=1),
+                    Deposit(account_id=other_id, amount=10),
+                    Deposit(account_id=account_id, amount=2),
+                    Deposit(account_id=other_id, amount=20),
+                ],
+                batch_size=2,
+            )
+
+        # Each chunk of two holds one account's deposits, so each account is
+        # loaded once
+        assert len(batch_commits) == 2
+        assert loads == [account_id, other_id]
+        assert [result.result for result in results] == [1.0, 10.0, 3.0, 30.0]
+
+    def test_failed_command_does_not_fail_the_batch(self, test_domain, account_id):
+        results = test_domain.process_many(
+            [
+                Deposit(account_id=account_id, amount=10),
+                Deposit(account_id=account_id, amount=-1),
+                Deposit(account_id=account_id, amount=20),
+            ]
+        )
+
+        assert [result.status for result in results] == [
+            CommandStatus.PROCESSED,
+            CommandStatus.FAILED,
+            CommandStatus.PROCESSED,
+        ]
+        assert isinstance(results[1].error, ValidationError)
+        assert results[1].ok is False
+        assert _balance(test_domain, account_id) == 30.0
+        # Events of the rolled-back batch attempt were never dispatched
+        assert deposits_seen == [10.0, 20.0]
+
+    def test_commands_are_grouped_by_aggregate_type(
+        self, test_domain, account_id, batch_commits
+    ):
+        wallet_id = str(uuid4())
+        results = test_domain.process_many(
+            [
+                Deposit(account_id=account_id, amount=10),
+                CreditWallet(wallet_id=wallet_id, amount=1),
+                Deposit(account_id=account_id, amount=20),
+                CreditWallet(wallet_id=wallet_id, amount=2),
+            ]
+        )
+
+        assert [type(result.command) for result in results] == [
+            Deposit,
+            CreditWallet,
+            Deposit,
+            CreditWallet,
+        ]
+        assert all(result.ok for result in results)
+        assert len(batch_commits) == 2
+        assert test_domain.repository_for(Wallet).get(wallet_id).balance == 3.0
+
+    def test_event_sourced_aggregate_is_shared_within_batch(self, test_domain):
+        wallet_id = str(uuid4())
+        test_domain.process(CreditWallet(wallet_id=wallet_id, amount=1))
+
+        results = test_domain.process_many(
+            [CreditWallet(wallet_id=wallet_id, amount=2) for _ in range(3)]
+        )
+
+        assert all(result.ok for result in results)
+        wallet = test_domain.repository_for(Wallet).get(wallet_id)
+        assert wallet.balance == 7.0
+        assert wallet._version == 3
+
+    def test_empty_batch(self, test_domain):
+        assert test_domain.process_many([]) == []
+
+
+class TestAsynchronousBatches:
+    def test_commands_are_enqueued(self, test_domain, account_id):
+        test_domain.config["command_processing"] = "async"
+
+        results = test_domain.process_many(
+            [Deposit(account_id=account_id, amount=amount) for amount in (1, 2)]
+        )
+
+        assert [result.status for result in results] == [CommandStatus.ENQUEUED] * 2
+        assert results[0].result < results[1].result
+        assert _balance(test_domain, account_id) == 0.0
+
+    def test_chunk_is_stored_with_one_batch_write(self, test_domain, account_id):
+        store = test_domain.event_store.store
+        test_domain.config["command_processing"] = "async"
+
+        with (
+            patch.object(store, "_write_many", wraps=store._write_many) as write_many,
+            patch.object(store, "_write", wraps=store._write) as write,
+        ):
+            test_domain.process_many(
+                [Deposit(account_id=account_id, amount=amount) for amount in (1, 2, 3)]
+            )
+
+        assert write_many.call_count == 1
+        assert len(write_many.call_args.args[0]) == 3
+        write.assert_not_called()
+
+    def test_failed_batch_write_falls_back_to_single_appends(
+        self, test_domain, account_id
+    ):
+        store = test_domain.event_store.store
+        test_domain.config["command_processing"] = "async"
+
+        with patch.object(store, "_write_many", side_effect=ValueError("conflict")):
+            results = test_domain.process_many(
+                [Deposit(account_id=account_id, amount=amount) for amount in (1, 2)]
+            )
+
+        assert [result.status for result in results] == [CommandStatus.ENQUEUED] * 2
+
+
+class TestIdempotency:
+    @pytest.fixture(autouse=True)
+    def memory_idempotency(self, test_domain):
+        test_domain.config["idempotency"]["backend"] = "memory"
+        test_domain._idempotency_store = None
+        yield
+        test_domain.idempotency_store.flush()
+
+    def test_processed_keys_are_duplicates(self, test_domain, account_id):
+        commands = [Deposit(account_id=account_id, amount=10)]
+
+        first = test_domain.process_many(commands, idempotency_keys=["k1"])
+        second = test_domain.process_many(commands, idempotency_keys=["k1"])
+
+        assert first[0].status == CommandStatus.PROCESSED
+        assert second[0].status == CommandStatus.DUPLICATE
+        assert second[0].result == 10.0
+        assert _balance(test_domain, account_id) == 10.0
+
+    def test_key_repeated_within_batch(self, test_domain, account_id):
+        results = test_domain.process_many(
+            [Deposit(account_id=account_id, amount=10)] * 2,
+            idempotency_keys=["k1", "k1"],
+        )
+
+        assert [result.status for result in results] == [
+            CommandStatus.PROCESSED,
+            CommandStatus.DUPLICATE,
+        ]
+        assert _balance(test_domain, account_id) == 10.0
+
+    def test_failed_keys_can_be_retried(self, test_domain, account_id):
+        test_domain.process_many(
+            [Deposit(account_id=account_id, amount=-1)], idempotency_keys=["k1"]
+        )
+
+        assert test_domain.idempotency_store.check("k1")["status"] == "error"
+
+    def test_keys_must_match_commands(self, test_domain, account_id):
+        with pytest.raises(IncorrectUsageError, match="one entry per command"):
+            test_domain.process_many(
+                [Deposit(account_id=account_id, amount=1)], idempotency_keys=[]
+            )
+
+
+def test_batch_size_must_be_positive(test_domain):
+    with pytest.raises(IncorrectUsageError, match="at least 1"):
+        test_domain.process_many([], batch_size=0)
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -15,6 +16,8 @@ from tests.shared import (
     REDIS_URI,
 )
 
+BENCHMARKS_DIR = Path(__file__).parent / "benchmarks"
+
 
 def pytest_configure(config):
     # Insert the docs_src path into sys.path so that we can import elements from there
@@ -57,6 +60,12 @@ def pytest_addoption(parser):
     parser.addoption(
         "--sendgrid", action="store_true", default=False, help="Run Sendgrid tests"
     )
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        default=False,
+        help="Run micro-benchmarks in tests/benchmarks (needs pytest-benchmark)",
+    )
 
     # Options to run Database tests
     parser.addoption(
@@ -135,6 +144,16 @@ def pytest_collection_modifyitems(config, items):
     if config.getoption("--sendgrid"):
         run_sendgrid = True
 
+    run_benchmarks = config.getoption("--benchmarks")
+    if run_benchmarks:
+        try:
+            import pytest_benchmark  # noqa: F401
+        except ImportError:
+            raise pytest.UsageError(
+                "--benchmarks needs pytest-benchmark: "
+                "uv run --with pytest-benchmark pytest tests/benchmarks --benchmarks"
+            )
+
     skip_slow = pytest.mark.skip(reason="need --slow option to run")
     skip_pending = pytest.mark.skip(reason="need --pending option to run")
     skip_sqlite = pytest.mark.skip(reason="need --sqlite option to run")
@@ -144,6 +163,7 @@ def pytest_collection_modifyitems(config, items):
     skip_redis = pytest.mark.skip(reason="need --redis option to run")
     skip_message_db = pytest.mark.skip(reason="need --message_db option to run")
     skip_sendgrid = pytest.mark.skip(reason="need --sendgrid option to run")
+    skip_benchmarks = pytest.mark.skip(reason="need --benchmarks option to run")
 
     for item in items:
         if "slow" in item.keywords and run_slow is False:
@@ -164,6 +184,8 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_message_db)
         if "sendgrid" in item.keywords and run_sendgrid is False:
             item.add_marker(skip_sendgrid)
+        if BENCHMARKS_DIR in item.path.parents and not run_benchmarks:
+            item.add_marker(skip_benchmarks)
 
         # Automatically add the `db` fixture to tests marked with `database`
         #   or any database capability marker, to setup and destroy database artifacts
@@ -730,6 +730,30 @@ class TestValidatePriorityLanesConfig:
         with pytest.raises(ConfigurationError, match="non-empty string"):
             domain.init(traverse=False)
 
+    @pytest.mark.no_test_domain
+    def test_min_backfill_share_must_be_below_one(self):
+        domain = Domain(__name__, "TestLanes")
+        domain.config["server"] = {
+            "priority_lanes": {"enabled": True, "min_backfill_share": 1.5}
+        }
+
+        domain.register(Account)
+
+        with pytest.raises(ConfigurationError, match="min_backfill_share"):
+            domain.init(traverse=False)
+
+    @pytest.mark.no_test_domain
+    def test_weights_must_name_known_lanes(self):
+        domain = Domain(__name__, "TestLanes")
+        domain.config["server"] = {
+            "priority_lanes": {"enabled": True, "weights": {"bulk": 1}}
+        }
+
+        domain.register(Account)
+
+        with pytest.raises(ConfigurationError, match="weights"):
+            domain.init(traverse=False)
+
     @pytest.mark.no_test_domain
     def test_valid_priority_lanes_config_passes(self):
         domain = Domain(__name__, "TestLanes")
@@ -745,6 +769,43 @@ class TestValidatePriorityLanesConfig:
         domain.init(traverse=False)  # Should not raise
 
 
+class TestValidateAdmissionConfig:
+    @pytest.mark.no_test_domain
+    def test_max_in_flight_must_be_positive_integer(self):
+        domain = Domain(__name__, "TestAdmission")
+        domain.config["server"] = {"admission": {"max_in_flight": 0}}
+
+        domain.register(Account)
+
+        with pytest.raises(ConfigurationError, match="max_in_flight"):
+            domain.init(traverse=False)
+
+    @pytest.mark.no_test_domain
+    def test_quotas_must_be_positive_integers(self):
+        domain = Domain(__name__, "TestAdmission")
+        domain.config["server"] = {"admission": {"quotas": {"Projector": "ten"}}}
+
+        domain.register(Account)
+
+        with pytest.raises(ConfigurationError, match="quotas"):
+            domain.init(traverse=False)
+
+    @pytest.mark.no_test_domain
+    def test_valid_admission_config_passes(self):
+        domain = Domain(__name__, "TestAdmission")
+        domain.config["server"] = {
+            "admission": {
+                "max_in_flight": 500,
+                "pool_saturation": 0.9,
+                "quotas": {"Projector": 50},
+                "priorities": {"OrderHandler": 10},
+            }
+        }
+
+        domain.register(Account)
+        domain.init(traverse=False)  # Should not raise
+
+
 # ─── validate_all() ──────────────────────────────────────────────────
 
 
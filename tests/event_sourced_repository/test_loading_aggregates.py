@@ -6,6 +6,7 @@ from protean.core.aggregate import BaseAggregate, apply
 from protean.core.command import BaseCommand
 from protean.core.command_handler import BaseCommandHandler
 from protean.core.event import BaseEvent
+from protean.core.unit_of_work import UnitOfWork
 from protean.exceptions import ObjectNotFoundError
 from protean.fields import Identifier, String
 from protean.fields.basic import Boolean
@@ -183,3 +184,29 @@ def test_loading_aggregates_from_multiple_events(test_domain):
     assert user.is_registered is True
 
     assert user._version == 1
+
+
+@pytest.mark.eventstore
+def test_aggregate_added_in_unit_of_work_is_returned_by_later_gets(test_domain):
+    identifier = str(uuid4())
+    UserCommandHandler().register_user(
+        Register(
+            user_id=identifier,
+            email="john.doe@example.com",
+            name="John Doe",
+            password_hash="hash",
+        )
+    )
+    user_repo = current_domain.repository_for(User)
+
+    with UnitOfWork():
+        user = user_repo.get(identifier)
+        user.change_address("foobar")
+        user_repo.add(user)
+
+        # The change is only in the identity map, not the event store yet
+        reloaded = user_repo.get(identifier)
+        assert reloaded is user
+        assert reloaded.address == "foobar"
+
+    assert user_repo.get(identifier).address == "foobar"
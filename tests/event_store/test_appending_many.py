@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.mark.eventstore
+class TestWriteMany:
+    def test_positions_are_returned_per_stream_in_order(self, test_domain):
+        store = test_domain.event_store.store
+        store._write("order-1", "Placed", {"n": 0})
+
+        positions = store._write_many(
+            [
+                ("order-1", "Paid", {"n": 1}, None, None),
+                ("order-2", "Placed", {"n": 0}, None, None),
+                ("order-1", "Shipped", {"n": 2}, None, None),
+            ]
+        )
+
+        assert positions == [1, 0, 2]
+        assert [m["type"] for m in store._read("order-1")] == [
+            "Placed",
+            "Paid",
+            "Shipped",
+        ]
+
+    def test_expected_versions_are_checked_per_message(self, test_domain):
+        store = test_domain.event_store.store
+
+        positions = store._write_many(
+            [
+                ("order-1", "Placed", {}, None, -1),
+                ("order-1", "Paid", {}, None, 0),
+            ]
+        )
+
+        assert positions == [0, 1]
+
+    def test_failed_batch_writes_nothing(self, test_domain):
+        store = test_domain.event_store.store
+        assert store.atomic_batches
+
+        with pytest.raises(ValueError) as exc:
+            store._write_many(
+                [
+                    ("order-1", "Placed", {}, None, None),
+                    ("order-2", "Placed", {}, None, 5),
+                ]
+            )
+
+        assert exc.value.stream == "order-2"
+
+        assert store._read("order-1") == []
+        assert store._read("order-2") == []
@@ -0,0 +1,114 @@
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.fields import Identifier, String
+from protean.utils.mixins import handle
+
+
+class User(BaseAggregate):
+    email = String()
+
+
+class Registered(BaseEvent):
+    id = Identifier()
+    email = String()
+
+
+class Renamed(BaseEvent):
+    id = Identifier()
+    name = String()
+
+
+class Register(BaseCommand):
+    id = Identifier()
+    email = String()
+
+
+class UserEventHandler(BaseEventHandler):
+    @handle(Registered)
+    def on_registered(self, event: Registered) -> None:
+        pass
+
+
+class AuditHandler(BaseEventHandler):
+    @handle("$any")
+    def record(self, event: BaseEvent) -> None:
+        pass
+
+
+class UserCommandHandler(BaseCommandHandler):
+    @handle(Register)
+    def register(self, command: Register) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def register(test_domain):
+    test_domain.register(User, is_event_sourced=True)
+    test_domain.register(Registered, part_of=User)
+    test_domain.register(Renamed, part_of=User)
+    test_domain.register(Register, part_of=User)
+    test_domain.register(UserEventHandler, part_of=User)
+    test_domain.register(AuditHandler, stream_category="$all")
+    test_domain.register(UserCommandHandler, part_of=User)
+    test_domain.init(traverse=False)
+
+
+class TestEventDispatch:
+    def test_table_is_built_at_init(self, test_domain):
+        event_store = test_domain.event_store
+
+        assert event_store._event_dispatch[
+            (Registered.__type__, "test::user")
+        ] == frozenset({UserEventHandler, AuditHandler})
+        assert event_store._event_dispatch[
+            (Renamed.__type__, "test::user")
+        ] == frozenset({AuditHandler})
+
+    def test_lookup_returns_cached_frozenset(self, test_domain):
+        event = Registered(id="1", email="john@example.com")
+
+        handlers = test_domain.handlers_for(event)
+
+        assert isinstance(handlers, frozenset)
+        assert handlers is test_domain.handlers_for(event)
+
+    def test_registration_invalidates_table(self, test_domain):
+        test_domain.handlers_for(Registered(id="1", email="john@example.com"))
+
+        class Profile(BaseAggregate):
+            name = String()
+
+        test_domain.register(Profile)
+
+        assert test_domain.event_store._event_dispatch == {}
+        assert test_domain.event_store._command_dispatch == {}
+
+    def test_reinitialization_picks_up_new_handlers(self, test_domain):
+        event = Renamed(id="1", name="John")
+        assert test_domain.handlers_for(event) == {AuditHandler}
+
+        class RenameHandler(BaseEventHandler):
+            @handle(Renamed)
+            def on_renamed(self, event: Renamed) -> None:
+                pass
+
+        test_domain.register(RenameHandler, part_of=User)
+        test_domain.init(traverse=False)
+
+        assert test_domain.handlers_for(event) == {AuditHandler, RenameHandler}
+
+
+class TestCommandDispatch:
+    def test_table_is_built_at_init(self, test_domain):
+        assert test_domain.event_store._command_dispatch == {
+            (Register.__type__, "test::user"): UserCommandHandler
+        }
+
+    def test_lookup(self, test_domain):
+        command = Register(id="1", email="john@example.com")
+        assert test_domain.command_handler_for(command) is UserCommandHandler
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+import pytest
+
+from protean.port.event_store import DEFAULT_STREAM_HEAD_TTL, StreamHeadTracker
+
+
+class FakeStore:
+    """Counts head lookups against a mutable set of heads."""
+
+    def __init__(self, **heads):
+        self.heads = {"$all": max(heads.values(), default=-1), **heads}
+        self.fetches: list[str] = []
+
+    def fetch(self, stream: str) -> int:
+        self.fetches.append(stream)
+        return self.heads.get(stream, -1)
+
+    def write(self, category: str, position: int) -> None:
+        self.heads[category] = position
+        self.heads["$all"] = position
+
+
+@pytest.fixture
+def store():
+    return FakeStore(order=5, payment=3)
+
+
+@pytest.fixture
+def clock():
+    with patch("protean.port.event_store.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        yield monotonic
+
+
+def test_heads_are_cached_within_ttl(store, clock):
+    tracker = StreamHeadTracker(store.fetch, ttl=2.0)
+
+    assert tracker.head("order") == 5
+    assert tracker.head("order") == 5
+
+    assert store.fetches == ["$all", "order"]
+
+
+def test_expired_entry_is_kept_while_all_head_is_unchanged(store, clock):
+    tracker = StreamHeadTracker(store.fetch, ttl=2.0)
+    tracker.head("order")
+    tracker.head("payment")
+    store.fetches.clear()
+
+    clock.return_value = 103.0
+    assert tracker.head("order") == 5
+    assert tracker.head("payment") == 3
+
+    assert store.fetches == ["$all"]
+
+
+def test_expired_entry_is_refetched_once_all_head_moves(store, clock):
+    tracker = StreamHeadTracker(store.fetch, ttl=2.0)
+    tracker.head("order")
+    store.write("order", 9)
+    store.fetches.clear()
+
+    clock.return_value = 103.0
+    assert tracker.head("order") == 9
+
+    assert store.fetches == ["$all", "order"]
+
+
+def test_discard_forgets_category_and_all(store, clock):
+    tracker = StreamHeadTracker(store.fetch, ttl=2.0)
+    tracker.head("order")
+    tracker.head("payment")
+    store.write("order", 9)
+
+    tracker.discard("order-123")
+
+    assert tracker.head("order") == 9
+    assert tracker.head("payment") == 3
+    assert len(tracker) == 3
+
+
+def test_zero_ttl_disables_caching(store):
+    tracker = StreamHeadTracker(store.fetch, ttl=0)
+
+    tracker.head("order")
+    tracker.head("order")
+
+    assert store.fetches == ["order", "order"]
+    assert len(tracker) == 0
+
+
+def test_ttl_from_event_store_config(test_domain):
+    store = test_domain.event_store.store
+    assert store._stream_heads._ttl == DEFAULT_STREAM_HEAD_TTL
+
+    store_cls = type(store)
+    configured = store_cls(test_domain, {"stream_head_ttl": 0.5})
+    invalid = store_cls(test_domain, {"stream_head_ttl": "soon"})
+
+    assert configured._stream_heads._ttl == 0.5
+    assert invalid._stream_heads._ttl == DEFAULT_STREAM_HEAD_TTL
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean.exceptions import IncorrectUsageError, NotSupportedError
+from protean.port.event_store import BaseEventStore
+
+
+def _metadata(stream_name, message_id):
+    return {
+        "domain": {"kind": "EVENT"},
+        "headers": {"id": message_id, "type": "Ticked", "stream": stream_name},
+    }
+
+
+@pytest.fixture
+def stream(test_domain):
+    stream_name = f"test::ticker-{uuid4()}"
+    store = test_domain.event_store.store
+    for i in range(5):
+        store._write(
+            stream_name,
+            "Ticked",
+            {"tick": i},
+            _metadata(stream_name, str(uuid4())),
+            expected_version=i - 1,
+        )
+    return stream_name
+
+
+@pytest.mark.eventstore
+class TestTruncatingStreams:
+    def test_messages_before_position_are_removed(self, test_domain, stream):
+        store = test_domain.event_store.store
+
+        removed = store.truncate_stream(stream, 3)
+
+        assert removed == 3
+        assert [m["data"]["tick"] for m in store._read(stream)] == [3, 4]
+
+    def test_stream_version_is_kept(self, test_domain, stream):
+        store = test_domain.event_store.store
+        store.truncate_stream(stream, 4)
+
+        assert store._read_last_message(stream)["position"] == 4
+        position = store._write(
+            stream,
+            "Ticked",
+            {"tick": 5},
+            _metadata(stream, str(uuid4())),
+            expected_version=4,
+        )
+        assert position == 5
+
+    def test_reads_start_at_first_kept_message(self, test_domain, stream):
+        store = test_domain.event_store.store
+        store.truncate_stream(stream, 2)
+
+        messages = store._read(stream, position=0, no_of_messages=1)
+
+        assert messages[0]["position"] == 2
+
+    def test_other_streams_are_untouched(self, test_domain, stream):
+        store = test_domain.event_store.store
+        other = f"test::ticker-{uuid4()}"
+        store._write(other, "Ticked", {"tick": 0}, _metadata(other, str(uuid4())))
+
+        store.truncate_stream(stream, 5)
+
+        assert store._read(stream) == []
+        assert len(store._read(other)) == 1
+
+    def test_categories_cannot_be_truncated(self, test_domain):
+        with pytest.raises(IncorrectUsageError, match="is a category"):
+            test_domain.event_store.store.truncate_stream("test::ticker", 1)
+
+    def test_truncation_support_is_checked(self, test_domain):
+        test_domain.event_store.store._check_truncate_support()
+
+    def test_stores_without_truncation_fail_the_check(self, test_domain):
+        store = test_domain.event_store.store
+
+        with (
+            patch.object(
+                type(store), "_truncate_stream", BaseEventStore._truncate_stream
+            ),
+            pytest.raises(NotSupportedError, match="does not support truncating"),
+        ):
+            store._check_truncate_support()
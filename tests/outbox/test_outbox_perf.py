@@ -9,7 +9,7 @@ contract introduced by #942:
 - ``find_unprocessed`` issues a single ``SELECT`` and does not over-fetch (the
   3x over-fetch loop is gone — lock/retry-window predicates are evaluated in the
   database).
-- ``count_by_status`` issues one flat ``SELECT COUNT(*)`` per status with no
+- ``count_by_status`` issues a single ``GROUP BY status`` count with no
   subquery wrapper (no ``FROM (SELECT ... ) AS anon_1``).
 - ``cleanup_old_published`` / ``cleanup_old_abandoned`` issue a single
   ``DELETE`` with no preceding read pass.
@@ -149,24 +149,26 @@ class TestOutboxPollPathQueryCounts:
             assert "LOCKED_UNTIL" in where
             assert "NEXT_RETRY_AT" in where
 
-    def test_count_by_status_issues_flat_counts_without_wrapper(
+    def test_count_by_status_issues_single_grouped_count(
         self, test_domain, sample_metadata
     ):
         _seed(test_domain, sample_metadata)
         repo = test_domain.repository_for(Outbox)
 
         with assert_no_subquery_wrap():
-            with assert_query_count(len(OutboxStatus)) as statements:
+            with assert_query_count(1) as statements:
                 counts = repo.count_by_status()
 
         assert counts[OutboxStatus.PENDING.value] == 5
         assert counts[OutboxStatus.FAILED.value] == 3
         assert counts[OutboxStatus.PUBLISHED.value] == 4
         assert counts[OutboxStatus.ABANDONED.value] == 2
-        # One flat COUNT per status (the query count above pins the round trips).
+        assert counts[OutboxStatus.PROCESSING.value] == 0
+        # One grouped COUNT (the query count above pins the round trip).
         if statements:
-            for stmt in self._selects(statements):
-                assert "COUNT(" in stmt.upper()
+            select = self._selects(statements)[0].upper()
+            assert "COUNT(" in select
+            assert "GROUP BY" in select
 
     def test_cleanup_old_published_issues_single_delete(
         self, test_domain, sample_metadata
@@ -640,15 +640,15 @@ class TestOutboxRepositoryAggregateQueries:
     ):
         """Test that count_by_status returns correct counts for each status.
 
-        Counts are now produced via flat ``SELECT COUNT(*)`` queries (one per
-        status) instead of subquery-wrapped projections, so the returned values
-        must still match the seeded distribution.
+        Counts are produced by a single grouped count instead of one query
+        per status, so the returned values must still match the seeded
+        distribution.
         """
         create_sample_messages()
 
         counts = outbox_repo.count_by_status()
 
-        # Result is a plain dict whose values are integers from QuerySet.count().
+        # Result is a plain dict with integer counts for every status.
         assert isinstance(counts, dict)
         for value in counts.values():
             assert isinstance(value, int)
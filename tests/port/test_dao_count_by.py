@@ -0,0 +1,86 @@
+"""Contract tests for ``BaseDAO._count_by`` — the grouped count primitive
+that backs ``OutboxRepository.count_by_status``.
+
+These run against the in-memory adapter (core suite). The contract is:
+
+- every distinct value of the field maps to its row count;
+- values without rows are absent;
+- ``criteria`` restricts which rows are counted.
+
+Cross-adapter behaviour is covered in ``tests/repository/test_count_by.py``.
+"""
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.fields import Integer, String
+from protean.port.dao import BaseDAO
+from protean.utils.query import Q
+
+
+class Widget(BaseAggregate):
+    status = String(max_length=20, default="active")
+    rank = Integer(default=0)
+
+
+@pytest.fixture(autouse=True)
+def setup(test_domain):
+    test_domain.register(Widget)
+    test_domain.init(traverse=False)
+    return test_domain
+
+
+@pytest.fixture
+def dao(test_domain):
+    return test_domain.repository_for(Widget)._dao
+
+
+@pytest.fixture
+def seed(test_domain):
+    """Factory: insert ``count`` Widgets with the given status."""
+
+    def _seed(count, status="active"):
+        repo = test_domain.repository_for(Widget)
+        for i in range(count):
+            repo.add(Widget(status=status, rank=i))
+
+    return _seed
+
+
+class TestCountByContract:
+    def test_counts_rows_per_value(self, dao, seed):
+        seed(3, "active")
+        seed(2, "archived")
+
+        assert dao._count_by("status") == {"active": 3, "archived": 2}
+
+    def test_empty_table_returns_empty_dict(self, dao):
+        assert dao._count_by("status") == {}
+
+    def test_criteria_restricts_counted_rows(self, dao, seed):
+        seed(4, "active")
+        seed(2, "archived")
+
+        assert dao._count_by("status", Q(rank__lt=2)) == {"active": 2, "archived": 2}
+
+
+class TestPortableDefault:
+    """The portable ``BaseDAO._count_by`` (project one field, tally in Python)
+    must agree with the adapter override."""
+
+    def test_portable_default_counts_rows_per_value(self, dao, seed):
+        seed(3, "active")
+        seed(2, "archived")
+
+        assert BaseDAO._count_by(dao, "status") == dao._count_by("status")
+
+    def test_portable_default_is_not_capped_by_page_size(self, dao, seed):
+        # More rows than the default query limit of 100
+        seed(150)
+
+        assert BaseDAO._count_by(dao, "status") == {"active": 150}
+
+    def test_portable_default_honours_criteria(self, dao, seed):
+        seed(5)
+
+        assert BaseDAO._count_by(dao, "status", Q(rank__gte=3)) == {"active": 2}
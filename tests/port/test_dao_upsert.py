@@ -0,0 +1,106 @@
+"""Contract tests for ``BaseDAO._upsert`` — the insert-or-overwrite primitive
+that backs database idempotency records.
+
+These run against the in-memory adapter (core suite), plus the portable
+default that other adapters inherit. The SQLAlchemy single-statement path is
+covered in ``tests/adapters/repository/sqlalchemy_repo/sqlite/``.
+"""
+
+import threading
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.fields import Identifier, Integer, String
+from protean.port.dao import BaseDAO
+
+
+class Setting(BaseAggregate):
+    name = Identifier(identifier=True, max_length=50)
+    value = String(max_length=50)
+    revision = Integer(default=0)
+
+
+@pytest.fixture(autouse=True)
+def setup(test_domain):
+    test_domain.register(Setting)
+    test_domain.init(traverse=False)
+    return test_domain
+
+
+@pytest.fixture
+def dao(test_domain):
+    return test_domain.repository_for(Setting)._dao
+
+
+class TestUpsertContract:
+    def test_inserts_missing_row(self, dao):
+        dao._upsert("theme", {"value": "dark", "revision": 1})
+
+        setting = dao.get("theme")
+        assert setting.value == "dark"
+        assert setting.revision == 1
+
+    def test_overwrites_existing_row(self, dao):
+        dao._upsert("theme", {"value": "dark", "revision": 1})
+        dao._upsert("theme", {"value": "light", "revision": 2})
+
+        assert dao.query.count() == 1
+        assert dao.get("theme").value == "light"
+        assert dao.get("theme").revision == 2
+
+    def test_concurrent_writers_of_a_new_key_do_not_collide(self, dao):
+        errors = []
+
+        def write(revision):
+            try:
+                dao._upsert("theme", {"value": "dark", "revision": revision})
+            except Exception as exc:  # pragma: no cover - failure path
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert dao.query.count() == 1
+
+    def test_upsert_many_inserts_and_overwrites(self, dao):
+        dao._upsert("theme", {"value": "dark", "revision": 1})
+        dao._upsert_many(
+            {
+                "theme": {"value": "light", "revision": 2},
+                "font": {"value": "mono", "revision": 1},
+            }
+        )
+
+        assert dao.query.count() == 2
+        assert dao.get("theme").value == "light"
+        assert dao.get("theme").revision == 2
+        assert dao.get("font").value == "mono"
+
+    def test_upsert_many_with_no_rows_is_a_no_op(self, dao):
+        dao._upsert_many({})
+
+        assert dao.query.count() == 0
+
+
+class TestPortableDefault:
+    def test_updates_then_inserts(self, dao):
+        BaseDAO._upsert(dao, "theme", {"value": "dark"})
+        BaseDAO._upsert(dao, "theme", {"value": "light"})
+
+        assert dao.query.count() == 1
+        assert dao.get("theme").value == "light"
+
+    def test_upsert_many_upserts_row_by_row(self, dao):
+        dao._upsert("theme", {"value": "dark"})
+        BaseDAO._upsert_many(
+            dao, {"theme": {"value": "light"}, "font": {"value": "mono"}}
+        )
+
+        assert dao.query.count() == 2
+        assert dao.get("theme").value == "light"
+        assert dao.get("font").value == "mono"
@@ -0,0 +1,106 @@
+"""Tests for LaneScheduler, the weighted fair scheduler behind priority lanes."""
+
+from unittest.mock import patch
+
+import pytest
+
+from protean.server.subscription.lane_scheduler import LaneScheduler
+
+PRIMARY = "orders"
+BACKFILL = "orders:backfill"
+
+
+def _simulate(scheduler: LaneScheduler, rounds: int, batch: int = 10) -> dict:
+    """Serve ``rounds`` batches with both lanes permanently busy."""
+    served = {PRIMARY: 0, BACKFILL: 0}
+    for _ in range(rounds):
+        lane = scheduler.order()[0]
+        scheduler.charge(lane, batch)
+        served[lane] += batch
+    return served
+
+
+class TestConstruction:
+    def test_default_is_strict(self):
+        scheduler = LaneScheduler(PRIMARY, BACKFILL)
+        assert scheduler.strict is True
+        assert scheduler.order() == [PRIMARY, BACKFILL]
+
+    def test_share_out_of_range_is_rejected(self):
+        with pytest.raises(ValueError):
+            LaneScheduler(PRIMARY, BACKFILL, backfill_share=1.0)
+
+    def test_from_config_weights(self):
+        scheduler = LaneScheduler.from_config(
+            PRIMARY, BACKFILL, {"weights": {"primary": 3, "backfill": 1}}
+        )
+        assert scheduler.backfill_share == pytest.approx(0.25)
+
+    def test_from_config_min_share_raises_weights(self):
+        scheduler = LaneScheduler.from_config(
+            PRIMARY,
+            BACKFILL,
+            {"weights": {"primary": 9, "backfill": 1}, "min_backfill_share": 0.3},
+        )
+        assert scheduler.backfill_share == pytest.approx(0.3)
+
+    def test_from_config_without_weights_is_strict(self):
+        scheduler = LaneScheduler.from_config(PRIMARY, BACKFILL, {"enabled": True})
+        assert scheduler.strict is True
+
+
+class TestScheduling:
+    def test_strict_mode_never_puts_backfill_first(self):
+        scheduler = LaneScheduler(PRIMARY, BACKFILL)
+        served = _simulate(scheduler, rounds=100)
+        assert served[BACKFILL] == 0
+
+    def test_weighted_mode_honours_share_under_load(self):
+        scheduler = LaneScheduler(PRIMARY, BACKFILL, backfill_share=0.2)
+        served = _simulate(scheduler, rounds=1000)
+
+        share = served[BACKFILL] / (served[PRIMARY] + served[BACKFILL])
+        assert share == pytest.approx(0.2, abs=0.01)
+
+    def test_ties_go_to_primary(self):
+        scheduler = LaneScheduler(PRIMARY, BACKFILL, backfill_share=0.5)
+        assert scheduler.order()[0] == PRIMARY
+
+    def test_idle_lane_does_not_bank_credit(self):
+        scheduler = LaneScheduler(PRIMARY, BACKFILL, backfill_share=0.5)
+
+        # Primary runs alone for a while; backfill keeps reporting empty
+        for _ in range(50):
+            scheduler.charge(PRIMARY, 10)
+            scheduler.idle(BACKFILL)
+
+        # Once backfill has work it alternates instead of bursting 50 batches
+        served = _simulate(scheduler, rounds=10)
+        assert served[PRIMARY] == served[BACKFILL] == 50
+
+
+class TestSnapshot:
+    def test_snapshot_reports_served_and_lag(self):
+        scheduler = LaneScheduler(PRIMARY, BACKFILL, backfill_share=0.1)
+        scheduler.charge(PRIMARY, 7)
+
+        stats = scheduler.snapshot({PRIMARY: 3, BACKFILL: 1200})
+
+        assert stats[PRIMARY]["served"] == 7
+        assert stats[PRIMARY]["lag"] == 3
+        assert stats[BACKFILL]["lag"] == 1200
+        assert stats[BACKFILL]["weight"] == pytest.approx(0.1)
+
+    def test_rate_is_measured_over_window(self):
+        clock = [100.0]
+        with patch(
+            "protean.server.subscription.lane_scheduler.time.monotonic",
+            lambda: clock[0],
+        ):
+            scheduler = LaneScheduler(PRIMARY, BACKFILL, rate_window=10.0)
+            scheduler.charge(PRIMARY, 50)
+            clock[0] += 10.0
+            stats = scheduler.snapshot()
+
+        assert stats[PRIMARY]["rate"] == pytest.approx(5.0)
+        assert stats[BACKFILL]["rate"] == 0.0
@@ -2,6 +2,7 @@
 
 Verifies that when priority lanes are enabled, StreamSubscription:
 - Reads from a primary stream (non-blocking) before a backfill stream (blocking).
+- Gives backfill its configured share under weighted scheduling.
 - ACKs, NACKs, and DLQ messages on the correct stream.
 - Falls back to standard single-stream behavior when lanes are disabled.
 """
@@ -612,6 +613,89 @@ class TestErrorHandling:
         assert streams_read[2] == "orders"  # Re-check primary
 
 
+# ---------------------------------------------------------------------------
+# Weighted Scheduling Tests
+# ---------------------------------------------------------------------------
+
+
+class TestWeightedScheduling:
+    """Tests for weighted fair scheduling between the two lanes."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_keeps_its_share_under_sustained_primary_load(self):
+        """With both lanes always busy, backfill gets its configured share."""
+        engine = _make_engine(
+            priority_lanes_config={"enabled": True, "min_backfill_share": 0.25}
+        )
+        sub = _make_subscription(engine, stream_category="orders")
+        sub.broker = engine.domain.brokers["default"]
+        sub.broker.read_blocking = MagicMock(
+            side_effect=lambda stream, **kwargs: [("id", {"data": stream})]
+        )
+
+        served_streams = []
+
+        async def _fake_process_batch(messages, stream=None):
+            served_streams.append(stream)
+            if len(served_streams) == 40:
+                sub.keep_going = False
+
+        sub.process_batch = _fake_process_batch
+
+        await sub.poll()
+
+        assert served_streams.count("orders:backfill") == 10
+
+    @pytest.mark.asyncio
+    async def test_backfill_owed_service_is_read_without_blocking(self):
+        """When backfill is scheduled first, its read must not block primary."""
+        engine = _make_engine(
+            priority_lanes_config={
+                "enabled": True,
+                "weights": {"primary": 1, "backfill": 1},
+                "backfill_batch_size": 50,
+            }
+        )
+        sub = _make_subscription(engine, stream_category="orders")
+        sub.broker = engine.domain.brokers["default"]
+        sub._lane_scheduler.charge("orders", 10)  # Primary is now ahead
+
+        reads = []
+
+        def _read_blocking(stream, **kwargs):
+            reads.append((stream, kwargs["timeout_ms"], kwargs["count"]))
+            return [("msg-1", {"data": "a"})] if stream == "orders" else []
+
+        sub.broker.read_blocking = MagicMock(side_effect=_read_blocking)
+
+        async def _fake_process_batch(messages, stream=None):
+            sub.keep_going = False
+
+        sub.process_batch = _fake_process_batch
+
+        await sub.poll()
+
+        assert reads == [("orders:backfill", 0, 50), ("orders", 0, 10)]
+
+    def test_lane_stats_reports_lag_from_consumer_group(self):
+        """lane_stats() reads each lane's lag from XINFO GROUPS."""
+        engine = _make_engine(priority_lanes_config={"enabled": True})
+        sub = _make_subscription(engine, stream_category="orders")
+        sub.broker = MagicMock()
+        sub.broker._get_field_value = lambda info, field, convert_to_int=False: (
+            info.get(field)
+        )
+        lags = {"orders": 2, "orders:backfill": 5000}
+        sub.broker.redis_instance.xinfo_groups = lambda stream: [
+            {"name": sub.consumer_group, "lag": lags[stream]}
+        ]
+
+        stats = sub.lane_stats()
+
+        assert stats["orders"]["lag"] == 2
+        assert stats["orders:backfill"]["lag"] == 5000
+
+
 # ---------------------------------------------------------------------------
 # DLQ Metadata Tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,259 @@
+"""Tests for process manager stream compaction."""
+
+import json
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean.core.process_manager import _state_cache
+from protean.exceptions import ConfigurationError, NotSupportedError
+from protean.utils.process_manager_compactor import COMPACTION_HANDLER
+
+from .elements import (
+    Order,
+    OrderFulfillmentPM,
+    OrderPlaced,
+    Payment,
+    PaymentConfirmed,
+    PaymentFailed,
+    ShipmentDelivered,
+    Shipping,
+)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Order)
+    test_domain.register(OrderPlaced, part_of=Order)
+    test_domain.register(Payment)
+    test_domain.register(PaymentConfirmed, part_of=Payment)
+    test_domain.register(PaymentFailed, part_of=Payment)
+    test_domain.register(Shipping)
+    test_domain.register(ShipmentDelivered, part_of=Shipping)
+    test_domain.register(
+        OrderFulfillmentPM,
+        stream_categories=["test::order", "test::payment", "test::shipping"],
+    )
+    test_domain.init(traverse=False)
+
+
+def _stream(order_id: str) -> str:
+    return f"{OrderFulfillmentPM.meta_.stream_category}-{order_id}"
+
+
+def _run(order_id: str, payments: int = 3, deliver: bool = True) -> None:
+    OrderFulfillmentPM._handle(
+        OrderPlaced(order_id=order_id, customer_id="CUST-1", total=100.0)
+    )
+    for i in range(payments):
+        OrderFulfillmentPM._handle(
+            PaymentConfirmed(payment_id=f"PAY-{i}", order_id=order_id, amount=100.0)
+        )
+    if deliver:
+        OrderFulfillmentPM._handle(ShipmentDelivered(order_id=order_id))
+
+
+def _compact(test_domain, **kwargs):
+    kwargs.setdefault("idle_days", None)
+    kwargs.setdefault("min_transitions", 2)
+    return test_domain.compact_process_manager(OrderFulfillmentPM, **kwargs)
+
+
+class TestCompaction:
+    def test_completed_stream_is_compacted(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+
+        result = _compact(test_domain)
+
+        assert result.success
+        assert result.streams_compacted == 1
+        assert result.transitions_removed == 5
+        messages = test_domain.event_store.store._read(_stream(order_id))
+        assert len(messages) == 1
+        assert messages[0]["position"] == 5
+        assert messages[0]["data"]["handler_name"] == COMPACTION_HANDLER
+        assert messages[0]["data"]["is_complete"] is True
+
+    def test_compacted_instance_loads_with_same_state(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        _compact(test_domain)
+        _state_cache(test_domain.event_store.store).clear()
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert pm.status == "completed"
+        assert pm.payment_id == "PAY-2"
+        assert pm._is_complete is True
+        assert pm._version == 5
+
+    def test_idle_stream_is_compacted_and_continues(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id, deliver=False)
+
+        result = _compact(test_domain, idle_days=0)
+        OrderFulfillmentPM._handle(ShipmentDelivered(order_id=order_id))
+
+        assert result.streams_compacted == 1
+        messages = test_domain.event_store.store._read(_stream(order_id))
+        assert [m["position"] for m in messages] == [4, 5]
+        assert messages[-1]["data"]["state"]["status"] == "completed"
+
+    def test_active_stream_is_left_alone(self, test_domain):
+        _run(str(uuid4()), deliver=False)
+
+        result = _compact(test_domain)
+
+        assert result.streams_examined == 1
+        assert result.streams_compacted == 0
+
+    def test_short_stream_is_left_alone(self, test_domain):
+        _run(str(uuid4()), payments=0)
+
+        result = _compact(test_domain, min_transitions=10)
+
+        assert result.streams_compacted == 0
+
+    def test_compacted_stream_is_not_compacted_again(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        _compact(test_domain)
+
+        result = _compact(test_domain)
+
+        assert result.streams_compacted == 0
+        assert len(test_domain.event_store.store._read(_stream(order_id))) == 1
+
+    def test_dry_run_writes_nothing(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+
+        result = _compact(test_domain, dry_run=True)
+
+        assert result.streams_compacted == 1
+        assert result.transitions_removed == 5
+        assert len(test_domain.event_store.store._read(_stream(order_id))) == 5
+
+    def test_removed_transitions_are_archived(self, test_domain, tmp_path):
+        order_id = str(uuid4())
+        _run(order_id)
+        archive = tmp_path / "transitions.jsonl"
+
+        result = _compact(test_domain, archive=archive)
+
+        lines = [json.loads(line) for line in archive.read_text().splitlines()]
+        assert result.transitions_archived == 5
+        assert [line["position"] for line in lines] == [0, 1, 2, 3, 4]
+        assert lines[0]["stream_name"] == _stream(order_id)
+
+    def test_replay_validation_reads_compacted_stream(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        _compact(test_domain)
+        test_domain.config["process_manager"]["replay_transitions"] = True
+        _state_cache(test_domain.event_store.store).clear()
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert pm.status == "completed"
+        assert pm._version == 5
+
+    def test_retention_defaults_come_from_config(self, test_domain):
+        _run(str(uuid4()), deliver=False)
+        test_domain.config["process_manager"]["compaction"] = {
+            "idle_days": 0,
+            "min_transitions": 2,
+        }
+
+        result = test_domain.compact_process_manager(OrderFulfillmentPM)
+
+        assert result.streams_compacted == 1
+
+    def test_all_process_managers(self, test_domain):
+        _run(str(uuid4()))
+
+        results = test_domain.compact_all_process_managers(min_transitions=2)
+
+        assert results["OrderFulfillmentPM"].streams_compacted == 1
+
+
+class TestCompactionErrors:
+    def test_store_without_truncation_support(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        store = test_domain.event_store.store
+
+        with patch.object(
+            store, "_truncate_stream", side_effect=NotSupportedError("no truncation")
+        ):
+            result = _compact(test_domain)
+
+        assert result.errors == ["no truncation"]
+
+    def test_store_that_cannot_truncate_is_left_untouched(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        store = test_domain.event_store.store
+
+        with patch.object(
+            store,
+            "_check_truncate_support",
+            side_effect=ConfigurationError("needs DELETE"),
+        ):
+            result = _compact(test_domain)
+
+        assert result.errors == ["needs DELETE"]
+        assert result.streams_compacted == 0
+        assert len(store._read(_stream(order_id))) == 5
+
+    def test_interrupted_truncation_is_resumed(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        store = test_domain.event_store.store
+
+        with patch.object(store, "truncate_stream", side_effect=RuntimeError("down")):
+            result = _compact(test_domain)
+        assert not result.success
+        assert store._read_last_message(_stream(order_id))["position"] == 5
+
+        assert _compact(test_domain, dry_run=True).transitions_removed == 5
+        result = _compact(test_domain)
+
+        assert result.streams_compacted == 1
+        assert result.transitions_removed == 5
+        messages = store._read(_stream(order_id))
+        assert [m["position"] for m in messages] == [5]
+        assert messages[0]["data"]["handler_name"] == COMPACTION_HANDLER
+
+    def test_failed_archive_is_resumed(self, test_domain, tmp_path):
+        order_id = str(uuid4())
+        _run(order_id)
+        archive = tmp_path / "transitions.jsonl"
+
+        with patch("protean.utils.process_manager_compactor.json") as archive_json:
+            archive_json.dumps.side_effect = OSError("disk full")
+            result = _compact(test_domain, archive=archive)
+        assert not result.success
+        assert len(test_domain.event_store.store._read(_stream(order_id))) == 6
+
+        result = _compact(test_domain, archive=archive)
+
+        lines = [json.loads(line) for line in archive.read_text().splitlines()]
+        assert result.transitions_archived == 5
+        assert [line["position"] for line in lines] == [0, 1, 2, 3, 4]
+        assert len(test_domain.event_store.store._read(_stream(order_id))) == 1
+
+    def test_concurrent_transition_skips_stream(self, test_domain):
+        order_id = str(uuid4())
+        _run(order_id)
+        store = test_domain.event_store.store
+        stale = store._read(_stream(order_id))[-2]
+
+        with patch.object(store, "_read_last_message", return_value=stale):
+            result = _compact(test_domain, idle_days=0)
+
+        assert not result.success
+        assert "Wrong expected version" in result.errors[0]
+        assert len(store._read(_stream(order_id))) == 5
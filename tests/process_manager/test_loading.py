@@ -0,0 +1,220 @@
+"""Tests for last-transition loading and the in-process state cache."""
+
+import logging
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean.core.process_manager import _state_cache
+
+from .elements import (
+    Order,
+    OrderFulfillmentPM,
+    OrderPlaced,
+    Payment,
+    PaymentConfirmed,
+    PaymentFailed,
+    ShipmentDelivered,
+    Shipping,
+)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Order)
+    test_domain.register(OrderPlaced, part_of=Order)
+    test_domain.register(Payment)
+    test_domain.register(PaymentConfirmed, part_of=Payment)
+    test_domain.register(PaymentFailed, part_of=Payment)
+    test_domain.register(Shipping)
+    test_domain.register(ShipmentDelivered, part_of=Shipping)
+    test_domain.register(
+        OrderFulfillmentPM,
+        stream_categories=["test::order", "test::payment", "test::shipping"],
+    )
+    test_domain.init(traverse=False)
+
+
+def _stream(order_id: str) -> str:
+    return f"{OrderFulfillmentPM.meta_.stream_category}-{order_id}"
+
+
+def _start(order_id: str) -> None:
+    OrderFulfillmentPM._handle(
+        OrderPlaced(order_id=order_id, customer_id="CUST-1", total=100.0)
+    )
+
+
+def _pay(order_id: str, payment_id: str = "PAY-1") -> None:
+    OrderFulfillmentPM._handle(
+        PaymentConfirmed(payment_id=payment_id, order_id=order_id, amount=100.0)
+    )
+
+
+class TestLastTransitionLoading:
+    def test_state_is_loaded_from_last_transition(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        _pay(order_id)
+        store = test_domain.event_store.store
+        _state_cache(store).clear()
+
+        with patch.object(store, "read", wraps=store.read) as read:
+            pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        read.assert_not_called()
+        assert pm.status == "awaiting_shipment"
+        assert pm.payment_id == "PAY-1"
+        assert pm._version == 1
+
+    def test_completion_is_restored(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        OrderFulfillmentPM._handle(ShipmentDelivered(order_id=order_id))
+        _state_cache(test_domain.event_store.store).clear()
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert pm._is_complete is True
+
+
+class TestStateCache:
+    def test_transitions_refresh_the_cache(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        _pay(order_id)
+
+        version, (state, is_complete) = _state_cache(test_domain.event_store.store).get(
+            _stream(order_id)
+        )
+
+        assert version == 1
+        assert state["status"] == "awaiting_shipment"
+        assert is_complete is False
+
+    def test_cached_pm_is_loaded_after_a_version_check(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        store = test_domain.event_store.store
+
+        with (
+            patch.object(
+                store, "_stream_version", wraps=store._stream_version
+            ) as stream_version,
+            patch.object(OrderFulfillmentPM, "_from_last_transition") as from_last,
+        ):
+            pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        stream_version.assert_called_once_with(_stream(order_id))
+        from_last.assert_not_called()
+        assert pm.status == "awaiting_payment"
+        assert pm._version == 0
+
+    def test_cached_state_is_not_shared_with_instances(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+        pm.status = "changed"
+
+        again = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+        assert again.status == "awaiting_payment"
+
+    def test_stale_entry_is_reloaded_before_handlers_run(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        store = test_domain.event_store.store
+        stale = _state_cache(store).get(_stream(order_id))
+        _pay(order_id, "PAY-1")
+        # Another worker's write left this process with an older version
+        _state_cache(store).put(_stream(order_id), *stale)
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert pm.status == "awaiting_shipment"
+        assert pm.payment_id == "PAY-1"
+        assert pm._version == 1
+
+    def test_stale_entry_does_not_fail_the_transition(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        store = test_domain.event_store.store
+        stale = _state_cache(store).get(_stream(order_id))
+        _pay(order_id, "PAY-1")
+        _state_cache(store).put(_stream(order_id), *stale)
+
+        _pay(order_id, "PAY-2")
+
+        pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+        assert pm.payment_id == "PAY-2"
+        assert pm._version == 2
+
+    def test_entry_is_dropped_when_transition_conflicts(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        store = test_domain.event_store.store
+
+        with (
+            patch.object(store, "append", side_effect=ValueError("conflict")),
+            pytest.raises(ValueError, match="conflict"),
+        ):
+            _pay(order_id)
+
+        assert _state_cache(store).get(_stream(order_id)) is None
+
+    def test_cache_is_bounded(self, test_domain):
+        test_domain.config["process_manager"]["cache_size"] = 2
+        store = type(test_domain.event_store.store)(test_domain, {})
+        with patch.object(test_domain.event_store, "_event_store", store):
+            order_ids = [str(uuid4()) for _ in range(3)]
+            for order_id in order_ids:
+                _start(order_id)
+
+            assert len(_state_cache(store)) == 2
+            assert _state_cache(store).get(_stream(order_ids[0])) is None
+
+    def test_reset_store_is_not_served_from_the_cache(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        store = test_domain.event_store.store
+
+        store._data_reset()
+
+        assert OrderFulfillmentPM._load_or_create(order_id, is_start=False) is None
+
+
+class TestReplayValidation:
+    @pytest.fixture(autouse=True)
+    def replay_transitions(self, test_domain):
+        test_domain.config["process_manager"]["replay_transitions"] = True
+
+    def test_replay_rebuilds_from_every_transition(self, test_domain):
+        order_id = str(uuid4())
+        _start(order_id)
+        _pay(order_id)
+        store = test_domain.event_store.store
+        _state_cache(store).clear()
+
+        with patch.object(store, "read", wraps=store.read) as read:
+            pm = OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        read.assert_called_once()
+        assert pm.status == "awaiting_shipment"
+        assert pm._version == 1
+
+    def test_divergent_history_is_logged(self, test_domain, caplog):
+        order_id = str(uuid4())
+        _start(order_id)
+        _pay(order_id)
+        store = test_domain.event_store.store
+        _state_cache(store).clear()
+        first = store.read(_stream(order_id))[:1]
+
+        with (
+            patch.object(OrderFulfillmentPM, "_read_transitions", return_value=first),
+            caplog.at_level(logging.WARNING, logger="protean.core.process_manager"),
+        ):
+            OrderFulfillmentPM._load_or_create(order_id, is_start=False)
+
+        assert "does not reproduce the state" in caplog.text
@@ -0,0 +1,297 @@
+"""Tests for paged, checkpointed and partitioned projection rebuilds."""
+
+from unittest.mock import patch
+
+import pytest
+
+from protean import current_domain
+from protean.utils.projection_rebuilder import (
+    _checkpoint_stream,
+    _default_partition_key,
+    _Partition,
+    _read_checkpoint,
+    _replay_partitions,
+    _supports_concurrency,
+)
+
+from .elements import (
+    Balances,
+    Registered,
+    Transacted,
+    Transaction,
+    TransactionProjector,
+    User,
+)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(User)
+    test_domain.register(Registered, part_of=User)
+    test_domain.register(Transaction)
+    test_domain.register(Transacted, part_of=Transaction)
+    test_domain.register(Balances)
+    test_domain.register(
+        TransactionProjector,
+        projector_for=Balances,
+        aggregates=[Transaction, User],
+    )
+    test_domain.init(traverse=False)
+
+
+def _seed(users: int = 1, transactions: int = 5) -> list[str]:
+    user_ids = []
+    for i in range(users):
+        user = User.register(email=f"user{i}@example.com", name=f"User {i}")
+        current_domain.repository_for(User).add(user)
+        user_ids.append(user.id)
+        for _ in range(transactions):
+            txn = Transaction.transact(user_id=user.id, amount=10.0)
+            current_domain.repository_for(Transaction).add(txn)
+    return user_ids
+
+
+def _balance(user_id: str) -> float:
+    return current_domain.repository_for(Balances).get(user_id).balance
+
+
+def _interrupt_on_call(call_number: int):
+    """Wrap ``_handle`` so that its ``call_number``-th call is interrupted."""
+    original = TransactionProjector._handle
+    calls = []
+
+    def handle(message):
+        calls.append(message)
+        if len(calls) == call_number:
+            raise KeyboardInterrupt
+        return original(message)
+
+    return handle
+
+
+class TestPagedReplay:
+    def test_events_are_replayed_across_pages(self, test_domain):
+        (user_id,) = _seed(transactions=7)
+
+        result = test_domain.rebuild_projection(Balances, batch_size=2)
+
+        assert result.success
+        assert result.events_dispatched == 8
+        assert _balance(user_id) == 70.0
+
+    def test_checkpoint_records_last_global_position(self, test_domain):
+        _seed(transactions=3)
+        head = test_domain.event_store.store.stream_head_position("transaction")
+
+        test_domain.rebuild_projection(Balances, batch_size=2)
+
+        stream = _checkpoint_stream(Balances, TransactionProjector, 0, 1)
+        assert _read_checkpoint(test_domain, stream) == head
+
+    def test_failing_event_only_skips_itself(self, test_domain):
+        (user_id,) = _seed(transactions=3)
+        failing = test_domain.event_store.store.read("transaction")[0]
+        original = TransactionProjector._handle
+
+        def handle(message):
+            if message.metadata.headers.id == failing.metadata.headers.id:
+                raise RuntimeError("Handler failure")
+            return original(message)
+
+        with patch.object(TransactionProjector, "_handle", side_effect=handle):
+            result = test_domain.rebuild_projection(Balances, batch_size=4)
+
+        assert result.events_dispatched == 3
+        assert result.events_skipped == 1
+        assert _balance(user_id) == 20.0
+
+
+class TestResume:
+    def test_resume_continues_after_last_committed_page(self, test_domain):
+        (user_id,) = _seed(transactions=5)
+
+        with (
+            patch.object(
+                TransactionProjector, "_handle", side_effect=_interrupt_on_call(4)
+            ),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            test_domain.rebuild_projection(Balances, batch_size=2)
+
+        # Only the first page (Registered + one Transacted) was committed
+        assert _balance(user_id) == 10.0
+
+        result = test_domain.rebuild_projection(Balances, batch_size=2, resume=True)
+
+        assert result.success
+        assert result.resumed is True
+        assert result.events_dispatched == 4
+        assert _balance(user_id) == 50.0
+
+    def test_resume_without_checkpoints_rebuilds_from_scratch(self, test_domain):
+        (user_id,) = _seed(transactions=2)
+
+        result = test_domain.rebuild_projection(Balances, resume=True)
+
+        assert result.resumed is False
+        assert result.events_dispatched == 3
+        assert _balance(user_id) == 20.0
+
+    def test_rebuild_without_resume_starts_over(self, test_domain):
+        (user_id,) = _seed(transactions=2)
+        test_domain.rebuild_projection(Balances)
+
+        result = test_domain.rebuild_projection(Balances)
+
+        assert result.resumed is False
+        assert result.events_dispatched == 3
+        assert _balance(user_id) == 20.0
+
+    def test_resume_with_another_worker_count_rebuilds_from_scratch(self, test_domain):
+        _seed(transactions=2)
+        test_domain.rebuild_projection(Balances)
+
+        result = test_domain.rebuild_projection(Balances, resume=True, workers=2)
+
+        assert result.resumed is False
+        assert result.events_dispatched == 3
+
+
+class TestPartitionedReplay:
+    def test_partitions_cover_every_event_once(self, test_domain):
+        user_ids = _seed(users=4, transactions=3)
+
+        result = test_domain.rebuild_projection(Balances, batch_size=2, workers=3)
+
+        assert result.success
+        assert result.events_dispatched == 16
+        assert all(_balance(user_id) == 30.0 for user_id in user_ids)
+
+    def test_each_partition_has_its_own_checkpoint(self, test_domain):
+        _seed(users=4, transactions=1)
+
+        test_domain.rebuild_projection(Balances, workers=2)
+
+        for index in range(2):
+            stream = _checkpoint_stream(Balances, TransactionProjector, index, 2)
+            assert _read_checkpoint(test_domain, stream) is not None
+
+    def test_default_key_follows_projection_identifier(self, test_domain):
+        (user_id,) = _seed(transactions=1)
+        key = _default_partition_key(Balances)
+        messages = test_domain.event_store.store.read(
+            "user"
+        ) + test_domain.event_store.store.read("transaction")
+
+        assert {key(message) for message in messages} == {user_id}
+
+    def test_partition_owns_messages_by_key_hash(self, test_domain):
+        _seed(users=5, transactions=1)
+        messages = test_domain.event_store.store.read("transaction")
+        key = _default_partition_key(Balances)
+        partitions = [_Partition(index=i, count=3, key=key) for i in range(3)]
+
+        for message in messages:
+            assert sum(p.owns(message) for p in partitions) == 1
+
+    def test_memory_stores_replay_partitions_sequentially(self, test_domain):
+        assert _supports_concurrency(test_domain, Balances) is False
+
+    def test_custom_partition_key(self, test_domain):
+        user_ids = _seed(users=2, transactions=2)
+
+        result = test_domain.rebuild_projection(
+            Balances,
+            workers=2,
+            partition_key=lambda message: message.data.get("user_id"),
+        )
+
+        assert result.events_dispatched == 6
+        assert all(_balance(user_id) == 20.0 for user_id in user_ids)
+
+
+class TestPartitionRouting:
+    def _replay(self, test_domain, handle, concurrent=True, workers=3):
+        categories = list(TransactionProjector.meta_.stream_categories)
+        with patch.object(TransactionProjector, "_handle", side_effect=handle):
+            return _replay_partitions(
+                test_domain,
+                TransactionProjector,
+                categories,
+                2,
+                [-1] * workers,
+                [None] * workers,
+                _default_partition_key(Balances),
+                transactional=False,
+                concurrent=concurrent,
+            )
+
+    def test_categories_are_read_once_for_all_partitions(self, test_domain):
+        _seed(users=4, transactions=3)
+        store = test_domain.event_store.store
+        handled = []
+
+        with patch.object(store, "read", wraps=store.read) as read:
+            outcomes = self._replay(test_domain, handled.append, concurrent=False)
+
+        # 4 user and 12 transaction events read 2 at a time, once in total
+        # rather than once per partition
+        assert read.call_count == 3 + 7
+        assert sum(dispatched for dispatched, _ in outcomes) == 16
+        assert len(handled) == 16
+
+    def test_concurrent_partitions_keep_each_key_in_order(self, test_domain):
+        _seed(users=4, transactions=3)
+        handled = []
+
+        outcomes = self._replay(test_domain, handled.append)
+
+        assert sum(dispatched for dispatched, _ in outcomes) == 16
+        key = _default_partition_key(Balances)
+        for user_key in {key(message) for message in handled}:
+            positions = [
+                message.metadata.event_store.global_position
+                for message in handled
+                if key(message) == user_key
+            ]
+            assert positions == sorted(positions)
+
+    def test_failed_partition_is_reported_without_blocking_the_others(
+        self, test_domain
+    ):
+        _seed(users=4, transactions=3)
+        key = _default_partition_key(Balances)
+        partition = _Partition(index=0, count=3, key=key)
+
+        def checkpoint_fails(position):
+            raise RuntimeError("checkpoint store down")
+
+        categories = list(TransactionProjector.meta_.stream_categories)
+        with patch.object(TransactionProjector, "_handle"):
+            outcomes = _replay_partitions(
+                test_domain,
+                TransactionProjector,
+                categories,
+                1,
+                [-1] * 3,
+                [checkpoint_fails, None, None],
+                key,
+                transactional=False,
+                concurrent=True,
+            )
+
+        assert isinstance(outcomes[0], RuntimeError)
+        messages = test_domain.event_store.store.read(
+            "user"
+        ) + test_domain.event_store.store.read("transaction")
+        others = sum(not partition.owns(message) for message in messages)
+        assert sum(outcome[0] for outcome in outcomes[1:]) == others
+
+    def test_worker_interrupts_are_re_raised(self, test_domain):
+        _seed(users=1, transactions=1)
+
+        def interrupt(message):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            self._replay(test_domain, interrupt, workers=2)
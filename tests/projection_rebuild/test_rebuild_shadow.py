@@ -0,0 +1,179 @@
+"""Tests for shadow (blue/green) projection rebuilds."""
+
+from unittest.mock import patch
+
+import pytest
+
+from protean import current_domain
+from protean.exceptions import NotSupportedError
+from protean.port.provider import shadow_storage_for, use_shadow_storage
+from protean.utils import fqn
+from protean.utils.projection_rebuilder import _read_checkpoint, _write_checkpoint
+
+from .elements import (
+    Balances,
+    CachedSummary,
+    CachedSummaryProjector,
+    Registered,
+    Transacted,
+    Transaction,
+    TransactionProjector,
+    User,
+)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(User)
+    test_domain.register(Registered, part_of=User)
+    test_domain.register(Transaction)
+    test_domain.register(Transacted, part_of=Transaction)
+    test_domain.register(Balances)
+    test_domain.register(
+        TransactionProjector,
+        projector_for=Balances,
+        aggregates=[Transaction, User],
+    )
+    test_domain.register(CachedSummary, cache="default")
+    test_domain.register(
+        CachedSummaryProjector, projector_for=CachedSummary, aggregates=[User]
+    )
+    test_domain.init(traverse=False)
+
+
+def _seed(transactions: int = 3) -> str:
+    user = User.register(email="john@example.com", name="John")
+    current_domain.repository_for(User).add(user)
+    for _ in range(transactions):
+        txn = Transaction.transact(user_id=user.id, amount=10.0)
+        current_domain.repository_for(Transaction).add(txn)
+    return user.id
+
+
+def _stale_balance(user_id: str) -> None:
+    """Overwrite the live row so a rebuild is observable."""
+    repo = current_domain.repository_for(Balances)
+    balance = repo.get(user_id)
+    balance.balance = -1.0
+    repo.add(balance)
+
+
+class TestShadowStorageRouting:
+    def test_no_shadow_outside_context(self):
+        assert shadow_storage_for(Balances) is None
+
+    def test_shadow_is_scoped_to_context_and_class(self):
+        with use_shadow_storage(Balances, "balances__rebuild_x"):
+            assert shadow_storage_for(Balances) == "balances__rebuild_x"
+            assert shadow_storage_for(CachedSummary) is None
+
+        assert shadow_storage_for(Balances) is None
+
+    def test_repository_resolves_routing_on_each_access(self, test_domain):
+        repo = current_domain.repository_for(Balances)
+        live = repo._dao
+        provider = test_domain.providers["default"]
+        shadow = provider.create_shadow(Balances, repo._database_model)
+
+        with use_shadow_storage(Balances, shadow):
+            assert repo._dao.schema_name == shadow
+
+        assert repo._dao is live
+        provider.drop_shadow(Balances, repo._database_model, shadow)
+
+
+class TestShadowRebuild:
+    def test_swap_replaces_live_data(self, test_domain):
+        user_id = _seed()
+        test_domain.rebuild_projection(Balances)
+        _stale_balance(user_id)
+
+        result = test_domain.rebuild_projection(Balances, shadow=True)
+
+        assert result.success
+        assert result.events_dispatched == 4
+        assert current_domain.repository_for(Balances).get(user_id).balance == 30.0
+
+    def test_live_projection_stays_readable_during_rebuild(self, test_domain):
+        user_id = _seed()
+        test_domain.rebuild_projection(Balances)
+        _stale_balance(user_id)
+        seen = []
+        original = TransactionProjector._handle
+
+        def handle(message):
+            shadow = shadow_storage_for(Balances)
+            with use_shadow_storage(Balances, None):
+                seen.append(
+                    current_domain.repository_for(Balances).get(user_id).balance
+                )
+            assert shadow is not None
+            return original(message)
+
+        with patch.object(TransactionProjector, "_handle", side_effect=handle):
+            test_domain.rebuild_projection(Balances, shadow=True)
+
+        assert seen and set(seen) == {-1.0}
+
+    def test_shadow_is_dropped_on_failure(self, test_domain):
+        _seed()
+        provider = test_domain.providers["default"]
+        before = set(provider._databases)
+
+        with (
+            patch.object(
+                TransactionProjector, "_handle", side_effect=KeyboardInterrupt
+            ),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            test_domain.rebuild_projection(Balances, shadow=True)
+
+        assert set(provider._databases) == before
+
+    def test_subscription_positions_are_handed_over(self, test_domain):
+        _seed()
+        head = test_domain.event_store.store.stream_head_position("transaction")
+
+        test_domain.rebuild_projection(Balances, shadow=True)
+
+        for category in TransactionProjector.meta_.stream_categories:
+            stream = f"position-{fqn(TransactionProjector)}-{category}"
+            assert _read_checkpoint(test_domain, stream) == head
+
+    def test_positions_ahead_of_rebuild_are_kept(self, test_domain):
+        _seed()
+        stream = f"position-{fqn(TransactionProjector)}-transaction"
+        _write_checkpoint(test_domain, stream, 10_000, origin_stream="transaction")
+
+        test_domain.rebuild_projection(Balances, shadow=True)
+
+        assert _read_checkpoint(test_domain, stream) == 10_000
+
+
+class TestShadowRebuildErrors:
+    def test_resume_is_rejected(self, test_domain):
+        result = test_domain.rebuild_projection(Balances, shadow=True, resume=True)
+
+        assert not result.success
+        assert "cannot be resumed" in result.errors[0]
+
+    def test_cache_projection_is_rejected(self, test_domain):
+        result = test_domain.rebuild_projection(CachedSummary, shadow=True)
+
+        assert not result.success
+        assert "database-backed" in result.errors[0]
+
+    def test_provider_without_shadow_support(self, test_domain):
+        user_id = _seed()
+        test_domain.rebuild_projection(Balances)
+        provider = test_domain.providers["default"]
+
+        with patch.object(
+            provider,
+            "create_shadow",
+            side_effect=NotSupportedError("no shadow storage"),
+        ):
+            result = test_domain.rebuild_projection(Balances, shadow=True)
+
+        assert result.errors == ["no shadow storage"]
+        assert current_domain.repository_for(Balances).get(user_id).balance == 30.0
@@ -0,0 +1,50 @@
+"""Cross-adapter tests for ``BaseDAO._count_by`` grouped counts.
+
+Marker-gated so they exercise the SQLAlchemy ``GROUP BY`` path and the
+Elasticsearch ``terms`` aggregation in addition to the in-memory adapter.
+Core behaviour is covered against memory in ``tests/port/test_dao_count_by.py``.
+"""
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.fields import Integer, String
+from protean.utils.query import Q
+
+
+class Ticket(BaseAggregate):
+    status = String(max_length=20, default="open")
+    rank = Integer(default=0)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Ticket)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def seeded_dao(test_domain, db):
+    """Seed three open and two closed Tickets and return their DAO.
+
+    Depends on ``db`` so table setup precedes the inserts on SQL adapters.
+    """
+    repo = test_domain.repository_for(Ticket)
+    for i in range(3):
+        repo.add(Ticket(status="open", rank=i))
+    for i in range(2):
+        repo.add(Ticket(status="closed", rank=i))
+    return repo._dao
+
+
+@pytest.mark.basic_storage
+@pytest.mark.usefixtures("db")
+class TestCountByAcrossAdapters:
+    def test_counts_rows_per_value(self, seeded_dao):
+        assert seeded_dao._count_by("status") == {"open": 3, "closed": 2}
+
+    def test_criteria_restricts_counted_rows(self, seeded_dao):
+        assert seeded_dao._count_by("status", Q(rank=0)) == {"open": 1, "closed": 1}
+
+    def test_no_matches_returns_empty_dict(self, seeded_dao):
+        assert seeded_dao._count_by("status", Q(rank=99)) == {}
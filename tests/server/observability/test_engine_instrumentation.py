@@ -212,6 +212,23 @@ class TestCommandDispatcherHandlerName:
         # Should be the specific handler name, not "Commands:test::user:command"
         assert started_calls[0].kwargs["handler"] == "UserCommandHandler"
 
+    @pytest.mark.asyncio
+    async def test_dispatched_command_completes(self, test_domain):
+        """A command routed through a CommandDispatcher, an instance rather
+        than a handler class, completes without emitting pm.transition."""
+        engine = Engine(domain=test_domain, test_mode=True)
+        engine.emitter = Mock()
+
+        dispatcher = engine._subscriptions["commands:test::user:command"].handler
+        message = _make_command_message(test_domain)
+
+        assert await engine.handle_message(dispatcher, message) is True
+
+        events = [c.kwargs.get("event") for c in engine.emitter.emit.call_args_list]
+        assert "handler.completed" in events
+        assert "handler.failed" not in events
+        assert "pm.transition" not in events
+
 
 class TestMessageContextCleanup:
     @pytest.fixture(autouse=True)
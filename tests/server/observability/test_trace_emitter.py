@@ -359,3 +359,243 @@ class TestEmitterInitializationEdgeCases:
         assert result is False
         assert emitter._initialized is True
         assert emitter._redis is None
+
+
+class _RecordingPipeline:
+    """Minimal pipeline stand-in that records commands and flushes to its owner."""
+
+    def __init__(self, owner):
+        self._owner = owner
+        self._commands = []
+
+    def xadd(self, *args, **kwargs):
+        self._commands.append(("xadd", args, kwargs))
+
+    def publish(self, *args, **kwargs):
+        self._commands.append(("publish", args, kwargs))
+
+    def execute(self):
+        self._owner.executions.append(list(self._commands))
+        self._commands = []
+
+
+class _RecordingRedis:
+    def __init__(self, subscribers=1):
+        self.subscribers = subscribers
+        self.executions = []
+        self.numsub_calls = 0
+
+    def pubsub_numsub(self, channel):
+        self.numsub_calls += 1
+        return [(channel, self.subscribers)]
+
+    def pipeline(self, transaction=True):
+        return _RecordingPipeline(self)
+
+    @property
+    def commands(self):
+        return [command for execution in self.executions for command in execution]
+
+
+def _emitter_with_fake_redis(subscribers=1, **kwargs):
+    mock_domain = MagicMock()
+    mock_domain.name = "test-domain"
+    emitter = TraceEmitter(mock_domain, **kwargs)
+    emitter._redis = _RecordingRedis(subscribers=subscribers)
+    emitter._initialized = True
+    return emitter
+
+
+def _emit(emitter, **overrides):
+    kwargs = {
+        "event": "handler.completed",
+        "stream": "test::order",
+        "message_id": "msg-1",
+        "message_type": "OrderPlaced",
+    }
+    kwargs.update(overrides)
+    emitter.emit(**kwargs)
+
+
+class TestEmitterPipelining:
+    def test_sync_emit_writes_stream_and_pubsub_in_one_round_trip(self):
+        emitter = _emitter_with_fake_redis()
+        _emit(emitter)
+
+        assert len(emitter._redis.executions) == 1
+        assert [c[0] for c in emitter._redis.commands] == ["xadd", "publish"]
+        assert emitter.emitted == 1
+
+    def test_publish_skipped_without_subscribers(self):
+        emitter = _emitter_with_fake_redis(subscribers=0)
+        _emit(emitter)
+
+        assert [c[0] for c in emitter._redis.commands] == ["xadd"]
+
+    def test_subscriber_count_is_cached(self):
+        emitter = _emitter_with_fake_redis()
+        for i in range(5):
+            _emit(emitter, message_id=f"msg-{i}")
+
+        assert emitter._redis.numsub_calls == 1
+
+    def test_pipeline_failure_is_counted_not_raised(self):
+        emitter = _emitter_with_fake_redis()
+        emitter._redis.pipeline = MagicMock(side_effect=ConnectionError("down"))
+
+        _emit(emitter)
+
+        assert emitter.flush_errors == 1
+        assert emitter.emitted == 0
+
+
+class TestEmitterBackground:
+    def test_background_emit_is_flushed_in_batches(self):
+        emitter = _emitter_with_fake_redis(background=True, batch_size=50)
+        try:
+            for i in range(120):
+                _emit(emitter, message_id=f"msg-{i}")
+            emitter.flush()
+        finally:
+            emitter.close()
+
+        assert emitter.emitted == 120
+        assert all(len(e) <= 100 for e in emitter._redis.executions)
+        assert len(emitter._redis.executions) < 120
+
+    def test_overflow_drops_and_counts(self):
+        emitter = _emitter_with_fake_redis(background=True, queue_size=5)
+        # Hold the flusher back so the queue fills up
+        emitter._ensure_flusher = lambda: None
+
+        for i in range(8):
+            _emit(emitter, message_id=f"msg-{i}")
+
+        assert emitter.dropped == 3
+        assert emitter.stats()["queue_depth"] == 5
+
+    def test_close_flushes_pending_traces(self):
+        emitter = _emitter_with_fake_redis(background=True, flush_interval=1.0)
+        _emit(emitter)
+        emitter.close()
+
+        assert emitter.emitted == 1
+        assert emitter._flusher is None
+
+    def test_close_without_flusher_is_noop(self):
+        emitter = _emitter_with_fake_redis(background=True)
+        emitter.close()
+        assert emitter._flusher is None
+
+
+class TestEmitterSampling:
+    def test_head_sampling_is_consistent_per_correlation_id(self):
+        emitter = _emitter_with_fake_redis(sample_rate=0.5)
+        for i in range(200):
+            for stage in ("handler.started", "handler.completed"):
+                _emit(
+                    emitter,
+                    event=stage,
+                    message_id=f"msg-{i}",
+                    correlation_id=f"corr-{i}",
+                )
+
+        kept = [
+            json.loads(c[1][1]["data"])
+            for c in emitter._redis.commands
+            if c[0] == "xadd"
+        ]
+        by_correlation = {}
+        for trace in kept:
+            by_correlation.setdefault(trace["correlation_id"], []).append(trace)
+
+        # Every kept chain has both stages; roughly half of chains are kept
+        assert all(len(stages) == 2 for stages in by_correlation.values())
+        assert 50 < len(by_correlation) < 150
+        assert emitter.sampled_out == 400 - len(kept)
+
+    def test_zero_rate_drops_everything_under_head_sampling(self):
+        emitter = _emitter_with_fake_redis(sample_rate=0.0)
+        _emit(emitter, status="error")
+
+        assert emitter._redis.executions == []
+        assert emitter.sampled_out == 1
+
+    def test_tail_sampling_keeps_errors_and_slow_traces(self):
+        emitter = _emitter_with_fake_redis(
+            sample_rate=0.0, sampling="tail", slow_threshold_ms=100
+        )
+        _emit(emitter, message_id="ok-fast", duration_ms=5)
+        _emit(emitter, message_id="failed", status="error")
+        _emit(emitter, message_id="slow", duration_ms=250)
+
+        kept = [
+            json.loads(c[1][1]["data"])["message_id"]
+            for c in emitter._redis.commands
+            if c[0] == "xadd"
+        ]
+        assert kept == ["failed", "slow"]
+
+    def test_invalid_sampling_mode_rejected(self):
+        with pytest.raises(ValueError):
+            _emitter_with_fake_redis(sampling="random")
+
+
+class TestEmitterPayloadTruncation:
+    def test_large_payload_is_truncated(self):
+        emitter = _emitter_with_fake_redis(max_payload_bytes=32)
+        _emit(emitter, payload={"blob": "x" * 100})
+
+        data = json.loads(emitter._redis.commands[0][1][1]["data"])
+        assert data["payload"]["_truncated"] is True
+        assert len(data["payload"]["_preview"]) == 32
+        assert emitter.truncated == 1
+
+    def test_small_payload_is_untouched(self):
+        emitter = _emitter_with_fake_redis(max_payload_bytes=1024)
+        _emit(emitter, payload={"name": "Alice"})
+
+        data = json.loads(emitter._redis.commands[0][1][1]["data"])
+        assert data["payload"] == {"name": "Alice"}
+        assert emitter.truncated == 0
+
+
+class TestEmitterFromConfig:
+    def test_reads_observatory_settings(self):
+        mock_domain = MagicMock()
+        mock_domain.name = "test-domain"
+        mock_domain.config = {
+            "observatory": {
+                "trace_retention_days": 0,
+                "trace_background": True,
+                "trace_queue_size": 42,
+                "trace_sample_rate": 0.25,
+                "trace_sampling": "tail",
+                "trace_max_payload_bytes": 512,
+            }
+        }
+
+        emitter = TraceEmitter.from_config(mock_domain)
+
+        assert emitter._persist is False
+        assert emitter._background is True
+        assert emitter._queue.maxsize == 42
+        assert emitter._sample_rate == 0.25
+        assert emitter._sampling == "tail"
+        assert emitter._max_payload_bytes == 512
+
+    def test_invalid_values_fall_back_to_defaults(self):
+        mock_domain = MagicMock()
+        mock_domain.name = "test-domain"
+        mock_domain.config = {
+            "observatory": {
+                "trace_retention_days": "abc",
+                "trace_sampling": "bogus",
+            }
+        }
+
+        emitter = TraceEmitter.from_config(mock_domain, background=True)
+
+        assert emitter._persist is True
+        assert emitter._sampling == "head"
+        assert emitter._background is True
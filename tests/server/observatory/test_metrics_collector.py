@@ -0,0 +1,269 @@
+"""Tests for background-refreshed Observatory metrics.
+
+Covers:
+- metrics.py: MetricsCollector scheduling, timeouts, staleness and config
+- metrics.py: scrapes reading precomputed values instead of querying
+- Observatory lifespan starting and stopping the collector
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from protean.server.observatory import Observatory
+from protean.server.observatory.metrics import (
+    DEFAULT_COLLECTOR_INTERVALS,
+    DEFAULT_COLLECTOR_TIMEOUT,
+    MetricsCollector,
+    _collector_for,
+    _hand_rolled_metrics,
+    _scrape_cache,
+)
+
+
+def _make_mock_domain(name: str = "collector-test", pending: int = 3) -> MagicMock:
+    domain = MagicMock()
+    domain.name = name
+    domain.config = {}
+    domain.domain_context.return_value.__enter__ = MagicMock(return_value=None)
+    domain.domain_context.return_value.__exit__ = MagicMock(return_value=False)
+    domain._get_outbox_repo.return_value.count_by_status.return_value = {
+        "pending": pending
+    }
+    domain.brokers.get.return_value.health_stats.return_value = {
+        "connected": True,
+        "details": {"healthy": True, "used_memory": 2048},
+    }
+    return domain
+
+
+@pytest.fixture(autouse=True)
+def clear_scrape_cache():
+    _scrape_cache.clear()
+    yield
+    _scrape_cache.clear()
+
+
+@pytest.fixture
+def domain():
+    return _make_mock_domain()
+
+
+@pytest.fixture
+def collector(domain):
+    collector = MetricsCollector([domain])
+    yield collector
+    collector.stop()
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestCollection:
+    def test_refresh_stores_values(self, domain, collector):
+        collector.refresh()
+
+        assert collector.read("outbox") == [(domain, {"pending": 3})]
+        assert collector.read("broker")["connected"] is True
+
+    def test_values_before_first_collection_are_empty(self, collector):
+        assert collector.read("outbox") == []
+        assert collector.read("broker") is None
+
+    def test_failure_keeps_last_value(self, collector):
+        collector.refresh()
+
+        with patch.dict(
+            "protean.server.observatory.metrics._COLLECTORS",
+            {"outbox": (MagicMock(side_effect=RuntimeError("db down")), [], False)},
+        ):
+            collector.collect("outbox")
+
+        state = next(s for s in collector.states() if s.name == "outbox")
+        assert state.failures == 1
+        assert state.error == "db down"
+        assert collector.read("outbox")[0][1] == {"pending": 3}
+
+    def test_infrastructure_failure_is_recorded_and_keeps_last_value(
+        self, domain, collector
+    ):
+        collector.refresh()
+        outbox_repo = domain._get_outbox_repo.return_value
+        outbox_repo.count_by_status.side_effect = RuntimeError("db down")
+
+        collector.collect("outbox")
+
+        state = next(s for s in collector.states() if s.name == "outbox")
+        assert collector.read("outbox") == [(domain, {"pending": 3})]
+        assert state.failures == 1
+        assert "db down" in state.error
+
+    def test_failed_collector_becomes_stale(self, domain, collector):
+        collector.refresh()
+        state = collector._states["broker"]
+        domain.brokers.get.return_value.health_stats.side_effect = RuntimeError(
+            "redis down"
+        )
+
+        collector.collect("broker")
+
+        assert state.failures == 1
+        assert state.stale(state.collected_at + state.interval + state.timeout + 1)
+        assert collector.read("broker")["connected"] is True
+
+
+class TestScrapes:
+    def test_scrape_reads_precomputed_values(self, domain, collector):
+        collector.refresh()
+        outbox_repo = domain._get_outbox_repo.return_value
+        outbox_repo.count_by_status.reset_mock()
+        outbox_repo.count_by_status.return_value = {"pending": 99}
+
+        with patch.object(collector, "_schedule"):
+            collector.start()
+            output = _hand_rolled_metrics([domain])
+
+        outbox_repo.count_by_status.assert_not_called()
+        assert 'protean_outbox_pending_count{domain="collector-test"} 3' in output
+
+    def test_scrape_queries_on_demand_without_collector(self, domain):
+        output = _hand_rolled_metrics([domain])
+
+        assert 'protean_outbox_pending_count{domain="collector-test"} 3' in output
+        assert "protean_metrics_collector_age_seconds" not in output
+
+    def test_on_demand_scrape_serves_healthy_domains(self, domain):
+        broken = _make_mock_domain("broken")
+        broken._get_outbox_repo.side_effect = RuntimeError("db down")
+
+        output = _hand_rolled_metrics([broken, domain])
+
+        assert 'protean_outbox_pending_count{domain="collector-test"} 3' in output
+        assert 'domain="broken"' not in output
+
+    def test_scrape_exposes_collector_staleness(self, domain, collector):
+        collector.refresh()
+
+        with patch.object(collector, "_schedule"):
+            collector.start()
+            output = _hand_rolled_metrics([domain])
+
+        assert 'protean_metrics_collector_stale{collector="outbox"} 0' in output
+        assert 'protean_metrics_collector_age_seconds{collector="broker"}' in output
+        assert 'protean_metrics_collector_duration_seconds{collector="pool"}' in output
+
+    def test_collector_serves_only_its_domains(self, domain, collector):
+        collector.start()
+
+        assert _collector_for([domain]) is collector
+        assert _collector_for([_make_mock_domain("other")]) is None
+
+        collector.stop()
+        assert _collector_for([domain]) is None
+
+
+class TestScheduling:
+    def test_collectors_run_in_background(self, domain):
+        collector = MetricsCollector([domain], intervals={"outbox": 0.01})
+        collector.start()
+        try:
+            assert _wait_for(lambda: collector.read("outbox") != [])
+        finally:
+            collector.stop()
+
+        assert not collector.running
+
+    def test_collectors_run_on_their_own_interval(self, collector):
+        started = []
+        with patch.object(
+            threading.Thread, "start", lambda thread: started.append(thread.name)
+        ):
+            collector._schedule(now=100.0)
+            for state in collector._states.values():
+                state.running_since = None
+            collector._schedule(now=100.0 + DEFAULT_COLLECTOR_INTERVALS["pool"])
+
+        assert started.count("protean-metrics-pool") == 2
+        assert started.count("protean-metrics-outbox") == 1
+
+    def test_overdue_collection_times_out_and_is_not_restarted(self, collector):
+        state = collector._states["outbox"]
+        with patch.object(threading.Thread, "start"):
+            collector._schedule(now=100.0)
+            collector._schedule(now=100.0 + state.interval + state.timeout + 1)
+
+        assert state.timed_out
+        assert state.timeouts == 1
+        assert state.error.startswith("Timed out")
+        assert state.running_since == 100.0
+
+    def test_value_is_stale_once_older_than_interval_plus_timeout(self, collector):
+        collector.refresh()
+        state = next(s for s in collector.states() if s.name == "outbox")
+        now = state.collected_at
+
+        assert not state.stale(now + state.interval)
+        assert state.stale(now + state.interval + state.timeout + 1)
+
+
+class TestConfig:
+    def test_defaults(self, domain):
+        collector = MetricsCollector.from_config([domain])
+
+        state = collector._states["outbox"]
+        assert state.interval == DEFAULT_COLLECTOR_INTERVALS["outbox"]
+        assert state.timeout == DEFAULT_COLLECTOR_TIMEOUT
+
+    def test_intervals_and_timeouts_from_config(self, domain):
+        domain.config = {
+            "observatory": {
+                "metrics": {
+                    "timeout": 3,
+                    "intervals": {"outbox": 60, "unknown": 1},
+                    "timeouts": {"subscriptions": 20},
+                }
+            }
+        }
+
+        collector = MetricsCollector.from_config([domain])
+
+        assert collector._states["outbox"].interval == 60
+        assert collector._states["outbox"].timeout == 3
+        assert collector._states["subscriptions"].timeout == 20
+        assert "unknown" not in collector._states
+
+    def test_invalid_values_fall_back_to_defaults(self, domain):
+        domain.config = {
+            "observatory": {"metrics": {"timeout": "soon", "intervals": {"outbox": -1}}}
+        }
+
+        collector = MetricsCollector.from_config([domain])
+
+        assert (
+            collector._states["outbox"].interval
+            == DEFAULT_COLLECTOR_INTERVALS["outbox"]
+        )
+        assert collector._states["outbox"].timeout == DEFAULT_COLLECTOR_TIMEOUT
+
+
+class TestObservatoryCollector:
+    def test_lifespan_runs_collector(self, domain):
+        observatory = Observatory(domains=[domain])
+
+        with TestClient(observatory.app) as client:
+            assert observatory.metrics_collector.running
+            assert client.get("/metrics").status_code == 200
+
+        assert not observatory.metrics_collector.running
+        assert _collector_for([domain]) is None
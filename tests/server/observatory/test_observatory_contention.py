@@ -0,0 +1,113 @@
+"""Tests for the Observatory contention endpoint (GET /api/contention)."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from protean.server.observatory import Observatory
+from protean.utils.contention import get_contention_tracker
+
+
+@pytest.fixture
+def client(test_domain):
+    return TestClient(Observatory(domains=[test_domain]).app)
+
+
+@pytest.fixture
+def tracker(test_domain):
+    tracker = get_contention_tracker(test_domain)
+    tracker.reset()
+    yield tracker
+    tracker.reset()
+
+
+def _redis_with(snapshots):
+    redis = MagicMock()
+    redis.scan_iter.return_value = [f"key-{i}" for i in range(len(snapshots))]
+    redis.get.side_effect = [json.dumps(s) for s in snapshots]
+    return redis
+
+
+def _snapshot(worker, aggregate_id, count):
+    return {
+        "worker": worker,
+        "conflicts": [
+            {
+                "aggregate": "Account",
+                "aggregate_id": aggregate_id,
+                "count": count,
+                "error": 0,
+            }
+        ],
+        "reloads": [],
+        "slow": [],
+        "retry_latency": [
+            {"aggregate": "Account", "retries": 1, "total_ms": 8.0, "max_ms": 8.0}
+        ],
+    }
+
+
+class TestContentionEndpoint:
+    def test_merges_worker_snapshots(self, client, test_domain):
+        redis = _redis_with([_snapshot("w1", "a1", 2), _snapshot("w2", "a1", 3)])
+        with patch(
+            "protean.server.observatory.routes.contention._get_redis",
+            return_value=redis,
+        ):
+            response = client.get("/api/contention")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "workers"
+        merged = data["domains"][test_domain.name]
+        assert merged["workers"] == ["w1", "w2"]
+        assert merged["conflicts"][0]["count"] == 5
+        assert merged["retry_latency"][0]["mean_ms"] == 8.0
+
+    def test_falls_back_to_local_tracker(self, client, test_domain, tracker):
+        tracker.record_conflict("Account", "a1")
+        tracker.record_conflict("Account", "a2")
+        tracker.record_conflict("Account", "a2")
+
+        with patch(
+            "protean.server.observatory.routes.contention._get_redis",
+            return_value=None,
+        ):
+            response = client.get("/api/contention", params={"top": 1})
+
+        data = response.json()
+        assert data["source"] == "local"
+        assert data["domains"][test_domain.name]["conflicts"] == [
+            {"aggregate": "Account", "aggregate_id": "a2", "count": 2, "error": 0}
+        ]
+
+    def test_rejects_invalid_top(self, client):
+        assert client.get("/api/contention", params={"top": 0}).status_code == 422
+
+
+class TestContentionPage:
+    def test_renders(self, client):
+        response = client.get("/contention")
+
+        assert response.status_code == 200
+        assert "Hot Aggregate Instances" in response.text
+        assert "/static/js/contention.js" in response.text
+
+    def test_serves_script(self, client):
+        assert client.get("/static/js/contention.js").status_code == 200
+
+
+class TestContentionPrometheusMetrics:
+    def test_exports_hot_instances(self, client, test_domain, tracker):
+        tracker.record_conflict("Account", "a1")
+
+        with patch("protean.server.observatory.api._get_redis", return_value=None):
+            body = client.get("/metrics").text
+
+        assert "# TYPE protean_aggregate_contention gauge" in body
+        assert (
+            f'protean_aggregate_contention{{domain="{test_domain.name}",'
+            'sketch="conflicts",aggregate="Account",aggregate_id="a1"} 1'
+        ) in body
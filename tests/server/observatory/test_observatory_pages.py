@@ -96,7 +96,7 @@ class TestCreatePageRouter:
         router = create_page_router([test_domain], templates)
         assert isinstance(router, APIRouter)
 
-    def test_registers_eight_routes(self, test_domain):
+    def test_registers_nine_routes(self, test_domain):
         from fastapi.templating import Jinja2Templates
 
         templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
@@ -110,6 +110,7 @@ class TestCreatePageRouter:
             "/timeline",
             "/infrastructure",
             "/messages",
+            "/contention",
             "/domain",
         }
 
@@ -141,7 +142,7 @@ class TestCreateAllRoutes:
 
         templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
         page_router, _ = create_all_routes([test_domain], templates)
-        assert len(page_router.routes) == 8
+        assert len(page_router.routes) == 9
 
     def test_api_router_includes_handler_routes(self, test_domain):
         from fastapi.templating import Jinja2Templates
@@ -0,0 +1,80 @@
+"""Tests for the Observatory handler profile endpoint (GET /api/profile)."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from protean.server.observatory import Observatory
+
+
+@pytest.fixture
+def client(test_domain):
+    return TestClient(Observatory(domains=[test_domain]).app)
+
+
+def _redis_with(snapshots):
+    redis = MagicMock()
+    redis.scan_iter.return_value = [f"key-{i}" for i in range(len(snapshots))]
+    redis.get.side_effect = [json.dumps(s) for s in snapshots]
+    return redis
+
+
+def _snapshot(worker, handler, samples):
+    return {
+        "worker": worker,
+        "samples": samples,
+        "calls": [
+            {
+                "handler": handler,
+                "message_type": "Evt",
+                "count": 1,
+                "wall_ms": 2.0,
+                "cpu_ms": 1.0,
+            }
+        ],
+        "stacks": [
+            {
+                "handler": handler,
+                "message_type": "Evt",
+                "frames": ["handle"],
+                "samples": samples,
+            }
+        ],
+    }
+
+
+class TestProfileEndpoint:
+    def test_merges_workers(self, client):
+        redis = _redis_with([_snapshot("w1", "A", 3), _snapshot("w2", "B", 4)])
+        with patch(
+            "protean.server.observatory.routes.profile._get_redis",
+            return_value=redis,
+        ):
+            response = client.get("/api/profile")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(data["workers"]) == ["w1", "w2"]
+        assert set(data["handlers"]) == {"A", "B"}
+        assert data["flamegraph"]["value"] == 7
+
+    def test_filters_flamegraph_by_handler(self, client):
+        redis = _redis_with([_snapshot("w1", "A", 3), _snapshot("w2", "B", 4)])
+        with patch(
+            "protean.server.observatory.routes.profile._get_redis",
+            return_value=redis,
+        ):
+            response = client.get("/api/profile", params={"handler": "B"})
+
+        assert response.json()["flamegraph"]["value"] == 4
+
+    def test_unavailable_without_redis(self, client):
+        with patch(
+            "protean.server.observatory.routes.profile._get_redis",
+            return_value=None,
+        ):
+            response = client.get("/api/profile")
+
+        assert response.status_code == 503
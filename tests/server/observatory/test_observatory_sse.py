@@ -247,6 +247,7 @@ class TestSSEStreamingLogic:
         endpoint_kwargs.setdefault("domain", None)
         endpoint_kwargs.setdefault("stream", None)
         endpoint_kwargs.setdefault("event", None)
+        endpoint_kwargs.setdefault("handler", None)
         endpoint_kwargs.setdefault("type", None)
 
         # Patch asyncio functions globally (sse.py uses `import asyncio`)
@@ -0,0 +1,207 @@
+"""Tests for the Observatory's shared SSE upstream.
+
+Covers:
+- sse.py: TraceFilter server-side matching
+- sse.py: TraceSubscriber bounded queues and dropped markers
+- sse.py: TraceFanout sharing one Pub/Sub subscription among clients
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from protean.server.observatory.sse import (
+    TraceFanout,
+    TraceFilter,
+    TraceSubscriber,
+    _format_sse,
+)
+
+pytestmark = pytest.mark.no_test_domain
+
+
+def _make_mock_domain(messages=()):
+    """Mock domain whose Redis Pub/Sub yields *messages*, then nothing."""
+    domain = MagicMock()
+    domain.name = "fanout-test"
+    domain.domain_context.return_value.__enter__ = MagicMock(return_value=None)
+    domain.domain_context.return_value.__exit__ = MagicMock(return_value=False)
+
+    pending = [{"type": "message", "data": json.dumps(m)} for m in messages]
+
+    def get_message(ignore_subscribe_messages=True, timeout=1.0):
+        if pending:
+            return pending.pop(0)
+        time.sleep(0.005)
+        return None
+
+    redis = MagicMock()
+    redis.pubsub.return_value.get_message = get_message
+    domain.brokers.get.return_value.redis_instance = redis
+    return domain, redis
+
+
+def _subscriber(queue_size: int = 3, **filters) -> TraceSubscriber:
+    return TraceSubscriber(TraceFilter(**filters), asyncio.Queue(maxsize=queue_size))
+
+
+def _drain(queue: asyncio.Queue) -> list[str]:
+    frames = []
+    while not queue.empty():
+        frames.append(queue.get_nowait())
+    return frames
+
+
+class TestTraceFilter:
+    def test_empty_filter_matches_everything(self):
+        assert TraceFilter().matches({"event": "handler.started"})
+
+    def test_handler_glob(self):
+        trace_filter = TraceFilter(handler="Order*")
+
+        assert trace_filter.matches({"handler": "OrderHandler"})
+        assert not trace_filter.matches({"handler": "PaymentHandler"})
+        assert not trace_filter.matches({"handler": None})
+
+    def test_filters_combine(self):
+        trace_filter = TraceFilter(stream="app::order", event="handler.*")
+
+        assert trace_filter.matches({"stream": "app::order", "event": "handler.failed"})
+        assert not trace_filter.matches(
+            {"stream": "app::order", "event": "outbox.published"}
+        )
+        assert not trace_filter.matches(
+            {"stream": "app::payment", "event": "handler.failed"}
+        )
+
+
+class TestTraceSubscriber:
+    def test_events_beyond_queue_size_are_dropped(self):
+        subscriber = _subscriber(queue_size=2)
+
+        for i in range(5):
+            subscriber.offer({"event": "handler.started"}, f"frame-{i}")
+
+        assert _drain(subscriber.queue) == ["frame-0", "frame-1"]
+        assert subscriber.dropped == 3
+        assert subscriber.dropped_by_event == {"handler.started": 3}
+
+    def test_dropped_marker_precedes_next_delivered_event(self):
+        subscriber = _subscriber(queue_size=2)
+        subscriber.offer({"event": "handler.started"}, "frame-0")
+        subscriber.offer({"event": "handler.started"}, "frame-1")
+        subscriber.offer({"event": "handler.failed"}, "frame-2")
+        _drain(subscriber.queue)
+
+        subscriber.offer({"event": "handler.completed"}, "frame-3")
+
+        marker, frame = _drain(subscriber.queue)
+        assert marker == _format_sse(
+            {"dropped": 1, "events": {"handler.failed": 1}}, event_type="dropped"
+        )
+        assert frame == "frame-3"
+        assert subscriber.dropped == 0
+        assert subscriber.dropped_total == 1
+
+    def test_marker_waits_for_room_for_itself_and_an_event(self):
+        subscriber = _subscriber(queue_size=2)
+        subscriber.offer({"event": "a"}, "frame-0")
+        subscriber.offer({"event": "a"}, "frame-1")
+        subscriber.offer({"event": "b"}, "frame-2")
+        subscriber.queue.get_nowait()
+
+        subscriber.offer({"event": "c"}, "frame-3")
+
+        assert _drain(subscriber.queue) == ["frame-1"]
+        assert subscriber.dropped_by_event == {"b": 1, "c": 1}
+
+
+class TestTraceFanout:
+    async def test_clients_share_one_subscription(self):
+        domain, redis = _make_mock_domain()
+        fanout = TraceFanout([domain])
+
+        first = fanout.join(TraceFilter())
+        second = fanout.join(TraceFilter())
+        await asyncio.sleep(0.05)
+
+        assert fanout.subscribers == 2
+        redis.pubsub.assert_called_once()
+
+        await fanout.leave(first)
+        redis.pubsub.return_value.close.assert_not_called()
+
+        await fanout.leave(second)
+        redis.pubsub.return_value.unsubscribe.assert_called()
+        redis.pubsub.return_value.close.assert_called_once()
+
+    async def test_events_are_filtered_per_client(self):
+        domain, _ = _make_mock_domain(
+            [
+                {"event": "handler.started", "handler": "OrderHandler"},
+                {"event": "handler.started", "handler": "PaymentHandler"},
+            ]
+        )
+        fanout = TraceFanout([domain])
+        orders = fanout.join(TraceFilter(handler="Order*"))
+        everything = fanout.join(TraceFilter())
+
+        frame = await asyncio.wait_for(orders.queue.get(), timeout=5)
+        while fanout.received < 2:
+            await asyncio.sleep(0.01)
+
+        assert "OrderHandler" in frame
+        assert orders.queue.empty()
+        assert everything.queue.qsize() == 2
+
+        await fanout.leave(orders)
+        await fanout.leave(everything)
+
+    async def test_slow_client_does_not_hold_back_others(self):
+        fanout = TraceFanout([], queue_size=2)
+        slow = _subscriber(queue_size=2)
+        fast = _subscriber(queue_size=10)
+        fanout._subscribers.extend([slow, fast])
+
+        for i in range(5):
+            fanout.publish(json.dumps({"event": "handler.started", "n": i}))
+
+        assert fast.queue.qsize() == 5
+        assert slow.queue.qsize() == 2
+        assert slow.dropped == 3
+
+    async def test_invalid_payloads_are_ignored(self):
+        fanout = TraceFanout([])
+        subscriber = _subscriber()
+        fanout._subscribers.append(subscriber)
+
+        fanout.publish("not-json{{{")
+        fanout.publish(json.dumps(["not", "a", "dict"]))
+
+        assert subscriber.queue.empty()
+        assert fanout.received == 0
+
+    async def test_join_without_redis_returns_none(self):
+        domain = MagicMock()
+        domain.brokers.get.return_value = MagicMock(spec=[])
+
+        assert TraceFanout([domain]).join(TraceFilter()) is None
+
+    async def test_upstream_restarts_after_last_client_leaves(self):
+        domain, redis = _make_mock_domain()
+        fanout = TraceFanout([domain])
+
+        subscriber = fanout.join(TraceFilter())
+        await asyncio.sleep(0.05)
+        await fanout.leave(subscriber)
+
+        subscriber = fanout.join(TraceFilter())
+        await asyncio.sleep(0.05)
+
+        assert redis.pubsub.call_count == 2
+        await fanout.leave(subscriber)
@@ -0,0 +1,265 @@
+"""Tests for the Observatory's tailing timeline index.
+
+Covers:
+- timeline_index.py: TimelineIndex tailing, eviction and queries
+- routes/timeline.py: collectors answering from an index
+- Observatory lifespan starting and stopping the tailer
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from protean.domain import Domain
+from protean.server.observatory import Observatory
+from protean.server.observatory.routes.timeline import (
+    build_correlation_response,
+    collect_aggregate_history,
+    collect_all_events,
+    collect_recent_traces,
+    collect_timeline_stats,
+    find_event_by_id,
+    search_traces,
+)
+from protean.server.observatory.timeline_index import TimelineIndex
+
+pytestmark = pytest.mark.no_test_domain
+
+
+def _write(domain, stream, message_id, correlation_id, causation_id=None, kind="EVENT"):
+    domain.event_store.store._write(
+        stream,
+        f"Test.{message_id}.v1",
+        {"id": message_id},
+        metadata={
+            "headers": {"id": message_id, "type": f"Test.{message_id}.v1"},
+            "domain": {
+                "kind": kind,
+                "correlation_id": correlation_id,
+                "causation_id": causation_id,
+            },
+        },
+    )
+
+
+@pytest.fixture
+def domain(tmp_path):
+    domain = Domain(name="IndexTests", root_path=str(tmp_path))
+    domain._initialize()
+    domain.init(traverse=False)
+
+    with domain.domain_context():
+        _write(domain, "test::order-1", "cmd-1", "corr-1", kind="COMMAND")
+        _write(domain, "test::order-1", "evt-1", "corr-1", causation_id="cmd-1")
+        _write(domain, "test::order-2", "evt-2", "corr-2")
+        yield domain
+
+
+@pytest.fixture
+def index(domain):
+    index = TimelineIndex([domain])
+    index.refresh()
+    return index
+
+
+class TestTailing:
+    def test_refresh_reads_all_messages(self, index):
+        assert len(index) == 3
+        assert index.complete
+
+    def test_refresh_continues_from_last_position(self, domain, index):
+        last_position = index.find("evt-2").message["global_position"]
+        _write(domain, "test::order-3", "evt-3", "corr-3")
+        store = domain.event_store.store
+
+        with patch.object(store, "_read", wraps=store._read) as read:
+            assert index.refresh() == 1
+
+        assert read.call_args_list[0].kwargs["position"] == last_position + 1
+        assert index.find("evt-3") is not None
+
+    def test_refresh_reads_in_batches(self, domain):
+        index = TimelineIndex([domain], batch_size=2)
+
+        assert index.refresh() == 3
+        assert len(index) == 3
+
+    def test_first_refresh_starts_one_window_behind_the_head(self, domain):
+        index = TimelineIndex([domain], capacity=2)
+        store = domain.event_store.store
+        head = store.stream_head_position("$all")
+
+        with patch.object(store, "_read", wraps=store._read) as read:
+            assert index.refresh() == 2
+
+        assert read.call_args_list[-1].kwargs["position"] == head - 1
+        assert index.find("cmd-1") is None
+        assert index.evicted == 0
+        assert not index.complete
+
+    def test_window_larger_than_store_is_complete(self, domain):
+        index = TimelineIndex([domain], capacity=3)
+
+        assert index.refresh() == 3
+        assert index.complete
+
+    def test_snapshots_are_not_indexed(self, domain, index):
+        domain.event_store.store._write("test::order:snapshot-1", "SNAPSHOT", {})
+
+        index.refresh()
+
+        assert len(index) == 3
+
+    def test_unreadable_store_is_skipped(self, domain):
+        index = TimelineIndex([domain])
+
+        with patch.object(
+            domain.event_store.store, "_read", side_effect=Exception("down")
+        ):
+            assert index.refresh() == 0
+
+        assert index.refresh() == 3
+
+    def test_tailer_picks_up_new_messages(self, domain):
+        index = TimelineIndex([domain], poll_interval=0.01)
+        index.start()
+        try:
+            _write(domain, "test::order-3", "evt-3", "corr-3")
+            deadline = time.monotonic() + 5
+            while index.find("evt-3") is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            index.stop()
+
+        assert index.find("evt-3") is not None
+        assert not index.tailing
+
+
+class TestEviction:
+    def test_window_is_bounded(self, domain):
+        index = TimelineIndex([domain], capacity=2)
+        index.refresh()
+        _write(domain, "test::order-3", "evt-3", "corr-3")
+        index.refresh()
+
+        assert len(index) == 2
+        assert index.evicted == 1
+        assert not index.complete
+
+    def test_evicted_messages_leave_every_index(self, domain):
+        index = TimelineIndex([domain], capacity=1)
+        index.refresh()
+
+        assert index.find("cmd-1") is None
+        assert index.correlation_group("corr-1") == []
+        assert index.stream("test::order-1") == []
+        assert [msg["type"] for msg, _ in index.events()] == ["Test.evt-2.v1"]
+        assert index.stats()["active_streams"] == 1
+
+    def test_stats_cover_only_the_window(self, domain):
+        index = TimelineIndex([domain], capacity=2)
+        index.refresh()
+        window = [msg for msg, _ in index.events()]
+
+        stats = index.stats()
+        assert stats["total_events"] == 2
+        assert stats["last_event_time"] == window[-1]["time"]
+        assert index._stats.first_event_datetime == datetime.fromisoformat(
+            window[0]["time"]
+        )
+
+    def test_events_taken_before_eviction_are_unchanged(self, domain):
+        index = TimelineIndex([domain], capacity=2)
+        index.refresh()
+        before = index.events()
+
+        for n in range(3, 7):
+            _write(domain, f"test::order-{n}", f"evt-{n}", f"corr-{n}")
+        index.refresh()
+
+        assert [msg["type"] for msg, _ in before] == ["Test.evt-1.v1", "Test.evt-2.v1"]
+        assert [msg["type"] for msg, _ in index.events()] == [
+            "Test.evt-5.v1",
+            "Test.evt-6.v1",
+        ]
+        assert len(index._entries.items) <= 2 * index.capacity
+
+
+class TestCollectorsWithIndex:
+    def test_events_match_store_scan(self, domain, index):
+        scanned, _ = collect_all_events([domain], order="desc")
+        indexed, _ = collect_all_events([domain], order="desc", index=index)
+
+        assert indexed == scanned
+
+    def test_filters_use_index(self, domain, index):
+        events, _ = collect_all_events(
+            [domain], event_type="Test.evt-1.v1", kind="EVENT", index=index
+        )
+
+        assert [e["message_id"] for e in events] == ["evt-1"]
+
+    def test_index_does_not_read_the_store(self, domain, index):
+        with patch.object(domain.event_store.store, "_read") as read:
+            assert find_event_by_id([domain], "evt-1", index=index) is not None
+            assert collect_timeline_stats([domain], index=index)["total_events"] == 3
+            assert build_correlation_response([domain], "corr-1", index=index)
+            assert collect_aggregate_history([domain], "test::order", "1", index=index)
+            assert len(collect_recent_traces([domain], index=index)) == 2
+            assert search_traces([domain], event_type="Test.evt-2.v1", index=index)
+
+        read.assert_not_called()
+
+    def test_correlation_chain_has_tree(self, domain, index):
+        response = build_correlation_response([domain], "corr-1", index=index)
+
+        assert response["event_count"] == 2
+        assert response["tree"]["message_id"] == "cmd-1"
+        assert response["tree"]["children"][0]["message_id"] == "evt-1"
+
+    def test_unknown_correlation_and_message(self, domain, index):
+        assert build_correlation_response([domain], "nope", index=index) is None
+        assert find_event_by_id([domain], "nope", index=index) is None
+
+    def test_aggregate_history_from_index(self, domain, index):
+        history = collect_aggregate_history([domain], "test::order", "1", index=index)
+
+        assert history["current_version"] == 1
+        assert history["event_count"] == 2
+
+    def test_aggregate_history_reads_store_once_window_is_truncated(self, domain):
+        index = TimelineIndex([domain], capacity=1)
+        index.refresh()
+
+        history = collect_aggregate_history([domain], "test::order", "1", index=index)
+
+        assert history["event_count"] == 2
+
+    def test_stats_match_store_scan(self, domain, index):
+        assert collect_timeline_stats([domain], index=index) == collect_timeline_stats(
+            [domain]
+        )
+
+
+class TestObservatoryIndex:
+    def test_routes_catch_up_without_tailer(self, domain):
+        client = TestClient(Observatory(domains=[domain]).app)
+        assert client.get("/api/timeline/stats").json()["total_events"] == 3
+
+        _write(domain, "test::order-3", "evt-3", "corr-3")
+
+        assert client.get("/api/timeline/events/evt-3").status_code == 200
+
+    def test_lifespan_runs_tailer(self, domain):
+        observatory = Observatory(domains=[domain])
+
+        with TestClient(observatory.app) as client:
+            assert observatory.timeline_index.tailing
+            assert client.get("/api/timeline/events").status_code == 200
+
+        assert not observatory.timeline_index.tailing
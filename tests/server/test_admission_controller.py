@@ -0,0 +1,198 @@
+"""Tests for AdmissionController, the engine-wide backpressure gate."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from protean.server import Engine
+from protean.server.admission import NULL_SLOT, AdmissionController
+from protean.server.subscription import BaseSubscription
+
+
+async def _hold(controller: AdmissionController, name: str, count: int, release):
+    """Enter a slot, admit ``count`` messages and hold until ``release`` is set."""
+    async with controller.slot(name) as slot:
+        slot.admit(count)
+        await release.wait()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConfiguration:
+    def test_disabled_without_limits(self):
+        controller = AdmissionController()
+        assert controller.enabled is False
+        assert controller.slot("Handler") is NULL_SLOT
+
+    def test_from_config(self, test_domain):
+        test_domain.config["server"]["admission"] = {
+            "max_in_flight": 10,
+            "quotas": {"Projector": 2},
+            "priorities": {"Handler": 5},
+        }
+
+        controller = AdmissionController.from_config(test_domain)
+
+        assert controller.enabled is True
+        assert controller.max_in_flight == 10
+        assert controller.quotas == {"Projector": 2}
+        assert controller.priorities == {"Handler": 5}
+
+    def test_engine_builds_controller_from_domain_config(self, test_domain):
+        engine = Engine(test_domain, test_mode=True)
+        assert isinstance(engine.admission, AdmissionController)
+        assert engine.admission.enabled is False
+
+
+class TestLimits:
+    async def test_admit_and_release_track_in_flight(self):
+        controller = AdmissionController(max_in_flight=100)
+
+        async with controller.slot("Handler") as slot:
+            slot.admit(7)
+            assert controller.in_flight == 7
+            assert controller.stats()["per_subscription"] == {"Handler": 7}
+
+        assert controller.in_flight == 0
+        assert controller.stats()["per_subscription"] == {}
+
+    async def test_slot_is_released_when_fetch_fails(self):
+        controller = AdmissionController(max_in_flight=100)
+
+        with pytest.raises(RuntimeError):
+            async with controller.slot("Handler"):
+                raise RuntimeError("broker down")
+
+        assert controller.in_flight == 0
+
+    async def test_global_limit_blocks_until_release(self):
+        controller = AdmissionController(max_in_flight=5, pool_check_interval=10)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "A", 5, release))
+        await _settle()
+
+        waiter = asyncio.create_task(_hold(controller, "B", 1, asyncio.Event()))
+        await _settle()
+        assert controller.stats()["waiting"] == 1
+        assert controller.stats()["throttled"] == 1
+
+        release.set()
+        await holder
+        await _settle()
+
+        assert controller.stats()["per_subscription"] == {"B": 1}
+        waiter.cancel()
+
+    async def test_quota_blocks_only_its_subscription(self):
+        controller = AdmissionController(quotas={"Slow": 2}, pool_check_interval=10)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "Slow", 2, release))
+        await _settle()
+
+        blocked = asyncio.create_task(_hold(controller, "Slow", 1, release))
+        other = asyncio.create_task(_hold(controller, "Fast", 1, release))
+        await _settle()
+
+        assert controller.stats()["per_subscription"] == {"Slow": 2, "Fast": 1}
+        assert controller.stats()["waiting"] == 1
+
+        release.set()
+        await asyncio.gather(holder, blocked, other)
+        assert controller.in_flight == 0
+
+    async def test_higher_priority_waiter_goes_first(self):
+        controller = AdmissionController(
+            max_in_flight=1,
+            priorities={"Urgent": 10},
+            pool_check_interval=10,
+        )
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "Holder", 1, release))
+        await _settle()
+
+        low = asyncio.create_task(_hold(controller, "Bulk", 1, asyncio.Event()))
+        await _settle()
+        high = asyncio.create_task(_hold(controller, "Urgent", 1, asyncio.Event()))
+        await _settle()
+
+        release.set()
+        await holder
+        await _settle()
+
+        assert controller.stats()["per_subscription"] == {"Urgent": 1}
+        low.cancel()
+        high.cancel()
+
+    async def test_pool_saturation_pauses_fetching(self):
+        pool = {"size": 10, "checked_out": 10}
+        controller = AdmissionController(
+            pool_saturation=0.9,
+            pool_check_interval=0.01,
+            pool_stats=lambda: [pool, {}],
+        )
+
+        waiter = asyncio.create_task(_hold(controller, "A", 1, asyncio.Event()))
+        await asyncio.sleep(0.03)
+        assert controller.in_flight == 0
+        assert controller.stats()["pool_saturation"] == 1.0
+
+        pool["checked_out"] = 2
+        await asyncio.sleep(0.05)
+
+        assert controller.in_flight == 1
+        waiter.cancel()
+
+    async def test_stop_releases_waiters(self):
+        controller = AdmissionController(max_in_flight=1, pool_check_interval=10)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, "A", 1, release))
+        await _settle()
+        waiter = asyncio.create_task(_hold(controller, "B", 1, release))
+        await _settle()
+
+        controller.stop()
+        await _settle()
+
+        assert controller.stats()["waiting"] == 0
+        assert controller.slot("C") is NULL_SLOT
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+
+class _Subscription(BaseSubscription):
+    subscriber_name = "tests.Projector"
+
+    def __init__(self, engine, batches):
+        super().__init__(engine)
+        self._batches = batches
+        self.seen_in_flight = []
+
+    async def get_next_batch_of_messages(self):
+        return self._batches.pop(0) if self._batches else []
+
+    async def process_batch(self, messages):
+        self.seen_in_flight.append(self.engine.admission.in_flight)
+        return len(messages)
+
+
+class TestSubscriptionIntegration:
+    async def test_tick_charges_batch_while_processing(self):
+        engine = MagicMock()
+        engine.admission = AdmissionController(max_in_flight=100)
+        subscription = _Subscription(engine, [[1, 2, 3]])
+
+        await subscription.tick()
+
+        assert subscription.seen_in_flight == [3]
+        assert engine.admission.in_flight == 0
+
+    async def test_tick_without_controller_is_ungated(self):
+        engine = MagicMock()
+        subscription = _Subscription(engine, [[1]])
+
+        assert subscription.admission_slot() is NULL_SLOT
+        await subscription.tick()
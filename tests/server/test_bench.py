@@ -0,0 +1,227 @@
+"""Tests for the load generator behind ``protean bench``."""
+
+import random
+from typing import Literal
+
+import pytest
+
+from protean import Domain, handle
+from protean.fields import Float, Identifier, Integer, String, ValueObject
+from protean.server.bench import (
+    CommandSynthesizer,
+    configure_adapters,
+    percentiles,
+    run_benchmark,
+)
+from protean.utils.globals import current_domain
+
+
+def build_domain() -> Domain:
+    domain = Domain(name="Bench")
+
+    @domain.value_object
+    class Address:
+        city = String(max_length=10, required=True)
+
+    @domain.aggregate
+    class Order:
+        customer = String(max_length=20, required=True)
+        quantity = Integer(min_value=1, max_value=5)
+
+    @domain.event(part_of=Order)
+    class OrderPlaced:
+        order_id = Identifier(identifier=True)
+        quantity = Integer()
+
+    @domain.command(part_of=Order)
+    class PlaceOrder:
+        order_id = Identifier(identifier=True)
+        customer = String(max_length=20, required=True)
+        quantity = Integer(min_value=1, max_value=5)
+        price = Float(min_value=0.5, max_value=2.0)
+        channel: Literal["web", "store"] = "web"
+        address = ValueObject(Address)
+
+    @domain.command(part_of=Order)
+    class ArchiveOrders:
+        reason = String()
+
+    @domain.command_handler(part_of=Order)
+    class OrderCommands:
+        @handle(PlaceOrder)
+        def place(self, command):
+            order = Order(
+                id=command.order_id,
+                customer=command.customer,
+                quantity=command.quantity,
+            )
+            order.raise_(OrderPlaced(order_id=order.id, quantity=order.quantity))
+            current_domain.repository_for(Order).add(order)
+
+    @domain.event_handler(part_of=Order)
+    class OrderEvents:
+        @handle(OrderPlaced)
+        def placed(self, event):
+            pass
+
+    return domain
+
+
+@pytest.fixture
+def bench_domain():
+    domain = build_domain()
+    configure_adapters(domain, "memory")
+    domain.init(traverse=False)
+    yield domain
+
+    # Memory stores outlive the domain instance; later tests reuse the ids
+    with domain.domain_context():
+        for provider in domain.providers.values():
+            provider._data_reset()
+        domain.event_store.store._data_reset()
+
+
+class TestConfigureAdapters:
+    def test_memory_adapters(self):
+        domain = Domain(name="Bench")
+        configure_adapters(domain, "memory")
+
+        assert domain.config["databases"]["default"] == {"provider": "memory"}
+        assert domain.config["event_store"] == {"provider": "memory"}
+        assert domain.config["brokers"] == {"default": {"provider": "inline"}}
+        assert domain.config["server"]["default_subscription_type"] == "event_store"
+
+    def test_sqlite_adapters_use_workdir(self, tmp_path):
+        domain = Domain(name="Bench")
+        configure_adapters(domain, "sqlite", workdir=str(tmp_path))
+
+        database = domain.config["databases"]["default"]
+        assert database["provider"] == "sqlite"
+        assert str(tmp_path) in database["database_uri"]
+
+    def test_configured_keeps_domain_config(self):
+        domain = Domain(name="Bench")
+        domain.config["databases"]["default"] = {"provider": "postgresql"}
+        configure_adapters(domain, "configured")
+
+        assert domain.config["databases"]["default"] == {"provider": "postgresql"}
+
+    def test_unknown_adapters(self):
+        with pytest.raises(ValueError, match="Unknown adapters"):
+            configure_adapters(Domain(name="Bench"), "mongo")
+
+
+class TestCommandSynthesizer:
+    def test_only_handled_commands_are_generated(self, bench_domain):
+        synthesizer = CommandSynthesizer(bench_domain, random.Random(1))
+        assert [cls.__name__ for cls in synthesizer.command_classes] == ["PlaceOrder"]
+
+    def test_values_respect_field_constraints(self, bench_domain):
+        synthesizer = CommandSynthesizer(bench_domain, random.Random(1), identities=3)
+
+        commands = [command for _, command in zip(range(50), synthesizer)]
+
+        assert len({command.order_id for command in commands}) <= 3
+        for command in commands:
+            assert len(command.customer) <= 20
+            assert command.quantity is None or 1 <= command.quantity <= 5
+            assert command.price is None or 0.5 <= command.price <= 2.0
+            assert command.channel in ("web", "store")
+            assert command.address is None or len(command.address.city) <= 10
+
+    def test_same_seed_same_commands(self, bench_domain):
+        def sample(seed):
+            synthesizer = CommandSynthesizer(bench_domain, random.Random(seed))
+            return [
+                {k: v for k, v in command.to_dict().items() if k != "_metadata"}
+                for _, command in zip(range(5), synthesizer)
+            ]
+
+        assert sample(7) == sample(7)
+        assert sample(7) != sample(8)
+
+    def test_command_filter(self, bench_domain):
+        synthesizer = CommandSynthesizer(
+            bench_domain, random.Random(1), command_names=["ArchiveOrders"]
+        )
+        assert synthesizer.command_classes == []
+
+
+class TestPercentiles:
+    def test_empty(self):
+        assert percentiles([])["p50"] is None
+
+    def test_nearest_rank(self):
+        stats = percentiles([float(n) for n in range(1, 101)])
+        assert (stats["count"], stats["p50"], stats["p90"], stats["p99"]) == (
+            100,
+            50.0,
+            90.0,
+            99.0,
+        )
+        assert stats["max"] == 100.0
+
+
+class TestRunBenchmark:
+    def test_sync_mode(self, bench_domain):
+        report = run_benchmark(bench_domain, commands=5, mode="sync", identities=10_000)
+
+        assert report["mode"] == "sync"
+        assert report["commands"] == 5
+        assert report["errors"] == {}
+        assert report["events"]["count"] == 5
+        assert report["latency_ms"]["PlaceOrder"]["count"] == 5
+        assert "processing" not in report
+
+    def test_async_mode_drains_through_engine(self, bench_domain):
+        report = run_benchmark(
+            bench_domain,
+            commands=5,
+            mode="async",
+            identities=10_000,
+            idle_seconds=0.2,
+        )
+
+        assert report["processing"]["messages"] == 10
+        assert report["processing"]["failed"] == 0
+        assert report["events"]["count"] == 5
+        assert report["latency_ms"]["OrderCommands"]["count"] == 5
+        assert report["latency_ms"]["OrderEvents"]["count"] == 5
+
+    def test_warmup_is_not_measured(self, bench_domain):
+        report = run_benchmark(
+            bench_domain, commands=3, mode="async", warmup=2, idle_seconds=0.2
+        )
+
+        assert report["commands"] == 3
+        assert report["events"]["count"] == 3
+        assert report["processing"]["messages"] == 6
+
+    def test_rejected_commands_are_counted(self, bench_domain):
+        # A single identity makes every later PlaceOrder a duplicate
+        report = run_benchmark(bench_domain, commands=3, mode="sync", identities=1)
+        assert report["errors"] == {"PlaceOrder": 2}
+
+    def test_scenario_replaces_generator(self, bench_domain):
+        seen = []
+
+        def scenario(domain, rng):
+            seen.append(rng.random())
+            return iter([])
+
+        report = run_benchmark(bench_domain, commands=3, mode="sync", scenario=scenario)
+
+        assert len(seen) == 1
+        assert report["commands"] == 0
+
+    def test_no_commands_to_generate(self):
+        domain = Domain(name="Empty")
+        configure_adapters(domain, "memory")
+        domain.init(traverse=False)
+
+        with pytest.raises(ValueError, match="No commands"):
+            run_benchmark(domain, commands=1)
+
+    def test_unknown_mode(self, bench_domain):
+        with pytest.raises(ValueError, match="Unknown mode"):
+            run_benchmark(bench_domain, mode="turbo")
@@ -196,3 +196,27 @@ class TestSubscriptionLevelDedup:
         # No key → nothing in the store
         # (We can't check by key since there's no key, just verify handler ran)
         assert handler_call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_subscription_processes_duplicate_keys_in_batch_once(
+        self, test_domain
+    ):
+        """Two redeliveries of the same command in one batch run the handler
+        once; the second is skipped as already processed."""
+        global handler_call_count
+
+        message = _submit_and_read_back(test_domain, idempotency_key="sub-dup-1")
+
+        engine = Engine(domain=test_domain, test_mode=False)
+        subscription = EventStoreSubscription(
+            engine,
+            "account:command",
+            AccountCommandHandlers,
+            messages_per_tick=10,
+        )
+
+        result = await subscription.process_batch([message, message])
+
+        assert handler_call_count == 1
+        assert result == 2
+        assert test_domain.idempotency_store.check("sub-dup-1")["status"] == "success"
@@ -0,0 +1,229 @@
+"""Tests for earliest-deadline-first scheduling of subscription batches."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.fields import Identifier, String
+from protean.server.deadlines import (
+    DeadlineScheduler,
+    PositionWatermark,
+    payload_deadline,
+)
+from protean.server.engine import Engine
+from protean.server.subscription.event_store_subscription import (
+    EventStoreSubscription,
+)
+from protean.server.subscription.stream_subscription import StreamSubscription
+from protean.utils.eventing import Message
+from protean.utils.mixins import handle
+
+handled = []
+
+
+class User(BaseAggregate):
+    user_id: Identifier(identifier=True)
+    email: String()
+
+
+class Register(BaseCommand):
+    user_id: Identifier(identifier=True)
+    email: String()
+
+
+class UserCommandHandler(BaseCommandHandler):
+    @handle(Register)
+    def register(self, command: Register) -> None:
+        handled.append(command.email)
+
+
+class FakeBroker:
+    def __init__(self):
+        self.acked: list[str] = []
+
+    def ack(self, stream, identifier, consumer_group):
+        self.acked.append(identifier)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(User, is_event_sourced=True)
+    test_domain.register(Register, part_of=User)
+    test_domain.register(UserCommandHandler, part_of=User)
+    test_domain.init(traverse=False)
+
+    handled.clear()
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def _enriched(test_domain, email, deadline=None, user_id=None):
+    command = Register(user_id=user_id or str(uuid4()), email=email)
+    return test_domain._command_processor.enrich(
+        command, asynchronous=True, deadline=deadline
+    )
+
+
+def _stored(test_domain, email, deadline=None, user_id=None):
+    """Append an async command to the event store and read it back."""
+    test_domain.event_store.store.append(
+        _enriched(test_domain, email, deadline, user_id)
+    )
+    return test_domain.event_store.store.read("test::user:command")[-1]
+
+
+class TestDeadlineScheduler:
+    def _schedule(self, scheduler, items):
+        return scheduler.schedule(
+            items,
+            deadline_of=lambda item: item[1],
+            stream_of=lambda item: item[2],
+        )
+
+    def test_earliest_deadline_first(self):
+        items = [("a", _in(30), "s1"), ("b", None, "s2"), ("c", _in(10), "s3")]
+
+        ready, expired = self._schedule(DeadlineScheduler(), items)
+
+        assert [item[0] for item in ready] == ["c", "a", "b"]
+        assert expired == []
+
+    def test_expired_items_are_split_off(self):
+        items = [("a", _in(-1), "s1"), ("b", _in(10), "s2"), ("c", _in(-5), "s3")]
+
+        ready, expired = self._schedule(DeadlineScheduler(), items)
+
+        assert [item[0] for item in ready] == ["b"]
+        assert [item[0] for item in expired] == ["a", "c"]
+
+    def test_shed_counts_are_kept_per_handler(self):
+        scheduler = DeadlineScheduler()
+
+        scheduler.record_shed("A")
+        scheduler.record_shed("A", 2)
+        scheduler.record_shed("B")
+
+        assert scheduler.shed_counts() == {"A": 3, "B": 1}
+
+    def test_stream_order_is_preserved(self):
+        # "b" comes after "a" in stream s1, so "a" is pulled forward with it
+        items = [("a", None, "s1"), ("x", _in(20), "s2"), ("b", _in(10), "s1")]
+
+        ready, _ = self._schedule(DeadlineScheduler(), items)
+
+        assert [item[0] for item in ready] == ["a", "b", "x"]
+
+    def test_disabled_scheduler_keeps_arrival_order_but_sheds(self):
+        items = [("a", _in(30), "s1"), ("b", _in(-1), "s2"), ("c", _in(10), "s3")]
+
+        ready, expired = self._schedule(DeadlineScheduler(enabled=False), items)
+
+        assert [item[0] for item in ready] == ["a", "c"]
+        assert [item[0] for item in expired] == ["b"]
+
+    def test_built_from_config(self, test_domain):
+        test_domain.config["server"]["deadline_scheduling"] = False
+        assert DeadlineScheduler.from_config(test_domain).enabled is False
+
+
+class TestPositionWatermark:
+    def test_advances_only_over_contiguous_completions(self):
+        watermark = PositionWatermark([5, 6, 7])
+
+        assert watermark.complete(7) is None
+        assert watermark.complete(5) == 5
+        assert watermark.complete(6) == 7
+
+
+class TestPayloadDeadline:
+    def test_reads_serialized_deadline(self, test_domain):
+        deadline = _in(60)
+        payload = Message.from_domain_object(
+            _enriched(test_domain, "john@example.com", deadline)
+        ).to_dict()
+
+        assert payload_deadline(payload) == deadline
+
+    def test_missing_or_malformed_deadline(self):
+        assert payload_deadline({"metadata": {"headers": {}}}) is None
+        assert payload_deadline({"metadata": {"headers": {"deadline": "?"}}}) is None
+        assert payload_deadline({}) is None
+
+
+class TestEventStoreSubscription:
+    async def test_batch_is_handled_earliest_deadline_first(self, test_domain):
+        messages = [
+            _stored(test_domain, "late@example.com", _in(60)),
+            _stored(test_domain, "none@example.com"),
+            _stored(test_domain, "soon@example.com", _in(5)),
+        ]
+        engine = Engine(domain=test_domain, test_mode=True)
+        subscription = EventStoreSubscription(
+            engine, "test::user:command", UserCommandHandler
+        )
+
+        result = await subscription.process_batch(messages)
+
+        assert result == 3
+        assert handled == ["soon@example.com", "late@example.com", "none@example.com"]
+        assert subscription.current_position == max(
+            message.metadata.event_store.global_position for message in messages
+        )
+
+    async def test_expired_commands_are_shed_and_counted(self, test_domain):
+        fresh = _stored(test_domain, "fresh@example.com", _in(60))
+        stale = _stored(test_domain, "stale@example.com", _in(0.05))
+        await asyncio.sleep(0.1)
+
+        engine = Engine(domain=test_domain, test_mode=True)
+        subscription = EventStoreSubscription(
+            engine, "test::user:command", UserCommandHandler
+        )
+
+        result = await subscription.process_batch([fresh, stale])
+
+        assert result == 2
+        assert handled == ["fresh@example.com"]
+        assert engine.deadlines.shed_counts() == {"UserCommandHandler": 1}
+        assert (
+            subscription.current_position == stale.metadata.event_store.global_position
+        )
+
+
+class TestStreamSubscription:
+    async def test_expired_payloads_are_acked_without_deserializing(self, test_domain):
+        fresh = Message.from_domain_object(
+            _enriched(test_domain, "fresh@example.com", _in(60))
+        ).to_dict()
+        stale = Message.from_domain_object(
+            _enriched(test_domain, "stale@example.com", _in(60))
+        ).to_dict()
+        stale["metadata"]["headers"]["deadline"] = _in(-1).isoformat()
+
+        engine = Engine(domain=test_domain, test_mode=True)
+        subscription = StreamSubscription(
+            engine=engine,
+            stream_category="test::user:command",
+            handler=UserCommandHandler,
+        )
+        subscription.broker = FakeBroker()
+
+        with patch.object(
+            Message, "deserialize", wraps=Message.deserialize
+        ) as deserialize:
+            result = await subscription.process_batch([("1-0", fresh), ("2-0", stale)])
+
+        assert result == 2
+        assert handled == ["fresh@example.com"]
+        assert deserialize.call_count == 1
+        assert sorted(subscription.broker.acked) == ["1-0", "2-0"]
+        assert engine.deadlines.shed_counts() == {"UserCommandHandler": 1}
@@ -0,0 +1,402 @@
+"""Tests for the graceful drain of subscriptions on shutdown."""
+
+import asyncio
+import signal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from protean.adapters.broker.redis import DRAINING_MARK_TTL_MS, RedisBroker
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.fields import Integer, String
+from protean.server import Engine
+from protean.server.drain import DrainPolicy
+from protean.server.outbox_processor import OutboxProcessor
+from protean.server.subscription import BaseSubscription
+from protean.server.subscription.stream_subscription import StreamSubscription
+from protean.server.supervisor import Supervisor
+from protean.utils.eventing import DomainMeta, MessageHeaders, Metadata
+from protean.utils.mixins import handle
+from protean.utils.outbox import Outbox, OutboxStatus
+
+
+class Account(BaseAggregate):
+    name: String()
+    balance: Integer(default=0)
+
+
+class AccountOpened(BaseEvent):
+    name: String()
+
+
+class Projector(BaseEventHandler):
+    @handle(AccountOpened)
+    def on_opened(self, event: AccountOpened) -> None:
+        pass
+
+
+class _Subscription(BaseSubscription):
+    """Subscription whose batches take ``batch_seconds`` to process."""
+
+    subscriber_name = "TestSubscription"
+
+    def __init__(self, engine, batch_seconds: float):
+        super().__init__(engine, messages_per_tick=1, tick_interval=0)
+        self.batch_seconds = batch_seconds
+        self.started = asyncio.Event()
+        self.completed = 0
+        self.cleaned_up = False
+
+    async def get_next_batch_of_messages(self):
+        return [1]
+
+    async def process_batch(self, messages):
+        self.started.set()
+        await asyncio.sleep(self.batch_seconds)
+        self.completed += 1
+        return len(messages)
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+def _engine(timeout_seconds: float = 10.0, handoff: bool = True):
+    engine = MagicMock()
+    engine.loop = asyncio.get_running_loop()
+    engine.shutting_down = False
+    engine.drain = DrainPolicy(timeout_seconds=timeout_seconds, handoff=handoff)
+    return engine
+
+
+class TestDrainPolicy:
+    def test_defaults(self, test_domain):
+        policy = DrainPolicy.from_config(test_domain)
+
+        assert policy.timeout_seconds == 10.0
+        assert policy.handoff is True
+        assert policy.rolling is False
+
+    def test_reads_drain_section(self, test_domain):
+        test_domain.config["server"]["drain"] = {
+            "timeout_seconds": "not-a-number",
+            "handoff": False,
+            "rolling": True,
+        }
+        policy = DrainPolicy.from_config(test_domain)
+
+        assert policy.timeout_seconds == 10.0
+        assert policy.handoff is False
+        assert policy.rolling is True
+
+    def test_engine_builds_policy(self, test_domain):
+        test_domain.config["server"]["drain"] = {"timeout_seconds": 3}
+        engine = Engine(test_domain, test_mode=True)
+
+        assert engine.drain.timeout_seconds == 3.0
+
+
+class TestSubscriptionDrain:
+    async def test_shutdown_waits_for_in_flight_batch(self):
+        subscription = _Subscription(_engine(), batch_seconds=0.2)
+        subscription._poll_task = asyncio.create_task(subscription.poll())
+        await subscription.started.wait()
+
+        await subscription.shutdown()
+
+        assert subscription.completed == 1
+        assert subscription._poll_task.done()
+        assert subscription.cleaned_up is True
+
+    async def test_shutdown_cancels_batch_after_timeout(self, caplog):
+        subscription = _Subscription(_engine(timeout_seconds=0.05), batch_seconds=10)
+        subscription._poll_task = asyncio.create_task(subscription.poll())
+        await subscription.started.wait()
+
+        await subscription.shutdown()
+
+        assert subscription.completed == 0
+        assert subscription._poll_task.done()
+        assert subscription.cleaned_up is True
+        assert "subscription.drain_timeout" in caplog.text
+
+    async def test_shutdown_without_poll_task_only_cleans_up(self):
+        subscription = _Subscription(_engine(), batch_seconds=0)
+
+        await subscription.shutdown()
+
+        assert subscription.keep_going is False
+        assert subscription.cleaned_up is True
+
+
+class TestStreamHandoff:
+    @pytest.fixture
+    def subscription(self, test_domain):
+        test_domain.register(Account)
+        test_domain.register(AccountOpened, part_of=Account)
+        test_domain.register(Projector, part_of=Account)
+        test_domain.init(traverse=False)
+        engine = Engine(test_domain, test_mode=True)
+        subscription = StreamSubscription(engine, "user", Projector)
+        subscription.consumer_name = "Projector-host-1-abc123"
+        subscription.consumer_group = "tests.Projector"
+        subscription.broker = MagicMock()
+        subscription.broker.release_pending.return_value = 2
+        subscription.broker.claim_released.return_value = 0
+        return subscription
+
+    async def test_cleanup_releases_pending_messages(self, subscription):
+        await subscription.cleanup()
+
+        subscription.broker.release_pending.assert_called_once_with(
+            "user", "tests.Projector", "Projector-host-1-abc123"
+        )
+
+    async def test_cleanup_keeps_messages_when_handoff_is_off(self, subscription):
+        subscription.engine.drain = DrainPolicy(handoff=False)
+
+        await subscription.cleanup()
+
+        subscription.broker.release_pending.assert_not_called()
+
+    async def test_shutdown_marks_consumer_as_draining(self, subscription):
+        await subscription.shutdown()
+
+        subscription.broker.mark_draining.assert_called_once_with(
+            "user", "tests.Projector", "Projector-host-1-abc123"
+        )
+
+    def test_engine_announces_drain_to_subscriptions(self, subscription):
+        engine = subscription.engine
+        engine._subscriptions = {"Projector": subscription}
+
+        engine.announce_drain()
+
+        subscription.broker.mark_draining.assert_called_once_with(
+            "user", "tests.Projector", "Projector-host-1-abc123"
+        )
+        assert subscription.keep_going is True
+
+    async def test_initialize_claims_released_messages(self, subscription, test_domain):
+        broker = subscription.broker
+        with patch.object(test_domain.brokers, "get", return_value=broker):
+            await subscription.initialize()
+
+        broker.claim_released.assert_called_once_with(
+            "user", "tests.Projector", "Projector-host-1-abc123"
+        )
+
+
+def _redis_broker(consumers, pending_batches, draining=()):
+    broker = RedisBroker.__new__(RedisBroker)
+    broker.redis_instance = MagicMock()
+    broker.redis_instance.xinfo_consumers.return_value = consumers
+    broker.redis_instance.zrangebyscore.return_value = [
+        name.encode() for name in draining
+    ]
+    broker.redis_instance.xpending_range.side_effect = [
+        [{"message_id": message_id.encode()} for message_id in batch]
+        for batch in pending_batches
+    ]
+    broker.redis_instance.xclaim.side_effect = lambda *args, **kwargs: args[4]
+    return broker
+
+
+class TestRedisRelease:
+    def test_hands_pending_messages_to_most_active_peer(self):
+        broker = _redis_broker(
+            consumers=[
+                {"name": "me", "pending": 2, "idle": 0},
+                {"name": "busy", "pending": 0, "idle": 50},
+                {"name": "recent", "pending": 0, "idle": 5},
+                {"name": "gone", "pending": 0, "idle": 3_600_000},
+            ],
+            pending_batches=[["1-0", "2-0"], []],
+        )
+
+        assert broker.release_pending("user", "group", "me") == 2
+
+        broker.redis_instance.xclaim.assert_called_once_with(
+            "user", "group", "recent", 0, ["1-0", "2-0"], justid=True
+        )
+        broker.redis_instance.xgroup_delconsumer.assert_called_once_with(
+            "user", "group", "me"
+        )
+
+    def test_skips_peers_that_are_draining(self):
+        broker = _redis_broker(
+            consumers=[
+                {"name": "me", "pending": 1, "idle": 0},
+                {"name": "stopping", "pending": 0, "idle": 1},
+                {"name": "staying", "pending": 0, "idle": 20},
+            ],
+            pending_batches=[["1-0"], []],
+            draining=["stopping"],
+        )
+
+        assert broker.release_pending("user", "group", "me") == 1
+
+        broker.redis_instance.xclaim.assert_called_once_with(
+            "user", "group", "staying", 0, ["1-0"], justid=True
+        )
+
+    def test_mark_draining_records_an_expiring_mark(self):
+        broker = _redis_broker(consumers=[], pending_batches=[])
+        pipe = broker.redis_instance.pipeline.return_value
+
+        broker.mark_draining("user", "group", "me")
+
+        key, marks = pipe.zadd.call_args.args
+        assert key == "user:group:draining"
+        assert list(marks) == ["me"]
+        pipe.pexpire.assert_called_once_with(key, DRAINING_MARK_TTL_MS)
+        pipe.execute.assert_called_once()
+
+    def test_parks_messages_without_an_active_peer(self):
+        broker = _redis_broker(
+            consumers=[{"name": "me", "pending": 1, "idle": 0}],
+            pending_batches=[["1-0"], []],
+        )
+
+        assert broker.release_pending("user", "group", "me") == 1
+
+        broker.redis_instance.xclaim.assert_called_once_with(
+            "user", "group", "group:handoff", 0, ["1-0"], justid=True
+        )
+
+    def test_claims_parked_messages(self):
+        broker = _redis_broker(consumers=[], pending_batches=[["1-0"], []])
+
+        assert broker.claim_released("user", "group", "new") == 1
+
+        broker.redis_instance.xclaim.assert_called_once_with(
+            "user", "group", "new", 0, ["1-0"], justid=True
+        )
+        broker.redis_instance.xgroup_delconsumer.assert_called_once_with(
+            "user", "group", "group:handoff"
+        )
+
+    def test_keeps_consumer_when_messages_cannot_be_moved(self):
+        broker = _redis_broker(consumers=[], pending_batches=[["1-0"], ["1-0"]])
+        broker.redis_instance.xclaim.side_effect = None
+        broker.redis_instance.xclaim.return_value = []
+
+        assert broker.release_pending("user", "group", "me") == 0
+        broker.redis_instance.xgroup_delconsumer.assert_not_called()
+
+
+@pytest.mark.database
+class TestOutboxRelease:
+    @pytest.fixture
+    def outbox_repo(self, test_domain):
+        test_domain.config["enable_outbox"] = True
+        test_domain.config["server"]["default_subscription_type"] = "stream"
+        test_domain.register(Account)
+        test_domain.register(AccountOpened, part_of=Account)
+        test_domain.init(traverse=False)
+        return test_domain._get_outbox_repo("default")
+
+    def _claim(self, outbox_repo, count):
+        for i in range(count):
+            metadata = Metadata(
+                headers=MessageHeaders(id=f"msg-{i}", type="AccountOpened"),
+                domain=DomainMeta(stream_category="account"),
+            )
+            outbox_repo.add(
+                Outbox.create_message(
+                    message_id=f"msg-{i}",
+                    stream_name="account",
+                    message_type="AccountOpened",
+                    data={"name": f"Account {i}"},
+                    metadata=metadata,
+                )
+            )
+        return outbox_repo.claim_batch("worker-1", count)
+
+    def test_release_returns_claim_to_pending(self, outbox_repo):
+        (message,) = self._claim(outbox_repo, 1)
+
+        assert message.release("worker-2") is False
+        assert message.release("worker-1") is True
+        assert message.status == OutboxStatus.PENDING.value
+        assert message.locked_by is None
+        assert message.retry_count == 0
+
+    async def test_cleanup_releases_unprocessed_claims(self, test_domain, outbox_repo):
+        messages = self._claim(outbox_repo, 3)
+        engine = Engine(test_domain, test_mode=True)
+        processor = OutboxProcessor(engine, "default", "default", worker_id="worker-1")
+        processor.outbox_repo = outbox_repo
+        processor._unprocessed = {message.id for message in messages[1:]}
+
+        await processor.cleanup()
+
+        statuses = {
+            message.id: outbox_repo.get(message.id).status for message in messages
+        }
+        assert statuses[messages[0].id] == OutboxStatus.PROCESSING.value
+        assert statuses[messages[1].id] == OutboxStatus.PENDING.value
+        assert statuses[messages[2].id] == OutboxStatus.PENDING.value
+        assert processor._unprocessed == set()
+
+
+class TestRollingSupervisor:
+    def _worker(self, pid, events):
+        worker = MagicMock()
+        worker.pid = pid
+        worker.name = f"worker-{pid}"
+        alive = [True]
+        worker.is_alive.side_effect = lambda: alive[0]
+
+        def join(timeout=None):
+            events.append(("join", pid))
+            alive[0] = False
+
+        worker.join.side_effect = join
+        return worker
+
+    def test_rolling_drain_is_off_by_default(self):
+        assert Supervisor(domain_path="d", num_workers=2).rolling_drain is False
+
+    def test_workers_are_drained_one_at_a_time(self):
+        events = []
+        supervisor = Supervisor(domain_path="d", num_workers=2, rolling_drain=True)
+        supervisor.workers = [self._worker(1, events), self._worker(2, events)]
+
+        with patch("os.kill", side_effect=lambda pid, sig: events.append((sig, pid))):
+            supervisor._shutdown_workers()
+
+        assert events == [
+            (signal.SIGUSR1, 1),
+            (signal.SIGUSR1, 2),
+            (signal.SIGTERM, 1),
+            ("join", 1),
+            (signal.SIGTERM, 2),
+            ("join", 2),
+        ]
+        assert supervisor.workers == []
+
+    def test_without_rolling_drain_all_workers_are_signalled_first(self):
+        events = []
+        supervisor = Supervisor(domain_path="d", num_workers=2, rolling_drain=False)
+        supervisor.workers = [self._worker(1, events), self._worker(2, events)]
+
+        with patch("os.kill", side_effect=lambda pid, sig: events.append((sig, pid))):
+            supervisor._shutdown_workers()
+
+        assert events[:2] == [(signal.SIGTERM, 1), (signal.SIGTERM, 2)]
+
+    def test_rolling_drain_shares_one_deadline(self):
+        supervisor = Supervisor(domain_path="d", num_workers=2, rolling_drain=True)
+        supervisor.workers = [self._worker(1, []), self._worker(2, [])]
+        deadlines = []
+
+        def reap(worker, deadline):
+            deadlines.append(deadline)
+            supervisor.workers.remove(worker)
+
+        with patch("os.kill"), patch.object(supervisor, "_reap", side_effect=reap):
+            supervisor._shutdown_workers()
+
+        assert len(set(deadlines)) == 1
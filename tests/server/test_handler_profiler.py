@@ -0,0 +1,218 @@
+"""Tests for HandlerProfiler, the opt-in sampling profiler of the Engine."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from protean.core.subscriber import BaseSubscriber
+from protean.server import Engine
+from protean.server.profiler import (
+    HandlerProfiler,
+    diff_snapshots,
+    merge_snapshots,
+    profile_key,
+    read_snapshots,
+    summarize,
+    to_flamegraph,
+)
+
+
+def _domain(name="Test"):
+    domain = MagicMock()
+    domain.name = name
+    return domain
+
+
+def _inner_work(profiler):
+    profiler.sample()
+
+
+def _handler_body(profiler):
+    _inner_work(profiler)
+
+
+class TestDisabled:
+    def test_disabled_by_default(self, test_domain):
+        profiler = HandlerProfiler.from_config(test_domain)
+        assert profiler.enabled is False
+
+    def test_profile_is_noop_when_disabled(self):
+        profiler = HandlerProfiler(_domain())
+
+        with profiler.profile("Handler", "Event"):
+            pass
+
+        profiler.start()
+        assert profiler._sampler is None
+        assert profiler.snapshot()["calls"] == []
+
+
+class TestAccounting:
+    def test_records_calls_per_handler_and_message_type(self):
+        profiler = HandlerProfiler(_domain(), enabled=True)
+
+        for _ in range(3):
+            with profiler.profile("OrderProjector", "OrderPlaced"):
+                pass
+        with profiler.profile("OrderProjector", "OrderShipped"):
+            pass
+
+        handlers = summarize(profiler.snapshot())
+
+        assert handlers["OrderProjector"]["count"] == 4
+        assert handlers["OrderProjector"]["message_types"]["OrderPlaced"]["count"] == 3
+        assert handlers["OrderProjector"]["wall_ms"] >= 0
+        assert handlers["OrderProjector"]["cpu_ms"] >= 0
+
+    def test_records_call_when_handler_raises(self):
+        profiler = HandlerProfiler(_domain(), enabled=True)
+
+        with pytest.raises(ValueError):
+            with profiler.profile("Handler", "Event"):
+                raise ValueError("boom")
+
+        assert profiler.snapshot()["calls"][0]["count"] == 1
+        assert profiler._active == {}
+
+    def test_sample_cuts_stack_at_handler_boundary(self):
+        profiler = HandlerProfiler(_domain(), enabled=True)
+
+        with profiler.profile("Handler", "Event"):
+            _handler_body(profiler)
+
+        [stack] = profiler.snapshot()["stacks"]
+        names = [frame.split(" ")[0] for frame in stack["frames"]]
+
+        assert names[:2] == ["_handler_body", "_inner_work"]
+        assert "test_sample_cuts_stack_at_handler_boundary" not in " ".join(names)
+
+    def test_sample_outside_handlers_records_nothing(self):
+        profiler = HandlerProfiler(_domain(), enabled=True)
+        profiler.sample()
+        assert profiler.snapshot()["samples"] == 0
+
+    def test_distinct_stacks_are_capped(self):
+        profiler = HandlerProfiler(_domain(), enabled=True, max_stacks=1)
+
+        profiler._record_stack(("Handler", "Event"), ("a",))
+        profiler._record_stack(("Handler", "Event"), ("b",))
+        profiler._record_stack(("Handler", "Event"), ("c",))
+
+        frames = {
+            tuple(s["frames"]): s["samples"] for s in profiler.snapshot()["stacks"]
+        }
+        assert frames == {("a",): 1, ("[truncated]",): 2}
+
+
+class TestSnapshots:
+    def _snapshot(self, worker, count, samples):
+        return {
+            "worker": worker,
+            "samples": samples,
+            "calls": [
+                {
+                    "handler": "H",
+                    "message_type": "E",
+                    "count": count,
+                    "wall_ms": 10.0 * count,
+                    "cpu_ms": 5.0 * count,
+                }
+            ],
+            "stacks": [
+                {
+                    "handler": "H",
+                    "message_type": "E",
+                    "frames": ["f", "g"],
+                    "samples": samples,
+                }
+            ],
+        }
+
+    def test_merge_sums_workers(self):
+        merged = merge_snapshots(
+            [self._snapshot("w1", 2, 4), self._snapshot("w2", 3, 6)]
+        )
+
+        assert merged["workers"] == ["w1", "w2"]
+        assert merged["samples"] == 10
+        assert merged["calls"][0]["count"] == 5
+        assert merged["stacks"][0]["samples"] == 10
+
+    def test_diff_reports_window(self):
+        before = merge_snapshots([self._snapshot("w1", 2, 4)])
+        after = merge_snapshots([self._snapshot("w1", 5, 9)])
+
+        window = diff_snapshots(before, after)
+
+        assert window["calls"][0]["count"] == 3
+        assert window["calls"][0]["wall_ms"] == pytest.approx(30.0)
+        assert window["stacks"][0]["samples"] == 5
+
+    def test_diff_drops_unchanged_entries(self):
+        snapshot = merge_snapshots([self._snapshot("w1", 2, 4)])
+        window = diff_snapshots(snapshot, snapshot)
+        assert window["calls"] == []
+        assert window["stacks"] == []
+
+    def test_flamegraph_tree(self):
+        snapshot = self._snapshot("w1", 1, 3)
+        snapshot["stacks"].append(
+            {"handler": "H", "message_type": "E", "frames": ["f", "h"], "samples": 2}
+        )
+
+        tree = to_flamegraph(snapshot)
+
+        assert tree["name"] == "all" and tree["value"] == 5
+        [handler] = tree["children"]
+        [message_type] = handler["children"]
+        [f] = message_type["children"]
+        assert (handler["name"], message_type["name"], f["name"]) == ("H", "E", "f")
+        assert {c["name"]: c["value"] for c in f["children"]} == {"g": 3, "h": 2}
+
+    def test_flamegraph_filters_by_handler(self):
+        assert to_flamegraph(self._snapshot("w1", 1, 3), handler="Other")["value"] == 0
+
+
+class TestPublishing:
+    def test_publish_writes_snapshot_with_ttl(self):
+        domain = _domain("Shop")
+        redis = MagicMock()
+        domain.brokers.get.return_value.redis_instance = redis
+        profiler = HandlerProfiler(
+            domain, enabled=True, publish_interval=5.0, worker="w1"
+        )
+
+        profiler.publish()
+
+        key, payload = redis.set.call_args.args
+        assert key == profile_key("Shop", "w1")
+        assert json.loads(payload)["worker"] == "w1"
+        assert redis.set.call_args.kwargs["ex"] == 15
+
+    def test_read_snapshots_skips_malformed_entries(self):
+        redis = MagicMock()
+        redis.scan_iter.return_value = ["k1", "k2"]
+        redis.get.side_effect = [json.dumps({"worker": "w1"}), "not json"]
+
+        assert read_snapshots(redis, "Shop") == [{"worker": "w1"}]
+        assert redis.scan_iter.call_args.kwargs["match"] == "protean:profile:Shop:*"
+
+
+class ProfiledSubscriber(BaseSubscriber):
+    def __call__(self, data: dict):
+        pass
+
+
+class TestEngineIntegration:
+    @pytest.mark.asyncio
+    async def test_engine_profiles_subscriber_calls(self, test_domain):
+        test_domain.config["server"]["profiling"] = {"enabled": True}
+        test_domain.register(ProfiledSubscriber, stream="test_stream")
+        test_domain.init(traverse=False)
+
+        engine = Engine(domain=test_domain, test_mode=True)
+        await engine.handle_broker_message(ProfiledSubscriber, {"foo": "bar"})
+
+        handlers = summarize(engine.profiler.snapshot())
+        assert handlers["ProfiledSubscriber"]["count"] == 1
@@ -0,0 +1,227 @@
+"""Tests for MemoryProfiler, the opt-in tracemalloc sampling of the Engine."""
+
+import asyncio
+import json
+import tracemalloc
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.event import BaseEvent
+from protean.core.event_handler import BaseEventHandler
+from protean.fields import Identifier, String
+from protean.server import Engine
+from protean.server.memory import MemoryProfiler
+from protean.utils.mixins import handle
+
+retained = []
+
+
+class User(BaseAggregate):
+    name: String()
+
+
+class Registered(BaseEvent):
+    user_id: Identifier()
+    name: String()
+
+
+class LeakyProjector(BaseEventHandler):
+    @handle(Registered)
+    def on_registered(self, event: Registered) -> None:
+        retained.append(bytearray(64 * 1024))
+
+
+def _domain(name="Test"):
+    domain = MagicMock()
+    domain.name = name
+    return domain
+
+
+def _leak(size: int = 64 * 1024) -> None:
+    retained.append(bytearray(size))
+
+
+@pytest.fixture(autouse=True)
+def stop_tracing():
+    retained.clear()
+    yield
+    retained.clear()
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def profiler():
+    profiler = MemoryProfiler(
+        _domain(),
+        enabled=True,
+        sample_rate=1.0,
+        leak_window=3,
+        leak_threshold_bytes=128 * 1024,
+    )
+    profiler.start()
+    yield profiler
+    profiler.stop()
+
+
+class TestDisabled:
+    def test_disabled_by_default(self, test_domain):
+        profiler = MemoryProfiler.from_config(test_domain)
+        assert profiler.enabled is False
+
+    def test_track_is_noop_when_disabled(self):
+        profiler = MemoryProfiler(_domain())
+
+        with profiler.track("Handler"):
+            _leak()
+
+        profiler.start()
+        assert tracemalloc.is_tracing() is False
+        assert profiler.snapshot()["handlers"] == []
+
+
+class TestSampling:
+    def test_records_net_allocations_and_sites(self, profiler):
+        with profiler.track("LeakyProjector"):
+            _leak()
+
+        (entry,) = profiler.snapshot()["handlers"]
+        assert entry["handler"] == "LeakyProjector"
+        assert entry["invocations"] == 1
+        assert entry["samples"] == 1
+        assert entry["net_bytes"] >= 64 * 1024
+
+        top = entry["top_sites"][0]
+        assert "test_memory_profiler.py" in top["site"]
+        assert top["net_bytes"] >= 64 * 1024
+
+    def test_freed_allocations_are_not_retained(self, profiler):
+        with profiler.track("CleanProjector"):
+            bytearray(256 * 1024)
+
+        (entry,) = profiler.snapshot()["handlers"]
+        assert entry["net_bytes"] < 16 * 1024
+
+    def test_unsampled_calls_are_only_counted(self, profiler):
+        profiler.sample_rate = 0.0
+
+        with profiler.track("LeakyProjector"):
+            _leak()
+
+        (entry,) = profiler.snapshot()["handlers"]
+        assert entry["invocations"] == 1
+        assert entry["samples"] == 0
+
+    def test_stop_only_stops_tracing_it_started(self):
+        tracemalloc.start()
+        profiler = MemoryProfiler(_domain(), enabled=True)
+        profiler.start()
+        profiler.stop()
+
+        assert tracemalloc.is_tracing() is True
+
+
+class TestLeakDetection:
+    def test_flags_handlers_that_keep_growing(self, profiler, caplog):
+        for _ in range(2):
+            with profiler.track("LeakyProjector"):
+                _leak()
+        assert profiler.suspected_leaks() == []
+
+        with profiler.track("LeakyProjector"):
+            _leak()
+
+        assert profiler.suspected_leaks() == ["LeakyProjector"]
+        assert "memory_profiler.suspected_leak" in caplog.text
+
+    def test_stable_handlers_are_not_flagged(self, profiler):
+        for _ in range(5):
+            with profiler.track("CleanProjector"):
+                bytearray(64 * 1024)
+
+        assert profiler.suspected_leaks() == []
+        (entry,) = profiler.snapshot()["handlers"]
+        assert entry["suspected_leak"] is False
+
+
+class TestConfig:
+    def test_reads_memory_profiling_section(self, test_domain):
+        test_domain.config["server"]["memory_profiling"] = {
+            "enabled": True,
+            "sample_rate": 0.5,
+            "top_sites": 3,
+            "leak_window": "not-a-number",
+        }
+        profiler = MemoryProfiler.from_config(test_domain)
+
+        assert profiler.enabled is True
+        assert profiler.sample_rate == 0.5
+        assert profiler.top_sites == 3
+        assert profiler.leak_window == 20
+
+
+class TestEngineIntegration:
+    @pytest.fixture
+    def engine(self, test_domain):
+        test_domain.register(User)
+        test_domain.register(Registered, part_of=User)
+        test_domain.register(LeakyProjector, part_of=User)
+        test_domain.init(traverse=False)
+        test_domain.config["server"]["memory_profiling"] = {
+            "enabled": True,
+            "sample_rate": 1.0,
+        }
+        test_domain.config["server"]["health"]["port"] = 0
+
+        engine = Engine(test_domain, test_mode=True)
+        engine.memory_profiler.start()
+        yield engine
+        engine.memory_profiler.stop()
+
+    async def test_handle_message_is_tracked(self, engine, test_domain):
+        user = User(name="John")
+        user.raise_(Registered(user_id=str(uuid4()), name="John"))
+        test_domain.repository_for(User).add(user)
+        (message,) = test_domain.event_store.store.read(f"test::user-{user.id}")
+
+        assert await engine.handle_message(LeakyProjector, message) is True
+
+        (entry,) = engine.memory_profiler.snapshot()["handlers"]
+        assert entry["handler"] == "LeakyProjector"
+        assert entry["samples"] == 1
+        sites = {site["site"]: site["net_bytes"] for site in entry["top_sites"]}
+        assert any(
+            "test_memory_profiler.py" in site and size >= 64 * 1024
+            for site, size in sites.items()
+        )
+
+    def test_health_server_serves_the_report(self, engine):
+        health_server = engine._health_server
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(health_server.start())
+            port = health_server._server.sockets[0].getsockname()[1]
+
+            async def _fetch():
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"GET /memory HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                await writer.drain()
+                data = await reader.read(65536)
+                writer.close()
+                await writer.wait_closed()
+                return data
+
+            engine.memory_profiler.enabled = False
+            assert b"404 Not Found" in loop.run_until_complete(_fetch())
+
+            engine.memory_profiler.enabled = True
+            response = loop.run_until_complete(_fetch())
+            header, _, body = response.partition(b"\r\n\r\n")
+            assert b"200 OK" in header
+            assert json.loads(body)["tracing"] is True
+        finally:
+            loop.run_until_complete(health_server.stop())
+            loop.close()
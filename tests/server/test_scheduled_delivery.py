@@ -0,0 +1,385 @@
+"""Tests for scheduled commands, schedule stores and the engine timer wheel."""
+
+import math
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean.adapters.scheduler import MemoryScheduleStore
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.exceptions import ConfigurationError, IncorrectUsageError
+from protean.fields import Identifier, String
+from protean.port.scheduler import ScheduledMessage
+from protean.server.deadlines import payload_deadline
+from protean.server.engine import Engine
+from protean.server.scheduler import ScheduledDelivery, TimerWheel
+from protean.server.subscription.stream_subscription import StreamSubscription
+from protean.utils.mixins import handle
+
+handled = []
+
+
+class User(BaseAggregate):
+    user_id: Identifier(identifier=True)
+    email: String()
+
+
+class Register(BaseCommand):
+    user_id: Identifier(identifier=True)
+    email: String()
+
+
+class UserCommandHandler(BaseCommandHandler):
+    @handle(Register)
+    def register(self, command: Register) -> None:
+        handled.append(command.email)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(User, is_event_sourced=True)
+    test_domain.register(Register, part_of=User)
+    test_domain.register(UserCommandHandler, part_of=User)
+    test_domain.init(traverse=False)
+
+    handled.clear()
+
+
+@pytest.fixture
+def memory_scheduler(test_domain):
+    test_domain.config["scheduler"]["backend"] = "memory"
+    test_domain._schedule_store_built = False
+    yield test_domain.schedule_store
+    test_domain.schedule_store.flush()
+    test_domain._schedule_store = None
+    test_domain._schedule_store_built = False
+
+
+def _at(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def _entry(id: str, seconds: float) -> ScheduledMessage:
+    return ScheduledMessage(
+        id=id, stream="s", payload={"n": id}, deliver_at=_at(seconds)
+    )
+
+
+def _register(email: str) -> Register:
+    return Register(user_id=str(uuid4()), email=email)
+
+
+class TestTimerWheel:
+    def test_fires_timers_in_their_tick(self):
+        wheel = TimerWheel(tick=0.1, slots=8, levels=2, now=0.0)
+        wheel.add("a", 0.25, "A")
+        wheel.add("b", 0.5, "B")
+
+        assert wheel.advance(0.2) == []
+        assert wheel.advance(0.3) == [("a", "A")]
+        assert wheel.advance(0.5) == [("b", "B")]
+        assert len(wheel) == 0
+
+    def test_cascades_timers_from_higher_levels(self):
+        wheel = TimerWheel(tick=1.0, slots=4, levels=3, now=0.0)
+        for when in (3, 5, 13, 17, 40):
+            wheel.add(when, float(when), when)
+
+        fired = []
+        for now in range(0, 45):
+            fired.extend(key for key, _ in wheel.advance(float(now)))
+            assert all(key <= now for key in fired)
+        assert fired == [3, 5, 13, 17, 40]
+
+    def test_parks_timers_beyond_span(self):
+        wheel = TimerWheel(tick=1.0, slots=4, levels=2, now=0.0)
+        assert wheel.span == 16.0
+        wheel.add("far", 50.0, "F")
+
+        assert wheel.advance(49.0) == []
+        assert wheel.advance(50.0) == [("far", "F")]
+
+    def test_cancel_and_replace(self):
+        wheel = TimerWheel(tick=1.0, slots=4, levels=2, now=0.0)
+        wheel.add("a", 2.0, "A")
+        wheel.add("b", 2.0, "B")
+        wheel.add("b", 6.0, "B2")
+
+        assert wheel.cancel("a") is True
+        assert wheel.cancel("a") is False
+        assert wheel.advance(5.0) == []
+        assert wheel.advance(6.0) == [("b", "B2")]
+
+    def test_past_timers_fire_on_next_advance(self):
+        wheel = TimerWheel(tick=1.0, slots=4, levels=2, now=0.0)
+        wheel.advance(10.0)
+        wheel.add("late", 3.0, "L")
+
+        assert "late" in wheel
+        assert wheel.advance(10.0) == [("late", "L")]
+
+    def test_rejects_invalid_geometry(self):
+        with pytest.raises(ValueError):
+            TimerWheel(slots=10)
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+
+
+class TestMemoryScheduleStore:
+    def test_due_returns_earliest_first_up_to_limit(self):
+        store = MemoryScheduleStore()
+        store.add_many([_entry("c", 3), _entry("a", 1), _entry("b", 2)])
+
+        assert [e.id for e in store.due(_at(10), limit=2)] == ["a", "b"]
+        assert [e.id for e in store.due(_at(1.5), limit=10)] == ["a"]
+
+    def test_claim_is_exclusive(self):
+        store = MemoryScheduleStore()
+        store.add(_entry("a", 1))
+
+        assert store.claim(["a", "missing"], lease=60) == {"a"}
+        assert store.claim(["a"], lease=60) == set()
+        assert store.due(_at(10), limit=10) == []
+        assert store.count() == 1
+
+        assert store.remove(["a", "missing"]) == 1
+        assert store.count() == 0
+
+    def test_released_and_expired_leases_can_be_claimed_again(self):
+        store = MemoryScheduleStore()
+        store.add_many([_entry("a", 1), _entry("b", 2)])
+
+        assert store.claim(["a", "b"], lease=60) == {"a", "b"}
+        store.release(["a"])
+        assert [e.id for e in store.due(_at(10), limit=10)] == ["a"]
+
+        assert store.claim(["a"], lease=0) == {"a"}
+        assert store.claim(["a"], lease=60) == {"a"}
+
+    def test_replaced_and_cancelled_entries_are_skipped(self):
+        store = MemoryScheduleStore()
+        store.add_many([_entry("a", 1), _entry("b", 2), _entry("c", 3)])
+        store.add(_entry("a", 5))
+        assert store.cancel("b") is True
+
+        assert [e.id for e in store.due(_at(10), limit=2)] == ["c", "a"]
+
+
+class TestDatabaseScheduleStore:
+    @pytest.fixture
+    def store(self, test_domain):
+        from protean.adapters.scheduler.database import DatabaseScheduleStore
+
+        store = DatabaseScheduleStore(
+            test_domain._infrastructure.get_schedule_repo("default")
+        )
+        yield store
+        store.flush()
+
+    def test_add_due_and_claim(self, store):
+        store.add_many([_entry("b", 2), _entry("a", 1)])
+        store.add(_entry("b", 3))
+
+        due = store.due(_at(10), limit=10)
+        assert [e.id for e in due] == ["a", "b"]
+        assert due[1].payload == {"n": "b"}
+        assert store.claim(["a", "b"], lease=60) == {"a", "b"}
+        assert store.claim(["a"], lease=60) == set()
+        assert store.due(_at(10), limit=10) == []
+
+        store.release(["b"])
+        assert [e.id for e in store.due(_at(10), limit=10)] == ["b"]
+        assert store.remove(["a", "b"]) == 2
+        assert store.count() == 0
+
+
+class TestDomainSchedule:
+    def test_requires_a_schedule_store(self, test_domain):
+        with pytest.raises(ConfigurationError):
+            test_domain.schedule(
+                _register("a@example.com"), delay=timedelta(seconds=10)
+            )
+
+    def test_requires_exactly_one_of_at_and_delay(self, test_domain, memory_scheduler):
+        with pytest.raises(IncorrectUsageError):
+            test_domain.schedule(_register("a@example.com"))
+        with pytest.raises(IncorrectUsageError):
+            test_domain.schedule(
+                _register("a@example.com"), at=_at(5), delay=timedelta(seconds=5)
+            )
+
+    def test_stores_the_enriched_command(self, test_domain, memory_scheduler):
+        command = _register("a@example.com")
+        schedule_id = test_domain.schedule(command, delay=timedelta(seconds=30))
+
+        (entry,) = memory_scheduler.due(_at(60), limit=10)
+        assert entry.id == schedule_id
+        assert entry.stream.startswith("test::user:command-")
+        assert entry.payload["data"]["email"] == "a@example.com"
+        assert abs((entry.deliver_at - _at(30)).total_seconds()) < 1
+
+    def test_deadline_runs_from_delivery(self, test_domain, memory_scheduler):
+        deliver_at = _at(60)
+        test_domain.schedule(
+            _register("a@example.com"),
+            at=deliver_at,
+            deadline=deliver_at + timedelta(seconds=5),
+        )
+        (entry,) = memory_scheduler.due(_at(120), limit=10)
+        assert payload_deadline(entry.payload) == deliver_at + timedelta(seconds=5)
+
+        with pytest.raises(IncorrectUsageError):
+            test_domain.schedule(
+                _register("b@example.com"), at=deliver_at, deadline=_at(30)
+            )
+
+    def test_cancel_scheduled(self, test_domain, memory_scheduler):
+        schedule_id = test_domain.schedule(
+            _register("a@example.com"), delay=timedelta(seconds=30)
+        )
+
+        assert test_domain.cancel_scheduled(schedule_id) is True
+        assert test_domain.cancel_scheduled(schedule_id) is False
+        assert memory_scheduler.count() == 0
+
+
+class TestScheduledDelivery:
+    async def test_delivers_due_commands_to_their_streams(
+        self, test_domain, memory_scheduler
+    ):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        assert isinstance(delivery, ScheduledDelivery)
+
+        now_id = test_domain.schedule(
+            _register("now@example.com"), delay=timedelta(seconds=0)
+        )
+        test_domain.schedule(
+            _register("later@example.com"), delay=timedelta(seconds=3600)
+        )
+
+        assert await delivery.run_once() == 1
+        assert memory_scheduler.count() == 1
+        assert now_id not in {e.id for e in memory_scheduler.due(_at(7200), 10)}
+
+        messages = test_domain.event_store.store.read("test::user:command")
+        assert [m.data["email"] for m in messages] == ["now@example.com"]
+
+    async def test_entries_within_horizon_fire_from_the_wheel(
+        self, test_domain, memory_scheduler
+    ):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        test_domain.schedule(
+            _register("soon@example.com"), delay=timedelta(seconds=0.5)
+        )
+
+        start = delivery.wheel._origin
+        assert await delivery.run_once(now=start) == 0
+        assert len(delivery.wheel) == 1
+
+        assert await delivery.run_once(now=start + 1.0) == 1
+        assert memory_scheduler.count() == 0
+
+    async def test_entry_claimed_elsewhere_is_not_delivered(
+        self, test_domain, memory_scheduler
+    ):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        schedule_id = test_domain.schedule(
+            _register("x@example.com"), delay=timedelta(seconds=0.5)
+        )
+
+        start = delivery.wheel._origin
+        await delivery.run_once(now=start)
+        memory_scheduler.claim([schedule_id], lease=60)
+
+        assert await delivery.run_once(now=start + 1.0) == 0
+        assert test_domain.event_store.store.read("test::user:command") == []
+
+    async def test_failed_append_keeps_the_entries(self, test_domain, memory_scheduler):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        test_domain.schedule(_register("x@example.com"), delay=timedelta(seconds=0))
+
+        with patch.object(
+            test_domain.event_store.store,
+            "append_many",
+            side_effect=RuntimeError("store down"),
+        ):
+            with pytest.raises(RuntimeError):
+                await delivery.run_once()
+
+        assert memory_scheduler.count() == 1
+        assert len(memory_scheduler.due(_at(10), limit=10)) == 1
+
+        delivery._last_poll = -math.inf
+        assert await delivery.run_once() == 1
+        assert memory_scheduler.count() == 0
+
+    async def test_entry_of_a_worker_that_died_is_delivered_again(
+        self, test_domain, memory_scheduler
+    ):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        schedule_id = test_domain.schedule(
+            _register("x@example.com"), delay=timedelta(seconds=0)
+        )
+
+        # Another worker leased the entry and died before removing it
+        memory_scheduler.claim([schedule_id], lease=0)
+
+        assert await delivery.run_once() == 1
+        assert memory_scheduler.count() == 0
+
+    async def test_call_later_runs_callbacks(self, test_domain, memory_scheduler):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        fired = []
+
+        delivery.call_later(0.5, lambda: fired.append("kept"))
+        key = delivery.call_later(0.5, lambda: fired.append("cancelled"))
+        assert delivery.cancel(key) is True
+
+        await delivery.run_once(now=delivery.wheel._origin + 1.0)
+        assert fired == ["kept"]
+
+    async def test_retries_wait_on_the_wheel(self, test_domain, memory_scheduler):
+        engine = Engine(domain=test_domain, test_mode=True)
+        delivery = engine._scheduled_delivery
+        delivery.running = True
+        nacked = []
+
+        class FakeBroker:
+            def nack(self, stream, identifier, consumer_group):
+                nacked.append(identifier)
+
+        subscription = StreamSubscription(
+            engine=engine,
+            stream_category="test::user:command",
+            handler=UserCommandHandler,
+            retry_delay_seconds=5,
+        )
+        subscription.broker = FakeBroker()
+
+        await subscription._retry_message("msg-1", 1)
+        assert nacked == []
+
+        await delivery.run_once(now=delivery.wheel._origin + 6)
+        assert nacked == ["msg-1"]
+
+    def test_engine_handles_delivered_commands(self, test_domain, memory_scheduler):
+        test_domain.schedule(_register("run@example.com"), delay=timedelta(seconds=0))
+
+        engine = Engine(domain=test_domain, test_mode=True)
+        engine.run()
+
+        assert handled == ["run@example.com"]
+
+    def test_not_started_without_a_backend(self, test_domain):
+        engine = Engine(domain=test_domain, test_mode=True)
+        assert engine._scheduled_delivery is None
@@ -0,0 +1,243 @@
+"""Tests for stage-level latency timing across the message pipeline."""
+
+import time
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider as SDKMeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from protean.core.aggregate import BaseAggregate, apply
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.event import BaseEvent
+from protean.fields import Identifier, String
+from protean.server import Engine
+from protean.server.subscription.event_store_subscription import (
+    EventStoreSubscription,
+)
+from protean.utils.eventing import Message
+from protean.utils.globals import current_domain
+from protean.utils.mixins import handle
+from protean.utils.stages import (
+    StageTimer,
+    current_stage_timer,
+    message_stages,
+    stage,
+)
+from protean.utils.telemetry import _DOMAIN_METRICS_KEY
+
+
+class AccountOpened(BaseEvent):
+    account_id = Identifier(required=True)
+    name = String(required=True)
+
+
+class Account(BaseAggregate):
+    account_id = Identifier(identifier=True)
+    name = String(required=True)
+
+    @classmethod
+    def open(cls, account_id: str, name: str) -> "Account":
+        account = cls(account_id=account_id, name=name)
+        account.raise_(AccountOpened(account_id=account_id, name=name))
+        return account
+
+    @apply
+    def opened(self, event: AccountOpened) -> None:
+        self.name = event.name
+
+
+class OpenAccount(BaseCommand):
+    account_id = Identifier(identifier=True)
+    name = String(required=True)
+
+
+class AccountCommandHandler(BaseCommandHandler):
+    @handle(OpenAccount)
+    def open(self, command: OpenAccount) -> None:
+        current_domain.repository_for(Account).add(
+            Account.open(account_id=command.account_id, name=command.name)
+        )
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(Account)
+    test_domain.register(AccountOpened, part_of=Account)
+    test_domain.register(OpenAccount, part_of=Account)
+    test_domain.register(AccountCommandHandler, part_of=Account)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def telemetry(test_domain):
+    """Enable in-memory OTel and return ``(span_exporter, metric_reader)``."""
+    resource = Resource.create({"service.name": test_domain.normalized_name})
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = SDKTracerProvider(resource=resource)
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    metric_reader = InMemoryMetricReader()
+
+    test_domain._otel_tracer_provider = tracer_provider
+    test_domain._otel_meter_provider = SDKMeterProvider(
+        resource=resource, metric_readers=[metric_reader]
+    )
+    test_domain._otel_init_attempted = True
+    yield span_exporter, metric_reader
+    if hasattr(test_domain, _DOMAIN_METRICS_KEY):
+        delattr(test_domain, _DOMAIN_METRICS_KEY)
+
+
+def _stage_points(metric_reader) -> dict[str, list]:
+    """Histogram data points of ``protean.message.stage_duration`` by stage."""
+    points: dict[str, list] = {}
+    data = metric_reader.get_metrics_data()
+    for resource_metric in data.resource_metrics if data else []:
+        for scope_metric in resource_metric.scope_metrics:
+            for metric in scope_metric.metrics:
+                if metric.name == "protean.message.stage_duration":
+                    for point in metric.data.data_points:
+                        stage_name = point.attributes["stage"]
+                        points.setdefault(stage_name, []).append(point)
+    return points
+
+
+def _command_message(test_domain) -> Message:
+    command = test_domain._enrich_command(
+        OpenAccount(account_id=str(uuid4()), name="Acme"), asynchronous=True
+    )
+    return Message.from_domain_object(command)
+
+
+class TestStageTimer:
+    def test_nested_stages_are_exclusive(self, test_domain):
+        with message_stages() as timer:
+            with stage("handler"):
+                time.sleep(0.02)
+                with stage("load"):
+                    time.sleep(0.02)
+                    with stage("append"):
+                        time.sleep(0.02)
+
+        durations = timer.durations
+        assert set(durations) == {"handler", "load", "append"}
+        for name in durations:
+            assert 0.015 < durations[name] < 0.1
+        assert current_stage_timer() is None
+
+    def test_repeated_stages_accumulate(self, test_domain):
+        with message_stages() as timer:
+            for _ in range(3):
+                with stage("flush"):
+                    time.sleep(0.005)
+
+        assert timer.durations["flush"] >= 0.015
+
+    def test_breakdown_is_in_pipeline_order(self):
+        timer = StageTimer()
+        timer.add("append", 0.002)
+        timer.add("custom", 0.001)
+        timer.add("deserialize", 0.0005)
+
+        assert list(timer.breakdown_ms()) == ["deserialize", "append", "custom"]
+        assert timer.breakdown_ms()["append"] == 2.0
+
+    def test_stage_outside_a_message_records_histogram(self, test_domain, telemetry):
+        _, metric_reader = telemetry
+
+        with stage("fetch", attributes={"handler_name": "Poller"}):
+            pass
+
+        (point,) = _stage_points(metric_reader)["fetch"]
+        assert point.attributes["handler_name"] == "Poller"
+        assert point.count == 1
+
+
+class TestHandleMessageStages:
+    @pytest.mark.asyncio
+    async def test_records_stages_of_a_command(self, test_domain, telemetry):
+        span_exporter, metric_reader = telemetry
+        engine = Engine(domain=test_domain, test_mode=True)
+
+        message = _command_message(test_domain)
+        # Without an incoming trace context the handler span is sampled
+        headers = message.metadata.headers.model_copy(update={"traceparent": None})
+        message.metadata = message.metadata.model_copy(update={"headers": headers})
+
+        assert await engine.handle_message(AccountCommandHandler, message)
+
+        points = _stage_points(metric_reader)
+        assert {"deserialize", "handler", "flush", "append"} <= set(points)
+        handler_point = points["handler"][0]
+        assert handler_point.attributes["handler_name"] == "AccountCommandHandler"
+
+        span = next(
+            s
+            for s in span_exporter.get_finished_spans()
+            if s.name == "protean.engine.handle_message"
+        )
+        assert "protean.stage.handler_ms" in span.attributes
+        assert "protean.stage.append_ms" in span.attributes
+
+    @pytest.mark.asyncio
+    async def test_trace_breakdown_is_opt_in(self, test_domain):
+        engine = Engine(domain=test_domain, test_mode=True)
+        engine.emitter = Mock(stage_breakdown=False)
+
+        await engine.handle_message(
+            AccountCommandHandler, _command_message(test_domain)
+        )
+
+        completed = engine.emitter.emit.call_args_list[-1].kwargs
+        assert completed["event"] == "handler.completed"
+        assert completed["metadata"] is None
+
+    @pytest.mark.asyncio
+    async def test_trace_carries_breakdown_when_enabled(self, test_domain):
+        test_domain.config["observatory"] = {"trace_stage_breakdown": True}
+        engine = Engine(domain=test_domain, test_mode=True)
+        assert engine.emitter.stage_breakdown is True
+
+        engine.emitter = Mock(stage_breakdown=True)
+        await engine.handle_message(
+            AccountCommandHandler, _command_message(test_domain)
+        )
+
+        completed = engine.emitter.emit.call_args_list[-1].kwargs
+        stages = completed["metadata"]["stages"]
+        assert {"deserialize", "handler", "append"} <= set(stages)
+        assert sum(stages.values()) <= completed["duration_ms"] + 1
+
+
+class TestSubscriptionStages:
+    @pytest.mark.asyncio
+    async def test_event_store_subscription_records_fetch_and_position(
+        self, test_domain, telemetry
+    ):
+        _, metric_reader = telemetry
+        test_domain.process(
+            OpenAccount(account_id=str(uuid4()), name="Acme"), asynchronous=True
+        )
+
+        engine = Engine(domain=test_domain, test_mode=True)
+        subscription = EventStoreSubscription(
+            engine,
+            "test::account:command",
+            AccountCommandHandler,
+            position_update_interval=1,
+        )
+        await subscription.initialize()
+        await subscription.tick()
+
+        points = _stage_points(metric_reader)
+        assert points["fetch"][0].attributes["handler_name"] == (
+            "AccountCommandHandler"
+        )
+        assert "ack" in points
+        assert "handler" in points
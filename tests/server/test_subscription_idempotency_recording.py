@@ -0,0 +1,144 @@
+"""Tests for when EventStoreSubscription records idempotency successes.
+
+Uses the in-memory idempotency backend, so no Redis is needed.
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.fields import Identifier, String
+from protean.server.engine import Engine
+from protean.server.subscription.event_store_subscription import (
+    EventStoreSubscription,
+)
+from protean.utils.mixins import handle
+
+
+class Account(BaseAggregate):
+    account_id: Identifier(identifier=True)
+    name: String()
+
+
+class OpenAccount(BaseCommand):
+    account_id: Identifier(identifier=True)
+    name: String()
+
+
+class AccountCommandHandlers(BaseCommandHandler):
+    @handle(OpenAccount)
+    def open_account(self, command: OpenAccount):
+        return {"account_id": command.account_id}
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.config["idempotency"]["backend"] = "memory"
+    test_domain._idempotency_store = None
+    test_domain.config["command_processing"] = "async"
+
+    test_domain.register(Account)
+    test_domain.register(OpenAccount, part_of=Account)
+    test_domain.register(AccountCommandHandlers, part_of=Account)
+    test_domain.init(traverse=False)
+
+    yield
+
+    test_domain.idempotency_store.flush()
+
+
+def _submit(test_domain, idempotency_key):
+    test_domain.process(
+        OpenAccount(account_id=str(uuid4()), name="Test"),
+        asynchronous=True,
+        idempotency_key=idempotency_key,
+    )
+    return test_domain.event_store.store.read("account:command")[-1]
+
+
+class _Crash(Exception):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_success_is_recorded_before_the_position_moves_past_it(test_domain):
+    """A crash mid-batch keeps the records of messages already handled."""
+    first = _submit(test_domain, "crash-1")
+    second = _submit(test_domain, "crash-2")
+    # Only look at what the subscription records, not the submission
+    test_domain.idempotency_store.flush()
+
+    engine = Engine(domain=test_domain, test_mode=False)
+    subscription = EventStoreSubscription(
+        engine, "account:command", AccountCommandHandlers, messages_per_tick=10
+    )
+
+    async def crash(position):
+        raise _Crash()
+
+    subscription.update_read_position = crash
+
+    with pytest.raises(_Crash):
+        await subscription.process_batch([first, second])
+
+    assert test_domain.idempotency_store.check("crash-1")["status"] == "success"
+    assert test_domain.idempotency_store.check("crash-2") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_successes_are_recorded_in_one_round_trip(test_domain):
+    messages = [_submit(test_domain, f"batch-{i}") for i in range(3)]
+    test_domain.idempotency_store.flush()
+
+    engine = Engine(domain=test_domain, test_mode=False)
+    subscription = EventStoreSubscription(
+        engine, "account:command", AccountCommandHandlers, messages_per_tick=10
+    )
+    store = test_domain.idempotency_store
+
+    with (
+        patch.object(store, "record_many", wraps=store.record_many) as record_many,
+        patch.object(store, "record_success") as record_success,
+    ):
+        assert await subscription.process_batch(messages) == 3
+
+    record_many.assert_called_once_with({f"batch-{i}": True for i in range(3)})
+    record_success.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_successes_are_recorded_before_a_position_write(test_domain):
+    messages = [_submit(test_domain, f"write-{i}") for i in range(3)]
+    test_domain.idempotency_store.flush()
+
+    engine = Engine(domain=test_domain, test_mode=False)
+    subscription = EventStoreSubscription(
+        engine,
+        "account:command",
+        AccountCommandHandlers,
+        messages_per_tick=10,
+        position_update_interval=2,
+    )
+    recorded_at_write = []
+    write = subscription.store._write
+
+    def recording_write(stream_name, *args, **kwargs):
+        if stream_name == subscription.subscriber_stream_name:
+            recorded_at_write.append(
+                [
+                    key
+                    for key in ("write-0", "write-1", "write-2")
+                    if test_domain.idempotency_store.check(key)
+                ]
+            )
+        return write(stream_name, *args, **kwargs)
+
+    with patch.object(subscription.store, "_write", side_effect=recording_write):
+        await subscription.process_batch(messages)
+
+    assert recorded_at_write == [["write-0", "write-1"]]
+    assert test_domain.idempotency_store.check("write-2")["status"] == "success"
@@ -176,6 +176,7 @@ class TestCollectEventStoreStatus:
         assert result.current_position == "5"
         assert result.head_position == "10"
         assert result.status == "lagging"
+        mock_store.stream_head_position.assert_called_once_with("order", cached=True)
 
     def test_lag_zero_when_caught_up(self):
         mock_domain = MagicMock()
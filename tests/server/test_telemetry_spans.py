@@ -631,18 +631,13 @@ class TestUoWCommitSpanOnError:
         """Force a commit failure during event store append and verify
         the UoW commit span is marked ERROR with an exception event."""
         store = test_domain.event_store.store
-        original_write = store._write
-        call_count = 0
-
-        def _exploding_write(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            # Let command append succeed (call 1), fail on event append (call 2+)
-            if call_count > 1:
-                raise RuntimeError("event store exploded")
-            return original_write(*args, **kwargs)
-
-        monkeypatch.setattr(store, "_write", _exploding_write)
+
+        def _exploding_write_many(*args, **kwargs):
+            # The command is appended on its own; the UoW appends its events
+            # as one batch, which fails
+            raise RuntimeError("event store exploded")
+
+        monkeypatch.setattr(store, "_write_many", _exploding_write_many)
 
         with pytest.raises(Exception):
             test_domain.process(
@@ -112,6 +112,16 @@ async def test_write_position_after_interval(test_domain):
     engine = Engine(test_domain, test_mode=True)
     email_event_handler_subscription = engine._subscriptions[fqn(EmailEventHandler)]
 
+    # Record the global position of every message the subscription hands over
+    handled_positions = []
+    handle_message = engine.handle_message
+
+    async def recording_handle_message(handler_cls, message, **kwargs):
+        handled_positions.append(message.metadata.event_store.global_position)
+        return await handle_message(handler_cls, message, **kwargs)
+
+    engine.handle_message = recording_handle_message
+
     await email_event_handler_subscription.load_position_on_start()
     await email_event_handler_subscription.update_current_position_to_store()
 
@@ -145,9 +155,10 @@ async def test_write_position_after_interval(test_domain):
     # ASSERT Positions after reading all messages (100 per tick now)
     # Current position should be 16 because we read all 15 messages plus 1 position update
     assert email_event_handler_subscription.current_position == 16
-    assert (
-        last_written_position == 11
-    )  # Position written after 10 messages (position update interval)
+    # Every message is handed over, none skipped between ticks
+    assert len(handled_positions) == 16
+    # Position written after 10 messages (position update interval)
+    assert last_written_position == handled_positions[9]
 
     # ASSERT Positions after reading to end of messages
     await email_event_handler_subscription.tick()
@@ -155,7 +166,8 @@ async def test_write_position_after_interval(test_domain):
     assert (
         email_event_handler_subscription.current_position == 16
     )  # Already read all messages in previous tick
-    assert last_written_position == 11  # Remains 11 as no new interval reached
+    # Unchanged as no new interval was reached
+    assert last_written_position == handled_positions[9]
 
 
 @pytest.mark.asyncio
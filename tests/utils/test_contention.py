@@ -0,0 +1,295 @@
+"""Tests for aggregate contention tracking: sketches, recording and merging."""
+
+import json
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from protean.core.aggregate import BaseAggregate, apply
+from protean.core.command import BaseCommand
+from protean.core.command_handler import BaseCommandHandler
+from protean.core.event import BaseEvent
+from protean.core.unit_of_work import UnitOfWork
+from protean.exceptions import ExpectedVersionError
+from protean.fields import Identifier, String
+from protean.utils.contention import (
+    ContentionTracker,
+    SpaceSaving,
+    collect_contention,
+    get_contention_tracker,
+    merge_snapshots,
+)
+from protean.utils.globals import current_domain
+from protean.utils.mixins import handle
+
+
+class UserRegistered(BaseEvent):
+    user_id: Identifier(required=True)
+    name: String(required=True)
+
+
+class UserRenamed(BaseEvent):
+    user_id: Identifier(required=True)
+    name: String(required=True)
+
+
+class User(BaseAggregate):
+    user_id: Identifier(identifier=True)
+    name: String()
+
+    @classmethod
+    def register(cls, user_id: str, name: str) -> "User":
+        user = cls(user_id=user_id, name=name)
+        user.raise_(UserRegistered(user_id=user_id, name=name))
+        return user
+
+    def rename(self, name: str) -> None:
+        self.raise_(UserRenamed(user_id=self.user_id, name=name))
+
+    @apply
+    def registered(self, event: UserRegistered) -> None:
+        self.user_id = event.user_id
+        self.name = event.name
+
+    @apply
+    def renamed(self, event: UserRenamed) -> None:
+        self.name = event.name
+
+
+class RenameUser(BaseCommand):
+    user_id: Identifier(required=True)
+    name: String(required=True)
+
+
+@pytest.fixture(autouse=True)
+def register_elements(test_domain):
+    test_domain.register(User, is_event_sourced=True)
+    test_domain.register(UserRegistered, part_of=User)
+    test_domain.register(UserRenamed, part_of=User)
+    test_domain.register(RenameUser, part_of=User)
+    test_domain.init(traverse=False)
+
+
+@pytest.fixture
+def tracker(test_domain):
+    tracker = get_contention_tracker(test_domain)
+    tracker.reset()
+    yield tracker
+    tracker.reset()
+
+
+def _create_user(test_domain) -> str:
+    identifier = str(uuid4())
+    with UnitOfWork():
+        user = User.register(user_id=identifier, name="John")
+        test_domain.repository_for(User).add(user)
+    return identifier
+
+
+class TestSpaceSaving:
+    def test_counts_exactly_within_capacity(self):
+        sketch = SpaceSaving(capacity=3)
+        for key in "aabac":
+            sketch.add(key)
+
+        assert sketch.top() == [("a", 3, 0), ("b", 1, 0), ("c", 1, 0)]
+        assert sketch.total == 5
+
+    def test_evicts_smallest_and_carries_its_count_as_error(self):
+        sketch = SpaceSaving(capacity=2)
+        for key in "aaab":
+            sketch.add(key)
+        sketch.add("c")
+
+        assert len(sketch) == 2
+        assert sketch.top() == [("a", 3, 0), ("c", 2, 1)]
+
+    def test_heavy_hitters_survive_a_long_tail(self):
+        sketch = SpaceSaving(capacity=10)
+        for i in range(1000):
+            sketch.add("hot")
+            sketch.add(f"cold-{i}")
+
+        key, count, error = sketch.top(1)[0]
+        assert key == "hot"
+        assert count - error <= 1000 <= count
+
+    def test_rejects_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            SpaceSaving(capacity=0)
+
+
+class TestContentionTracker:
+    def test_records_conflicts_reloads_and_latency(self, test_domain, tracker):
+        tracker.record_conflict("User", "u1")
+        tracker.record_conflict("User", "u1")
+        tracker.record_reload("User", "u1")
+        tracker.record_retry_latency("User", 0.02)
+        tracker.record_retry_latency("User", 0.04)
+
+        snapshot = tracker.snapshot()
+        assert snapshot["conflicts"] == [
+            {"aggregate": "User", "aggregate_id": "u1", "count": 2, "error": 0}
+        ]
+        assert snapshot["reloads"][0]["count"] == 1
+        (latency,) = snapshot["retry_latency"]
+        assert latency["retries"] == 2
+        assert latency["max_ms"] == pytest.approx(40)
+        json.dumps(snapshot)
+
+    def test_slow_uow_threshold(self, test_domain):
+        tracker = ContentionTracker(test_domain, slow_uow_threshold_ms=50)
+        tracker.record_uow([("User", "fast")], 0.01)
+        tracker.record_uow([("User", "slow"), ("Order", "o1")], 0.2)
+
+        assert [e["aggregate_id"] for e in tracker.top("slow")] == ["slow", "o1"]
+        assert tracker.top("slow")[0]["count"] == pytest.approx(200)
+
+    def test_disabled_tracker_records_nothing(self, test_domain):
+        tracker = ContentionTracker(test_domain, enabled=False)
+        tracker.record_conflict("User", "u1")
+        tracker.record_uow([("User", "u1")], 10)
+
+        assert tracker.top("conflicts") == []
+        assert tracker.top("slow") == []
+
+    def test_from_config(self, test_domain):
+        test_domain.config["contention"] = {
+            "enabled": False,
+            "capacity": "bad",
+            "slow_uow_threshold_ms": 5,
+        }
+        tracker = ContentionTracker.from_config(test_domain)
+
+        assert tracker.enabled is False
+        assert tracker._sketches["conflicts"].capacity == 100
+        assert tracker.slow_uow_threshold == pytest.approx(0.005)
+
+    def test_publishes_snapshots_to_redis(self, test_domain):
+        redis = MagicMock()
+        tracker = ContentionTracker(test_domain, worker="w1", publish_interval=60)
+        with patch.object(tracker, "_get_redis", return_value=redis):
+            tracker.record_conflict("User", "u1")
+            tracker.record_conflict("User", "u2")
+
+        redis.set.assert_called_once()
+        key, raw = redis.set.call_args.args
+        assert key == f"protean:contention:{test_domain.name}:w1"
+        assert json.loads(raw)["conflicts"][0]["aggregate_id"] == "u1"
+
+
+class TestMergeSnapshots:
+    def _snapshot(self, worker, conflicts, retries):
+        return {
+            "worker": worker,
+            "conflicts": [
+                {"aggregate": "User", "aggregate_id": id, "count": n, "error": 0}
+                for id, n in conflicts
+            ],
+            "reloads": [],
+            "slow": [],
+            "retry_latency": [
+                {"aggregate": "User", "retries": r, "total_ms": t, "max_ms": m}
+                for r, t, m in retries
+            ],
+        }
+
+    def test_sums_counts_across_workers(self):
+        merged = merge_snapshots(
+            [
+                self._snapshot("w1", [("u1", 3), ("u2", 1)], [(2, 30.0, 20.0)]),
+                self._snapshot("w2", [("u2", 5)], [(1, 50.0, 50.0)]),
+            ],
+            top=1,
+        )
+
+        assert merged["workers"] == ["w1", "w2"]
+        assert merged["conflicts"] == [
+            {"aggregate": "User", "aggregate_id": "u2", "count": 6, "error": 0}
+        ]
+        assert merged["retry_latency"] == [
+            {"aggregate": "User", "retries": 3, "mean_ms": 80.0 / 3, "max_ms": 50.0}
+        ]
+
+    def test_collects_local_trackers_without_redis(self, test_domain, tracker):
+        tracker.record_conflict("User", "u1")
+
+        report = collect_contention([test_domain])
+        assert report[test_domain.name]["conflicts"][0]["aggregate_id"] == "u1"
+
+
+class TestRecordingFromUnitOfWork:
+    @pytest.mark.eventstore
+    def test_conflict_is_attributed_to_the_aggregate_instance(
+        self, test_domain, tracker
+    ):
+        identifier = _create_user(test_domain)
+        repo = test_domain.repository_for(User)
+        first, second = repo.get(identifier), repo.get(identifier)
+
+        with UnitOfWork():
+            first.rename("Jane")
+            repo.add(first)
+
+        with pytest.raises(ExpectedVersionError) as exc:
+            with UnitOfWork():
+                second.rename("Mike")
+                repo.add(second)
+
+        assert exc.value.aggregate == "User"
+        assert exc.value.aggregate_id == identifier
+        assert exc.value.stream == f"{User.meta_.stream_category}-{identifier}"
+        assert tracker.top("conflicts") == [
+            {"aggregate": "User", "aggregate_id": identifier, "count": 1, "error": 0}
+        ]
+
+    def test_slow_unit_of_work_is_attributed_to_its_aggregates(
+        self, test_domain, tracker
+    ):
+        tracker.slow_uow_threshold = 0
+        identifier = _create_user(test_domain)
+
+        assert tracker.top("slow")[0]["aggregate_id"] == identifier
+
+
+class TestRecordingFromVersionRetries:
+    @patch("protean.utils.mixins.time.sleep")
+    def test_retries_record_reloads_and_latency(self, _, test_domain, tracker):
+        attempts = 0
+
+        class RenameHandler(BaseCommandHandler):
+            @handle(RenameUser)
+            def rename(self, command: RenameUser) -> None:
+                nonlocal attempts
+                attempts += 1
+                if attempts < 3:
+                    raise ExpectedVersionError(
+                        "Wrong expected version",
+                        aggregate="User",
+                        aggregate_id=command.user_id,
+                    )
+                repo = current_domain.repository_for(User)
+                user = repo.get(command.user_id)
+                user.rename(command.name)
+                repo.add(user)
+
+        test_domain.register(RenameHandler, part_of=User)
+        test_domain.init(traverse=False)
+        identifier = _create_user(test_domain)
+
+        command = test_domain._enrich_command(
+            RenameUser(user_id=identifier, name="Jane"), True
+        )
+        RenameHandler._handle(command)
+
+        assert tracker.top("conflicts")[0]["count"] == 2
+        assert tracker.top("reloads")[0] == {
+            "aggregate": "User",
+            "aggregate_id": identifier,
+            "count": 2,
+            "error": 0,
+        }
+        (latency,) = tracker.snapshot()["retry_latency"]
+        assert latency["aggregate"] == "User"
+        assert latency["retries"] == 1